@@ -47,6 +47,9 @@ var CONFIG_KEYS = {
   // Folder IDs
   MONTHLY_FOLDER_ID: 'MONTHLY_FOLDER_ID',  // Monthly Meeting presentations folder
 
+  // Precomputed Data
+  DASHBOARD_PAYLOADS_FILE_ID: 'DASHBOARD_PAYLOADS_FILE_ID',  // dashboard-payloads.json (scripts/dashboard_payloads.py)
+
   // Library Reference
   API_LIBRARY_ID: 'API_LIBRARY_ID',  // MO-APIs Library ID
 
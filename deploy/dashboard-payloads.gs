@@ -0,0 +1,211 @@
+/**
+ * Precomputed Dashboard Payloads
+ * ==============================
+ * Serves page views built offline by scripts/dashboard_payloads.py
+ * (topsheet, schedule, sep, comms) from the script cache, so pages can skip
+ * the full sheet scans when a fresh payload is available.
+ *
+ * The payload file (dashboard-payloads.json, Drive file id in the
+ * DASHBOARD_PAYLOADS_FILE_ID config key) holds a manifest and gzip+base64
+ * chunks, each under the 100 KB CacheService entry limit.
+ *
+ * The milestone, coverage and SEP wrappers read these views first and fall
+ * back to the live MoApi call on a miss. Run installDashboardPayloadTrigger()
+ * once to keep the cache primed.
+ *
+ * A cached view is only served while it is fresh:
+ * - its asOf date (the reference date for overdue / upcoming / coverage
+ *   counts) must be today, or, when the DASHBOARD_PAYLOAD_MAX_AGE_HOURS script
+ *   property is set, no more than that many hours old
+ * - it must have been generated after the last web-app write to milestones,
+ *   SEP milestones or stories; those wrappers call invalidateDashboardPayloads(),
+ *   which drops the cache keys and records the write time so a re-prime from
+ *   the same export is not served either
+ * Otherwise callers aggregate live until the export is re-run.
+ *
+ * @fileoverview Cache loader for precomputed dashboard views
+ */
+
+var DASHBOARD_PAYLOAD_MANIFEST_KEY = 'dashboard_payload_manifest';
+var DASHBOARD_PAYLOAD_TTL = 21600;      // CacheService maximum (6 hours)
+var DASHBOARD_PAYLOAD_PUT_BATCH = 50;   // Entries per putAll call
+var DASHBOARD_PAYLOAD_REFRESH_HOURS = 4; // Re-prime before the TTL runs out
+var DASHBOARD_PAYLOAD_MAX_AGE_PROPERTY = 'DASHBOARD_PAYLOAD_MAX_AGE_HOURS';
+var DASHBOARD_PAYLOAD_INVALIDATED_PROPERTY = 'DASHBOARD_PAYLOAD_INVALIDATED';
+
+// ============================================================================
+// CACHE PRIMING
+// ============================================================================
+
+/**
+ * Load the payload file from Drive into the script cache.
+ * Run after each pipeline export and from a time trigger (< 6 hours).
+ * @returns {Object} {success, pages, chunks} or {success: false, error}
+ */
+function primeDashboardPayloadCache() {
+  try {
+    var fileId = getConfigValue('DASHBOARD_PAYLOADS_FILE_ID');
+    if (!fileId) {
+      return { success: false, error: 'DASHBOARD_PAYLOADS_FILE_ID not configured' };
+    }
+
+    var payload = JSON.parse(DriveApp.getFileById(fileId).getBlob().getDataAsString('UTF-8'));
+    var cache = CacheService.getScriptCache();
+    var keys = Object.keys(payload.entries);
+
+    // Chunks first, manifest last, so readers never see a manifest without its chunks
+    for (var i = 0; i < keys.length; i += DASHBOARD_PAYLOAD_PUT_BATCH) {
+      var batch = {};
+      keys.slice(i, i + DASHBOARD_PAYLOAD_PUT_BATCH).forEach(function(key) {
+        batch[key] = payload.entries[key];
+      });
+      cache.putAll(batch, DASHBOARD_PAYLOAD_TTL);
+    }
+    cache.put(DASHBOARD_PAYLOAD_MANIFEST_KEY, JSON.stringify(payload.manifest), DASHBOARD_PAYLOAD_TTL);
+
+    return {
+      success: true,
+      generated: payload.manifest.generated,
+      fresh: isDashboardPayloadFresh_(payload.manifest),
+      pages: Object.keys(payload.manifest.pages),
+      chunks: keys.length
+    };
+  } catch (e) {
+    Logger.log('primeDashboardPayloadCache error: ' + e);
+    return { success: false, error: e.message };
+  }
+}
+
+/**
+ * Install the time-driven trigger that re-primes the cache every
+ * DASHBOARD_PAYLOAD_REFRESH_HOURS, replacing any earlier one. Run once.
+ * @returns {Object} {success, everyHours}
+ */
+function installDashboardPayloadTrigger() {
+  ScriptApp.getProjectTriggers().forEach(function(trigger) {
+    if (trigger.getHandlerFunction() === 'primeDashboardPayloadCache') {
+      ScriptApp.deleteTrigger(trigger);
+    }
+  });
+  ScriptApp.newTrigger('primeDashboardPayloadCache')
+    .timeBased()
+    .everyHours(DASHBOARD_PAYLOAD_REFRESH_HOURS)
+    .create();
+  primeDashboardPayloadCache();
+  return { success: true, everyHours: DASHBOARD_PAYLOAD_REFRESH_HOURS };
+}
+
+// ============================================================================
+// READING
+// ============================================================================
+
+/**
+ * Get a precomputed page view
+ * @param {string} page - 'topsheet', 'schedule', 'sep' or 'comms'
+ * @returns {Object|null} The view, or null when not cached (caller aggregates live)
+ */
+function getDashboardPayload(page) {
+  try {
+    var cache = CacheService.getScriptCache();
+    var manifestJson = cache.get(DASHBOARD_PAYLOAD_MANIFEST_KEY);
+    if (!manifestJson) return null;
+
+    var manifest = JSON.parse(manifestJson);
+    if (!isDashboardPayloadFresh_(manifest)) return null;
+
+    var entry = manifest.pages[page];
+    if (!entry) return null;
+
+    var chunks = cache.getAll(entry.keys);
+    var parts = [];
+    for (var i = 0; i < entry.keys.length; i++) {
+      var chunk = chunks[entry.keys[i]];
+      if (!chunk) return null;  // Evicted - fall back to live data
+      parts.push(chunk);
+    }
+
+    var gzipped = Utilities.newBlob(Utilities.base64Decode(parts.join('')), 'application/x-gzip');
+    var json = Utilities.ungzip(gzipped).getDataAsString('UTF-8');
+    if (sha256Hex_(json) !== entry.sha256) {
+      Logger.log('getDashboardPayload: hash mismatch for ' + page);
+      return null;
+    }
+    return JSON.parse(json);
+  } catch (e) {
+    Logger.log('getDashboardPayload error: ' + e);
+    return null;
+  }
+}
+
+/**
+ * Drop the cached payloads after a write to data they summarize, and record
+ * the write time so payloads generated before it are not served again.
+ * Called by the milestone, SEP milestone and story write wrappers.
+ */
+function invalidateDashboardPayloads() {
+  try {
+    var cache = CacheService.getScriptCache();
+    var manifest = getDashboardPayloadManifest();
+    var keys = [DASHBOARD_PAYLOAD_MANIFEST_KEY];
+    if (manifest) {
+      Object.keys(manifest.pages).forEach(function(page) {
+        keys = keys.concat(manifest.pages[page].keys);
+      });
+    }
+    cache.removeAll(keys);
+    setProperty(DASHBOARD_PAYLOAD_INVALIDATED_PROPERTY, localTimestamp_(new Date()));
+  } catch (e) {
+    Logger.log('invalidateDashboardPayloads error: ' + e);
+  }
+}
+
+/**
+ * Whether a manifest may still be served: asOf is today (or within the
+ * configured max age) and it was generated after the last invalidating write
+ * @private
+ */
+function isDashboardPayloadFresh_(manifest) {
+  var asOf = String(manifest.asOf || manifest.generated || '').slice(0, 19);
+  var generated = String(manifest.generated || '').slice(0, 19);
+  if (!asOf || !generated) return false;
+
+  var maxAgeHours = parseFloat(getProperty(DASHBOARD_PAYLOAD_MAX_AGE_PROPERTY));
+  var now = new Date();
+  if (maxAgeHours > 0) {
+    if (now - new Date(asOf) > maxAgeHours * 3600 * 1000) return false;
+  } else if (asOf.slice(0, 10) !== localTimestamp_(now).slice(0, 10)) {
+    return false;
+  }
+
+  // Timestamps are local ISO strings, so they compare as text
+  var invalidated = getProperty(DASHBOARD_PAYLOAD_INVALIDATED_PROPERTY);
+  return !invalidated || generated > invalidated;
+}
+
+/**
+ * yyyy-MM-ddTHH:mm:ss in the script time zone (the format the exporter writes)
+ * @private
+ */
+function localTimestamp_(date) {
+  return Utilities.formatDate(date, Session.getScriptTimeZone(), "yyyy-MM-dd'T'HH:mm:ss");
+}
+
+/**
+ * Get the cached manifest (generated time, pages, sizes)
+ * @returns {Object|null} Manifest or null when not cached
+ */
+function getDashboardPayloadManifest() {
+  var manifestJson = CacheService.getScriptCache().get(DASHBOARD_PAYLOAD_MANIFEST_KEY);
+  return manifestJson ? JSON.parse(manifestJson) : null;
+}
+
+/**
+ * Lowercase hex SHA-256 of a UTF-8 string
+ * @private
+ */
+function sha256Hex_(text) {
+  var digest = Utilities.computeDigest(Utilities.DigestAlgorithm.SHA_256, text, Utilities.Charset.UTF_8);
+  return digest.map(function(b) {
+    return ('0' + (b & 0xff).toString(16)).slice(-2);
+  }).join('');
+}
@@ -36,7 +36,9 @@ function getOverdueMilestones() {
 
 // Statistics & Summaries
 function getMilestoneStats() {
-  return MoApi.getMilestoneStats();
+  // Precomputed topsheet view when cached (dashboard-payloads.gs)
+  var cached = getDashboardPayload('topsheet');
+  return cached ? cached.stats : MoApi.getMilestoneStats();
 }
 
 function getSolutionMilestoneSummary(solutionId) {
@@ -44,6 +46,10 @@ function getSolutionMilestoneSummary(solutionId) {
 }
 
 function getSolutionMilestoneTimeline(solutionId) {
+  var cached = getDashboardPayload('schedule');
+  if (cached && cached.timelines[solutionId]) {
+    return cached.timelines[solutionId];
+  }
   return MoApi.getSolutionMilestoneTimeline(solutionId);
 }
 
@@ -53,7 +59,8 @@ function getMultipleSolutionMilestones(solutionIds) {
 }
 
 function getMilestoneCountsBySolution() {
-  return MoApi.getMilestoneCountsBySolution();
+  var cached = getDashboardPayload('topsheet');
+  return cached ? cached.countsBySolution : MoApi.getMilestoneCountsBySolution();
 }
 
 function searchMilestones(query) {
@@ -70,7 +77,9 @@ function toggleMilestoneCompletion(milestoneId, completed) {
   if (!auth.authorized) {
     return { success: false, error: auth.message };
   }
-  return MoApi.toggleMilestoneCompletion(milestoneId, completed);
+  var result = MoApi.toggleMilestoneCompletion(milestoneId, completed);
+  invalidateDashboardPayloads();
+  return result;
 }
 
 function updateMilestone(milestoneId, updates) {
@@ -78,5 +87,7 @@ function updateMilestone(milestoneId, updates) {
   if (!auth.authorized) {
     return { success: false, error: auth.message };
   }
-  return MoApi.updateMilestone(milestoneId, updates);
+  var result = MoApi.updateMilestone(milestoneId, updates);
+  invalidateDashboardPayloads();
+  return result;
 }
@@ -108,7 +108,8 @@ function getSolutionsBySEPMilestone() {
 }
 
 function getSEPPipelineStats() {
-  return MoApi.getSEPPipelineStats();
+  var cached = getDashboardPayload('sep');
+  return cached ? cached.stats : MoApi.getSEPPipelineStats();
 }
 
 function updateSolutionSEPMilestone(solutionId, milestoneId, date) {
@@ -116,7 +117,9 @@ function updateSolutionSEPMilestone(solutionId, milestoneId, date) {
   if (!auth.authorized) {
     return { success: false, error: auth.message };
   }
-  return MoApi.updateSolutionSEPMilestone(solutionId, milestoneId, date);
+  var result = MoApi.updateSolutionSEPMilestone(solutionId, milestoneId, date);
+  invalidateDashboardPayloads();
+  return result;
 }
 
 function getSEPCycles() {
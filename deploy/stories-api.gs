@@ -19,7 +19,9 @@ function createStory(storyData) {
   if (!auth.authorized) {
     return { success: false, error: auth.message };
   }
-  return MoApi.createStory(storyData);
+  var result = MoApi.createStory(storyData);
+  invalidateDashboardPayloads();
+  return result;
 }
 
 function updateStory(storyId, updates) {
@@ -27,7 +29,9 @@ function updateStory(storyId, updates) {
   if (!auth.authorized) {
     return { success: false, error: auth.message };
   }
-  return MoApi.updateStory(storyId, updates);
+  var result = MoApi.updateStory(storyId, updates);
+  invalidateDashboardPayloads();
+  return result;
 }
 
 function deleteStory(storyId) {
@@ -35,7 +39,9 @@ function deleteStory(storyId) {
   if (!auth.authorized) {
     return { success: false, error: auth.message };
   }
-  return MoApi.deleteStory(storyId);
+  var result = MoApi.deleteStory(storyId);
+  invalidateDashboardPayloads();
+  return result;
 }
 
 // Pipeline Queries
@@ -65,6 +71,11 @@ function getPipelineStories() {
 
 // Coverage Analysis
 function getCoverageAnalysis(days) {
+  // The precomputed comms view covers one period (90 days)
+  var cached = getDashboardPayload('comms');
+  if (cached && cached.period_days === (days || 90)) {
+    return cached;
+  }
   return MoApi.getCoverageAnalysis(days);
 }
 
@@ -121,7 +132,9 @@ function updateStoryStatus(storyId, newStatus) {
   if (!auth.authorized) {
     return { success: false, error: auth.message };
   }
-  return MoApi.updateStoryStatus(storyId, newStatus);
+  var result = MoApi.updateStoryStatus(storyId, newStatus);
+  invalidateDashboardPayloads();
+  return result;
 }
 
 function searchStories(query) {
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Precompute Stakeholder Need x Solution Alignment Matrix
+=======================================================
+Scores every stakeholder need (extract_needs_data.py output) against every
+solution's Earthdata characteristics (extract_earthdata_content.py output)
+in one pass, instead of stakeholder-solution-alignment.gs looping over the
+needs inside checkResolutionMatch_() / checkFrequencyMatch_() on every
+report request.
+
+Each side is encoded once:
+- resolution, frequency: position in the same hierarchies as the .gs
+  (last token contained, -1 if none)
+- geographic domain: category codes; containment is checked once per pair
+  of distinct values
+- thematic areas: multi-hot over the solutions' thematic areas (a need has
+  an area when its free text mentions it)
+and the needs x solutions matrices come from NumPy broadcasting.
+
+Per pair, each dimension scores like calculateNeedAlignment_():
+    resolution  20 match / 10 partial or unknown order / 0 gap
+    frequency   20 match or exceeds / 5 gap
+    coverage    20 global or contained / 10 otherwise
+    thematic    20 shared area / 0
+A dimension counts only when the need states it; a solution that does not
+specify it scores 0 there. The score is points as a percentage of the
+applicable maximum (255 = nothing comparable).
+
+Outputs (next to the Earthdata CSV by default):
+    need-alignment-matrix.npz   - score and match flag matrices + labels
+    need-alignment-matrix.json  - same, matrices as base64 uint8 (row-major)
+
+Usage:
+    python alignment_matrix.py
+    python alignment_matrix.py --needs mo_db_needs.csv --solutions earthdata-content-for-merge.csv
+"""
+
+import argparse
+import base64
+import json
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from extract_needs_data import OUTPUT_DIR as NEEDS_DIR
+
+DATABASE_DIR = Path(__file__).parent.parent.parent / "database-files"
+NEEDS_CSV = NEEDS_DIR / "mo_db_needs.csv"
+SOLUTIONS_CSV = DATABASE_DIR / "earthdata-content-for-merge.csv"
+OUTPUT_STEM = DATABASE_DIR / "need-alignment-matrix"
+
+# Hierarchies from checkResolutionMatch_ / checkFrequencyMatch_ (finer/more frequent first)
+RESOLUTION_ORDER = ['<1', '1 m', '1-5', '5-10', '10-30', '30-100', '100-250', '250', '1 km', '>1']
+FREQUENCY_ORDER = ['hour', 'daily', 'day', 'week', 'month', 'quarter', 'year', 'annual']
+
+# Need free text searched for thematic areas
+NEED_TEXT_COLUMNS = ['feature_to_observe', 'application_description', 'strategic_objective']
+
+DIMENSIONS = ['resolution', 'frequency', 'coverage', 'thematic']
+DIMENSION_POINTS = 20
+NO_DATA = 255
+
+# Match flag bits (full match per dimension)
+FLAG_BITS = {name: 1 << i for i, name in enumerate(DIMENSIONS)}
+
+
+# =============================================================================
+# ENCODING
+# =============================================================================
+
+def clean_text(values):
+    """Lowercased, stripped strings ('' for missing and 'nan')"""
+    text = pd.Series(values, dtype=object).fillna('').astype(str).str.strip().str.lower()
+    return text.where(text != 'nan', '')
+
+
+def column_text(df, column):
+    """clean_text of a column, all '' when the column is missing"""
+    if column not in df.columns:
+        return pd.Series('', index=df.index)
+    return clean_text(df[column])
+
+
+def hierarchy_rank(text, order):
+    """Position of the last order token each value contains, -1 if none"""
+    if not len(text):
+        return np.empty(0, dtype=np.int8)
+    hits = np.column_stack([text.str.contains(token, regex=False).to_numpy() for token in order])
+    last = len(order) - 1 - np.argmax(hits[:, ::-1], axis=1)
+    return np.where(hits.any(axis=1), last, -1).astype(np.int8)
+
+
+def containment_matrix(need_text, solution_text):
+    """needs x solutions: one value contains the other (checked once per distinct pair)"""
+    need_codes, need_values = pd.factorize(need_text)
+    solution_codes, solution_values = pd.factorize(solution_text)
+    pairs = np.array([[bool(n) and bool(s) and (n in s or s in n) for s in solution_values]
+                      for n in need_values], dtype=bool).reshape(len(need_values), len(solution_values))
+    return pairs[need_codes[:, None], solution_codes[None, :]]
+
+
+def multi_hot(text, vocabulary):
+    """rows x vocabulary: value mentions the term"""
+    if not vocabulary:
+        return np.zeros((len(text), 0), dtype=bool)
+    return np.column_stack([text.str.contains(term, regex=False).to_numpy() for term in vocabulary])
+
+
+def thematic_vocabulary(solution_areas):
+    """Distinct thematic areas across solutions (comma-separated lists)"""
+    terms = solution_areas.str.split(',').explode().str.strip()
+    return sorted(set(terms[terms.ne('') & terms.notna()]))
+
+
+# =============================================================================
+# SCORING
+# =============================================================================
+
+def resolution_points(need_text, solution_text):
+    need_rank = hierarchy_rank(need_text, RESOLUTION_ORDER)[:, None]
+    solution_rank = hierarchy_rank(solution_text, RESOLUTION_ORDER)[None, :]
+    known = (need_rank >= 0) & (solution_rank >= 0)
+    diff = solution_rank.astype(int) - need_rank
+    contains = containment_matrix(need_text, solution_text)
+
+    full = np.where(known, diff <= 0, contains)
+    partial = np.where(known, np.abs(diff) <= 1, True)
+    points = np.where(full, DIMENSION_POINTS, np.where(partial, DIMENSION_POINTS // 2, 0))
+    return points, full
+
+
+def frequency_points(need_text, solution_text):
+    need_rank = hierarchy_rank(need_text, FREQUENCY_ORDER)[:, None]
+    solution_rank = hierarchy_rank(solution_text, FREQUENCY_ORDER)[None, :]
+    known = (need_rank >= 0) & (solution_rank >= 0)
+    full = np.where(known, solution_rank <= need_rank, containment_matrix(need_text, solution_text))
+    return np.where(full, DIMENSION_POINTS, 5), full
+
+
+def coverage_points(need_text, solution_text):
+    is_global = solution_text.str.contains('global', regex=False).to_numpy()[None, :]
+    full = is_global | containment_matrix(need_text, solution_text)
+    return np.where(full, DIMENSION_POINTS, DIMENSION_POINTS // 2), full
+
+
+def thematic_points(need_hot, solution_hot):
+    full = (need_hot.astype(np.int32) @ solution_hot.T.astype(np.int32)) > 0
+    return np.where(full, DIMENSION_POINTS, 0), full
+
+
+def alignment_matrix(needs, solutions):
+    """
+    (scores, flags, per-dimension points) for needs x solutions.
+
+    scores: uint8 percent of applicable points, NO_DATA where no dimension applies
+    flags:  uint8 FLAG_BITS of the dimensions that fully match
+    """
+    need_cols = {
+        'resolution': column_text(needs, 'horizontal_resolution'),
+        'frequency': column_text(needs, 'temporal_frequency'),
+        'coverage': column_text(needs, 'geographic_coverage'),
+    }
+    solution_cols = {
+        'resolution': column_text(solutions, 'horizontal_resolution'),
+        'frequency': column_text(solutions, 'temporal_frequency'),
+        'coverage': column_text(solutions, 'geographic_domain'),
+    }
+    need_text = pd.Series('', index=needs.index)
+    for name in NEED_TEXT_COLUMNS:
+        need_text = need_text + ' ' + column_text(needs, name)
+    areas = column_text(solutions, 'thematic_areas')
+    vocabulary = thematic_vocabulary(areas)
+    need_hot = multi_hot(need_text, vocabulary)
+    solution_hot = np.array([[term in {a.strip() for a in value.split(',')} for term in vocabulary]
+                             for value in areas], dtype=bool).reshape(len(areas), len(vocabulary))
+
+    scorers = {
+        'resolution': resolution_points,
+        'frequency': frequency_points,
+        'coverage': coverage_points,
+    }
+    shape = (len(needs), len(solutions))
+    total = np.zeros(shape, dtype=np.int32)
+    maximum = np.zeros(shape, dtype=np.int32)
+    flags = np.zeros(shape, dtype=np.uint8)
+    points = {}
+
+    for name in DIMENSIONS:
+        if name == 'thematic':
+            dim_points, full = thematic_points(need_hot, solution_hot)
+            need_states = need_hot.any(axis=1)
+            solution_states = solution_hot.any(axis=1)
+        else:
+            dim_points, full = scorers[name](need_cols[name], solution_cols[name])
+            need_states = (need_cols[name] != '').to_numpy()
+            solution_states = (solution_cols[name] != '').to_numpy()
+
+        applies = np.broadcast_to(need_states[:, None], shape)
+        scored = applies & solution_states[None, :]
+        dim_points = np.where(scored, dim_points, 0)
+        total += dim_points
+        maximum += np.where(applies, DIMENSION_POINTS, 0)
+        flags |= np.where(scored & full, FLAG_BITS[name], 0).astype(np.uint8)
+        points[name] = dim_points.astype(np.uint8)
+
+    # Integer Math.round(100 * total / maximum): halves round up, as in the .gs
+    scores = np.where(maximum > 0, (200 * total + maximum) // np.maximum(2 * maximum, 1), NO_DATA)
+    return scores.astype(np.uint8), flags, points
+
+
+# =============================================================================
+# ARTIFACT
+# =============================================================================
+
+def labels(df, column, fallback):
+    values = df[column] if column in df.columns else pd.Series(fallback, index=df.index)
+    return values.fillna('').astype(str).tolist()
+
+
+def write_artifact(stem, needs, solutions, scores, flags, points):
+    """Write the .npz and .json artifacts; returns their paths"""
+    stem = Path(stem)
+    stem.parent.mkdir(parents=True, exist_ok=True)
+    need_ids = labels(needs, 'need_id', [f'row-{i}' for i in range(len(needs))])
+    need_solutions = labels(needs, 'solution', '')
+    solution_keys = labels(solutions, 'solution_key', [f'row-{i}' for i in range(len(solutions))])
+
+    npz_path = stem.with_suffix('.npz')
+    np.savez_compressed(npz_path, scores=scores, flags=flags, need_ids=np.array(need_ids),
+                        need_solutions=np.array(need_solutions), solution_keys=np.array(solution_keys),
+                        **{f'points_{name}': values for name, values in points.items()})
+
+    json_path = stem.with_suffix('.json')
+    payload = {
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'shape': list(scores.shape),
+        'needs': need_ids,
+        'needSolutions': need_solutions,
+        'solutions': solution_keys,
+        'dimensions': DIMENSIONS,
+        'flagBits': FLAG_BITS,
+        'noData': NO_DATA,
+        'encoding': 'base64 uint8, row-major (needs x solutions)',
+        'scores': base64.b64encode(scores.tobytes()).decode('ascii'),
+        'flags': base64.b64encode(flags.tobytes()).decode('ascii'),
+    }
+    json_path.write_text(json.dumps(payload, ensure_ascii=False), encoding='utf-8')
+    return npz_path, json_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompute the need x solution alignment matrix')
+    parser.add_argument('--needs', type=Path, default=NEEDS_CSV, help='MO-DB_Needs CSV (extract_needs_data.py)')
+    parser.add_argument('--solutions', type=Path, default=SOLUTIONS_CSV,
+                        help='Earthdata characteristics CSV (extract_earthdata_content.py)')
+    parser.add_argument('--output', type=Path, default=OUTPUT_STEM, help='Output path without extension')
+    args = parser.parse_args()
+
+    for path in (args.needs, args.solutions):
+        if not path.exists():
+            raise SystemExit(f"ERROR: Input file not found: {path}")
+
+    needs = pd.read_csv(args.needs, dtype=str)
+    solutions = pd.read_csv(args.solutions, dtype=str)
+    print(f"Needs: {len(needs)}  Solutions: {len(solutions)}")
+
+    scores, flags, points = alignment_matrix(needs, solutions)
+    npz_path, json_path = write_artifact(args.output, needs, solutions, scores, flags, points)
+
+    comparable = scores != NO_DATA
+    if comparable.any():
+        print(f"Comparable pairs: {comparable.sum():,} of {scores.size:,}, "
+              f"mean score {scores[comparable].mean():.1f}")
+    for name in DIMENSIONS:
+        print(f"  {name}: {np.count_nonzero(flags & FLAG_BITS[name]):,} full matches")
+    print(f"Wrote: {npz_path}")
+    print(f"Wrote: {json_path}")
+
+
+if __name__ == '__main__':
+    main()
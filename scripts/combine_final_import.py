@@ -3,14 +3,23 @@
 Combine All Updates + Meeting References for Final Import
 ==========================================================
 Merges extracted updates with meeting references for complete import.
+Near-duplicate updates reported by several sources in the same week are
+collapsed (see dedupe_updates.py) and listed on a Duplicates tab.
 
-Usage: python combine_final_import.py
+Usage: python combine_final_import.py [--dedup-window DAYS] [--no-dedup]
+                                     [--archive-before YEAR] [--store [DB]]
 """
 
+import argparse
 import pandas as pd
 from pathlib import Path
-from datetime import datetime
-import re
+
+from dedupe_updates import dedupe_updates, DEFAULT_WINDOW_DAYS, DEFAULT_THRESHOLD
+from mo_db_store import DB_FILE, store_output
+from update_shards import (
+    sanitize_columns, parse_meeting_dates, write_year_shards, print_shard_counts,
+    DEFAULT_ARCHIVE_BEFORE,
+)
 
 # Input files
 UPDATES_FILE = Path(r"C:\Users\cjtucke3\Documents\Personal\MO-development\nsite-mo-viewer\database-files\all_updates_import.xlsx")
@@ -26,16 +35,6 @@ KEEP_COLUMNS = [
     'created_at', 'created_by'
 ]
 
-# Illegal characters for Excel
-ILLEGAL_CHARS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
-
-
-def sanitize_text(text):
-    """Remove characters that are illegal in Excel"""
-    if pd.isna(text):
-        return ''
-    return ILLEGAL_CHARS_RE.sub('', str(text))
-
 
 def load_all_sheets(file_path, source_name):
     """Load all sheets from an Excel file"""
@@ -60,25 +59,19 @@ def load_all_sheets(file_path, source_name):
     return combined
 
 
-def get_year_from_date(date_str):
-    """Extract year from date string"""
-    if pd.isna(date_str):
-        return None
-
-    try:
-        if isinstance(date_str, str):
-            match = re.match(r'(\d{4})', str(date_str))
-            if match:
-                return int(match.group(1))
-        elif hasattr(date_str, 'year'):
-            return date_str.year
-    except:
-        pass
-
-    return None
-
-
 def main():
+    parser = argparse.ArgumentParser(description='Combine updates + meeting references for final import')
+    parser.add_argument('--dedup-window', type=int, default=DEFAULT_WINDOW_DAYS,
+                        help=f'Days within which near-duplicate updates are merged (default: {DEFAULT_WINDOW_DAYS})')
+    parser.add_argument('--dedup-threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Min text similarity for merging (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--no-dedup', action='store_true', help='Keep near-duplicate updates')
+    parser.add_argument('--archive-before', type=int, default=DEFAULT_ARCHIVE_BEFORE,
+                        help=f'Years before this go to the Archive tab (default: {DEFAULT_ARCHIVE_BEFORE})')
+    parser.add_argument('--store', nargs='?', const=DB_FILE, type=Path, metavar='DB',
+                        help=f'Also upsert the updates into the local store (default: {DB_FILE})')
+    args = parser.parse_args()
+
     print("Combining all updates + meeting references for final import...")
     print()
 
@@ -103,12 +96,21 @@ def main():
             df_combined[col] = ''
 
     # Sanitize text
-    for col in ['update_text', 'source_document', 'source_tab']:
-        if col in df_combined.columns:
-            df_combined[col] = df_combined[col].apply(sanitize_text)
+    sanitize_columns(df_combined)
+
+    # Collapse near-duplicates across sources
+    df_duplicates = pd.DataFrame()
+    if not args.no_dedup:
+        before = len(df_combined)
+        df_combined, df_duplicates = dedupe_updates(
+            df_combined, args.dedup_window, args.dedup_threshold
+        )
+        print(f"\nNear-duplicates merged: {before - len(df_combined)} "
+              f"({len(df_duplicates)} clusters, {args.dedup_window}-day window)")
 
     # Get year
-    df_combined['_year'] = df_combined['meeting_date'].apply(get_year_from_date)
+    parsed_dates = parse_meeting_dates(df_combined['meeting_date'])
+    years = parsed_dates[1]
 
     # Stats
     print("\nBy source:")
@@ -117,7 +119,7 @@ def main():
         print(f"  {source}: {count}")
 
     print("\nBy year:")
-    year_counts = df_combined['_year'].value_counts().sort_index(ascending=False)
+    year_counts = years.value_counts().sort_index(ascending=False)
     for year, count in year_counts.head(10).items():
         if pd.notna(year):
             print(f"  {int(year)}: {count}")
@@ -127,66 +129,26 @@ def main():
     for sol, count in sol_counts.head(15).items():
         print(f"  {sol}: {count}")
 
-    # Split by year
-    df_2026 = df_combined[df_combined['_year'] == 2026].copy()
-    df_2025 = df_combined[df_combined['_year'] == 2025].copy()
-    df_2024 = df_combined[df_combined['_year'] == 2024].copy()
-    df_archive = df_combined[df_combined['_year'] < 2024].copy()
-    df_unknown = df_combined[df_combined['_year'].isna()].copy()
-
-    if len(df_unknown) > 0:
-        print(f"\n{len(df_unknown)} entries with unknown dates added to Archive")
-        df_archive = pd.concat([df_archive, df_unknown], ignore_index=True)
-
-    # Sort each by date, then solution
-    for df in [df_2026, df_2025, df_2024, df_archive]:
-        if len(df) > 0:
-            df['meeting_date'] = pd.to_datetime(df['meeting_date'], errors='coerce')
-            df.sort_values(['meeting_date', 'solution_id'], ascending=[False, True], inplace=True)
-            df['meeting_date'] = df['meeting_date'].dt.strftime('%Y-%m-%d')
-
-    # Clean up and select columns
-    for df in [df_2026, df_2025, df_2024, df_archive]:
-        for col in ['_year', '_source']:
-            if col in df.columns:
-                df.drop(col, axis=1, inplace=True)
+    unknown = years.isna().sum()
+    if unknown > 0:
+        print(f"\n{unknown} entries with unknown dates added to Archive")
 
-    df_2026 = df_2026[KEEP_COLUMNS] if len(df_2026) > 0 else pd.DataFrame(columns=KEEP_COLUMNS)
-    df_2025 = df_2025[KEEP_COLUMNS] if len(df_2025) > 0 else pd.DataFrame(columns=KEEP_COLUMNS)
-    df_2024 = df_2024[KEEP_COLUMNS] if len(df_2024) > 0 else pd.DataFrame(columns=KEEP_COLUMNS)
-    df_archive = df_archive[KEEP_COLUMNS] if len(df_archive) > 0 else pd.DataFrame(columns=KEEP_COLUMNS)
+    # Split by year and write one tab per year (+ Duplicates)
+    extra_sheets = [('Duplicates', df_duplicates)] if len(df_duplicates) > 0 else []
+    shards = write_year_shards(df_combined, OUTPUT_FILE, KEEP_COLUMNS,
+                               archive_before=args.archive_before, extra_sheets=extra_sheets,
+                               parsed_dates=parsed_dates)
 
     print(f"\n{'=' * 60}")
     print("FINAL COUNTS")
     print(f"{'=' * 60}")
-    print(f"  2026 tab: {len(df_2026)}")
-    print(f"  2025 tab: {len(df_2025)}")
-    print(f"  2024 tab: {len(df_2024)}")
-    print(f"  Archive tab: {len(df_archive)}")
-    print(f"  TOTAL: {len(df_2026) + len(df_2025) + len(df_2024) + len(df_archive)}")
-
-    # Write to Excel
-    OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
-
-    with pd.ExcelWriter(OUTPUT_FILE, engine='openpyxl') as writer:
-        df_2026.to_excel(writer, sheet_name='2026', index=False)
-        df_2025.to_excel(writer, sheet_name='2025', index=False)
-        df_2024.to_excel(writer, sheet_name='2024', index=False)
-        df_archive.to_excel(writer, sheet_name='Archive', index=False)
-
-        # Column widths
-        for sheet_name in ['2026', '2025', '2024', 'Archive']:
-            worksheet = writer.sheets[sheet_name]
-            widths = {
-                'update_id': 20, 'solution_id': 15, 'update_text': 80,
-                'source_document': 25, 'source_category': 15, 'source_url': 50,
-                'source_tab': 30, 'meeting_date': 12, 'created_at': 25, 'created_by': 25
-            }
-            for idx, col in enumerate(KEEP_COLUMNS):
-                col_letter = chr(65 + idx) if idx < 26 else f"A{chr(65 + idx - 26)}"
-                worksheet.column_dimensions[col_letter].width = widths.get(col, 15)
+    print_shard_counts(shards, ' tab')
+    if len(df_duplicates) > 0:
+        print(f"  Duplicates tab: {len(df_duplicates)} merged clusters")
 
     print(f"\nFinal import file: {OUTPUT_FILE}")
+    if args.store:
+        store_output('updates', df_combined[KEEP_COLUMNS], args.store)
 
 
 if __name__ == '__main__':
@@ -8,11 +8,16 @@ Usage: python combine_monthly_updates.py
 """
 
 import pandas as pd
-import re
 from pathlib import Path
 import uuid
 from datetime import datetime
 
+from excel_export import write_xlsx
+from text_normalization import (
+    clean_update_text, is_meaningful_update,
+    clean_update_text_series, is_meaningful_update_series,
+)
+
 # Input files
 PPTX_FILE = Path(r"C:\Users\cjtucke3\Documents\Personal\MO-development\nsite-mo-viewer\database-files\monthly_updates_import.xlsx")
 DOCX_FILE = Path(r"C:\Users\cjtucke3\Documents\Personal\MO-development\nsite-mo-viewer\database-files\monthly_docx_updates_import.csv")
@@ -27,6 +32,9 @@ KEEP_COLUMNS = [
     'created_at', 'created_by'
 ]
 
+# Boilerplate rule set in text_normalization
+TEXT_PROFILE = 'monthly'
+
 
 def generate_update_id():
     """Generate a unique update ID"""
@@ -35,103 +43,27 @@ def generate_update_id():
     return f"UPD_{date_str}_{random_part}"
 
 
-def clean_update_text(text):
-    """Clean boilerplate and standardize formatting"""
-    if not text or pd.isna(text):
-        return ''
-
-    text = str(text)
-
-    # Remove common boilerplate patterns
-    removals = [
-        r'Project Status\s*\n?',
-        r'Project Phase:\s*(Operations|Implementation|Planning|Development|Production \+ Development)\s*\n?',
-        r'Project Description\s*\n?',
-        r'Solution Products?\s*\(acronyms and definitions\):\s*',
-        r'Solution Products?:\s*\n?',
-        # Clean up the long question headers (various formats)
-        r'What have I done to ensure that my solution is the right fit for end users and/or is achieving its intended impact\?[^\n]*\n?',
-        r'What have I done to ensure that my solution is the right fit[^\n]*\n?',
-        r'What programmatic/project timeline milestones have occurred this month\?\s*\n?',
-        r'What software/hardware/location/product development milestones have occurred this month\?\s*\n?',
-        r'The SNWG MO can help me with this roadblock or challenge:\s*\n?',
-        # Simplified versions with markdown
-        r'\*\*What have I done.*?\*\*\s*\n?',
-        r'\*\*What programmatic.*?\*\*\s*\n?',
-        r'\*\*What software.*?\*\*\s*\n?',
-        r'\*\*The SNWG MO can help.*?\*\*\s*\n?',
-        # Without markdown
-        r'What have I done to ensure[^\n]*\?\s*\n?',
-        r'What programmatic[^\n]*\?\s*\n?',
-        r'What software[^\n]*\?\s*\n?',
-        r'Production status\?\s*\n?',
-        # Other boilerplate
-        r'\(e\.?g\.?,?\s*user engagement[^\)]*\)\s*\n?',
-        r'products?\s*\(acronyms and definitions\):\s*If needed\s*\n?',
-        r'/Implementation\s*\n?',
-        r'/Operations\s*\n?',
-        r'Provided by the SNWG MO\s*\n?',
-        r'^Today\s*\n?',
-    ]
-
-    for pattern in removals:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-
-    # Clean up excessive whitespace
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    text = re.sub(r'^\s+', '', text)
-    text = re.sub(r'\s+$', '', text)
-
-    return text.strip()
-
-
-def is_meaningful_update(text):
-    """Check if update has real content"""
-    if not text or len(text) < 30:
-        return False
-
-    # Skip if mostly boilerplate
-    boilerplate_only = [
-        r'^n/a\s*$',
-        r'^none\s*$',
-        r'^no\s+update\s*$',
-        r'^tbd\s*$',
-        r'^operations\s*$',
-        r'^provided\s+by\s+the\s+snwg',
-        r'^today\s*$',
-    ]
-
-    text_lower = text.lower().strip()
-    for pattern in boilerplate_only:
-        if re.match(pattern, text_lower):
-            return False
-
-    return True
-
-
 def consolidate_updates(df):
     """Consolidate multiple updates for same solution+date into one"""
     consolidated = []
 
+    # Clean the whole history in one vectorized pass, then drop empty updates
+    df = df.copy()
+    df['_clean_text'] = clean_update_text_series(df['update_text'], TEXT_PROFILE)
+    df = df[is_meaningful_update_series(df['_clean_text'], TEXT_PROFILE)]
+
     # Group by solution and date
     for (solution_id, meeting_date), group in df.groupby(['solution_id', 'meeting_date']):
         # Combine all update texts
-        texts = []
-        for _, row in group.iterrows():
-            text = clean_update_text(row['update_text'])
-            if text and is_meaningful_update(text):
-                texts.append(text)
-
-        if not texts:
-            continue
+        texts = group['_clean_text'].tolist()
 
         # Join with separator
         combined_text = '\n\n'.join(texts)
 
         # Clean again after combining
-        combined_text = clean_update_text(combined_text)
+        combined_text = clean_update_text(combined_text, TEXT_PROFILE)
 
-        if not is_meaningful_update(combined_text):
+        if not is_meaningful_update(combined_text, TEXT_PROFILE):
             continue
 
         # Use first row's metadata
@@ -219,19 +151,7 @@ def main():
     # Write to Excel
     OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-    with pd.ExcelWriter(OUTPUT_FILE, engine='openpyxl') as writer:
-        df_consolidated.to_excel(writer, sheet_name='Updates', index=False)
-
-        # Auto-adjust column widths
-        worksheet = writer.sheets['Updates']
-        for idx, col in enumerate(df_consolidated.columns):
-            max_length = max(
-                df_consolidated[col].astype(str).map(len).max(),
-                len(col)
-            )
-            adjusted_width = min(max_length + 2, 60)
-            col_letter = chr(65 + idx) if idx < 26 else f"A{chr(65 + idx - 26)}"
-            worksheet.column_dimensions[col_letter].width = adjusted_width
+    write_xlsx(OUTPUT_FILE, {'Updates': df_consolidated}, max_width=60)
 
     print(f"\nConsolidated file written to: {OUTPUT_FILE}")
 
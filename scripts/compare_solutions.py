@@ -9,6 +9,8 @@ import pandas as pd
 from pathlib import Path
 import sys
 
+from row_diff import normalize_frame
+
 sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
 def main():
@@ -40,7 +42,7 @@ def main():
     print("-" * 50)
     for col in contact_cols:
         if col in df.columns:
-            filled = df[col].notna() & (df[col].astype(str).str.strip() != '')
+            filled = normalize_frame(df, [col])[col] != ''
             pct = filled.sum() / len(df) * 100
             print(f"  {col:35} {filled.sum():3}/{len(df)} ({pct:5.1f}%)")
         else:
@@ -50,7 +52,7 @@ def main():
     print("-" * 50)
     for col in status_cols:
         if col in df.columns:
-            filled = df[col].notna() & (df[col].astype(str).str.strip() != '')
+            filled = normalize_frame(df, [col])[col] != ''
             pct = filled.sum() / len(df) * 100
             print(f"  {col:35} {filled.sum():3}/{len(df)} ({pct:5.1f}%)")
         else:
@@ -60,7 +62,7 @@ def main():
     print("-" * 50)
     for col in milestone_cols:
         if col in df.columns:
-            filled = df[col].notna() & (df[col].astype(str).str.strip() != '')
+            filled = normalize_frame(df, [col])[col] != ''
             pct = filled.sum() / len(df) * 100
             print(f"  {col:35} {filled.sum():3}/{len(df)} ({pct:5.1f}%)")
         else:
@@ -71,24 +73,13 @@ def main():
     print("SOLUTIONS MISSING KEY CONTACTS")
     print("=" * 80)
 
-    for _, row in df.iterrows():
-        name = row['name']
-        missing = []
-
-        if 'solution_lead' in df.columns:
-            if pd.isna(row['solution_lead']) or str(row['solution_lead']).strip() == '':
-                missing.append('lead')
-
-        if 'ra_representative' in df.columns:
-            if pd.isna(row['ra_representative']) or str(row['ra_representative']).strip() == '':
-                missing.append('R&A')
-
-        if 'earth_action_advocate' in df.columns:
-            if pd.isna(row['earth_action_advocate']) or str(row['earth_action_advocate']).strip() == '':
-                missing.append('EAA')
-
-        if missing:
-            print(f"  {name:45} missing: {', '.join(missing)}")
+    required = {'solution_lead': 'lead', 'ra_representative': 'R&A', 'earth_action_advocate': 'EAA'}
+    present = [col for col in required if col in df.columns]
+    blank = normalize_frame(df, present) == ''
+    names = df['name'].to_numpy()
+    for i in blank.any(axis=1).to_numpy().nonzero()[0]:
+        missing = [required[col] for col in present if blank[col].iat[i]]
+        print(f"  {names[i]:45} missing: {', '.join(missing)}")
 
 if __name__ == '__main__':
     main()
@@ -13,15 +13,53 @@ Before: 80 columns
 After: ~50 columns + related tables
 
 Usage:
-    python consolidate_solutions_db.py [--dry-run]
+    python consolidate_solutions_db.py [--dry-run] [--store [DB]]
 """
 
+import numpy as np
 import pandas as pd
 import argparse
 from datetime import datetime
 from pathlib import Path
 import re
 
+from date_parsing import format_dates
+from mo_db_store import DB_FILE, store_output
+
+# Milestone types in Solutions, in output order; the four decision points
+# have a date plus memo date/URL, the rest a date plus URL
+MILESTONE_TYPES = ['science_sow', 'project_plan', 'ipa', 'icd', 'tta', 'deep_dive',
+                   'atp', 'f2i', 'orr', 'closeout']
+MEMO_MILESTONES = {'atp', 'f2i', 'orr', 'closeout'}
+MILESTONE_FIELDS = ['date', 'url', 'memo_date', 'memo_url']
+
+PERSON_COLUMNS = ['solution_lead', 'ra_representative', 'earth_action_advocate']
+
+# Known name mappings (Solutions DB name -> Key Messages name)
+KEY_MESSAGE_ALIASES = {
+    'nisar downlink': 'additional nisar downlink station',
+    'hls-ll': 'hls low latency',
+    'air quality - pandora sensors': 'aq forecasts and pandora sensors',
+    'air quality - gmao': 'atmospheric composition using geos-5',
+    'vlm for coastal applications': 'vlm',
+    'opera dswx': 'opera surface water extent',
+    'opera disp': 'opera land surface deformation',
+    'opera dist': 'opera land surface disturbance',
+    'icesat-2 boreal biomass': 'icesat-2 quick look products',
+    'gcc from satcorps': 'global cloud composite',
+    'gacr': 'gacr',
+    'tempo': 'tempo nrt products enhanced',
+}
+
+KEY_MESSAGE_COLUMNS = ['key_messages', 'focus_type', 'industry_connections',
+                       'scientific_advancement', 'agency_use_impact', 'public_comms_links']
+
+
+def milestone_columns(m_type):
+    """{field: Solutions column} for one milestone type"""
+    fields = ['date', 'memo_date', 'memo_url'] if m_type in MEMO_MILESTONES else ['date', 'url']
+    return {field: f'{m_type}_{field}' for field in fields}
+
 
 def extract_milestones(solutions_df):
     """
@@ -38,97 +76,108 @@ def extract_milestones(solutions_df):
     - f2i (date, memo_date, memo_url)
     - orr (date, memo_date, memo_url)
     - closeout (date, memo_date, memo_url)
+
+    The column groups are stacked into one row per (solution, type); a
+    milestone is kept when any of its columns has a value. Solutions with a
+    missing or blank solution_id are skipped (the row-by-row version kept
+    NaN ids, since NaN is truthy).
     """
-    milestones = []
-
-    milestone_types = [
-        ('science_sow', ['science_sow_date', 'science_sow_url'], []),
-        ('project_plan', ['project_plan_date', 'project_plan_url'], []),
-        ('ipa', ['ipa_date', 'ipa_url'], []),
-        ('icd', ['icd_date', 'icd_url'], []),
-        ('tta', ['tta_date', 'tta_url'], []),
-        ('deep_dive', ['deep_dive_date', 'deep_dive_url'], []),
-        ('atp', ['atp_date'], ['atp_memo_date', 'atp_memo_url']),
-        ('f2i', ['f2i_date'], ['f2i_memo_date', 'f2i_memo_url']),
-        ('orr', ['orr_date'], ['orr_memo_date', 'orr_memo_url']),
-        ('closeout', ['closeout_date'], ['closeout_memo_date', 'closeout_memo_url']),
-    ]
+    columns = pd.MultiIndex.from_tuples(
+        [(m_type, field) for m_type in MILESTONE_TYPES for field in MILESTONE_FIELDS],
+        names=['milestone_type', 'field']
+    )
+    sources = {(m_type, field): col for m_type in MILESTONE_TYPES
+               for field, col in milestone_columns(m_type).items()}
+    wide = pd.DataFrame(
+        {key: solutions_df[sources[key]] if sources.get(key) in solutions_df.columns else None
+         for key in columns},
+        index=solutions_df.index, columns=columns
+    ).astype(object)
+
+    ids = solutions_df['solution_id'] if 'solution_id' in solutions_df.columns else pd.Series(None, index=solutions_df.index)
+    wide = wide[ids.notna() & ids.astype(str).ne('')]
+
+    long = wide.stack(level='milestone_type', future_stack=True)
+    long = long[long.notna().any(axis=1)].reset_index(level='milestone_type')
+
+    # Solution row order, then milestone type order
+    order = pd.Categorical(long['milestone_type'], categories=MILESTONE_TYPES, ordered=True)
+    long = long.assign(_row=solutions_df.index.get_indexer(long.index), _type=order.codes)
+    long = long.sort_values(['_row', '_type'], kind='stable')
+
+    today = datetime.now().strftime('%Y-%m-%d')
+    names = solutions_df['name'] if 'name' in solutions_df.columns else pd.Series('', index=solutions_df.index)
+    milestones = pd.DataFrame({
+        'milestone_id': 'MS-' + pd.Series(range(1, len(long) + 1), dtype='int64').astype(str).str.zfill(4).to_numpy(),
+        'solution_id': ids[long.index].to_numpy(),
+        'solution_name': names[long.index].to_numpy(),
+        'milestone_type': long['milestone_type'].to_numpy(),
+        'milestone_name': long['milestone_type'].str.replace('_', ' ').str.title().to_numpy(),
+        'date': format_dates(long['date'].reset_index(drop=True)).to_numpy(),
+        'url': strip_text(long['url']).to_numpy(),
+        'memo_date': format_dates(long['memo_date'].reset_index(drop=True)).to_numpy(),
+        'memo_url': strip_text(long['memo_url']).to_numpy(),
+        'status': milestone_statuses(long['date']).to_numpy(),
+        'notes': '',
+        'created_date': today,
+    })
+    return milestones
+
+
+def strip_text(values):
+    """Cells as stripped text, missing ''"""
+    return values.map(str).str.strip().where(values.notna(), '')
+
+
+def milestone_statuses(dates, now=None):
+    """
+    Milestone status from each date: completed (on or before now),
+    scheduled (later), pending (missing or not a date). An empty-string
+    date is pending too; determine_milestone_status() used to call it
+    scheduled, because pd.to_datetime('') is NaT and NaT <= now is False.
+    """
+    now = now or datetime.now()
+    parseable = dates.map(lambda v: isinstance(v, (str, datetime)))
+    parsed = pd.to_datetime(dates.where(parseable), errors='coerce', format='mixed')
+    status = pd.Series('pending', index=dates.index, dtype=object)
+    status[parsed.notna() & (parsed <= now)] = 'completed'
+    status[parsed.notna() & (parsed > now)] = 'scheduled'
+    return status
+
 
-    milestone_id = 0
-
-    for idx, row in solutions_df.iterrows():
-        solution_id = row.get('solution_id', '')
-        solution_name = row.get('name', '')
-
-        if not solution_id:
-            continue
-
-        for m_type, date_url_cols, memo_cols in milestone_types:
-            # Check if any data exists for this milestone type
-            has_data = False
-
-            date_col = f'{m_type}_date'
-            url_col = f'{m_type}_url' if m_type not in ['atp', 'f2i', 'orr', 'closeout'] else None
-            memo_date_col = f'{m_type}_memo_date' if m_type in ['atp', 'f2i', 'orr', 'closeout'] else None
-            memo_url_col = f'{m_type}_memo_url' if m_type in ['atp', 'f2i', 'orr', 'closeout'] else None
-
-            date_val = row.get(date_col) if date_col in row.index else None
-            url_val = row.get(url_col) if url_col and url_col in row.index else None
-            memo_date_val = row.get(memo_date_col) if memo_date_col and memo_date_col in row.index else None
-            memo_url_val = row.get(memo_url_col) if memo_url_col and memo_url_col in row.index else None
-
-            # Check for non-null values
-            if pd.notna(date_val) or pd.notna(url_val) or pd.notna(memo_date_val) or pd.notna(memo_url_val):
-                has_data = True
-
-            if has_data:
-                milestone_id += 1
-                milestones.append({
-                    'milestone_id': f'MS-{milestone_id:04d}',
-                    'solution_id': solution_id,
-                    'solution_name': solution_name,
-                    'milestone_type': m_type,
-                    'milestone_name': m_type.replace('_', ' ').title(),
-                    'date': format_date(date_val),
-                    'url': str(url_val).strip() if pd.notna(url_val) else '',
-                    'memo_date': format_date(memo_date_val),
-                    'memo_url': str(memo_url_val).strip() if pd.notna(memo_url_val) else '',
-                    'status': determine_milestone_status(date_val),
-                    'notes': '',
-                    'created_date': datetime.now().strftime('%Y-%m-%d')
-                })
-
-    return pd.DataFrame(milestones)
-
-
-def format_date(date_val):
-    """Format date value to YYYY-MM-DD string."""
-    if pd.isna(date_val) or date_val is None:
-        return ''
-    if isinstance(date_val, datetime):
-        return date_val.strftime('%Y-%m-%d')
-    if isinstance(date_val, str):
-        return date_val.strip()
-    return str(date_val)
-
-
-def determine_milestone_status(date_val):
-    """Determine milestone status based on date."""
-    if pd.isna(date_val) or date_val is None:
-        return 'pending'
-
-    try:
-        if isinstance(date_val, str):
-            date_obj = pd.to_datetime(date_val)
-        else:
-            date_obj = date_val
-
-        if date_obj <= datetime.now():
-            return 'completed'
-        else:
-            return 'scheduled'
-    except:
-        return 'pending'
+def normalize_person(values):
+    """Name key for contact matching: stripped, lowercased"""
+    return values.astype(str).str.strip().str.lower()
+
+
+def contact_lookup(contacts_df):
+    """
+    Name key -> contact_id from contacts: "first last" plus an alias from
+    the email prefix ("jane.doe@..." -> "jane doe"). Later rows win.
+    """
+    def column(name):
+        if name not in contacts_df.columns:
+            return pd.Series('', index=contacts_df.index, dtype=object)
+        return contacts_df[name].astype(object).where(contacts_df[name].notna(), '').astype(str)
+
+    contact_ids = contacts_df['contact_id'] if 'contact_id' in contacts_df.columns else pd.Series(None, index=contacts_df.index)
+    full_names = normalize_person(column('first_name') + ' ' + column('last_name'))
+
+    email = column('email')
+    email = email.where(email.ne(''), column('primary_email')).str.lower()
+    email_names = email.str.split('@').str[0].str.replace('.', ' ', regex=False)
+    email_names = email_names.where(email.str.contains('@', regex=False), '')
+
+    # Each row's email alias goes after its full name, so later entries win
+    row = np.arange(len(contacts_df))
+    keys = pd.DataFrame({
+        'key': np.concatenate([full_names.to_numpy(), email_names.to_numpy()]),
+        'contact_id': np.concatenate([contact_ids.to_numpy(), contact_ids.to_numpy()]),
+        '_order': np.concatenate([row * 2, row * 2 + 1]),
+    })
+    keys = keys[keys['key'].ne('') & keys['contact_id'].notna() & keys['contact_id'].astype(str).ne('')]
+    keys = keys.sort_values('_order').drop_duplicates('key', keep='last')
+    return keys.set_index('key')['contact_id']
 
 
 def map_contacts(solutions_df, contacts_df):
@@ -136,41 +185,49 @@ def map_contacts(solutions_df, contacts_df):
     Map person name fields to contact_ids where possible.
     Returns mapping dict and list of unmatched names.
     """
-    # Build lookup from contacts
-    contact_lookup = {}
-    for _, row in contacts_df.iterrows():
-        full_name = f"{row.get('first_name', '')} {row.get('last_name', '')}".strip().lower()
-        if full_name and row.get('contact_id'):
-            contact_lookup[full_name] = row['contact_id']
-        # Also try email prefix
-        email = str(row.get('email', '') or row.get('primary_email', '')).lower()
-        if '@' in email:
-            email_name = email.split('@')[0].replace('.', ' ')
-            contact_lookup[email_name] = row.get('contact_id')
-
-    person_columns = ['solution_lead', 'ra_representative', 'earth_action_advocate']
-    mappings = {}
-    unmatched = []
-
-    for col in person_columns:
-        if col not in solutions_df.columns:
-            continue
+    lookup = contact_lookup(contacts_df)
 
-        for idx, row in solutions_df.iterrows():
-            name = row.get(col)
-            if pd.isna(name) or not str(name).strip():
-                continue
+    columns = [c for c in PERSON_COLUMNS if c in solutions_df.columns]
+    people = solutions_df[columns].rename_axis('_idx').reset_index().melt(
+        id_vars='_idx', value_vars=columns, var_name='column', value_name='person'
+    )
+    people = people[people['person'].notna()]
+    people = people[people['person'].astype(str).str.strip().ne('')]
+    people['contact_id'] = normalize_person(people['person']).map(lookup)
 
-            name_lower = str(name).strip().lower()
+    found = people[people['contact_id'].notna()]
+    mappings = dict(zip(zip(found['_idx'], found['column']), found['contact_id']))
 
-            if name_lower in contact_lookup:
-                mappings[(idx, col)] = contact_lookup[name_lower]
-            else:
-                unmatched.append((row.get('solution_id'), col, name))
+    missing = people[people['contact_id'].isna()]
+    solution_ids = solutions_df['solution_id'] if 'solution_id' in solutions_df.columns else pd.Series(None, index=solutions_df.index)
+    unmatched = list(zip(solution_ids[missing['_idx']].to_numpy(), missing['column'], missing['person']))
 
     return mappings, unmatched
 
 
+def normalize_name(values):
+    """Normalize solution/key-message names for matching."""
+    return values.astype(str).str.strip().str.lower().str.replace('-', ' ').str.replace('_', ' ').where(values.notna(), '')
+
+
+def fuzzy_match(sol_norm, km_norms):
+    """
+    Position of the first key message name that contains or is contained
+    in sol_norm, else the first sharing more than half its words.
+    """
+    for pos, km_norm in km_norms.items():
+        if sol_norm in km_norm or km_norm in sol_norm:
+            return pos
+
+    sol_words = set(sol_norm.split())
+    for pos, km_norm in km_norms.items():
+        km_words = set(km_norm.split())
+        if len(sol_words & km_words) / max(len(sol_words), len(km_words)) > 0.5:
+            return pos
+
+    return None
+
+
 def merge_key_messages(solutions_df, key_messages_path):
     """
     Merge key messages data from source file into Solutions.
@@ -184,11 +241,11 @@ def merge_key_messages(solutions_df, key_messages_path):
 
     # The first row contains headers in this file
     # Find the actual header row
-    for i, row in km_df.iterrows():
-        if 'Solution Name' in str(row.values):
-            km_df.columns = km_df.iloc[i].values
-            km_df = km_df.iloc[i+1:].reset_index(drop=True)
-            break
+    hits = km_df.astype(str).apply(lambda col: col.str.contains('Solution Name', regex=False)).any(axis=1)
+    if hits.any():
+        i = km_df.index.get_loc(hits.idxmax())
+        km_df.columns = km_df.iloc[i].values
+        km_df = km_df.iloc[i+1:].reset_index(drop=True)
 
     # Rename columns to match our schema
     column_map = {
@@ -215,89 +272,40 @@ def merge_key_messages(solutions_df, key_messages_path):
     elif 'key_messages_new' in km_df.columns:
         km_df['key_messages'] = km_df['key_messages_new']
 
-    # Known name mappings (Solutions DB name -> Key Messages name)
-    name_aliases = {
-        'nisar downlink': 'additional nisar downlink station',
-        'hls-ll': 'hls low latency',
-        'air quality - pandora sensors': 'aq forecasts and pandora sensors',
-        'air quality - gmao': 'atmospheric composition using geos-5',
-        'vlm for coastal applications': 'vlm',
-        'opera dswx': 'opera surface water extent',
-        'opera disp': 'opera land surface deformation',
-        'opera dist': 'opera land surface disturbance',
-        'icesat-2 boreal biomass': 'icesat-2 quick look products',
-        'gcc from satcorps': 'global cloud composite',
-        'gacr': 'gacr',
-        'tempo': 'tempo nrt products enhanced',
-    }
-
-    def normalize_name(name):
-        """Normalize name for matching."""
-        if pd.isna(name):
-            return ''
-        return str(name).strip().lower().replace('-', ' ').replace('_', ' ')
-
-    def find_best_match(sol_name, km_names_list):
-        """Find best matching key message entry."""
-        sol_norm = normalize_name(sol_name)
-
-        # 1. Check aliases
-        if sol_norm in name_aliases:
-            alias = name_aliases[sol_norm]
-            for km_name in km_names_list:
-                if normalize_name(km_name) == alias:
-                    return km_name
-
-        # 2. Exact match
-        for km_name in km_names_list:
-            if normalize_name(km_name) == sol_norm:
-                return km_name
-
-        # 3. Partial match - solution name contains key message name or vice versa
-        for km_name in km_names_list:
-            km_norm = normalize_name(km_name)
-            if sol_norm in km_norm or km_norm in sol_norm:
-                return km_name
-
-        # 4. Word overlap match (>50% of words match)
-        sol_words = set(sol_norm.split())
-        for km_name in km_names_list:
-            km_words = set(normalize_name(km_name).split())
-            if len(sol_words & km_words) / max(len(sol_words), len(km_words)) > 0.5:
-                return km_name
-
-        return None
-
-    key_cols = ['key_messages', 'focus_type', 'industry_connections',
-                'scientific_advancement', 'agency_use_impact', 'public_comms_links']
-
     # Add new columns to solutions
-    for col in key_cols:
+    for col in KEY_MESSAGE_COLUMNS:
         if col not in solutions_df.columns:
             solutions_df[col] = ''
 
-    # Build list of key message names
-    km_names_list = km_df['name'].dropna().tolist()
-
-    # Match and update
-    matched = 0
-    unmatched = []
-    for idx, sol_row in solutions_df.iterrows():
-        sol_name = sol_row['name']
-        best_match = find_best_match(sol_name, km_names_list)
-
-        if best_match:
-            km_row = km_df[km_df['name'] == best_match].iloc[0]
-            for col in key_cols:
-                if col in km_row.index and pd.notna(km_row[col]):
-                    solutions_df.at[idx, col] = str(km_row[col]).strip()
-            matched += 1
-        else:
-            unmatched.append(sol_name)
-
-    print(f"  Key messages matched: {matched}/{len(solutions_df)} solutions")
+    # Name index: normalized key message name -> first row with it
+    km_df = km_df[km_df['name'].notna()].reset_index(drop=True)
+    km_norms = normalize_name(km_df['name'])
+    name_index = pd.Series(km_norms.index, index=km_norms).groupby(level=0).first()
+
+    # 1. aliases, 2. exact normalized name, 3./4. fuzzy for what is left
+    sol_norm = normalize_name(solutions_df['name'])
+    aliases = dict(zip(normalize_name(pd.Series(list(KEY_MESSAGE_ALIASES))),
+                       normalize_name(pd.Series(list(KEY_MESSAGE_ALIASES.values())))))
+    match = sol_norm.map(aliases).map(name_index)
+    match = match.fillna(sol_norm.map(name_index))
+    todo = match.isna() & sol_norm.ne('')
+    fuzzy = {name: fuzzy_match(name, km_norms) for name in sol_norm[todo].unique()}
+    match[todo] = sol_norm[todo].map(fuzzy)
+
+    # Copy each matched row's non-empty values over
+    matched = match.notna()
+    picked = km_df.reindex(columns=KEY_MESSAGE_COLUMNS).iloc[match[matched].astype(int)]
+    picked.index = match[matched].index
+    for col in KEY_MESSAGE_COLUMNS:
+        values = picked[col]
+        has_value = values.notna()
+        solutions_df[col] = solutions_df[col].astype(object)
+        solutions_df.loc[has_value[has_value].index, col] = values[has_value].astype(str).str.strip()
+
+    unmatched = solutions_df.loc[~matched, 'name'].tolist()
+    print(f"  Key messages matched: {int(matched.sum())}/{len(solutions_df)} solutions")
     if unmatched and len(unmatched) <= 10:
-        print(f"  Unmatched: {', '.join(unmatched[:10])}")
+        print(f"  Unmatched: {', '.join(map(str, unmatched[:10]))}")
 
     return solutions_df
 
@@ -389,6 +397,8 @@ def get_final_column_order():
 def main():
     parser = argparse.ArgumentParser(description='Consolidate MO-DB_Solutions database')
     parser.add_argument('--dry-run', action='store_true', help='Show changes without writing files')
+    parser.add_argument('--store', nargs='?', const=DB_FILE, type=Path, metavar='DB',
+                        help=f'Also upsert solutions and milestones into the local store (default: {DB_FILE})')
     args = parser.parse_args()
 
     base_dir = Path(__file__).parent.parent.parent  # MO-development
@@ -475,6 +485,11 @@ def main():
         milestones_df.to_excel(milestones_path, index=False, sheet_name='Milestones')
         print(f"  Created: {milestones_path}")
 
+        if args.store:
+            # Both are whole tables; milestone IDs are renumbered each run
+            store_output('solutions', solutions_df, args.store, replace=True)
+            store_output('milestones', milestones_df, args.store, replace=True)
+
         print("\n=== CONSOLIDATION COMPLETE ===")
 
 
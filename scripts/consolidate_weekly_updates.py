@@ -9,11 +9,16 @@ Usage: python consolidate_weekly_updates.py
 """
 
 import pandas as pd
-import re
 from pathlib import Path
 import uuid
 from datetime import datetime
 
+from excel_export import write_xlsx
+from text_normalization import (
+    clean_update_text, is_meaningful_update,
+    clean_update_text_series, is_meaningful_update_series,
+)
+
 # Input/Output files
 INPUT_FILE = Path(r"C:\Users\cjtucke3\Documents\Personal\MO-development\nsite-mo-viewer\database-files\historical_updates_import.csv")
 OUTPUT_FILE = Path(r"C:\Users\cjtucke3\Documents\Personal\MO-development\nsite-mo-viewer\database-files\weekly_updates_combined.xlsx")
@@ -77,6 +82,9 @@ SOLUTION_ID_NORMALIZATION = {
 # Maximum text length for updates (truncate very long ones)
 MAX_UPDATE_LENGTH = 3000
 
+# Boilerplate rule set in text_normalization
+TEXT_PROFILE = 'weekly'
+
 
 def generate_update_id():
     """Generate a unique update ID"""
@@ -93,75 +101,15 @@ def normalize_solution_id(solution_id):
     return SOLUTION_ID_NORMALIZATION.get(lower, solution_id)
 
 
-def clean_update_text(text):
-    """Clean boilerplate and standardize formatting"""
-    if not text or pd.isna(text):
-        return ''
-
-    text = str(text)
-
-    # Remove common boilerplate patterns
-    removals = [
-        r'^\s*•\s*',  # Leading bullet
-        r'^\s*○\s*',  # Leading circle
-        r'^\s*■\s*',  # Leading square
-        r'Action:\s*.*$',  # Action items (multiline)
-        r'ACTION:\s*.*$',
-        r'\[Action\].*$',
-    ]
-
-    for pattern in removals:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.MULTILINE)
-
-    # Clean up excessive whitespace
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    text = re.sub(r'^\s+', '', text)
-    text = re.sub(r'\s+$', '', text)
-
-    return text.strip()
-
-
-def is_meaningful_update(text):
-    """Check if update has real content"""
-    if not text or len(text) < 30:
-        return False
-
-    text_lower = text.lower().strip()
-
-    # Skip if mostly boilerplate or administrative notes
-    skip_patterns = [
-        r'^n/a\s*$',
-        r'^none\s*$',
-        r'^no\s+update\s*$',
-        r'^tbd\s*$',
-        r'^no\s+new\s+updates?\s*$',
-        r'^\s*$',
-        r'^air quality\s*\(gsfc\)',  # Header only
-        r'^gmao\s*$',
-        r'^pm2\.5\s*$',
-        r'^pandora\s+sensors?\s*$',
-        r'^poc:\s*',  # Point of contact lines
-        r'^next\s+steps?:\s*wait',  # Waiting placeholders
-        r'^next\s+deliverable.*:$',  # Empty deliverable lines
-        r'^updates?\s+pending\s+',  # Pending updates
-        r'^delay\s+this\s+',  # Delay notes
-        r'^note:\s*\w+\s+on\s+leave',  # Leave notices
-        r'^verify\s+data\s+input',  # Admin tasks
-        r'^pi\s+objectives\s+review',  # Just headers
-        r'deep\s+dive.*\d{1,2}[;:]\s*\d',  # Event scheduling
-    ]
-
-    for pattern in skip_patterns:
-        if re.match(pattern, text_lower):
-            return False
-
-    return True
-
-
 def consolidate_updates(df):
     """Consolidate multiple updates for same solution+date into one"""
     consolidated = []
 
+    # Clean the whole history in one vectorized pass, then drop empty updates
+    df = df.copy()
+    df['_clean_text'] = clean_update_text_series(df['update_text'], TEXT_PROFILE)
+    df = df[is_meaningful_update_series(df['_clean_text'], TEXT_PROFILE)]
+
     # Group by solution and date
     for (solution_id, meeting_date), group in df.groupby(['solution_id', 'meeting_date']):
         if pd.isna(solution_id) or not solution_id:
@@ -173,14 +121,7 @@ def consolidate_updates(df):
             continue
 
         # Combine all update texts
-        texts = []
-        for _, row in group.iterrows():
-            text = clean_update_text(row.get('update_text', ''))
-            if text and is_meaningful_update(text):
-                texts.append(text)
-
-        if not texts:
-            continue
+        texts = group['_clean_text'].tolist()
 
         # Join with bullet points for readability
         if len(texts) == 1:
@@ -189,9 +130,9 @@ def consolidate_updates(df):
             combined_text = '\n'.join(f"• {t}" for t in texts)
 
         # Clean again after combining
-        combined_text = clean_update_text(combined_text)
+        combined_text = clean_update_text(combined_text, TEXT_PROFILE)
 
-        if not is_meaningful_update(combined_text):
+        if not is_meaningful_update(combined_text, TEXT_PROFILE):
             continue
 
         # Truncate very long updates
@@ -282,19 +223,7 @@ def main():
     # Write to Excel
     OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-    with pd.ExcelWriter(OUTPUT_FILE, engine='openpyxl') as writer:
-        df_consolidated.to_excel(writer, sheet_name='Updates', index=False)
-
-        # Auto-adjust column widths
-        worksheet = writer.sheets['Updates']
-        for idx, col in enumerate(df_consolidated.columns):
-            max_length = max(
-                df_consolidated[col].astype(str).map(len).max(),
-                len(col)
-            )
-            adjusted_width = min(max_length + 2, 60)
-            col_letter = chr(65 + idx) if idx < 26 else f"A{chr(65 + idx - 26)}"
-            worksheet.column_dimensions[col_letter].width = adjusted_width
+    write_xlsx(OUTPUT_FILE, {'Updates': df_consolidated}, max_width=60)
 
     print(f"\nConsolidated file written to: {OUTPUT_FILE}")
 
@@ -25,6 +25,8 @@ import argparse
 from datetime import datetime
 import sys
 
+from solution_name_index import SolutionNameIndex
+
 sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
 
@@ -112,53 +114,6 @@ NAME_MAPPINGS = {
 }
 
 
-def normalize_name(name):
-    """Normalize solution name for matching."""
-    if pd.isna(name):
-        return ''
-    return str(name).strip().lower().replace('(', '').replace(')', '').replace('-', ' ')
-
-
-def find_solution_match(quicklook_name, solutions_names):
-    """Find the best matching solution name from MO-DB_Solutions."""
-    if pd.isna(quicklook_name):
-        return None
-
-    ql_norm = normalize_name(quicklook_name)
-
-    # Remove "Cycle N" prefix for matching
-    import re
-    ql_norm = re.sub(r'^cycle \d+\s*', '', ql_norm).strip()
-
-    # 1. Check direct mappings
-    for pattern, target in NAME_MAPPINGS.items():
-        if pattern in ql_norm:
-            if target in solutions_names:
-                return target
-
-    # 2. Exact match (after normalization)
-    for sol_name in solutions_names:
-        if normalize_name(sol_name) == ql_norm:
-            return sol_name
-
-    # 3. Substring match
-    for sol_name in solutions_names:
-        sol_norm = normalize_name(sol_name)
-        if sol_norm in ql_norm or ql_norm in sol_norm:
-            return sol_name
-
-    # 4. Word overlap > 50%
-    ql_words = set(ql_norm.split())
-    for sol_name in solutions_names:
-        sol_words = set(normalize_name(sol_name).split())
-        overlap = len(ql_words & sol_words)
-        total = max(len(ql_words), len(sol_words))
-        if total > 0 and overlap / total > 0.5:
-            return sol_name
-
-    return None
-
-
 def parse_funded_status(val):
     """Parse funded/unfunded value."""
     if pd.isna(val):
@@ -218,6 +173,7 @@ def main():
 
     # Get list of solution names for matching
     solutions_names = solutions_df['name'].dropna().tolist()
+    name_index = SolutionNameIndex(solutions_names, NAME_MAPPINGS, underscores=False, word_overlap=True)
 
     # Column mappings from Quick Look to MO-DB_Solutions
     column_map = {
@@ -254,7 +210,7 @@ def main():
             continue
 
         # Find matching solution in MO-DB_Solutions
-        match = find_solution_match(ql_name, solutions_names)
+        match = name_index.find(ql_name)
 
         if match:
             matched.append((ql_name, match))
@@ -0,0 +1,388 @@
+# -*- coding: utf-8 -*-
+"""
+Precomputed Dashboard Payloads
+==============================
+Last stage of the import pipeline: builds the per-page views the web app
+otherwise aggregates from full sheet scans on every page view, from the
+local MO-DB store (mo_db_store.py):
+
+    topsheet  - milestone stats, counts per solution, upcoming/overdue
+                (getMilestoneStats, getMilestoneCountsBySolution, ...)
+    schedule  - phase timeline per solution (getSolutionMilestoneTimeline)
+    sep       - SEP pipeline overview and milestone buckets
+                (getSEPPipelineOverview, getSEPPipelineStats)
+    comms     - story coverage per solution (getCoverageAnalysis)
+
+Each payload is JSON, gzip-compressed and base64-encoded, then split into
+chunks below the 100 KB CacheService entry limit. Chunk keys embed the
+payload's SHA-256 prefix, so a reader never mixes chunks of two versions.
+The manifest lists every page's keys plus the hashes of the JSON and of
+each chunk; deploy/dashboard-payloads.gs loads the file into the script
+cache and serves the pages from it.
+
+Output:
+    dashboard-payloads.json - {"manifest": {...}, "entries": {key: chunk}}
+
+Usage:
+    python dashboard_payloads.py
+    python dashboard_payloads.py --db mo_db.sqlite --output dashboard-payloads.json [--today 2026-01-15]
+"""
+
+import argparse
+import base64
+import gzip
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from mo_db_store import DATABASE_DIR, DB_FILE, connect, read_table
+
+OUTPUT_FILE = DATABASE_DIR / "dashboard-payloads.json"
+
+# CacheService rejects values over 100 KB; base64 is one byte per character
+CACHE_ENTRY_LIMIT = 100 * 1024
+CHUNK_CHARS = 90 * 1024
+KEY_PREFIX = 'dashboard_'
+MANIFEST_KEY = 'dashboard_payload_manifest'
+
+COVERAGE_DAYS = 90
+UPCOMING_DAYS = 90
+
+PHASE_ORDER = ['Pre-Formulation', 'Formulation', 'Implementation', 'Production', 'Closeout']
+
+# SEP_MILESTONES in library/solutions-api.gs, in pipeline order
+SEP_MILESTONES = ['ws1', 'tp4', 'ws2', 'tp5', 'ws3', 'tp6', 'ws4', 'tp7', 'ws5', 'tp8']
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+def text(df, column):
+    """Stripped strings of a column ('' for missing values and missing columns)"""
+    if column not in df.columns:
+        return pd.Series('', index=df.index, dtype=object)
+    values = df[column].astype(object).where(df[column].notna(), '').astype(str).str.strip()
+    return values.where(values.str.lower() != 'nan', '')
+
+
+def dates(df, column):
+    return pd.to_datetime(text(df, column).replace('', None), errors='coerce')
+
+
+def records(df):
+    """JSON-ready row dicts, '' for missing values"""
+    return df.astype(object).where(df.notna(), '').to_dict('records')
+
+
+def value_counts(values, default):
+    return values.where(values != '', default).value_counts(sort=False).to_dict()
+
+
+# =============================================================================
+# PAGE VIEWS
+# =============================================================================
+
+def topsheet_view(milestones, today):
+    """getMilestoneStats + getMilestoneCountsBySolution + upcoming/overdue lists"""
+    status = text(milestones, 'status').str.lower()
+    target = dates(milestones, 'target_date')
+    open_dated = target.notna() & (status != 'completed')
+    days_out = (target - today).dt.total_seconds() / 86400
+
+    stats = {
+        'total': len(milestones),
+        'byStatus': value_counts(status, 'unknown'),
+        'byPhase': value_counts(text(milestones, 'phase'), 'Unknown'),
+        'byType': value_counts(text(milestones, 'type'), 'Other'),
+        'byCycle': value_counts(text(milestones, 'cycle'), 'Unknown'),
+        'overdue': int((open_dated & (days_out < 0)).sum()),
+        'upcoming30': int((open_dated & (days_out >= 0) & (days_out <= 30)).sum()),
+        'upcoming90': int((open_dated & (days_out > 30) & (days_out <= 90)).sum()),
+    }
+
+    solution_id = text(milestones, 'solution_id')
+    target_text = text(milestones, 'target_date')
+    has_id = solution_id != ''
+    planned = has_id & (status == 'planned') & (target_text != '')
+    counts = pd.DataFrame({
+        'completed': (status[has_id] == 'completed').groupby(solution_id[has_id]).sum(),
+        'planned': planned[has_id].groupby(solution_id[has_id]).sum(),
+        'total': solution_id[has_id].value_counts(),
+    }).fillna(0).astype(int)
+    next_date = target_text[planned].groupby(solution_id[planned]).min()
+    counts_by_solution = {
+        sid: {**row, 'next_date': next_date.get(sid) or None}
+        for sid, row in counts.to_dict('index').items()
+    }
+
+    upcoming = open_dated & (days_out >= 0) & (days_out <= UPCOMING_DAYS)
+    overdue = open_dated & (days_out < 0)
+    by_date = target.sort_values(kind='stable').index
+    return {
+        'stats': stats,
+        'countsBySolution': counts_by_solution,
+        'upcoming': records(milestones.loc[by_date[upcoming[by_date].to_numpy()]]),
+        'overdue': records(milestones.loc[by_date[overdue[by_date].to_numpy()]]),
+    }
+
+
+def schedule_view(milestones):
+    """getSolutionMilestoneTimeline for every solution"""
+    rows = milestones.assign(_solution=text(milestones, 'solution_id'), _phase=text(milestones, 'phase'),
+                             _completed=text(milestones, 'status').str.lower() == 'completed')
+    rows = rows[rows['_solution'] != '']
+    columns = list(milestones.columns)
+    timelines = {}
+    for solution_id, group in rows.groupby('_solution', sort=True):
+        timeline = []
+        for phase in PHASE_ORDER:
+            in_phase = group[group['_phase'] == phase]
+            if len(in_phase):
+                timeline.append({
+                    'phase': phase,
+                    'milestones': records(in_phase[columns]),
+                    'completed': int(in_phase['_completed'].sum()),
+                    'total': len(in_phase),
+                })
+        timelines[solution_id] = timeline
+    return {'timelines': timelines}
+
+
+def sep_progress(solutions):
+    """Per solution: (current milestone, next milestone or None, completed count)"""
+    done = pd.DataFrame({ms: text(solutions, f'sep_{ms}_date') != '' for ms in SEP_MILESTONES})
+    completed = done.sum(axis=1)
+    # Last completed milestone position (-1 when none)
+    last = done.to_numpy()[:, ::-1].argmax(axis=1)
+    last = pd.Series(len(SEP_MILESTONES) - 1 - last, index=solutions.index).where(completed > 0, -1)
+    current = [SEP_MILESTONES[i] if i >= 0 else 'not_started' for i in last]
+    following = [SEP_MILESTONES[i + 1] if i + 1 < len(SEP_MILESTONES) else None for i in last]
+    return current, following, completed.tolist()
+
+
+def sep_view(solutions, people, today):
+    """getSEPPipelineOverview (People tab) + getSEPPipelineStats (solutions)"""
+    engagement = text(people, 'engagement_level')
+    next_contact = dates(people, 'next_scheduled_contact')
+    midnight = today.normalize()
+    overdue = int((next_contact < midnight).sum())
+    this_week = int(((next_contact >= midnight) & (next_contact <= today + pd.Timedelta(days=7))).sum())
+    agencies = text(people, 'agency_id')
+    overview = {
+        'total_contacts': len(people),
+        'total_agencies': int(agencies[agencies != ''].nunique()),
+        'engagement_levels': engagement[engagement != ''].value_counts(sort=False).to_dict(),
+        'follow_ups': {
+            'overdue': overdue,
+            'this_week': this_week,
+            'need_attention': this_week + overdue,
+        },
+    }
+
+    active = text(solutions, 'sep_active').str.upper().isin(['TRUE', '1'])
+    sep_solutions = solutions[active]
+    current, following, completed = sep_progress(sep_solutions)
+    # Bucket by the milestone being worked toward, as getSolutionsBySEPMilestone
+    bucket = pd.Series([nxt or ('completed' if n == len(SEP_MILESTONES) else 'not_started')
+                        for nxt, n in zip(following, completed)], dtype=object)
+    by_milestone = {ms: int((bucket == ms).sum()) for ms in SEP_MILESTONES}
+    stats = {
+        'total_solutions': len(sep_solutions),
+        'not_started': int((bucket == 'not_started').sum()),
+        'in_progress': sum(n for n in by_milestone.values() if n > 0),
+        'completed': int((bucket == 'completed').sum()),
+        'by_milestone': by_milestone,
+    }
+    progress = [
+        {
+            'solution_id': sid,
+            'name': name,
+            'currentMilestone': cur,
+            'nextMilestone': nxt,
+            'completedCount': int(n),
+            'totalMilestones': len(SEP_MILESTONES),
+        }
+        for sid, name, cur, nxt, n in zip(text(sep_solutions, 'solution_id'),
+                                          text(sep_solutions, 'core_official_name'),
+                                          current, following, completed)
+    ]
+    return {'overview': overview, 'stats': stats, 'solutions': progress}
+
+
+def comms_view(solutions, stories, today, days=COVERAGE_DAYS):
+    """getCoverageAnalysis(days)"""
+    names = text(solutions, 'core_official_name')
+    solution_ids = text(solutions, 'solution_id')
+    phase = text(solutions, 'admin_lifecycle_phase')
+    known = solution_ids != ''
+    coverage = pd.DataFrame({
+        'solution_name': names.where(names != '', solution_ids)[known].to_numpy(),
+        'phase': phase[known].to_numpy(),
+    }, index=solution_ids[known].to_numpy())
+    coverage = coverage[~coverage.index.duplicated(keep='last')]
+
+    story_ids = text(stories, 'solution_id')
+    story_date_text = text(stories, 'publish_date')
+    for fallback in ('idea_date', 'created_date'):
+        story_date_text = story_date_text.where(story_date_text != '', text(stories, fallback))
+    story_dates = pd.to_datetime(story_date_text.replace('', None), errors='coerce')
+    linked = story_ids != ''
+    cutoff = today - pd.Timedelta(days=days)
+
+    # Stories whose solution is not in the master list still get a row
+    missing = pd.Index(story_ids[linked].unique()).difference(coverage.index)
+    coverage = pd.concat([coverage, pd.DataFrame({'solution_name': missing, 'phase': ''}, index=missing)])
+
+    grouped_ids = story_ids[linked]
+    coverage['total_stories'] = grouped_ids.value_counts().reindex(coverage.index, fill_value=0)
+    coverage['recent_stories'] = ((story_dates >= cutoff)[linked].groupby(grouped_ids).sum()
+                                  .reindex(coverage.index, fill_value=0))
+    # Most recent dated story per solution (first one on ties)
+    dated = pd.DataFrame({'solution_id': story_ids, 'date': story_dates, 'text': story_date_text})
+    latest = (dated[linked & story_dates.notna()]
+              .sort_values('date', ascending=False, kind='stable')
+              .drop_duplicates('solution_id')
+              .set_index('solution_id')
+              .reindex(coverage.index))
+    coverage['last_story_date'] = latest['text']
+    last_dates = latest['date']
+    coverage['days_since_story'] = (today - last_dates).dt.days
+
+    coverage = coverage.rename_axis('solution_id').reset_index()
+    rows = [
+        {
+            'solution_name': r.solution_name,
+            'solution_id': r.solution_id,
+            'phase': r.phase,
+            'total_stories': int(r.total_stories),
+            'recent_stories': int(r.recent_stories),
+            'last_story_date': r.last_story_date if isinstance(r.last_story_date, str) else None,
+            'days_since_story': None if pd.isna(r.days_since_story) else int(r.days_since_story),
+        }
+        for r in coverage.itertuples(index=False)
+    ]
+    uncovered = [r for r in rows if r['total_stories'] == 0]
+    gaps = sorted((r for r in rows if r['total_stories'] and (r['days_since_story'] or 0) > days),
+                  key=lambda r: -(r['days_since_story'] or 0))
+    covered = [r for r in rows if r['total_stories'] and not (r['days_since_story'] or 0) > days]
+    return {
+        'period_days': days,
+        'total_solutions': len(rows),
+        'well_covered': len(covered),
+        'needs_attention': len(gaps),
+        'no_stories': len(uncovered),
+        'gaps': gaps,
+        'uncovered': uncovered,
+        'covered': covered,
+    }
+
+
+def build_views(conn, today):
+    """All page views from the store, keyed by page name"""
+    milestones = read_table(conn, 'milestones')
+    # Status is compared lowercase, as loadAllMilestones_ normalizes it
+    milestones['status'] = text(milestones, 'status').str.lower()
+    solutions = read_table(conn, 'solutions')
+    return {
+        'topsheet': topsheet_view(milestones, today),
+        'schedule': schedule_view(milestones),
+        'sep': sep_view(solutions, read_table(conn, 'contacts'), today),
+        'comms': comms_view(solutions, read_table(conn, 'stories'), today),
+    }
+
+
+# =============================================================================
+# ENCODING
+# =============================================================================
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def encode_payload(page, view, chunk_chars=CHUNK_CHARS):
+    """
+    (manifest entry, {cache key: chunk}) for one page view.
+
+    The JSON is gzipped (mtime 0, so unchanged views encode identically)
+    and base64-encoded; chunk keys are KEY_PREFIX + page + hash prefix + n.
+    """
+    if not 0 < chunk_chars <= CACHE_ENTRY_LIMIT:
+        raise ValueError(f"chunk_chars must be 1..{CACHE_ENTRY_LIMIT}, got {chunk_chars}")
+    raw = json.dumps(view, ensure_ascii=False, separators=(',', ':'), allow_nan=False, default=str).encode('utf-8')
+    digest = sha256(raw)
+    compressed = gzip.compress(raw, mtime=0)
+    packed = base64.b64encode(compressed).decode('ascii')
+    chunks = [packed[i:i + chunk_chars] for i in range(0, len(packed), chunk_chars)]
+    keys = [f"{KEY_PREFIX}{page}_{digest[:12]}_{n}" for n in range(len(chunks))]
+    entry = {
+        'keys': keys,
+        'sha256': digest,
+        'chunkSha256': [sha256(chunk.encode('ascii')) for chunk in chunks],
+        'jsonBytes': len(raw),
+        'gzipBytes': len(compressed),
+    }
+    return entry, dict(zip(keys, chunks))
+
+
+def decode_payload(entry, entries):
+    """Page view back from its manifest entry and cache entries (checks hashes)"""
+    chunks = [entries[key] for key in entry['keys']]
+    for key, chunk, expected in zip(entry['keys'], chunks, entry['chunkSha256']):
+        if sha256(chunk.encode('ascii')) != expected:
+            raise ValueError(f"Chunk hash mismatch: {key}")
+    raw = gzip.decompress(base64.b64decode(''.join(chunks)))
+    if sha256(raw) != entry['sha256']:
+        raise ValueError("Payload hash mismatch")
+    return json.loads(raw)
+
+
+def build_payloads(views, generated, as_of=None, chunk_chars=CHUNK_CHARS):
+    """
+    {'manifest': ..., 'entries': ...} for all page views. generated is the
+    build time, as_of the reference date the views were computed for.
+    """
+    manifest = {'version': 1, 'generated': generated, 'asOf': as_of or generated,
+                'manifestKey': MANIFEST_KEY, 'pages': {}}
+    entries = {}
+    for page, view in views.items():
+        manifest['pages'][page], page_entries = encode_payload(page, view, chunk_chars)
+        entries.update(page_entries)
+    return {'manifest': manifest, 'entries': entries}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build cache-ready dashboard payloads from the MO-DB store')
+    parser.add_argument('--db', type=Path, default=DB_FILE, help='SQLite store (mo_db_store.py)')
+    parser.add_argument('--output', type=Path, default=OUTPUT_FILE, help='Output JSON file')
+    parser.add_argument('--today', help='Reference date for overdue/upcoming/coverage (default: now)')
+    parser.add_argument('--chunk-chars', type=int, default=CHUNK_CHARS,
+                        help=f'Max characters per cache entry (default: {CHUNK_CHARS})')
+    args = parser.parse_args()
+
+    if not args.db.exists():
+        raise SystemExit(f"ERROR: Input file not found: {args.db}")
+
+    today = pd.Timestamp(args.today) if args.today else pd.Timestamp(datetime.now())
+    conn = connect(args.db)
+    try:
+        views = build_views(conn, today)
+    finally:
+        conn.close()
+
+    generated = datetime.now().isoformat(timespec='seconds')
+    payloads = build_payloads(views, generated, today.isoformat(), args.chunk_chars)
+    for page, entry in payloads['manifest']['pages'].items():
+        print(f"  {page}: {entry['jsonBytes']:,} bytes JSON -> {entry['gzipBytes']:,} gzip, "
+              f"{len(entry['keys'])} chunk(s)")
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(payloads, separators=(',', ':')), encoding='utf-8')
+    print(f"Wrote: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+"""
+Shared Date Parsing
+===================
+One place for the date handling the import scripts used to do cell by cell
+with their own format lists and try/except cascades.
+
+parse_dates() takes a whole column and:
+1. formats datetime cells directly
+2. drops empty and skip values ("TBD", "Working", ...)
+3. runs the profile's format cascade column-wise with
+   pd.to_datetime(format=...), each step only on what is still unparsed
+4. applies the profile's fallback (embedded date, free-form parse, year)
+   to whatever is left
+
+Every distinct string is parsed once and cached per profile, so repeated
+free text like "Q3 FY25" or "TBD" costs one lookup after the first time.
+
+A profile keeps each sheet's existing rules, so switching a script over
+does not change its output:
+- milestones: MO-Viewer/Cycles milestone columns (year-only fallback)
+- cycles:     dates embedded in notes ("SADR 6/25/2024", "03/26/2024 Working")
+- solutions:  Top Sheet dates, free-form pandas parse
+- stories:    story tracking sheets (unparseable text kept as written)
+
+Usage:
+    from date_parsing import parse_dates, parse_date, date_from_filename
+    df['target_date'] = parse_dates(df['Date'], 'milestones')
+"""
+
+import re
+import warnings
+from datetime import date, datetime
+
+import pandas as pd
+
+ISO_FORMAT = '%Y-%m-%d'
+
+PROFILES = {
+    'milestones': {
+        'formats': ['%m/%d/%Y', '%m/%d/%y', '%Y-%m-%d', '%d/%m/%Y',
+                    '%B %d, %Y', '%b %d, %Y', '%m-%d-%Y', '%m-%d-%y'],
+        'skip': {'nan', 'none', 'nat', 'tbd', 'n/a'},
+        'year_fallback': True,
+        'missing': '',
+    },
+    'cycles': {
+        'embedded': [(r'(\d{1,2}/\d{1,2}/\d{4})', '%m/%d/%Y'),
+                     (r'(\d{4}-\d{2}-\d{2})', '%Y-%m-%d')],
+        'skip': {'working', 'tbd', 'pending', 'x', 'nan', 'snwg monthly', 'est.', 'estimated'},
+        'skip_prefixes': ('est',),
+        'missing': None,
+    },
+    'solutions': {
+        'skip': {'working', 'in work', 'tbd', 'n/a'},
+        'free_form': True,
+        'text_only': True,      # numbers and date (non-datetime) cells -> missing
+        'missing': '',
+    },
+    'stories': {
+        'formats': ['%Y-%m-%d', '%m/%d/%Y', '%m-%d-%Y', '%B %d, %Y', '%b %d, %Y'],
+        'keep_unparsed': True,
+        'falsy_missing': True,  # 0 / False cells count as empty
+        'missing': '',
+    },
+}
+
+YEAR_RE = re.compile(r'\b(20\d{2})\b')
+
+# {profile: {stripped string: parsed result}}
+_cache = {name: {} for name in PROFILES}
+
+
+def _filled(index, value):
+    """Object Series of one value (pandas would turn a None fill into NaN)"""
+    return pd.Series([value] * len(index), index=index, dtype=object)
+
+
+def _parse_strings(values, profile):
+    """Run a profile's cascade over unique stripped strings; returns a list"""
+    rules = PROFILES[profile]
+    missing = rules['missing']
+    s = pd.Series(values, dtype=object)
+    result = _filled(s.index, missing)
+
+    lowered = s.str.lower()
+    todo = s.ne('') & ~lowered.isin(rules.get('skip', ()))
+    if rules.get('skip_prefixes'):
+        todo &= ~lowered.str.startswith(rules['skip_prefixes'])
+
+    for fmt in rules.get('formats', []):
+        if not todo.any():
+            break
+        parsed = pd.to_datetime(s[todo], format=fmt, errors='coerce')
+        hit = parsed.dropna()
+        result[hit.index] = hit.dt.strftime(ISO_FORMAT)
+        todo[hit.index] = False
+
+    for pattern, fmt in rules.get('embedded', []):
+        if not todo.any():
+            break
+        found = s[todo].str.extract(pattern, expand=False).dropna()
+        hit = pd.to_datetime(found, format=fmt, errors='coerce').dropna()
+        result[hit.index] = hit.dt.strftime(ISO_FORMAT)
+        todo[hit.index] = False
+
+    if rules.get('free_form'):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)  # per-value format guessing
+            for idx in s[todo].index:
+                try:
+                    result[idx] = pd.to_datetime(s[idx]).strftime(ISO_FORMAT)
+                    todo[idx] = False
+                except (ValueError, TypeError, OverflowError):
+                    pass
+
+    if rules.get('year_fallback') and todo.any():
+        years = s[todo].str.extract(YEAR_RE, expand=False).dropna()
+        result[years.index] = years
+        todo[years.index] = False
+
+    if rules.get('keep_unparsed'):
+        result[todo] = s[todo]
+
+    return result.tolist()
+
+
+def parse_dates(values, profile='milestones'):
+    """
+    Parse a column of mixed date cells to YYYY-MM-DD strings.
+
+    Returns a Series aligned with values; cells that are empty, skipped or
+    unparseable get the profile's missing value ('' or None), except in
+    profiles that keep unparsed text as written.
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown date profile '{profile}' (expected one of {', '.join(PROFILES)})")
+
+    series = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+    missing = PROFILES[profile]['missing']
+
+    if pd.api.types.is_datetime64_any_dtype(series):
+        result = _filled(series.index, missing)
+        result[series.notna()] = series.dropna().dt.strftime(ISO_FORMAT)
+        return result
+
+    rules = PROFILES[profile]
+    result = _filled(series.index, missing)
+    present = series.notna()
+
+    date_types = datetime if rules.get('text_only') else (datetime, date)
+    is_date = present & series.map(lambda v: isinstance(v, date_types))
+    if is_date.any():
+        result[is_date] = series[is_date].map(lambda v: v.strftime(ISO_FORMAT))
+
+    is_text = present & ~is_date
+    if rules.get('text_only'):
+        is_text &= series.map(lambda v: isinstance(v, str))
+    if rules.get('falsy_missing'):
+        is_text &= series.map(bool)
+    text = series[is_text].astype(str).str.strip()
+    if text.empty:
+        return result
+
+    cache = _cache[profile]
+    new = [v for v in text.unique() if v not in cache]
+    if new:
+        cache.update(zip(new, _parse_strings(new, profile)))
+    result[text.index] = [cache[v] for v in text]
+    return result
+
+
+def parse_date(value, profile='milestones'):
+    """Single-cell form of parse_dates(), for values read one at a time"""
+    if isinstance(value, str):
+        key = value.strip()
+        cache = _cache.get(profile)
+        if cache is not None and key in cache:
+            return cache[key]
+    return parse_dates(pd.Series([value], dtype=object), profile).iat[0]
+
+
+def parse_column(df, column, profile='milestones'):
+    """parse_dates() of df[column]; all missing if the sheet lacks the column"""
+    if column not in df.columns:
+        return _filled(df.index, PROFILES[profile]['missing'])
+    return parse_dates(df[column], profile)
+
+
+def format_date(value):
+    """Datetime cells as YYYY-MM-DD; text is kept as written (stripped)"""
+    if value is None or pd.isna(value):
+        return ''
+    if isinstance(value, datetime):
+        return value.strftime(ISO_FORMAT)
+    if isinstance(value, str):
+        return value.strip()
+    return str(value)
+
+
+def format_dates(values):
+    """Column form of format_date(): datetimes as YYYY-MM-DD, text stripped, missing ''"""
+    series = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.dt.strftime(ISO_FORMAT).astype(object).where(series.notna(), '')
+
+    result = _filled(series.index, '')
+    present = series.notna()
+    is_dt = present & series.map(lambda v: isinstance(v, datetime))
+    is_str = present & series.map(lambda v: isinstance(v, str))
+    other = present & ~is_dt & ~is_str
+    if is_dt.any():
+        result[is_dt] = series[is_dt].map(lambda v: v.strftime(ISO_FORMAT))
+    if is_str.any():
+        result[is_str] = series[is_str].str.strip()
+    if other.any():
+        result[other] = series[other].map(str)
+    return result
+
+
+# =============================================================================
+# DATES IN FILENAMES
+# =============================================================================
+
+LEADING_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+LEADING_MONTH_RE = re.compile(r'(\d{4})-(\d{2})')
+US_DATE_RE = re.compile(r'(\d{2})-(\d{2})-(\d{4})')
+
+
+def date_from_filename(filename, anywhere=False, month_day=None):
+    """
+    Meeting date from a filename like '2024-03-11 SNWG Weekly.docx'.
+
+    By default the date must start the name. anywhere=True also finds dates
+    inside the name, including MM-DD-YYYY ('..._C3_04-25-2024.pdf').
+    month_day turns a leading 'YYYY-MM' into that day of the month (monthly
+    decks are named by month only). Returns YYYY-MM-DD or None.
+    """
+    filename = str(filename)
+
+    if month_day is not None:
+        match = LEADING_MONTH_RE.match(filename)
+        if match:
+            return f"{match.group(1)}-{match.group(2)}-{month_day:02d}"
+
+    find = LEADING_DATE_RE.search if anywhere else LEADING_DATE_RE.match
+    match = find(filename)
+    if match:
+        return match.group(1)
+
+    if anywhere:
+        match = US_DATE_RE.search(filename)
+        if match:
+            month, day, year = match.groups()
+            return f"{year}-{month}-{day}"
+
+    return None
+
+
+def dates_from_filenames(filenames, anywhere=False):
+    """Vectorized date_from_filename() for a column of names (None if absent)"""
+    names = pd.Series(filenames, dtype=object).astype(str)
+    if anywhere:
+        result = names.str.extract(LEADING_DATE_RE, expand=False)
+        us = names[result.isna()].str.extract(US_DATE_RE).dropna()
+        result[us.index] = us[2] + '-' + us[0] + '-' + us[1]
+    else:
+        result = names.str.extract('^' + LEADING_DATE_RE.pattern, expand=False)
+    return pd.Series([v if isinstance(v, str) else None for v in result],
+                     index=result.index, dtype=object)
@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+Data-Driven Deck Generator
+==========================
+Renders PowerPoint decks from slide specs (JSON, or YAML when PyYAML is
+installed), so the presentation scripts hold slide content as data instead
+of hundreds of lines of shape placement.
+
+- colors and paragraph styles are resolved once per spec (Theme) rather
+  than rebuilt on every helper call
+- the base template is read once per process; each deck is opened from the
+  cached bytes
+- batch mode renders many decks (several specs, or one deck per row of a
+  variables file, e.g. per solution or audience) across a worker pool; each
+  worker imports python-pptx and loads templates and specs once
+
+Spec format:
+    {
+      "slide_size": [13.333, 7.5],          # inches
+      "layout": 6,                          # slide layout index (6 = blank)
+      "template": "base.pptx",              # optional, relative to the spec
+      "output": "MO-Viewer-{audience}.pptx",
+      "colors": {"primary": "1A237E", "white": "FFFFFF", ...},
+      "styles": {"header": {"size": 36, "bold": true, "color": "primary"}, ...},
+      "slides": [
+        {"elements": [
+          {"type": "background", "color": "primary"},
+          {"type": "text", "box": [0.5, 2.5, 12.333, 1.5],
+           "paragraphs": [{"text": "MO Viewer", "style": "title"}]}
+        ]}
+      ]
+    }
+
+Element types (see ELEMENT_BUILDERS): background, text, shape, header,
+header_bar, feature_box, rounded_box, demo_box. Boxes are
+[left, top, width, height] in inches. Colors are names from "colors" or
+RRGGBB hex. Paragraph properties: text, style, level, size, bold, italic,
+color, align, space_before; unset properties are left to PowerPoint.
+{name} placeholders in strings are filled from the deck variables.
+
+Usage:
+    python deck_generator.py deck_specs/sep.json
+    python deck_generator.py deck_specs/*.json --workers 3
+    python deck_generator.py deck_specs/solution.json --vars solutions.csv --output-dir decks
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.enum.text import PP_ALIGN
+from pptx.util import Inches, Pt
+
+SCRIPTS_DIR = Path(__file__).parent
+DEFAULT_OUTPUT_DIR = SCRIPTS_DIR.parent
+
+DEFAULT_SLIDE_SIZE = (13.333, 7.5)
+BLANK_LAYOUT = 6
+
+SHAPES = {
+    'rectangle': MSO_SHAPE.RECTANGLE,
+    'rounded_rectangle': MSO_SHAPE.ROUNDED_RECTANGLE,
+    'oval': MSO_SHAPE.OVAL,
+}
+ALIGNMENTS = {
+    'left': PP_ALIGN.LEFT,
+    'center': PP_ALIGN.CENTER,
+    'right': PP_ALIGN.RIGHT,
+}
+PARAGRAPH_PROPERTIES = ('level', 'size', 'bold', 'italic', 'color', 'align', 'space_before')
+
+PLACEHOLDER_RE = re.compile(r'\{(\w+)\}')
+
+
+# =============================================================================
+# SPECS AND TEMPLATES (cached per process)
+# =============================================================================
+
+def read_spec(path):
+    """Parse a JSON or YAML spec file"""
+    path = Path(path)
+    text = path.read_text(encoding='utf-8')
+    if path.suffix.lower() in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise SystemExit(f"PyYAML is needed for {path.name} (pip install pyyaml), or use a .json spec")
+        return yaml.safe_load(text)
+    return json.loads(text)
+
+
+@lru_cache(maxsize=None)
+def load_spec(path):
+    """Spec file contents, parsed once per process (treat as read-only)"""
+    return read_spec(path)
+
+
+@lru_cache(maxsize=None)
+def template_bytes(path=None):
+    """Bytes of the base template (python-pptx's default when None), read once per process"""
+    if path is not None:
+        return Path(path).read_bytes()
+    buffer = io.BytesIO()
+    Presentation().save(buffer)
+    return buffer.getvalue()
+
+
+def fill_placeholders(value, variables):
+    """Deep copy of a spec value with {name} placeholders filled in"""
+    if isinstance(value, str):
+        if not variables:
+            return value
+        return PLACEHOLDER_RE.sub(lambda m: str(variables.get(m.group(1), m.group(0))), value)
+    if isinstance(value, list):
+        return [fill_placeholders(v, variables) for v in value]
+    if isinstance(value, dict):
+        return {k: fill_placeholders(v, variables) for k, v in value.items()}
+    return value
+
+
+# =============================================================================
+# THEME
+# =============================================================================
+
+@lru_cache(maxsize=None)
+def rgb(hex_color):
+    """RGBColor for an RRGGBB string"""
+    return RGBColor.from_string(hex_color.lstrip('#').upper())
+
+
+class Theme:
+    """A spec's colors and paragraph styles, resolved once"""
+
+    def __init__(self, colors=None, styles=None):
+        self.colors = {name: rgb(value) for name, value in (colors or {}).items()}
+        self.styles = {name: self.resolve(props) for name, props in (styles or {}).items()}
+
+    def color(self, value):
+        """RGBColor for a color name or hex string"""
+        if isinstance(value, RGBColor):
+            return value
+        if value in self.colors:
+            return self.colors[value]
+        return rgb(value)
+
+    def resolve(self, props):
+        """Paragraph properties with pptx values (Pt, RGBColor, PP_ALIGN)"""
+        resolved = {}
+        for key in PARAGRAPH_PROPERTIES:
+            if key not in props:
+                continue
+            value = props[key]
+            if key in ('size', 'space_before'):
+                value = Pt(value)
+            elif key == 'color':
+                value = self.color(value)
+            elif key == 'align':
+                value = ALIGNMENTS[value]
+            resolved[key] = value
+        return resolved
+
+    def style(self, name):
+        """Resolved properties of a named style ({} for None)"""
+        if name is None:
+            return {}
+        if name not in self.styles:
+            raise KeyError(f"Unknown style '{name}'")
+        return self.styles[name]
+
+    def paragraph(self, spec, style=None, **overrides):
+        """
+        (text, resolved properties) for a paragraph spec (a string or a dict).
+        A paragraph's own style replaces the element's; explicit properties
+        win over both.
+        """
+        if isinstance(spec, str):
+            spec = {'text': spec}
+        props = dict(self.style(spec.get('style', style)))
+        props.update(self.resolve(overrides))
+        props.update(self.resolve(spec))
+        return spec.get('text', ''), props
+
+
+# =============================================================================
+# ELEMENTS
+# =============================================================================
+
+def box_emu(box):
+    """[left, top, width, height] inches -> EMU"""
+    return [Inches(v) for v in box]
+
+
+def write_paragraphs(text_frame, paragraphs, theme, style=None, wrap=None, **overrides):
+    """Fill a text frame: the first paragraph reuses the frame's own, the rest are added"""
+    if wrap is not None:
+        text_frame.word_wrap = wrap
+    for idx, spec in enumerate(paragraphs):
+        text, props = theme.paragraph(spec, style, **overrides)
+        p = text_frame.paragraphs[0] if idx == 0 else text_frame.add_paragraph()
+        p.text = text
+        if 'level' in props:
+            p.level = props['level']
+        if 'size' in props:
+            p.font.size = props['size']
+        if 'bold' in props:
+            p.font.bold = props['bold']
+        if 'italic' in props:
+            p.font.italic = props['italic']
+        if 'color' in props:
+            p.font.color.rgb = props['color']
+        if 'align' in props:
+            p.alignment = props['align']
+        if 'space_before' in props:
+            p.space_before = props['space_before']
+
+
+def add_text(slide, theme, box, paragraphs, style=None, wrap=None, **overrides):
+    textbox = slide.shapes.add_textbox(*box_emu(box))
+    write_paragraphs(textbox.text_frame, paragraphs, theme, style, wrap, **overrides)
+    return textbox
+
+
+def add_shape(slide, theme, box, shape='rectangle', fill=None, line=None, line_width=None,
+              paragraphs=None, style=None, wrap=None):
+    """Autoshape; line='none' hides the outline, paragraphs go in the shape's own text frame"""
+    autoshape = slide.shapes.add_shape(SHAPES[shape], *box_emu(box))
+    if fill is not None:
+        autoshape.fill.solid()
+        autoshape.fill.fore_color.rgb = theme.color(fill)
+    if line == 'none':
+        autoshape.line.fill.background()
+    elif line is not None:
+        autoshape.line.color.rgb = theme.color(line)
+    if line_width is not None:
+        autoshape.line.width = Pt(line_width)
+    if paragraphs:
+        write_paragraphs(autoshape.text_frame, paragraphs, theme, style, wrap)
+    return autoshape
+
+
+def add_background(slide, theme, color, slide_size):
+    """Full-slide rectangle sent behind everything else"""
+    background = add_shape(slide, theme, [0, 0, *slide_size], fill=color, line='none')
+    sp_tree = slide.shapes._spTree
+    sp_tree.remove(background._element)
+    sp_tree.insert(2, background._element)
+    return background
+
+
+def add_header(slide, theme, text, color=None):
+    """Slide title at the top left (style 'header')"""
+    overrides = {'color': color} if color else {}
+    return add_text(slide, theme, [0.5, 0.5, 12.333, 1], [text], 'header', **overrides)
+
+
+def add_header_bar(slide, theme, title, subtitle=None, fill='primary', slide_size=DEFAULT_SLIDE_SIZE):
+    """Full-width colored bar with the title in it (style 'header_bar')"""
+    add_shape(slide, theme, [0, 0, slide_size[0], 1.0], fill=fill, line='none')
+    text = f"{title}: {subtitle}" if subtitle else title
+    return add_text(slide, theme, [0.4, 0.15, 12.5, 0.7], [text], 'header_bar')
+
+
+def add_feature_box(slide, theme, box, title, bullets, color):
+    """Outlined box with a title and bullets (styles 'feature_title', 'feature_bullet')"""
+    left, top, width, height = box
+    add_shape(slide, theme, box, 'rounded_rectangle', fill='white', line=color, line_width=2)
+    add_text(slide, theme, [left + 0.2, top + 0.15, width - 0.4, 0.5], [title], 'feature_title', color=color)
+    add_text(slide, theme, [left + 0.2, top + 0.6, width - 0.4, height - 0.8],
+             ['• ' + bullet for bullet in bullets], 'feature_bullet', wrap=True)
+
+
+def add_rounded_box(slide, theme, box, title, color, title_color=None):
+    """Outlined box with a title (style 'box_title'); content is added separately"""
+    left, top, width, _ = box
+    add_shape(slide, theme, box, 'rounded_rectangle', fill='white', line=color, line_width=3)
+    add_text(slide, theme, [left + 0.2, top + 0.15, width - 0.4, 0.5], [title], 'box_title',
+             color=title_color or color)
+
+
+def add_demo_box(slide, theme, box, caption, color):
+    """'LIVE DEMO' panel with a navigation caption (styles 'demo_title', 'demo_caption')"""
+    paragraphs = [
+        {'text': '\n\nLIVE DEMO', 'style': 'demo_title', 'color': color},
+        {'text': '\n' + caption, 'style': 'demo_caption'},
+    ]
+    return add_shape(slide, theme, box, 'rounded_rectangle', fill='light_gray', line=color,
+                     paragraphs=paragraphs, wrap=True)
+
+
+def _build_text(slide, theme, element, deck):
+    overrides = {k: element[k] for k in PARAGRAPH_PROPERTIES if k in element}
+    add_text(slide, theme, element['box'], element['paragraphs'], element.get('style'),
+             element.get('wrap'), **overrides)
+
+
+def _build_shape(slide, theme, element, deck):
+    add_shape(slide, theme, element['box'], element.get('shape', 'rectangle'), element.get('fill'),
+              element.get('line'), element.get('line_width'), element.get('paragraphs'),
+              element.get('style'), element.get('wrap'))
+
+
+ELEMENT_BUILDERS = {
+    'text': _build_text,
+    'shape': _build_shape,
+    'background': lambda slide, theme, e, deck: add_background(slide, theme, e['color'], deck['slide_size']),
+    'header': lambda slide, theme, e, deck: add_header(slide, theme, e['text'], e.get('color')),
+    'header_bar': lambda slide, theme, e, deck: add_header_bar(
+        slide, theme, e['title'], e.get('subtitle'), e.get('fill', 'primary'), deck['slide_size']),
+    'feature_box': lambda slide, theme, e, deck: add_feature_box(
+        slide, theme, e['box'], e['title'], e['bullets'], e['color']),
+    'rounded_box': lambda slide, theme, e, deck: add_rounded_box(
+        slide, theme, e['box'], e['title'], e['color'], e.get('title_color')),
+    'demo_box': lambda slide, theme, e, deck: add_demo_box(slide, theme, e['box'], e['caption'], e['color']),
+}
+
+
+# =============================================================================
+# RENDERING
+# =============================================================================
+
+def build_deck(spec, base_dir=None):
+    """Presentation for a spec dict (placeholders already filled)"""
+    template = spec.get('template')
+    if template is not None:
+        template = str((Path(base_dir or '.') / template).resolve())
+    prs = Presentation(io.BytesIO(template_bytes(template)))
+
+    slide_size = spec.get('slide_size', DEFAULT_SLIDE_SIZE)
+    prs.slide_width, prs.slide_height = Inches(slide_size[0]), Inches(slide_size[1])
+    deck = {'slide_size': slide_size}
+    theme = Theme(spec.get('colors'), spec.get('styles'))
+    default_layout = prs.slide_layouts[spec.get('layout', BLANK_LAYOUT)]
+
+    for slide_spec in spec['slides']:
+        layout = default_layout if 'layout' not in slide_spec else prs.slide_layouts[slide_spec['layout']]
+        slide = prs.slides.add_slide(layout)
+        for element in slide_spec.get('elements', []):
+            kind = element.get('type')
+            if kind not in ELEMENT_BUILDERS:
+                raise ValueError(f"Unknown element type '{kind}'")
+            ELEMENT_BUILDERS[kind](slide, theme, element, deck)
+
+    return prs
+
+
+def output_path_for(spec_path, variables=None, output_dir=None):
+    """Where a spec renders to: its 'output' name (placeholders filled) under output_dir"""
+    spec = load_spec(Path(spec_path).resolve())
+    if 'output' not in spec:
+        raise ValueError(f"{Path(spec_path).name} has no 'output' and no output path was given")
+    return Path(output_dir or DEFAULT_OUTPUT_DIR) / fill_placeholders(spec['output'], variables)
+
+
+def render_deck(spec_path, output_path=None, variables=None, output_dir=None):
+    """Render one deck from a spec file; returns the output path"""
+    spec_path = Path(spec_path).resolve()
+    if output_path is None:
+        output_path = output_path_for(spec_path, variables, output_dir)
+    spec = fill_placeholders(load_spec(spec_path), variables)
+
+    prs = build_deck(spec, spec_path.parent)
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    prs.save(output_path)
+    return output_path
+
+
+def _render_job(job):
+    spec_path, output_path, variables = job
+    return str(render_deck(spec_path, output_path, variables))
+
+
+def _warm_worker(spec_paths):
+    """Worker initializer: parse specs and load the default template up front"""
+    for path in spec_paths:
+        load_spec(path)
+    template_bytes()
+
+
+def render_batch(spec_paths, variable_rows=None, output_dir=None, workers=1):
+    """
+    Render every spec (once per variables row, when given) and return the
+    output paths in job order. workers > 1 spreads decks across processes.
+
+    A spec whose output name does not use the variables is rendered once,
+    with the first row.
+    """
+    spec_paths = [Path(p).resolve() for p in spec_paths]
+    jobs = {}
+    for path in spec_paths:
+        for row in variable_rows or [None]:
+            output_path = output_path_for(path, row, output_dir)
+            jobs.setdefault(output_path, (path, output_path, row))
+    jobs = list(jobs.values())
+
+    if workers <= 1 or len(jobs) <= 1:
+        return [_render_job(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs)), initializer=_warm_worker,
+                             initargs=(spec_paths,)) as pool:
+        return list(pool.map(_render_job, jobs))
+
+
+def read_variables(path):
+    """Variable rows from a CSV (one deck per row) or a JSON list of objects"""
+    path = Path(path)
+    if path.suffix.lower() == '.json':
+        return json.loads(path.read_text(encoding='utf-8'))
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render PowerPoint decks from slide specs')
+    parser.add_argument('specs', nargs='+', help='Spec files (.json, or .yaml with PyYAML)')
+    parser.add_argument('--vars', help='CSV or JSON list of variable rows; one deck per row and spec')
+    parser.add_argument('--output-dir', default=str(DEFAULT_OUTPUT_DIR),
+                        help='Directory for the specs\' output names (default: repo root)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes for batch rendering (default: CPU count)')
+    args = parser.parse_args()
+
+    variable_rows = read_variables(args.vars) if args.vars else None
+    outputs = render_batch(args.specs, variable_rows, args.output_dir, args.workers)
+    for path in outputs:
+        print(f"Presentation saved to: {path}")
+    print(f"\nRendered {len(outputs)} deck(s)")
+
+
+if __name__ == '__main__':
+    main()
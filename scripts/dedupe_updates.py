@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+"""
+Near-Duplicate Update Detection Across Sources
+===============================================
+The same status text often shows up in the weekly, monthly, SEP and meeting
+reference extracts for the same week. This stage finds those near-duplicates
+without comparing every pair of updates:
+
+1. Shingle each update_text into word 3-grams
+2. Build a MinHash signature per update (NumPy, fixed seed)
+3. Split signatures into LSH bands; only updates that share a band bucket
+   for the same solution_id become candidates
+4. Verify candidates by estimated Jaccard similarity and meeting_date
+   window; only rows from different source_documents can match
+5. Grow clusters in date order from their earliest row: a row joins a
+   matching cluster within window_days of that anchor that has no row from
+   its source yet. Keep one canonical row per cluster with the merged
+   update_ids and sources listed on it
+
+Work grows with the number of updates, not the number of pairs.
+
+Usage:
+    python dedupe_updates.py INPUT.xlsx [--output OUTPUT.xlsx]
+                             [--window-days 7] [--threshold 0.8]
+"""
+
+import argparse
+import re
+import zlib
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from excel_export import write_xlsx
+
+# Defaults
+DEFAULT_WINDOW_DAYS = 7
+DEFAULT_THRESHOLD = 0.8
+NUM_PERM = 128
+NUM_BANDS = 16          # 16 bands x 8 rows: candidates from ~0.7 similarity up
+SHINGLE_SIZE = 3
+MINHASH_SEED = 1
+SIGNATURE_CHUNK_SHINGLES = 20000
+
+# Bucket members compared per update (buckets are date-sorted, so this only
+# bounds pathological buckets of the same text repeated every week)
+MAX_BUCKET_LOOKBACK = 8
+
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+def shingle_hashes(text, k=SHINGLE_SIZE):
+    """Hash the word k-grams of a text into a uint64 array"""
+    if not isinstance(text, str):
+        return np.empty(0, dtype=np.uint64)
+
+    tokens = TOKEN_RE.findall(text.lower())
+    if not tokens:
+        return np.empty(0, dtype=np.uint64)
+
+    if len(tokens) <= k:
+        grams = {' '.join(tokens)}
+    else:
+        grams = {' '.join(tokens[i:i + k]) for i in range(len(tokens) - k + 1)}
+
+    return np.fromiter((zlib.crc32(g.encode('utf-8')) for g in grams), dtype=np.uint64, count=len(grams))
+
+
+class MinHasher:
+    """MinHash signatures from a fixed family of universal hash functions"""
+
+    def __init__(self, num_perm=NUM_PERM, seed=MINHASH_SEED):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self.a = rng.randint(1, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self.b = rng.randint(0, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+    def signatures(self, hash_sets, chunk_shingles=SIGNATURE_CHUNK_SHINGLES):
+        """
+        MinHash signatures for a list of non-empty shingle hash arrays.
+
+        Shingles of consecutive documents are permuted together in chunks of
+        about chunk_shingles rows, then reduced per document with reduceat,
+        so memory stays bounded by the chunk rather than the corpus.
+        """
+        result = np.empty((len(hash_sets), self.num_perm), dtype=np.uint64)
+        start = 0
+        while start < len(hash_sets):
+            end, size = start, 0
+            while end < len(hash_sets) and (size == 0 or size + len(hash_sets[end]) <= chunk_shingles):
+                size += len(hash_sets[end])
+                end += 1
+
+            chunk = hash_sets[start:end]
+            flat = np.concatenate(chunk)
+            offsets = np.cumsum([0] + [len(h) for h in chunk[:-1]])
+            permuted = ((flat[:, None] * self.a + self.b) % MERSENNE_PRIME) & MAX_HASH
+            result[start:end] = np.minimum.reduceat(permuted, offsets, axis=0)
+            start = end
+        return result
+
+
+class UnionFind:
+    """Disjoint sets over row positions"""
+
+    def __init__(self, size):
+        self.parent = np.arange(size)
+
+    def find(self, i):
+        root = i
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[i] != root:
+            self.parent[i], i = root, self.parent[i]
+        return root
+
+    def union(self, i, j):
+        ri, rj = self.find(i), self.find(j)
+        if ri != rj:
+            self.parent[max(ri, rj)] = min(ri, rj)
+
+    def labels(self):
+        return np.array([self.find(i) for i in range(len(self.parent))])
+
+
+def find_duplicate_clusters(df, window_days=DEFAULT_WINDOW_DAYS, threshold=DEFAULT_THRESHOLD,
+                            num_perm=NUM_PERM, num_bands=NUM_BANDS,
+                            text_column='update_text', key_column='solution_id',
+                            date_column='meeting_date', source_column='source_document'):
+    """
+    Label each row with a cluster id (position of the cluster's anchor row).
+
+    Rows match when they share solution_id, their meeting dates are at most
+    window_days apart, their estimated Jaccard similarity is at least
+    threshold and their source_document differs. Clusters are grown in date
+    order from their earliest row (the anchor): a row joins a matching
+    cluster only if it is within window_days of the anchor and no member
+    has the same source, so an update repeated week after week in one
+    source stays one row per week. Rows without text, solution_id or a
+    parseable date are never linked.
+    """
+    if num_perm % num_bands:
+        raise ValueError(f"num_perm ({num_perm}) must be divisible by num_bands ({num_bands})")
+
+    n = len(df)
+    rows_per_band = num_perm // num_bands
+    hasher = MinHasher(num_perm)
+
+    dates = pd.to_datetime(df[date_column], errors='coerce')
+    days = (dates - pd.Timestamp('1970-01-01')).dt.days.to_numpy()
+    keys = df[key_column].fillna('').astype(str).str.strip().to_numpy()
+    texts = df[text_column].to_numpy()
+    if source_column in df.columns:
+        sources = df[source_column].fillna('').astype(str).str.strip().to_numpy()
+    else:
+        sources = np.full(n, '', dtype=object)
+    # A blank source is unknown, never equal to another row's
+    sources = np.array([s or f'#{i}' for i, s in enumerate(sources)], dtype=object)
+
+    hash_sets = [
+        shingle_hashes(text) if keys[i] and not pd.isna(days[i]) else np.empty(0, dtype=np.uint64)
+        for i, text in enumerate(texts)
+    ]
+    usable = np.array([len(h) > 0 for h in hash_sets], dtype=bool)
+    signatures = np.zeros((n, num_perm), dtype=np.uint64)
+    if usable.any():
+        signatures[usable] = hasher.signatures([h for h in hash_sets if len(h)])
+
+    # Band buckets per solution, filled in date order
+    order = [i for i in np.argsort(days, kind='stable') if usable[i]]
+    buckets = defaultdict(list)
+    for i in order:
+        for band in range(num_bands):
+            chunk = signatures[i, band * rows_per_band:(band + 1) * rows_per_band]
+            buckets[(keys[i], band, chunk.tobytes())].append(i)
+
+    matches = defaultdict(set)
+    checked = set()
+    min_matches = threshold * num_perm
+
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        for pos, i in enumerate(members):
+            for j in members[max(0, pos - MAX_BUCKET_LOOKBACK):pos][::-1]:
+                if days[i] - days[j] > window_days:
+                    break
+                pair = (j, i)
+                if pair in checked:
+                    continue
+                checked.add(pair)
+                if sources[i] == sources[j]:
+                    continue
+                if np.count_nonzero(signatures[i] == signatures[j]) >= min_matches:
+                    matches[i].add(j)
+
+    # Grow clusters from their anchors in date order (no transitive chains)
+    labels = np.arange(n)
+    cluster_sources = {}
+    for i in order:
+        for j in sorted(matches[i], key=lambda j: days[j], reverse=True):
+            anchor = labels[j]
+            if days[i] - days[anchor] <= window_days and sources[i] not in cluster_sources[anchor]:
+                labels[i] = anchor
+                cluster_sources[anchor].add(sources[i])
+                break
+        else:
+            cluster_sources[i] = {sources[i]}
+
+    return labels
+
+
+def _join_unique_value(value):
+    return '' if pd.isna(value) else str(value).strip()
+
+
+def _join_unique(values):
+    seen = []
+    for value in map(_join_unique_value, values):
+        if value and value not in seen:
+            seen.append(value)
+    return '; '.join(seen)
+
+
+def dedupe_updates(df, window_days=DEFAULT_WINDOW_DAYS, threshold=DEFAULT_THRESHOLD,
+                   source_column='source_document', id_column='update_id', **kwargs):
+    """
+    Collapse near-duplicate updates to one canonical row per cluster.
+
+    The canonical row is the one with the longest update_text (earliest
+    meeting_date on ties). It gains merged_update_ids, merged_sources and
+    duplicate_count columns.
+
+    Returns (deduped_df, clusters_df), where clusters_df lists only the
+    clusters that merged more than one row.
+    """
+    if df.empty:
+        return df.copy(), pd.DataFrame()
+
+    work = df.reset_index(drop=True).copy()
+    work['_cluster'] = find_duplicate_clusters(work, window_days, threshold,
+                                               source_column=source_column, **kwargs)
+    work['_text_len'] = work['update_text'].fillna('').astype(str).str.len()
+    work['_date'] = pd.to_datetime(work['meeting_date'], errors='coerce')
+
+    ranked = work.sort_values(['_cluster', '_text_len', '_date'], ascending=[True, False, True])
+    canonical = ranked.drop_duplicates('_cluster').set_index('_cluster')
+    canonical['duplicate_count'] = ranked['_cluster'].value_counts()
+    canonical['merged_update_ids'] = canonical[id_column].map(_join_unique_value)
+    canonical['merged_sources'] = canonical[source_column].map(_join_unique_value)
+
+    # Only real clusters need their members joined
+    merged = ranked[ranked['_cluster'].map(canonical['duplicate_count']) > 1]
+    if not merged.empty:
+        grouped = merged.groupby('_cluster', sort=False)
+        canonical.loc[grouped.groups.keys(), 'merged_update_ids'] = grouped[id_column].agg(_join_unique)
+        canonical.loc[grouped.groups.keys(), 'merged_sources'] = grouped[source_column].agg(_join_unique)
+
+    deduped = canonical.sort_values('_date', ascending=False, kind='stable').reset_index(drop=True)
+    deduped = deduped.drop(columns=['_text_len', '_date'])
+
+    clusters = deduped[deduped['duplicate_count'] > 1][
+        [id_column, 'solution_id', 'meeting_date', 'duplicate_count', 'merged_update_ids', 'merged_sources']
+    ].reset_index(drop=True)
+
+    return deduped.reset_index(drop=True), clusters
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Collapse near-duplicate updates across sources')
+    parser.add_argument('input', type=Path, help='Updates xlsx (all sheets are read)')
+    parser.add_argument('--output', type=Path, help='Output xlsx (default: <input>_deduped.xlsx)')
+    parser.add_argument('--window-days', type=int, default=DEFAULT_WINDOW_DAYS,
+                        help=f'Max days between linked updates (default: {DEFAULT_WINDOW_DAYS})')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Min estimated Jaccard similarity (default: {DEFAULT_THRESHOLD})')
+    args = parser.parse_args()
+
+    output = args.output or args.input.with_name(f"{args.input.stem}_deduped.xlsx")
+
+    sheets = pd.read_excel(args.input, sheet_name=None)
+    df = pd.concat(sheets.values(), ignore_index=True)
+    print(f"Loaded {len(df)} updates from {len(sheets)} sheet(s)")
+
+    deduped, clusters = dedupe_updates(df, args.window_days, args.threshold)
+    print(f"Merged {len(df) - len(deduped)} near-duplicates into {len(clusters)} clusters")
+    print(f"Remaining updates: {len(deduped)}")
+
+    write_xlsx(output, {'Updates': deduped, 'Duplicates': clusters})
+
+    print(f"\nDeduplicated file written to: {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,12 +3,19 @@
 Diff Quick Look vs MO-DB_Solutions
 ==================================
 Shows differences between Quick Look (source of truth) and current database.
+Rows are compared with the hash-based diff engine in row_diff.py.
+
+Usage:
+    python diff_solutions.py [--output changes.json|changes.xlsx]
 """
 
+import argparse
 import pandas as pd
 from pathlib import Path
 import sys
-import re
+
+from row_diff import diff_tables
+from solution_name_index import SolutionNameIndex
 
 sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
@@ -86,36 +93,6 @@ NAME_MAPPINGS = {
 }
 
 
-def normalize_name(name):
-    if pd.isna(name):
-        return ''
-    return str(name).strip().lower().replace('(', '').replace(')', '').replace('-', ' ')
-
-
-def find_solution_match(quicklook_name, solutions_names):
-    if pd.isna(quicklook_name):
-        return None
-
-    ql_norm = normalize_name(quicklook_name)
-    ql_norm = re.sub(r'^cycle \d+\s*', '', ql_norm).strip()
-
-    for pattern, target in NAME_MAPPINGS.items():
-        if pattern in ql_norm:
-            if target in solutions_names:
-                return target
-
-    for sol_name in solutions_names:
-        if normalize_name(sol_name) == ql_norm:
-            return sol_name
-
-    for sol_name in solutions_names:
-        sol_norm = normalize_name(sol_name)
-        if sol_norm in ql_norm or ql_norm in sol_norm:
-            return sol_name
-
-    return None
-
-
 def safe_str(val, max_len=50):
     if pd.isna(val) or str(val).strip() == '':
         return '[empty]'
@@ -126,6 +103,10 @@ def safe_str(val, max_len=50):
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Diff Quick Look vs MO-DB_Solutions')
+    parser.add_argument('--output', type=Path, help='Also write the changeset (.json or .xlsx)')
+    args = parser.parse_args()
+
     base_dir = Path(__file__).parent.parent.parent
 
     quicklook_path = base_dir / 'Solution Status Quick Look_NSITE MO_C0_01-16-2026.xlsx'
@@ -147,6 +128,7 @@ def main():
 
     solutions_df = pd.read_excel(solutions_path)
     solutions_names = solutions_df['name'].dropna().tolist()
+    name_index = SolutionNameIndex(solutions_names, NAME_MAPPINGS, underscores=False)
 
     # Column mappings
     column_map = {
@@ -158,46 +140,27 @@ def main():
         'Earth Action Representative Affiliation': 'earth_action_affiliation',
     }
 
-    differences = []
-    empty_in_db = []
-
-    for _, poc_row in pocs_df.iterrows():
-        ql_name = poc_row.get('Solution') or poc_row.get('Title')
-        if pd.isna(ql_name) or not str(ql_name).strip():
-            continue
-
-        match = find_solution_match(ql_name, solutions_names)
-        if not match:
-            continue
-
-        sol_row = solutions_df[solutions_df['name'] == match].iloc[0]
-
-        for ql_col, sol_col in column_map.items():
-            if ql_col not in poc_row.index:
-                continue
-
-            ql_val = poc_row[ql_col]
-            db_val = sol_row.get(sol_col) if sol_col in sol_row.index else None
-
-            ql_empty = pd.isna(ql_val) or str(ql_val).strip() == ''
-            db_empty = pd.isna(db_val) or str(db_val).strip() == ''
-
-            if ql_empty:
-                continue  # No data in Quick Look
-
-            if db_empty:
-                empty_in_db.append({
-                    'solution': match,
-                    'field': sol_col,
-                    'quicklook_value': safe_str(ql_val)
-                })
-            elif str(ql_val).strip() != str(db_val).strip():
-                differences.append({
-                    'solution': match,
-                    'field': sol_col,
-                    'db_value': safe_str(db_val),
-                    'quicklook_value': safe_str(ql_val)
-                })
+    # Quick Look fields keyed on the matched DB name
+    ql_names = pocs_df['Solution'] if 'Solution' in pocs_df.columns else pocs_df.get('Title')
+    present = [c for c in column_map if c in pocs_df.columns]
+    quicklook = pocs_df[present].rename(columns=column_map)
+    quicklook['name'] = name_index.resolve(ql_names)['db_name'].to_numpy()
+    quicklook = quicklook[quicklook['name'].notna()]
+
+    changeset = diff_tables(solutions_df, quicklook, key='name',
+                            columns=[column_map[c] for c in present], skip_blank_new=True)
+    if args.output:
+        changeset.write(args.output)
+
+    empty_in_db = [
+        {'solution': c.key, 'field': c.field, 'quicklook_value': safe_str(c.new_value)}
+        for c in changeset.of_kind('filled').itertuples()
+    ]
+    differences = [
+        {'solution': c.key, 'field': c.field, 'db_value': safe_str(c.old_value),
+         'quicklook_value': safe_str(c.new_value)}
+        for c in changeset.of_kind('changed').itertuples()
+    ]
 
     # Report
     print(f"\n{'='*90}")
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+Shared xlsx Export
+==================
+One writer for the review/import workbooks the extract and combine scripts
+produce, instead of each building an openpyxl workbook in memory and sizing
+columns by hand.
+
+- rows are streamed with xlsxwriter in constant-memory mode, so writing the
+  full update history keeps memory flat
+- columns are addressed by index, so any number of columns works (no
+  chr(65 + idx) letter arithmetic)
+- autofit widths come from str.len over a bounded row sample instead of a
+  str copy of every column
+- sanitize_for_excel / sanitize_columns drop Excel-illegal control
+  characters with a str.translate table
+
+Usage:
+    from excel_export import write_xlsx, sanitize_columns
+    write_xlsx(OUTPUT_PATH, {'Updates': df}, max_width=60)
+"""
+
+import pandas as pd
+import xlsxwriter
+
+# Control characters Excel rejects (tab, newline and CR are allowed)
+ILLEGAL_CHARS_TABLE = dict.fromkeys([*range(0x00, 0x09), 0x0b, 0x0c, *range(0x0e, 0x20)])
+# ...and CR folded into newlines, for text pulled from slides/documents
+EXCEL_TEXT_TABLE = {**ILLEGAL_CHARS_TABLE, ord('\r'): '\n'}
+
+DEFAULT_MAX_WIDTH = 60
+DEFAULT_WIDTH = 15
+WIDTH_PADDING = 2
+WIDTH_SAMPLE_ROWS = 2000
+
+
+def sanitize_for_excel(text):
+    """Remove characters that can't be written to Excel (CR becomes newline)"""
+    if not text:
+        return text
+    return text.translate(EXCEL_TEXT_TABLE)
+
+
+def sanitize_columns(df, columns, fold_cr=False):
+    """Column-wise sanitize in place (missing -> ''); returns df"""
+    table = EXCEL_TEXT_TABLE if fold_cr else ILLEGAL_CHARS_TABLE
+    for col in columns:
+        if col in df.columns:
+            df[col] = df[col].fillna('').astype(str).str.translate(table)
+    return df
+
+
+def autofit_widths(df, max_width=DEFAULT_MAX_WIDTH, sample_rows=WIDTH_SAMPLE_ROWS):
+    """
+    {column: width} from the longest value or header, capped at max_width.
+
+    Large frames are measured on a fixed random sample of sample_rows rows;
+    long text columns hit max_width either way.
+    """
+    sample = df if len(df) <= sample_rows else df.sample(sample_rows, random_state=0)
+    widths = {}
+    for idx, col in enumerate(df.columns):
+        values = sample.iloc[:, idx]
+        # Missing values count as empty (astype(str) keeps NaN in pandas 3)
+        longest = values.astype(object).fillna('').astype(str).str.len().max() if len(values) else 0
+        widths[col] = min(max(int(longest), len(str(col))) + WIDTH_PADDING, max_width)
+    return widths
+
+
+def _rows(frame):
+    """Row tuples with missing values as None and Timestamps as datetimes"""
+    values = frame.astype(object).where(frame.notna(), None)
+    for idx, dtype in enumerate(frame.dtypes):
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            values.iloc[:, idx] = [v.to_pydatetime() if v is not None else None for v in values.iloc[:, idx]]
+    return values.itertuples(index=False, name=None)
+
+
+def write_xlsx(path, sheets, widths='auto', max_width=DEFAULT_MAX_WIDTH, default_width=DEFAULT_WIDTH):
+    """
+    Stream DataFrames to one xlsx file.
+
+    sheets: {sheet name: DataFrame} or [(sheet name, DataFrame)], written in
+    order. widths: 'auto' to autofit each sheet, a {column: width} dict
+    (other columns get default_width), or None to leave Excel defaults.
+    Strings are written as text (no URL or formula conversion).
+    """
+    items = sheets.items() if isinstance(sheets, dict) else sheets
+    workbook = xlsxwriter.Workbook(str(path), {
+        'constant_memory': True,
+        'strings_to_urls': False,
+        'strings_to_formulas': False,
+        'default_date_format': 'yyyy-mm-dd',
+    })
+    header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+
+    try:
+        for sheet_name, frame in items:
+            worksheet = workbook.add_worksheet(sheet_name)
+
+            if widths is not None:
+                sheet_widths = autofit_widths(frame, max_width) if widths == 'auto' else widths
+                for idx, col in enumerate(frame.columns):
+                    worksheet.set_column(idx, idx, sheet_widths.get(col, default_width))
+
+            # constant_memory flushes each row once the next one starts,
+            # so cells are written strictly row by row
+            worksheet.write_row(0, 0, [str(c) for c in frame.columns], header_format)
+            write_string, write = worksheet.write_string, worksheet.write
+            for row_idx, row in enumerate(_rows(frame), start=1):
+                for col_idx, value in enumerate(row):
+                    if value is None:
+                        continue
+                    if isinstance(value, str):
+                        write_string(row_idx, col_idx, value)  # skips per-cell type sniffing
+                    else:
+                        write(row_idx, col_idx, value)
+    finally:
+        workbook.close()
@@ -7,10 +7,10 @@ Extracts actual dates from the Quick Look inner tabs and merges with final impor
 
 import pandas as pd
 from pathlib import Path
-from datetime import datetime
-import re
 import sys
 
+from date_parsing import parse_dates
+
 sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
 # Column mapping from SNWG MO Cycles sheet
@@ -97,46 +97,6 @@ def normalize_name(name):
     return result
 
 
-def parse_date(val):
-    """Parse a date value - could be datetime, string, or text with date."""
-    if pd.isna(val):
-        return None
-
-    # Already a datetime
-    if isinstance(val, (datetime, pd.Timestamp)):
-        return val.strftime('%Y-%m-%d')
-
-    val_str = str(val).strip()
-    if not val_str:
-        return None
-
-    # Skip non-date values
-    skip_values = ['working', 'tbd', 'pending', 'x', 'nan', 'snwg monthly', 'est.', 'estimated']
-    if val_str.lower() in skip_values or val_str.lower().startswith('est'):
-        return None
-
-    # Try to extract date from string like "03/26/2024\nWorking" or "SADR 6/25/2024"
-    date_patterns = [
-        r'(\d{1,2}/\d{1,2}/\d{4})',  # MM/DD/YYYY or M/D/YYYY
-        r'(\d{4}-\d{2}-\d{2})',       # YYYY-MM-DD
-    ]
-
-    for pattern in date_patterns:
-        match = re.search(pattern, val_str)
-        if match:
-            date_str = match.group(1)
-            try:
-                if '/' in date_str:
-                    dt = datetime.strptime(date_str, '%m/%d/%Y')
-                else:
-                    dt = datetime.strptime(date_str, '%Y-%m-%d')
-                return dt.strftime('%Y-%m-%d')
-            except ValueError:
-                continue
-
-    return None
-
-
 def get_solution_id(name):
     """Get solution_id from Quick Look name using keyword matching."""
     if pd.isna(name):
@@ -189,6 +149,12 @@ def main():
     # Extract dates from cycles sheet (data starts at row 7)
     dates_extracted = {}
 
+    # Parse each mapped date column once, not cell by cell
+    parsed_columns = {
+        col_idx: parse_dates(cycles_df.iloc[:, col_idx], 'cycles')
+        for col_idx in COLUMN_MAP if col_idx < cycles_df.shape[1]
+    }
+
     for row_idx in range(7, cycles_df.shape[0]):
         row = cycles_df.iloc[row_idx]
         solution_name = row.iloc[0]
@@ -204,8 +170,8 @@ def main():
         # Extract dates from mapped columns
         dates = {}
         for col_idx, (field_name, desc) in COLUMN_MAP.items():
-            if col_idx < len(row):
-                date_val = parse_date(row.iloc[col_idx])
+            if col_idx in parsed_columns:
+                date_val = parsed_columns[col_idx].iat[row_idx]
                 if date_val:
                     dates[field_name] = date_val
 
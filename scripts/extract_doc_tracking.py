@@ -9,9 +9,10 @@ Generates CSV with document completion status for each solution.
 import pandas as pd
 from pathlib import Path
 import sys
-import re
 from datetime import datetime
 
+from solution_name_index import SolutionNameIndex
+
 sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
 # Name mappings - more specific patterns first
@@ -86,43 +87,6 @@ NAME_MAPPINGS = {
 }
 
 
-def normalize_name(name):
-    if pd.isna(name):
-        return ''
-    result = str(name).strip().lower()
-    result = result.replace('(', '').replace(')', '').replace('-', ' ').replace('_', ' ')
-    # Collapse multiple spaces
-    result = ' '.join(result.split())
-    return result
-
-
-def find_db_name(ql_name, db_names):
-    if pd.isna(ql_name):
-        return None
-    norm = normalize_name(ql_name)
-    norm = re.sub(r'^cycle \d+\s*', '', norm).strip()
-
-    # Check mappings in order (specific patterns first due to dict ordering in Python 3.7+)
-    for pattern, target in NAME_MAPPINGS.items():
-        if pattern in norm:
-            if target in db_names:
-                return target
-
-    # Exact match
-    for db_name in db_names:
-        if normalize_name(db_name) == norm:
-            return db_name
-
-    # Substring match - but be careful with short names
-    for db_name in db_names:
-        db_norm = normalize_name(db_name)
-        # Only match if it's a significant portion
-        if len(db_norm) > 3 and (db_norm in norm or norm in db_norm):
-            return db_name
-
-    return None
-
-
 def count_filled(record):
     """Count non-empty fields in a record."""
     count = 0
@@ -173,6 +137,7 @@ def main():
     # Read current database for solution names
     db_df = pd.read_excel(solutions_path)
     db_names = db_df['name'].dropna().tolist()
+    name_index = SolutionNameIndex(db_names, NAME_MAPPINGS, collapse_spaces=True, min_substring=3)
     print(f"\nDatabase has {len(db_names)} solutions")
 
     # =========================================================================
@@ -259,7 +224,7 @@ def main():
         if pd.isna(sol_name_ql) or not str(sol_name_ql).strip():
             continue
 
-        db_name = find_db_name(sol_name_ql, db_names)
+        db_name = name_index.find(sol_name_ql)
         if not db_name:
             print(f"  No match for: {sol_name_ql}")
             continue
@@ -317,7 +282,7 @@ def main():
             if pd.isna(sol_name_ql) or not str(sol_name_ql).strip():
                 continue
 
-            db_name = find_db_name(sol_name_ql, db_names)
+            db_name = name_index.find(sol_name_ql)
             if not db_name:
                 continue
 
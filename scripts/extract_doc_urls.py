@@ -3,13 +3,20 @@
 Extract Document URLs from File Log
 ====================================
 Extracts Google Drive URLs for SOW, Project Plans, IPA, ICD, Risk Registers, Fact Sheets, etc.
+
+The file log is processed column-wise: solution and document type come from
+one ordered regex per mapping, the preferred file per document is picked
+with drop_duplicates, and the result is merged into the blank cells of the
+final import in one pass per field.
 """
 
 import pandas as pd
 from pathlib import Path
-import re
 import sys
 
+from date_parsing import dates_from_filenames
+from text_normalization import first_substring_match_series
+
 sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
 # Solution name mappings from file names
@@ -42,82 +49,115 @@ SOLUTION_MAPPINGS = {
 }
 
 
-def get_solution_id(filename):
-    """Extract solution ID from filename."""
-    filename_lower = filename.lower()
-
-    # Try exact matches first
-    for pattern, sol_id in SOLUTION_MAPPINGS.items():
-        if pattern in filename_lower:
-            # Avoid false matches
-            if pattern == 'hls' and ('hls ll' in filename_lower or 'hls vi' in filename_lower):
-                continue
-            if pattern == 'tempo' and 'tempo nrt' in filename_lower:
-                continue
-            return sol_id
-    return None
-
-
-def get_doc_type(filename):
-    """Determine document type from filename."""
-    filename_lower = filename.lower()
-
-    # Check for specific document types
-    if 'science sow' in filename_lower or 'nasa science sow' in filename_lower:
-        return 'science_sow'
-    elif 'sow' in filename_lower:
-        return 'science_sow'
-    elif 'project plan' in filename_lower:
-        return 'project_plan'
-    elif 'ipa' in filename_lower:
-        return 'ipa'
-    elif 'icd' in filename_lower:
-        return 'icd'
-    elif 'risk register' in filename_lower:
-        return 'risk_register'
-    elif 'fact sheet' in filename_lower:
-        return 'fact_sheet'
-    elif 'tech eval' in filename_lower:
-        return 'tech_eval'
-    return None
-
-
-def build_url(file_id, mime_type):
-    """Build Google Drive URL based on file type."""
-    if pd.isna(mime_type):
-        mime_type = ''
-    mime_type = str(mime_type).lower()
-
-    if 'document' in mime_type:
-        return f"https://docs.google.com/document/d/{file_id}/edit"
-    elif 'spreadsheet' in mime_type:
-        return f"https://docs.google.com/spreadsheets/d/{file_id}/edit"
-    elif 'presentation' in mime_type:
-        return f"https://docs.google.com/presentation/d/{file_id}/edit"
-    elif 'pdf' in mime_type:
-        return f"https://drive.google.com/file/d/{file_id}/view"
-    else:
-        return f"https://drive.google.com/file/d/{file_id}/view"
-
-
-def extract_date_from_filename(filename):
-    """Try to extract a date from the filename."""
-    # Patterns like _2024-11-01, _C3_2024-04-25, etc.
-    patterns = [
-        r'(\d{4}-\d{2}-\d{2})',  # YYYY-MM-DD
-        r'(\d{2}-\d{2}-\d{4})',  # MM-DD-YYYY
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, filename)
-        if match:
-            date_str = match.group(1)
-            # Convert to YYYY-MM-DD if needed
-            if len(date_str.split('-')[0]) == 2:
-                parts = date_str.split('-')
-                return f"{parts[2]}-{parts[0]}-{parts[1]}"
-            return date_str
-    return None
+# Document types by filename substring, checked in order ('science sow' is a sow)
+DOC_TYPES = {
+    'sow': 'science_sow',
+    'project plan': 'project_plan',
+    'ipa': 'ipa',
+    'icd': 'icd',
+    'risk register': 'risk_register',
+    'fact sheet': 'fact_sheet',
+    'tech eval': 'tech_eval',
+}
+
+# File log columns: Unnamed: 4 = file_id, Unnamed: 5 = mime_type
+FILE_ID_COLUMN = 'Unnamed: 4'
+MIME_TYPE_COLUMN = 'Unnamed: 5'
+
+# Mime type substring -> Google Docs URL path (anything else is a Drive file)
+DOCS_URL_PATHS = {
+    'document': 'document',
+    'spreadsheet': 'spreadsheets',
+    'presentation': 'presentation',
+}
+
+
+def build_urls(file_ids, mime_types):
+    """Google Drive URL per file, based on its (lowercase) mime type."""
+    urls = 'https://drive.google.com/file/d/' + file_ids + '/view'
+    # Applied in reverse so the first matching mime type wins
+    for mime, path in reversed(DOCS_URL_PATHS.items()):
+        is_doc = mime_types.str.contains(mime, regex=False)
+        urls = urls.where(~is_doc, f'https://docs.google.com/{path}/d/' + file_ids + '/edit')
+    return urls
+
+
+def find_documents(file_log):
+    """
+    Document files in the file log, in log order.
+
+    Returns a frame of solution_id, doc_type, filename, url, date and
+    preferred (neither archived nor a shortcut). Templates, unrecognized
+    files and rows without a file ID are left out.
+    """
+    filenames = file_log.get('File Title', pd.Series('', index=file_log.index)).map(str)
+    file_ids = file_log.get(FILE_ID_COLUMN, pd.Series('', index=file_log.index))
+    mime_types = file_log.get(MIME_TYPE_COLUMN, pd.Series('', index=file_log.index))
+    mime_types = mime_types.where(mime_types.notna(), '').map(str).str.lower()
+    lower = filenames.str.lower()
+
+    docs = pd.DataFrame({
+        'solution_id': first_substring_match_series(filenames, SOLUTION_MAPPINGS),
+        'doc_type': first_substring_match_series(filenames, DOC_TYPES),
+        'filename': filenames,
+    })
+    keep = (
+        (filenames != '') & ~lower.str.contains('template', regex=False)
+        & docs['solution_id'].notna() & docs['doc_type'].notna()
+        & file_ids.notna() & file_ids.map(bool)
+    )
+
+    docs = docs[keep].copy()
+    docs['url'] = build_urls(file_ids[keep].map(str).str.strip(), mime_types[keep])
+    docs['date'] = dates_from_filenames(docs['filename'], anywhere=True)
+    docs['preferred'] = ~(lower[keep].str.contains('archived', regex=False)
+                          | mime_types[keep].str.contains('shortcut', regex=False))
+    return docs
+
+
+def select_documents(docs):
+    """
+    One URL and status per (solution, doc type), as a frame indexed by
+    solution_id with a column per field.
+
+    The first file found is taken and then replaced by each later preferred
+    file, so the URL is the last preferred file (the first file if none is
+    preferred) and the status is the date of the last of those that has one.
+    """
+    keys = ['solution_id', 'doc_type']
+    candidates = docs[docs['preferred'] | ~docs.duplicated(keys)]
+    urls = candidates.drop_duplicates(keys, keep='last')
+    dates = candidates[candidates['date'].notna()].drop_duplicates(keys, keep='last')
+
+    # The webapp expects status in the base field (e.g., "project_plan", not "project_plan_date")
+    # It interprets dates as "Complete" status
+    fields = pd.concat([
+        pd.DataFrame({'solution_id': urls['solution_id'], 'field': urls['doc_type'] + '_url',
+                      'value': urls['url']}),
+        pd.DataFrame({'solution_id': dates['solution_id'], 'field': dates['doc_type'],
+                      'value': dates['date']}),
+    ])
+    return fields.pivot(index='solution_id', columns='field', values='value')
+
+
+def is_blank(values):
+    """True where a cell is missing or whitespace only."""
+    return values.isna() | (values.map(str).str.strip() == '')
+
+
+def fill_blank_fields(final_df, fields):
+    """
+    Fill blank cells of final_df from a solution_id-indexed frame of values
+    (only columns final_df already has). Returns {field: cells filled}.
+    """
+    filled_counts = {}
+    for field in fields.columns.intersection(final_df.columns):
+        found = final_df['solution_id'].map(fields[field].dropna())
+        current = final_df[field]
+        filled = is_blank(current) & found.notna()
+        final_df[field] = current.mask(filled).combine_first(found.where(filled))
+        filled_counts[field] = int(filled.sum())
+    return filled_counts
 
 
 def main():
@@ -137,83 +177,18 @@ def main():
     final_df = pd.read_csv(final_csv_path)
     print(f"Final import: {len(final_df)} solutions")
 
-    # Document types to extract
-    doc_types = ['science_sow', 'project_plan', 'ipa', 'icd', 'risk_register', 'fact_sheet', 'tech_eval']
-
     # Find document files
-    doc_data = {}  # {solution_id: {doc_type_url: url, doc_type_date: date}}
-
-    for _, row in file_log.iterrows():
-        filename = str(row.get('File Title', ''))
-        if not filename or pd.isna(filename):
-            continue
-
-        # Skip archived and template files
-        if 'template' in filename.lower():
-            continue
-
-        solution_id = get_solution_id(filename)
-        doc_type = get_doc_type(filename)
-
-        if not solution_id or not doc_type:
-            continue
-
-        # Get file ID and mime type
-        file_id = row.get('Unnamed: 4', '')
-        mime_type = row.get('Unnamed: 5', '')
-
-        if pd.isna(file_id) or not file_id:
-            continue
-
-        file_id = str(file_id).strip()
-
-        url = build_url(file_id, mime_type)
-        url_field = f"{doc_type}_url"
-        # The webapp expects status in the base field (e.g., "project_plan", not "project_plan_date")
-        # It interprets dates as "Complete" status
-        status_field = doc_type
-
-        # Try to extract date from filename
-        date_val = extract_date_from_filename(filename)
-
-        if solution_id not in doc_data:
-            doc_data[solution_id] = {}
-
-        # Prefer non-archived, non-shortcut files
-        is_archived = 'archived' in filename.lower()
-        is_shortcut = 'shortcut' in str(mime_type).lower()
-
-        # Only set if not already set, or if this is a better version
-        if url_field not in doc_data[solution_id]:
-            doc_data[solution_id][url_field] = url
-            # Set status to date if we have one (webapp interprets date as Complete)
-            if date_val:
-                doc_data[solution_id][status_field] = date_val
-            print(f"  [{solution_id}] {doc_type}: {filename[:50]}...")
-        elif not is_archived and not is_shortcut:
-            # Replace with better version
-            doc_data[solution_id][url_field] = url
-            if date_val:
-                doc_data[solution_id][status_field] = date_val
+    docs = find_documents(file_log)
+    for row in docs.drop_duplicates(['solution_id', 'doc_type']).itertuples():
+        print(f"  [{row.solution_id}] {row.doc_type}: {row.filename[:50]}...")
 
-    print(f"\nFound documents for {len(doc_data)} solutions")
+    doc_fields = select_documents(docs)
+    print(f"\nFound documents for {len(doc_fields)} solutions")
 
     # Update final dataframe
-    url_updates = 0
-    status_updates = 0
-
-    for idx, row in final_df.iterrows():
-        sol_id = row['solution_id']
-        if sol_id in doc_data:
-            for field, value in doc_data[sol_id].items():
-                if field in final_df.columns:
-                    current_val = final_df.at[idx, field]
-                    if pd.isna(current_val) or str(current_val).strip() == '':
-                        final_df.at[idx, field] = value
-                        if field.endswith('_url'):
-                            url_updates += 1
-                        else:
-                            status_updates += 1
+    filled = fill_blank_fields(final_df, doc_fields)
+    url_updates = sum(n for field, n in filled.items() if field.endswith('_url'))
+    status_updates = sum(n for field, n in filled.items() if not field.endswith('_url'))
 
     print(f"Applied {url_updates} URL updates, {status_updates} status updates")
 
@@ -227,21 +202,12 @@ def main():
 
     # Summary
     print("\nDocument fields with data:")
-    for doc_type in doc_types:
+    for doc_type in dict.fromkeys(DOC_TYPES.values()):
         url_col = f"{doc_type}_url"
         status_col = doc_type  # webapp expects status in the base field
 
-        if url_col in final_df.columns:
-            url_filled = final_df[url_col].notna() & (final_df[url_col].astype(str).str.strip() != '')
-            url_count = url_filled.sum()
-        else:
-            url_count = 0
-
-        if status_col in final_df.columns:
-            status_filled = final_df[status_col].notna() & (final_df[status_col].astype(str).str.strip() != '')
-            status_count = status_filled.sum()
-        else:
-            status_count = 0
+        url_count = (~is_blank(final_df[url_col])).sum() if url_col in final_df.columns else 0
+        status_count = (~is_blank(final_df[status_col])).sum() if status_col in final_df.columns else 0
 
         if url_count > 0 or status_count > 0:
             print(f"  {doc_type}: {url_count} URLs, {status_count} status")
@@ -13,11 +13,13 @@ import docx
 from docx.oxml.ns import qn
 from pathlib import Path
 import pandas as pd
-import csv
 import re
 from datetime import datetime
 import uuid
 
+from date_parsing import date_from_filename
+from update_batch import UpdateBatch
+
 # Configuration
 NEW_MARKER = '🆕'
 BASE_PATH = Path(r"C:\Users\cjtucke3\Documents\Personal\MO-development\source-archives\Weekly Internal Planning")
@@ -201,9 +203,9 @@ def is_solution_header(text, solution_mapping):
     return False
 
 
-def parse_items_notes_format(doc, doc_path, meeting_date, solution_mapping):
+def parse_items_notes_format(doc, doc_path, meeting_date, solution_mapping, batch):
     """Parse FY24+ style documents with Items/Notes table format"""
-    updates = []
+    count = 0
 
     for table in doc.tables:
         # Check if this is the main content table
@@ -298,26 +300,21 @@ def parse_items_notes_format(doc, doc_path, meeting_date, solution_mapping):
                     if len(full_text.strip()) < 10:
                         continue
 
-                    updates.append({
-                        'update_id': generate_update_id(),
-                        'solution_id': current_solution,
-                        'update_text': full_text,
-                        'source_document': 'Internal Planning',
-                        'source_category': 'MO',
-                        'source_url': '',
-                        'source_tab': doc_path.name,
-                        'meeting_date': meeting_date,
-                        'created_at': datetime.now().isoformat(),
-                        'created_by': 'historical_import',
-                        'has_new_marker': has_new_marker
-                    })
+                    batch.append(
+                        solution_id=current_solution,
+                        update_text=full_text,
+                        source_tab=doc_path.name,
+                        meeting_date=meeting_date,
+                        has_new_marker=has_new_marker
+                    )
+                    count += 1
 
-    return updates
+    return count
 
 
-def parse_agenda_format(doc, doc_path, meeting_date, solution_mapping):
+def parse_agenda_format(doc, doc_path, meeting_date, solution_mapping, batch):
     """Parse FY22-FY23 style documents with agenda format"""
-    updates = []
+    count = 0
 
     # These documents often have content after the header table
     # Look for bullet lists in paragraphs or later tables
@@ -343,19 +340,14 @@ def parse_agenda_format(doc, doc_path, meeting_date, solution_mapping):
                 continue
             if 'action item' in text.lower():
                 continue
-            updates.append({
-                'update_id': generate_update_id(),
-                'solution_id': current_solution,
-                'update_text': text,
-                'source_document': 'Internal Planning',
-                'source_category': 'MO',
-                'source_url': '',
-                'source_tab': doc_path.name,
-                'meeting_date': meeting_date,
-                'created_at': datetime.now().isoformat(),
-                'created_by': 'historical_import',
-                'has_new_marker': False
-            })
+            batch.append(
+                solution_id=current_solution,
+                update_text=text,
+                source_tab=doc_path.name,
+                meeting_date=meeting_date,
+                has_new_marker=False
+            )
+            count += 1
 
     # Also check tables beyond the header
     for table in doc.tables[1:] if len(doc.tables) > 1 else []:
@@ -377,21 +369,16 @@ def parse_agenda_format(doc, doc_path, meeting_date, solution_mapping):
                             continue
                         if 'action item' in text.lower():
                             continue
-                        updates.append({
-                            'update_id': generate_update_id(),
-                            'solution_id': current_solution,
-                            'update_text': text,
-                            'source_document': 'Internal Planning',
-                            'source_category': 'MO',
-                            'source_url': '',
-                            'source_tab': doc_path.name,
-                            'meeting_date': meeting_date,
-                            'created_at': datetime.now().isoformat(),
-                            'created_by': 'historical_import',
-                            'has_new_marker': False
-                        })
-
-    return updates
+                        batch.append(
+                            solution_id=current_solution,
+                            update_text=text,
+                            source_tab=doc_path.name,
+                            meeting_date=meeting_date,
+                            has_new_marker=False
+                        )
+                        count += 1
+
+    return count
 
 
 def detect_document_format(doc):
@@ -413,33 +400,25 @@ def detect_document_format(doc):
         return 'items_notes'  # Default to items/notes parsing
 
 
-def parse_document(doc_path, meeting_date, solution_mapping):
+def parse_document(doc_path, meeting_date, solution_mapping, batch):
     """Parse a document and extract updates"""
     try:
         doc = docx.Document(doc_path)
     except Exception as e:
         print(f"  Error opening {doc_path.name}: {e}")
-        return []
+        return 0
 
     doc_format = detect_document_format(doc)
 
     if doc_format == 'items_notes':
-        return parse_items_notes_format(doc, doc_path, meeting_date, solution_mapping)
+        return parse_items_notes_format(doc, doc_path, meeting_date, solution_mapping, batch)
     elif doc_format == 'agenda':
-        return parse_agenda_format(doc, doc_path, meeting_date, solution_mapping)
+        return parse_agenda_format(doc, doc_path, meeting_date, solution_mapping, batch)
     else:
-        return []
-
-
-def extract_date_from_filename(filename):
-    """Extract meeting date from filename"""
-    match = re.match(r'(\d{4}-\d{2}-\d{2})', filename)
-    if match:
-        return match.group(1)
-    return None
+        return 0
 
 
-def parse_consolidated_document(doc_path, solution_mapping):
+def parse_consolidated_document(doc_path, solution_mapping, batch):
     """
     Parse consolidated document (e.g., Weekly Internal Planning Meeting_NSITE MO_C0_2026.docx)
     These files contain multiple meetings with date markers in MM_DD format.
@@ -449,13 +428,13 @@ def parse_consolidated_document(doc_path, solution_mapping):
         doc = docx.Document(doc_path)
     except Exception as e:
         print(f"  Error opening {doc_path.name}: {e}")
-        return []
+        return 0
 
     # Extract year from filename (e.g., _C0_2026.docx -> 2026)
     year_match = re.search(r'_C0_(\d{4})\.docx', doc_path.name)
     current_year = int(year_match.group(1)) if year_match else datetime.now().year
 
-    updates = []
+    count = 0
     current_meeting_date = None
     date_pattern = re.compile(r'^(\d{2})_(\d{2})$')  # MM_DD pattern
     year_pattern_re = re.compile(r'^(20\d{2})$')  # Year pattern
@@ -557,25 +536,30 @@ def parse_consolidated_document(doc_path, solution_mapping):
                     if len(full_text.strip()) < 10:
                         continue
 
-                    updates.append({
-                        'update_id': generate_update_id(),
-                        'solution_id': current_solution,
-                        'update_text': full_text,
-                        'source_document': 'Internal Planning',
-                        'source_category': 'MO',
-                        'source_url': '',
-                        'source_tab': meeting_date or doc_path.name,
-                        'meeting_date': meeting_date or '',
-                        'created_at': datetime.now().isoformat(),
-                        'created_by': 'historical_import',
-                        'has_new_marker': has_new_marker
-                    })
+                    batch.append(
+                        solution_id=current_solution,
+                        update_text=full_text,
+                        source_tab=meeting_date or doc_path.name,
+                        meeting_date=meeting_date or '',
+                        has_new_marker=has_new_marker
+                    )
+                    count += 1
 
-    return updates
+    return count
+
+
+def new_batch():
+    """Empty UpdateBatch with this importer's defaults"""
+    return UpdateBatch(CSV_HEADERS + ['has_new_marker'], defaults={
+        'source_document': 'Internal Planning',
+        'source_category': 'MO',
+        'created_by': 'historical_import',
+        'has_new_marker': False,
+    }, id_factory=generate_update_id)
 
 
 def main():
-    all_updates = []
+    batch = new_batch()
     files_processed = 0
 
     print("Building solution name to core_id mapping...")
@@ -593,54 +577,43 @@ def main():
             print(f"Processing {fy_folder.name}...")
             fy_updates = 0
             for doc_file in sorted(fy_folder.glob("*.docx")):
-                meeting_date = extract_date_from_filename(doc_file.name)
+                meeting_date = date_from_filename(doc_file.name)
                 if meeting_date:
-                    updates = parse_document(doc_file, meeting_date, solution_mapping)
-                    if updates:
-                        fy_updates += len(updates)
-                        all_updates.extend(updates)
+                    fy_updates += parse_document(doc_file, meeting_date, solution_mapping, batch)
                     files_processed += 1
             print(f"  {fy_updates} updates from {fy_folder.name}")
 
     # Process consolidated docs (_C0_ files for 2025, 2026)
     for doc_file in sorted(BASE_PATH.glob("*_C0_*.docx")):
         print(f"Processing consolidated file: {doc_file.name}...")
-        updates = parse_consolidated_document(doc_file, solution_mapping)
-        if updates:
-            print(f"  Found {len(updates)} updates")
-            all_updates.extend(updates)
+        count = parse_consolidated_document(doc_file, solution_mapping, batch)
+        if count:
+            print(f"  Found {count} updates")
         files_processed += 1
 
     print()
     print(f"Total files processed: {files_processed}")
-    print(f"Total updates found: {len(all_updates)}")
+    print(f"Total updates found: {len(batch)}")
 
     # Count updates with explicit NEW markers
-    new_marked = sum(1 for u in all_updates if u.get('has_new_marker'))
+    new_marked = sum(map(bool, batch.column('has_new_marker')))
     print(f"Updates with NEW marker: {new_marked}")
 
+    # Internal tracking field is left out of the export
+    df = batch.to_frame(CSV_HEADERS)
+
     # Count by solution
-    by_solution = {}
-    for u in all_updates:
-        sol = u['solution_id']
-        by_solution[sol] = by_solution.get(sol, 0) + 1
+    by_solution = df['solution_id'].value_counts()
 
     print(f"Unique solutions: {len(by_solution)}")
     print("\nTop 10 solutions by update count:")
-    for sol, count in sorted(by_solution.items(), key=lambda x: -x[1])[:10]:
+    for sol, count in by_solution.head(10).items():
         print(f"  {sol}: {count}")
 
-    # Remove internal tracking field before export
-    for u in all_updates:
-        u.pop('has_new_marker', None)
-
     # Write CSV
-    if all_updates:
+    if len(df):
         OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with open(OUTPUT_PATH, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=CSV_HEADERS)
-            writer.writeheader()
-            writer.writerows(all_updates)
+        df.to_csv(OUTPUT_PATH, index=False, encoding='utf-8')
         print(f"\nCSV written to: {OUTPUT_PATH}")
     else:
         print("\nNo updates found to export.")
@@ -14,6 +14,9 @@ from pathlib import Path
 from datetime import datetime
 import uuid
 
+from update_batch import UpdateBatch, UPDATE_COLUMNS
+from update_shards import write_year_shards, print_shard_counts
+
 # Input/Output
 FILE_LOG = Path(r"C:\Users\cjtucke3\Documents\Personal\MO-development\source-archives\file log - Sheet1.csv")
 OUTPUT_FILE = Path(r"C:\Users\cjtucke3\Documents\Personal\MO-development\nsite-mo-viewer\database-files\meeting_references_import.xlsx")
@@ -199,7 +202,11 @@ def main():
     print(f"Total files in log: {len(df)}")
 
     # Filter for meeting notes
-    meeting_notes = []
+    meeting_notes = UpdateBatch(UPDATE_COLUMNS + ['_year'], defaults={
+        'source_document': 'File Log Reference',
+        'source_category': 'Meeting Notes',
+        'created_by': 'file_log_reference_import',
+    }, id_factory=generate_update_id)
 
     for _, row in df.iterrows():
         file_title = row.get('file_title', '')
@@ -235,19 +242,13 @@ def main():
         # Create update text as linked title
         update_text = f"[{combined_title}]({url})" if url else combined_title
 
-        meeting_notes.append({
-            'update_id': generate_update_id(),
-            'solution_id': solution_id,
-            'update_text': update_text,
-            'source_document': 'File Log Reference',
-            'source_category': 'Meeting Notes',
-            'source_url': url,
-            'source_tab': '',
-            'meeting_date': meeting_date,
-            'created_at': datetime.now().isoformat(),
-            'created_by': 'file_log_reference_import',
-            '_year': year
-        })
+        meeting_notes.append(
+            solution_id=solution_id,
+            update_text=update_text,
+            source_url=url,
+            meeting_date=meeting_date,
+            _year=year
+        )
 
     print(f"Meeting notes found: {len(meeting_notes)}")
 
@@ -255,7 +256,7 @@ def main():
         print("No meeting notes found!")
         return
 
-    df_notes = pd.DataFrame(meeting_notes)
+    df_notes = meeting_notes.to_frame()
 
     # Stats
     print("\nBy solution:")
@@ -268,40 +269,11 @@ def main():
     for year, count in by_year.items():
         print(f"  {int(year)}: {count}")
 
-    # Split by year
-    df_2026 = df_notes[df_notes['_year'] == 2026].copy()
-    df_2025 = df_notes[df_notes['_year'] == 2025].copy()
-    df_2024 = df_notes[df_notes['_year'] == 2024].copy()
-    df_archive = df_notes[df_notes['_year'] < 2024].copy()
-
-    # Remove helper column
-    keep_cols = ['update_id', 'solution_id', 'update_text', 'source_document',
-                 'source_category', 'source_url', 'source_tab', 'meeting_date',
-                 'created_at', 'created_by']
-
-    for df_year in [df_2026, df_2025, df_2024, df_archive]:
-        if '_year' in df_year.columns:
-            df_year.drop('_year', axis=1, inplace=True)
-
-    df_2026 = df_2026[keep_cols] if len(df_2026) > 0 else pd.DataFrame(columns=keep_cols)
-    df_2025 = df_2025[keep_cols] if len(df_2025) > 0 else pd.DataFrame(columns=keep_cols)
-    df_2024 = df_2024[keep_cols] if len(df_2024) > 0 else pd.DataFrame(columns=keep_cols)
-    df_archive = df_archive[keep_cols] if len(df_archive) > 0 else pd.DataFrame(columns=keep_cols)
+    # Split by year and write one tab per year
+    shards = write_year_shards(df_notes, OUTPUT_FILE, UPDATE_COLUMNS)
 
     print(f"\nFinal counts:")
-    print(f"  2026: {len(df_2026)}")
-    print(f"  2025: {len(df_2025)}")
-    print(f"  2024: {len(df_2024)}")
-    print(f"  Archive: {len(df_archive)}")
-
-    # Write to Excel
-    OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
-
-    with pd.ExcelWriter(OUTPUT_FILE, engine='openpyxl') as writer:
-        df_2026.to_excel(writer, sheet_name='2026', index=False)
-        df_2025.to_excel(writer, sheet_name='2025', index=False)
-        df_2024.to_excel(writer, sheet_name='2024', index=False)
-        df_archive.to_excel(writer, sheet_name='Archive', index=False)
+    print_shard_counts(shards)
 
     print(f"\nMeeting references written to: {OUTPUT_FILE}")
 
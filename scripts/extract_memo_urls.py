@@ -3,13 +3,17 @@
 Extract Memo URLs from File Log
 ===============================
 Extracts Google Drive URLs for ATP, F2I, ORR, and Closeout memos from the file log.
+
+Memos are found column-wise (one ordered regex per mapping) and merged into
+the blank URL cells of the final import in one pass per field.
 """
 
 import pandas as pd
 from pathlib import Path
-import re
 import sys
 
+from text_normalization import first_substring_match_series
+
 sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
 # Solution name mappings from file names
@@ -34,42 +38,58 @@ SOLUTION_MAPPINGS = {
 }
 
 
-def get_solution_id(filename):
-    """Extract solution ID from filename."""
-    filename_lower = filename.lower()
+# Memo types by filename substring, checked in order
+MEMO_TYPES = {
+    'closeout': 'closeout_memo',
+    'orr': 'orr_memo',
+    'f2i': 'f2i_memo',
+    'atp': 'atp_memo',
+}
+
+# File log columns: Unnamed: 4 = file_id, Unnamed: 5 = mime_type
+FILE_ID_COLUMN = 'Unnamed: 4'
+MIME_TYPE_COLUMN = 'Unnamed: 5'
+
 
-    for pattern, sol_id in SOLUTION_MAPPINGS.items():
-        if pattern in filename_lower:
-            return sol_id
-    return None
+def build_urls(file_ids, mime_types):
+    """Google Drive URL per file: Docs for documents, the Drive viewer otherwise (incl. shortcuts)."""
+    is_doc = mime_types.str.contains('document', regex=False)
+    return ('https://drive.google.com/file/d/' + file_ids + '/view').where(
+        ~is_doc, 'https://docs.google.com/document/d/' + file_ids + '/edit')
 
 
-def get_memo_type(filename):
-    """Determine memo type from filename."""
-    filename_lower = filename.lower()
+def find_memos(file_log):
+    """
+    Memo files in the file log, in log order: solution_id, url_field, url.
 
-    if 'closeout' in filename_lower:
-        return 'closeout_memo'
-    elif 'orr' in filename_lower:
-        return 'orr_memo'
-    elif 'f2i' in filename_lower:
-        return 'f2i_memo'
-    elif 'atp' in filename_lower:
-        return 'atp_memo'
-    return None
+    Templates, unrecognized files and rows without a file ID are left out.
+    """
+    filenames = file_log.get('File Title', pd.Series('', index=file_log.index)).map(str)
+    file_ids = file_log.get(FILE_ID_COLUMN, pd.Series('', index=file_log.index))
+    mime_types = file_log.get(MIME_TYPE_COLUMN, pd.Series('', index=file_log.index))
+    mime_types = mime_types.where(mime_types.notna(), '').map(str)
+    lower = filenames.str.lower()
 
+    memos = pd.DataFrame({
+        'solution_id': first_substring_match_series(filenames, SOLUTION_MAPPINGS),
+        'memo_type': first_substring_match_series(filenames, MEMO_TYPES),
+    })
+    keep = (
+        (filenames != '') & lower.str.contains('memo', regex=False)
+        & ~lower.str.contains('template', regex=False)
+        & memos['solution_id'].notna() & memos['memo_type'].notna()
+        & file_ids.notna() & file_ids.map(bool)
+    )
 
-def build_url(file_id, mime_type):
-    """Build Google Drive URL based on file type."""
-    if 'document' in mime_type:
-        return f"https://docs.google.com/document/d/{file_id}/edit"
-    elif 'pdf' in mime_type:
-        return f"https://drive.google.com/file/d/{file_id}/view"
-    elif 'shortcut' in mime_type:
-        # Shortcuts - use the file ID directly
-        return f"https://drive.google.com/file/d/{file_id}/view"
-    else:
-        return f"https://drive.google.com/file/d/{file_id}/view"
+    memos = memos[keep].copy()
+    memos['url_field'] = memos['memo_type'] + '_url'
+    memos['url'] = build_urls(file_ids[keep].map(str).str.strip(), mime_types[keep])
+    return memos
+
+
+def is_blank(values):
+    """True where a cell is missing or whitespace only."""
+    return values.isna() | (values.map(str).str.strip() == '')
 
 
 def main():
@@ -89,62 +109,22 @@ def main():
     final_df = pd.read_csv(final_csv_path)
     print(f"Final import: {len(final_df)} solutions")
 
-    # Find memo files
-    # Column mapping: Unnamed: 4 = file_id, Unnamed: 5 = mime_type
-    memo_urls = {}  # {solution_id: {memo_type_url: url}}
-
-    for _, row in file_log.iterrows():
-        filename = str(row.get('File Title', ''))
-        if not filename or pd.isna(filename):
-            continue
-
-        # Check if it's a memo file
-        if 'memo' not in filename.lower():
-            continue
-
-        # Skip templates
-        if 'template' in filename.lower():
-            continue
-
-        solution_id = get_solution_id(filename)
-        memo_type = get_memo_type(filename)
-
-        if not solution_id or not memo_type:
-            continue
-
-        # Get file ID and mime type from correct columns
-        file_id = row.get('Unnamed: 4', '')
-        mime_type = row.get('Unnamed: 5', '')
-
-        if pd.isna(file_id) or not file_id:
-            continue
-
-        file_id = str(file_id).strip()
-        mime_type = str(mime_type) if pd.notna(mime_type) else ''
-
-        url = build_url(file_id, mime_type)
-        url_field = f"{memo_type}_url"
-
-        if solution_id not in memo_urls:
-            memo_urls[solution_id] = {}
-
-        # Only set if not already set (first occurrence wins - usually the canonical one)
-        if url_field not in memo_urls[solution_id]:
-            memo_urls[solution_id][url_field] = url
-            print(f"  [{solution_id}] {url_field}: {url[:60]}...")
+    # Find memo files; first occurrence wins (usually the canonical one)
+    memos = find_memos(file_log).drop_duplicates(['solution_id', 'url_field'])
+    for row in memos.itertuples():
+        print(f"  [{row.solution_id}] {row.url_field}: {row.url[:60]}...")
 
+    memo_urls = memos.pivot(index='solution_id', columns='url_field', values='url')
     print(f"\nFound URLs for {len(memo_urls)} solutions")
 
     # Update final dataframe
     updates = 0
-    for idx, row in final_df.iterrows():
-        sol_id = row['solution_id']
-        if sol_id in memo_urls:
-            for url_field, url in memo_urls[sol_id].items():
-                if url_field in final_df.columns:
-                    if pd.isna(final_df.at[idx, url_field]) or final_df.at[idx, url_field] == '':
-                        final_df.at[idx, url_field] = url
-                        updates += 1
+    for url_field in memo_urls.columns.intersection(final_df.columns):
+        found = final_df['solution_id'].map(memo_urls[url_field].dropna())
+        current = final_df[url_field]
+        filled = is_blank(current) & found.notna()
+        final_df[url_field] = current.mask(filled).combine_first(found.where(filled))
+        updates += int(filled.sum())
 
     print(f"Applied {updates} URL updates")
 
@@ -160,8 +140,7 @@ def main():
     print("\nURL fields with data:")
     url_cols = [c for c in final_df.columns if c.endswith('_url')]
     for col in url_cols:
-        filled = final_df[col].notna() & (final_df[col].astype(str).str.strip() != '')
-        count = filled.sum()
+        count = (~is_blank(final_df[col])).sum()
         if count > 0:
             print(f"  {col}: {count} solutions")
 
@@ -9,6 +9,8 @@ import pandas as pd
 from datetime import datetime
 import re
 
+from date_parsing import parse_dates
+
 # File paths
 INPUT_FILE = r'C:\Users\cjtucke3\Documents\Personal\MO-development\Solution Status Quick Look_C0_2025_v0.01.xlsx'
 OUTPUT_FILE = r'C:\Users\cjtucke3\Documents\Personal\MO-development\nsite-mo-viewer\database-files\MO-DB_Milestones.csv'
@@ -45,37 +47,6 @@ NOT_MILESTONES = ['ESDIS IPA', 'IPA', 'ICD', 'DAAC ICD', 'DAAC Selection', 'Cont
 # Alias for backward compatibility
 MILESTONE_TYPES = IMPLEMENTATION_MILESTONES
 
-def parse_date(date_val):
-    """Parse various date formats to ISO date string."""
-    if pd.isna(date_val) or date_val == '' or date_val is None:
-        return ''
-
-    # If already a datetime
-    if isinstance(date_val, datetime):
-        return date_val.strftime('%Y-%m-%d')
-
-    date_str = str(date_val).strip()
-    if not date_str or date_str.lower() in ['nan', 'none', 'nat', 'tbd', 'n/a']:
-        return ''
-
-    # Try various formats
-    formats = [
-        '%m/%d/%Y', '%m/%d/%y', '%Y-%m-%d', '%d/%m/%Y',
-        '%B %d, %Y', '%b %d, %Y', '%m-%d-%Y', '%m-%d-%y'
-    ]
-
-    for fmt in formats:
-        try:
-            return datetime.strptime(date_str, fmt).strftime('%Y-%m-%d')
-        except ValueError:
-            continue
-
-    # Try to extract just a year if present
-    year_match = re.search(r'\b(20\d{2})\b', date_str)
-    if year_match:
-        return year_match.group(1)
-
-    return ''
 
 def determine_status(target_date, actual_date, is_complete):
     """Determine milestone status based on dates and completion."""
@@ -166,6 +137,11 @@ def extract_milestones():
     # 6: Thematic Area
     # 7: Provider
 
+    # Parse both date columns in one pass instead of per row
+    no_dates = pd.Series('', index=df.index)
+    next_dates = parse_dates(df.iloc[:, 4], 'milestones') if df.shape[1] > 4 else no_dates
+    closeout_dates = parse_dates(df.iloc[:, 5], 'milestones') if df.shape[1] > 5 else no_dates
+
     for idx in range(data_start, min(data_start + 50, len(df))):
         row = df.iloc[idx]
 
@@ -178,8 +154,8 @@ def extract_milestones():
         current_phase = str(row.iloc[1]).strip() if len(row) > 1 and pd.notna(row.iloc[1]) else ''
         status = str(row.iloc[2]).strip() if len(row) > 2 and pd.notna(row.iloc[2]) else ''
         next_milestone = str(row.iloc[3]).strip() if len(row) > 3 and pd.notna(row.iloc[3]) else ''
-        next_date = parse_date(row.iloc[4]) if len(row) > 4 else ''
-        closeout_date = parse_date(row.iloc[5]) if len(row) > 5 else ''
+        next_date = next_dates.iat[idx]
+        closeout_date = closeout_dates.iat[idx]
 
         # Clean strings of Unicode characters
         def clean_str(s):
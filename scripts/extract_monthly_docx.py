@@ -14,11 +14,14 @@ import docx
 from docx.oxml.ns import qn
 from pathlib import Path
 import pandas as pd
-import csv
 import re
 from datetime import datetime
 import uuid
 
+from date_parsing import date_from_filename
+from text_normalization import should_skip_line
+from update_batch import UpdateBatch
+
 # Configuration
 BASE_PATH = Path(r"C:\Users\cjtucke3\Documents\Personal\MO-development\source-archives\Monthly Project Status Updates")
 SOLUTIONS_PATH = Path(r"C:\Users\cjtucke3\Documents\Personal\MO-development\nsite-mo-viewer\database-files\MO-Viewer Databases\MO-DB_Solutions.xlsx")
@@ -97,26 +100,6 @@ SOLUTION_ALIASES = {
     'snwg management office': 'SNWG-MO',
 }
 
-# Lines to skip (headers, agenda items, etc.)
-SKIP_PATTERNS = [
-    r'^SNWG Monthly Meeting',
-    r'^AGENDA:?$',
-    r'^Moderator',
-    r'^Recording',
-    r'^Previous Meeting Notes',
-    r'^I\.\s+Introduction',
-    r'^II\.\s+Verbal Status',
-    r'^III\.',
-    r'^IV\.',
-    r'^Cycle\s+\d+',
-    r'^\d+\.\s+(Introduction|Meeting Series)',
-    r'^Announcements:?$',
-    r'^Notes on Open Source',
-    r'^Quick Verbal Status',
-    r'^Action:',
-    r'^ACTION:',
-]
-
 
 def generate_update_id():
     """Generate a unique update ID"""
@@ -225,34 +208,6 @@ def find_core_id(text, solution_mapping):
     return None
 
 
-def extract_date_from_filename(filename):
-    """Extract meeting date from filename like '2021-05-10 SNWG Monthly...'"""
-    match = re.match(r'(\d{4}-\d{2}-\d{2})', filename)
-    if match:
-        return match.group(1)
-    return None
-
-
-def should_skip_line(text):
-    """Check if line should be skipped"""
-    if not text or len(text.strip()) < 5:
-        return True
-
-    text_stripped = text.strip()
-
-    for pattern in SKIP_PATTERNS:
-        if re.match(pattern, text_stripped, re.IGNORECASE):
-            return True
-
-    # Skip date-only lines
-    if re.match(r'^[A-Z][a-z]+\s+\d{1,2},?\s+\d{4}', text_stripped):
-        return True
-    if re.match(r'^\d{1,2}:\d{2}\s*(AM|PM|CT|ET|PT)', text_stripped, re.IGNORECASE):
-        return True
-
-    return False
-
-
 def is_solution_header(text, solution_mapping):
     """Check if text is a solution header and extract solution name"""
     if not text:
@@ -283,16 +238,16 @@ def is_solution_header(text, solution_mapping):
     return None, None
 
 
-def parse_document(doc_path, solution_mapping):
-    """Parse a Word document and extract updates"""
+def parse_document(doc_path, solution_mapping, batch):
+    """Add a Word document's updates to batch; returns the number added"""
     try:
         doc = docx.Document(doc_path)
     except Exception as e:
         print(f"  Error opening {doc_path.name}: {e}")
-        return []
+        return 0
 
-    meeting_date = extract_date_from_filename(doc_path.name)
-    updates = []
+    meeting_date = date_from_filename(doc_path.name)
+    count = 0
 
     current_solution = None
     current_updates = []
@@ -311,18 +266,13 @@ def parse_document(doc_path, solution_mapping):
             if current_solution and current_updates:
                 combined_text = '\n'.join(current_updates)
                 if len(combined_text) >= 20:
-                    updates.append({
-                        'update_id': generate_update_id(),
-                        'solution_id': normalize_solution_id(current_solution),
-                        'update_text': combined_text,
-                        'source_document': 'Monthly Status Meeting',
-                        'source_category': 'MO',
-                        'source_url': '',
-                        'source_tab': doc_path.name,
-                        'meeting_date': meeting_date,
-                        'created_at': datetime.now().isoformat(),
-                        'created_by': 'monthly_docx_import'
-                    })
+                    batch.append(
+                        solution_id=normalize_solution_id(current_solution),
+                        update_text=combined_text,
+                        source_tab=doc_path.name,
+                        meeting_date=meeting_date
+                    )
+                    count += 1
 
             # Start new solution
             current_solution = solution_id
@@ -339,24 +289,28 @@ def parse_document(doc_path, solution_mapping):
     if current_solution and current_updates:
         combined_text = '\n'.join(current_updates)
         if len(combined_text) >= 20:
-            updates.append({
-                'update_id': generate_update_id(),
-                'solution_id': normalize_solution_id(current_solution),
-                'update_text': combined_text,
-                'source_document': 'Monthly Status Meeting',
-                'source_category': 'MO',
-                'source_url': '',
-                'source_tab': doc_path.name,
-                'meeting_date': meeting_date,
-                'created_at': datetime.now().isoformat(),
-                'created_by': 'monthly_docx_import'
-            })
-
-    return updates
+            batch.append(
+                solution_id=normalize_solution_id(current_solution),
+                update_text=combined_text,
+                source_tab=doc_path.name,
+                meeting_date=meeting_date
+            )
+            count += 1
+
+    return count
+
+
+def new_batch():
+    """Empty UpdateBatch with this importer's defaults"""
+    return UpdateBatch(CSV_HEADERS, defaults={
+        'source_document': 'Monthly Status Meeting',
+        'source_category': 'MO',
+        'created_by': 'monthly_docx_import',
+    }, id_factory=generate_update_id)
 
 
 def main():
-    all_updates = []
+    batch = new_batch()
     files_processed = 0
 
     print("Building solution name to core_id mapping...")
@@ -386,10 +340,7 @@ def main():
             if 'biweekly' in doc_file.name.lower():
                 continue
 
-            updates = parse_document(doc_file, solution_mapping)
-            if updates:
-                fy_updates += len(updates)
-                all_updates.extend(updates)
+            fy_updates += parse_document(doc_file, solution_mapping, batch)
             files_processed += 1
 
         print(f"  Found {fy_updates} updates from {fy_folder}")
@@ -397,36 +348,29 @@ def main():
     print()
     print("=" * 60)
     print(f"Total files processed: {files_processed}")
-    print(f"Total updates found: {len(all_updates)}")
+    print(f"Total updates found: {len(batch)}")
+
+    df = batch.to_frame()
 
     # Count by solution
-    by_solution = {}
-    for u in all_updates:
-        sol = u['solution_id']
-        by_solution[sol] = by_solution.get(sol, 0) + 1
+    by_solution = df['solution_id'].value_counts()
 
     print(f"Unique solutions: {len(by_solution)}")
     print("\nTop solutions by update count:")
-    for sol, count in sorted(by_solution.items(), key=lambda x: -x[1])[:15]:
+    for sol, count in by_solution.head(15).items():
         print(f"  {sol}: {count}")
 
     # Count by date
-    by_date = {}
-    for u in all_updates:
-        date = u.get('meeting_date', 'Unknown')
-        by_date[date] = by_date.get(date, 0) + 1
+    by_date = df['meeting_date'].value_counts(dropna=False).sort_index()
 
     print(f"\nUpdates by meeting date:")
-    for date, count in sorted(by_date.items()):
+    for date, count in by_date.items():
         print(f"  {date}: {count}")
 
     # Write CSV
-    if all_updates:
+    if len(df):
         OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with open(OUTPUT_PATH, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=CSV_HEADERS)
-            writer.writeheader()
-            writer.writerows(all_updates)
+        df.to_csv(OUTPUT_PATH, index=False, encoding='utf-8')
         print(f"\nCSV written to: {OUTPUT_PATH}")
     else:
         print("\nNo updates found to export.")
@@ -17,11 +17,19 @@ from datetime import datetime
 import uuid
 import sys
 
+from date_parsing import date_from_filename
+from excel_export import write_xlsx, sanitize_for_excel
+from update_batch import UpdateBatch
+from text_normalization import should_skip_slide, is_template_text, clean_section_headers
+
 # Configuration
 BASE_PATH = Path(r"C:\Users\cjtucke3\Documents\Personal\MO-development\source-archives\Monthly Project Status Updates")
 SOLUTIONS_PATH = Path(r"C:\Users\cjtucke3\Documents\Personal\MO-development\nsite-mo-viewer\database-files\MO-Viewer Databases\MO-DB_Solutions.xlsx")
 OUTPUT_PATH = Path(r"C:\Users\cjtucke3\Documents\Personal\MO-development\nsite-mo-viewer\database-files\monthly_updates_import.xlsx")
 
+# Monthly decks are named by month ("2026-01 NSITE Monthly..."); use mid-month
+MONTHLY_DEFAULT_DAY = 15
+
 # CSV columns matching MO-DB_Updates
 OUTPUT_COLUMNS = [
     'update_id', 'solution_id', 'update_text', 'source_document',
@@ -85,34 +93,6 @@ SOLUTION_ALIASES = {
     'tempo-nrt-enhanced': 'TEMPO-NRT-Enhanced',
 }
 
-# Slides to skip (not solution-specific updates)
-SKIP_TITLE_PATTERNS = [
-    r'^agenda',
-    r'^snwg\s+(headquarters|hq)',
-    r'^solution\s+team\s+folders',
-    r'^insert\s+impact',
-    r'^cycle\s+\d+\s+\(\d{4}\)',  # "Cycle 1 (2016)" divider slides
-    r'^assessment',
-    r'^appendix',
-    r'^thank\s*you',
-    r'^questions',
-    r'^backup',
-    r'^management\s+office',
-    r'^nsite\s+mo\s+slide',
-    r'^satellite\s+needs\s+working\s+group\s+management',  # Title slide
-    r'^\[project\s+name\]',  # Template placeholder
-    r'^project\s+name',  # Template placeholder
-    r'^cycle\s+\d+[:\s]',  # "Cycle 2: Land Surface" divider slides
-    r'^\[project\]',  # Template placeholder
-    r'^\d{4}\s+snwg\s+assessment',  # Assessment slides
-    r'^status\s+and\s+near',  # Non-solution slides
-    r'^snwg\s+sep',  # SEP overview slides
-    r'^sep\s+',  # SEP slides
-]
-
-# Illegal characters for Excel (control characters except tab/newline)
-ILLEGAL_CHARS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
-
 
 def generate_update_id():
     """Generate a unique update ID"""
@@ -121,17 +101,6 @@ def generate_update_id():
     return f"UPD_{date_str}_{random_part}"
 
 
-def sanitize_for_excel(text):
-    """Remove illegal characters that can't be written to Excel"""
-    if not text:
-        return text
-    # Remove control characters except newline and tab
-    text = ILLEGAL_CHARS_RE.sub('', text)
-    # Replace other problematic characters
-    text = text.replace('\r', '\n')
-    return text
-
-
 # Post-processing normalization for solution IDs
 SOLUTION_ID_NORMALIZATION = {
     'hls': 'HLS',
@@ -234,20 +203,6 @@ def find_core_id(text, solution_mapping):
     return None
 
 
-def should_skip_slide(title):
-    """Check if this slide should be skipped (not a solution update)"""
-    if not title:
-        return True
-
-    title_lower = title.lower().strip()
-
-    for pattern in SKIP_TITLE_PATTERNS:
-        if re.search(pattern, title_lower):
-            return True
-
-    return False
-
-
 def extract_date_from_shape_text(text):
     """Extract date from 'Update as of:' text"""
     if not text:
@@ -268,23 +223,6 @@ def extract_date_from_shape_text(text):
     return None
 
 
-def extract_date_from_filename(filename):
-    """Extract meeting date from filename like '2026-01 NSITE Monthly...'"""
-    # Pattern: YYYY-MM at start of filename
-    match = re.match(r'(\d{4})-(\d{2})', filename)
-    if match:
-        year, month = match.groups()
-        # Use 15th as default day for monthly updates
-        return f"{year}-{month}-15"
-
-    # Pattern: YYYY-MM-DD
-    match = re.match(r'(\d{4}-\d{2}-\d{2})', filename)
-    if match:
-        return match.group(1)
-
-    return None
-
-
 def parse_title(title_text):
     """Parse slide title to extract solution name and presenter"""
     if not title_text:
@@ -316,15 +254,14 @@ def parse_title(title_text):
     return solution, presenter
 
 
-def extract_updates_from_slide(slide, solution_mapping, file_date, filename):
-    """Extract updates from a single slide"""
-    updates = []
+def extract_updates_from_slide(slide, solution_mapping, file_date, filename, batch):
+    """Add a slide's update to batch; returns the number added"""
 
     # Get title
     title_text = slide.shapes.title.text if slide.shapes.title else None
 
     if should_skip_slide(title_text):
-        return []
+        return 0
 
     solution_name, presenter = parse_title(title_text)
     core_id = find_core_id(solution_name, solution_mapping)
@@ -349,7 +286,7 @@ def extract_updates_from_slide(slide, solution_mapping, file_date, filename):
             ]
             for pattern in skip_patterns:
                 if re.search(pattern, name_lower):
-                    return []
+                    return 0
         # Use the solution name as-is for manual review
         core_id = solution_name
 
@@ -398,27 +335,21 @@ def extract_updates_from_slide(slide, solution_mapping, file_date, filename):
 
     # Skip if only boilerplate remains
     if is_template_text(cleaned_text):
-        return []
+        return 0
 
     if len(cleaned_text.strip()) < 30:
-        return []
+        return 0
 
-    updates.append({
-        'update_id': generate_update_id(),
-        'solution_id': normalize_solution_id(core_id),
-        'update_text': sanitize_for_excel(cleaned_text),
-        'source_document': 'Monthly Status Meeting',
-        'source_category': 'MO',
-        'source_url': '',
-        'source_tab': filename,
-        'meeting_date': meeting_date,
-        'created_at': datetime.now().isoformat(),
-        'created_by': 'monthly_import',
-        'slide_title': sanitize_for_excel(solution_name),
-        'presenter': sanitize_for_excel(presenter)
-    })
+    batch.append(
+        solution_id=normalize_solution_id(core_id),
+        update_text=sanitize_for_excel(cleaned_text),
+        source_tab=filename,
+        meeting_date=meeting_date,
+        slide_title=sanitize_for_excel(solution_name),
+        presenter=sanitize_for_excel(presenter)
+    )
 
-    return updates
+    return 1
 
 
 def parse_sections(text):
@@ -479,85 +410,36 @@ def parse_sections(text):
     return sections
 
 
-def is_template_text(text):
-    """Check if text is just template/boilerplate"""
-    template_patterns = [
-        r'^project\s+status\s*$',
-        r'^project\s+status\s*\n\s*project\s+phase',
-        r'^project\s+phase\s*:\s*(operations|implementation|planning|development)',
-        r'^solution\s+products?\s*\(acronyms',
-        r'^solution\s+products?\s*:',
-        r'^what\s+have\s+i\s+done.*?\?\s*$',
-        r'^what\s+programmatic.*?\?\s*$',
-        r'^what\s+software.*?\?\s*$',
-        r'^the\s+snwg\s+mo\s+can\s+help.*?\s*$',
-        r'^n/a\s*$',
-        r'^none\s*$',
-        r'^no\s+update\s*$',
-        r'^tbd\s*$',
-        r'sneaky\s*slide',
-        r'^project\s+description\s*$',
-    ]
-
-    text_lower = text.lower().strip()
-
-    for pattern in template_patterns:
-        if re.search(pattern, text_lower):
-            return True
-
-    # Very short text with no real content
-    if len(text_lower) < 20:
-        return True
-
-    return False
-
-
-def clean_section_headers(text):
-    """Remove or simplify section header boilerplate"""
-    # Remove the long question headers but keep as simple labels
-    replacements = [
-        (r'\*\*What have I done to ensure that my solution is the right fit for end users and/or is achieving its intended impact\?.*?\*\*\s*', 'User Engagement: '),
-        (r'\*\*What programmatic/project timeline milestones have occurred this month\?\*\*\s*', 'Milestones: '),
-        (r'\*\*What software/hardware/location/product development milestones have occurred this month\?\*\*\s*', 'Development: '),
-        (r'\*\*The SNWG MO can help me with this roadblock or challenge:\*\*\s*', 'Needs Help: '),
-        (r'Project Status\s*\n\s*Project Phase:\s*\w+\s*\n?', ''),
-        (r'Solution Products?\s*\(acronyms and definitions\):\s*', 'Products: '),
-        (r'Project Description\s*\n?', ''),
-    ]
-
-    result = text
-    for pattern, replacement in replacements:
-        result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
-
-    # Clean up multiple newlines
-    result = re.sub(r'\n{3,}', '\n\n', result)
-    result = result.strip()
-
-    return result
-
-
-def process_presentation(pptx_path, solution_mapping):
-    """Process a single PowerPoint file and extract all updates"""
+def process_presentation(pptx_path, solution_mapping, batch):
+    """Add all updates from a PowerPoint file to batch; returns the number added"""
     try:
         prs = Presentation(pptx_path)
     except Exception as e:
         print(f"  Error opening {pptx_path.name}: {e}")
-        return []
+        return 0
 
-    file_date = extract_date_from_filename(pptx_path.name)
-    updates = []
+    file_date = date_from_filename(pptx_path.name, month_day=MONTHLY_DEFAULT_DAY)
+    count = 0
 
     for slide in prs.slides:
-        slide_updates = extract_updates_from_slide(
-            slide, solution_mapping, file_date, pptx_path.name
+        count += extract_updates_from_slide(
+            slide, solution_mapping, file_date, pptx_path.name, batch
         )
-        updates.extend(slide_updates)
 
-    return updates
+    return count
+
+
+def new_batch():
+    """Empty UpdateBatch with this importer's defaults"""
+    return UpdateBatch(OUTPUT_COLUMNS, defaults={
+        'source_document': 'Monthly Status Meeting',
+        'source_category': 'MO',
+        'created_by': 'monthly_import',
+    }, id_factory=generate_update_id)
 
 
 def main():
-    all_updates = []
+    batch = new_batch()
     files_processed = 0
 
     print("Building solution name to core_id mapping...")
@@ -575,11 +457,9 @@ def main():
         print(f"Processing root folder ({len(root_files)} files)...")
         for pptx_file in sorted(root_files):
             print(f"  {pptx_file.name}")
-            updates = process_presentation(pptx_file, solution_mapping)
-            if updates:
-                all_updates.extend(updates)
+            process_presentation(pptx_file, solution_mapping, batch)
             files_processed += 1
-        print(f"  Found {sum(1 for u in all_updates)} updates")
+        print(f"  Found {len(batch)} updates")
         print()
 
     # Process FY folders
@@ -590,10 +470,7 @@ def main():
                 print(f"Processing {fy_folder.name} ({len(pptx_files)} files)...")
                 fy_updates = 0
                 for pptx_file in sorted(pptx_files):
-                    updates = process_presentation(pptx_file, solution_mapping)
-                    if updates:
-                        fy_updates += len(updates)
-                        all_updates.extend(updates)
+                    fy_updates += process_presentation(pptx_file, solution_mapping, batch)
                     files_processed += 1
                 print(f"  Found {fy_updates} updates")
 
@@ -606,54 +483,36 @@ def main():
     print()
     print("=" * 60)
     print(f"Total files processed: {files_processed}")
-    print(f"Total updates found: {len(all_updates)}")
+    print(f"Total updates found: {len(batch)}")
+
+    df = batch.to_frame()
 
     # Count by solution
-    by_solution = {}
-    for u in all_updates:
-        sol = u['solution_id']
-        by_solution[sol] = by_solution.get(sol, 0) + 1
+    by_solution = df['solution_id'].value_counts()
 
     print(f"Unique solutions: {len(by_solution)}")
     print("\nTop 15 solutions by update count:")
-    for sol, count in sorted(by_solution.items(), key=lambda x: -x[1])[:15]:
+    for sol, count in by_solution.head(15).items():
         print(f"  {sol}: {count}")
 
     # Count by date
-    by_date = {}
-    for u in all_updates:
-        date = u.get('meeting_date', 'Unknown')
-        by_date[date] = by_date.get(date, 0) + 1
+    by_date = df['meeting_date'].value_counts(dropna=False).sort_index(ascending=False)
 
     print(f"\nUpdates by date (showing {min(10, len(by_date))} most recent):")
-    for date, count in sorted(by_date.items(), reverse=True)[:10]:
+    for date, count in by_date.head(10).items():
         print(f"  {date}: {count}")
 
     # Write Excel file
-    if all_updates:
+    if len(df):
         OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-        df = pd.DataFrame(all_updates, columns=OUTPUT_COLUMNS)
-
         # Sort by date descending, then solution
         df['meeting_date'] = pd.to_datetime(df['meeting_date'], errors='coerce')
         df = df.sort_values(['meeting_date', 'solution_id'], ascending=[False, True])
         df['meeting_date'] = df['meeting_date'].dt.strftime('%Y-%m-%d')
 
-        # Write to Excel
-        with pd.ExcelWriter(OUTPUT_PATH, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Updates', index=False)
-
-            # Auto-adjust column widths
-            worksheet = writer.sheets['Updates']
-            for idx, col in enumerate(df.columns):
-                max_length = max(
-                    df[col].astype(str).map(len).max(),
-                    len(col)
-                )
-                # Limit width for readability
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[chr(65 + idx)].width = adjusted_width
+        # Write to Excel (column widths limited for readability)
+        write_xlsx(OUTPUT_PATH, {'Updates': df}, max_width=50)
 
         print(f"\nExcel file written to: {OUTPUT_PATH}")
         print(f"Open to review before importing to MO-DB_Updates")
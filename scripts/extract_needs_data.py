@@ -91,7 +91,7 @@ FIELD_MAPPINGS = {
 # Output columns in order
 OUTPUT_COLUMNS = [
     'need_id', 'solution', 'survey_year',
-    'submitter_name', 'department', 'agency', 'organization',
+    'submitter_name', 'submitter_email', 'department', 'agency', 'organization',
     'strategic_objective', 'application_description',
     'similar_to_previous', 'need_nature_type', 'need_nature_frequency', 'archival_period',
     'feature_to_observe', 'how_long_required', 'degree_need_met', 'efficiency_gain',
@@ -230,6 +230,12 @@ def process_sheet(df, solution, year, filename):
                 if '@' not in val:
                     record['department'] = val.strip()
 
+        # 2024 surveys put the respondent's email in (1d)
+        if 'agency_old' in df_mapped.columns and pd.notna(row.get('agency_old')):
+            val = str(row.get('agency_old', '')).strip()
+            if '@' in val:
+                record['submitter_email'] = val
+
         record['solution'] = solution
         record['survey_year'] = int(year)
         record['need_id'] = f"{solution[:20]}_{year}_{idx+1}"
@@ -18,6 +18,11 @@ import re
 from datetime import datetime
 import uuid
 
+from date_parsing import date_from_filename
+from excel_export import write_xlsx
+from update_batch import UpdateBatch
+from text_normalization import clean_update_text, is_meaningful_update
+
 # Configuration
 BASE_PATH = Path(r"C:\Users\cjtucke3\Documents\Personal\MO-development\source-archives\SEP")
 FILE_LOG_PATH = Path(r"C:\Users\cjtucke3\Documents\Personal\MO-development\source-archives\file log - Sheet1.csv")
@@ -63,6 +68,9 @@ SOLUTION_ID_NORMALIZATION = {
 # Maximum text length
 MAX_UPDATE_LENGTH = 3000
 
+# Boilerplate rule set in text_normalization
+TEXT_PROFILE = 'sep'
+
 
 def generate_update_id():
     """Generate a unique update ID"""
@@ -150,60 +158,6 @@ def normalize_solution_id(solution_id):
     return SOLUTION_ID_NORMALIZATION.get(lower, solution_id)
 
 
-def extract_date_from_filename(filename):
-    """Extract date from filename"""
-    match = re.match(r'(\d{4}-\d{2}-\d{2})', filename)
-    if match:
-        return match.group(1)
-    return None
-
-
-def clean_update_text(text):
-    """Clean boilerplate and standardize formatting"""
-    if not text:
-        return ''
-
-    text = str(text)
-
-    # Remove common boilerplate
-    removals = [
-        r'^\s*•\s*',
-        r'^\s*○\s*',
-        r'Action:\s*.*$',
-        r'ACTION:\s*.*$',
-    ]
-
-    for pattern in removals:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.MULTILINE)
-
-    # Clean whitespace
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    text = text.strip()
-
-    return text
-
-
-def is_meaningful_update(text):
-    """Check if update has real content"""
-    if not text or len(text) < 30:
-        return False
-
-    text_lower = text.lower().strip()
-
-    skip_patterns = [
-        r'^n/a\s*$',
-        r'^none\s*$',
-        r'^no\s+update\s*$',
-        r'^tbd\s*$',
-    ]
-
-    for pattern in skip_patterns:
-        if re.match(pattern, text_lower):
-            return False
-
-    return True
-
-
 def extract_solution_from_filename(filename):
     """Try to identify solution from filename"""
     filename_lower = filename.lower()
@@ -251,16 +205,16 @@ def get_paragraphs_text(doc):
     return '\n'.join(texts)
 
 
-def parse_document(doc_path, url_map):
-    """Parse a Word document and extract updates"""
+def parse_document(doc_path, url_map, batch):
+    """Add a Word document's update to batch; returns the number added"""
     try:
         doc = docx.Document(doc_path)
     except Exception as e:
         print(f"  Error opening {doc_path.name}: {e}")
-        return []
+        return 0
 
     filename = doc_path.name
-    meeting_date = extract_date_from_filename(filename)
+    meeting_date = date_from_filename(filename)
     source_url = find_url_for_file(filename, url_map)
     solution_id = extract_solution_from_filename(filename)
 
@@ -268,38 +222,34 @@ def parse_document(doc_path, url_map):
     full_text = get_paragraphs_text(doc)
 
     if not full_text or len(full_text) < 50:
-        return []
+        return 0
 
     # Clean and truncate
-    cleaned_text = clean_update_text(full_text)
+    cleaned_text = clean_update_text(full_text, TEXT_PROFILE)
 
-    if not is_meaningful_update(cleaned_text):
-        return []
+    if not is_meaningful_update(cleaned_text, TEXT_PROFILE):
+        return 0
 
     if len(cleaned_text) > MAX_UPDATE_LENGTH:
         cleaned_text = cleaned_text[:MAX_UPDATE_LENGTH] + '...[truncated]'
 
-    return [{
-        'update_id': generate_update_id(),
-        'solution_id': normalize_solution_id(solution_id),
-        'update_text': cleaned_text,
-        'source_document': 'SEP Meeting',
-        'source_category': 'SEP',
-        'source_url': source_url,
-        'source_tab': filename,
-        'meeting_date': meeting_date or '',
-        'created_at': datetime.now().isoformat(),
-        'created_by': 'sep_import'
-    }]
+    batch.append(
+        solution_id=normalize_solution_id(solution_id),
+        update_text=cleaned_text,
+        source_url=source_url,
+        source_tab=filename,
+        meeting_date=meeting_date or ''
+    )
+    return 1
 
 
-def parse_consolidated_document(doc_path, url_map):
-    """Parse consolidated SEP document with multiple meeting dates"""
+def parse_consolidated_document(doc_path, url_map, batch):
+    """Add each meeting in a consolidated SEP document to batch; returns the number added"""
     try:
         doc = docx.Document(doc_path)
     except Exception as e:
         print(f"  Error opening {doc_path.name}: {e}")
-        return []
+        return 0
 
     filename = doc_path.name
     source_url = find_url_for_file(filename, url_map)
@@ -308,7 +258,7 @@ def parse_consolidated_document(doc_path, url_map):
     year_match = re.search(r'_C0_(\d{4})\.docx', filename)
     current_year = int(year_match.group(1)) if year_match else datetime.now().year
 
-    updates = []
+    count = 0
     current_meeting_date = None
     current_content = []
     date_pattern = re.compile(r'^(\d{2})_(\d{2})$')
@@ -324,24 +274,22 @@ def parse_consolidated_document(doc_path, url_map):
             # Save previous meeting's content
             if current_meeting_date and current_content:
                 combined = '\n'.join(current_content)
-                combined = clean_update_text(combined)
+                combined = clean_update_text(combined, TEXT_PROFILE)
 
-                if is_meaningful_update(combined):
+                if is_meaningful_update(combined, TEXT_PROFILE):
                     if len(combined) > MAX_UPDATE_LENGTH:
                         combined = combined[:MAX_UPDATE_LENGTH] + '...[truncated]'
 
-                    updates.append({
-                        'update_id': generate_update_id(),
-                        'solution_id': 'SEP',
-                        'update_text': combined,
-                        'source_document': 'SEP Weekly Meeting',
-                        'source_category': 'SEP',
-                        'source_url': source_url,
-                        'source_tab': current_meeting_date,
-                        'meeting_date': current_meeting_date,
-                        'created_at': datetime.now().isoformat(),
-                        'created_by': 'sep_consolidated_import'
-                    })
+                    batch.append(
+                        solution_id='SEP',
+                        update_text=combined,
+                        source_document='SEP Weekly Meeting',
+                        source_url=source_url,
+                        source_tab=current_meeting_date,
+                        meeting_date=current_meeting_date,
+                        created_by='sep_consolidated_import'
+                    )
+                    count += 1
 
             # Start new meeting
             month, day = date_match.groups()
@@ -353,30 +301,37 @@ def parse_consolidated_document(doc_path, url_map):
     # Don't forget last meeting
     if current_meeting_date and current_content:
         combined = '\n'.join(current_content)
-        combined = clean_update_text(combined)
+        combined = clean_update_text(combined, TEXT_PROFILE)
 
-        if is_meaningful_update(combined):
+        if is_meaningful_update(combined, TEXT_PROFILE):
             if len(combined) > MAX_UPDATE_LENGTH:
                 combined = combined[:MAX_UPDATE_LENGTH] + '...[truncated]'
 
-            updates.append({
-                'update_id': generate_update_id(),
-                'solution_id': 'SEP',
-                'update_text': combined,
-                'source_document': 'SEP Weekly Meeting',
-                'source_category': 'SEP',
-                'source_url': source_url,
-                'source_tab': current_meeting_date,
-                'meeting_date': current_meeting_date,
-                'created_at': datetime.now().isoformat(),
-                'created_by': 'sep_consolidated_import'
-            })
+            batch.append(
+                solution_id='SEP',
+                update_text=combined,
+                source_document='SEP Weekly Meeting',
+                source_url=source_url,
+                source_tab=current_meeting_date,
+                meeting_date=current_meeting_date,
+                created_by='sep_consolidated_import'
+            )
+            count += 1
 
-    return updates
+    return count
+
+
+def new_batch():
+    """Empty UpdateBatch with this importer's defaults"""
+    return UpdateBatch(OUTPUT_COLUMNS, defaults={
+        'source_document': 'SEP Meeting',
+        'source_category': 'SEP',
+        'created_by': 'sep_import',
+    }, id_factory=generate_update_id)
 
 
 def main():
-    all_updates = []
+    batch = new_batch()
     files_processed = 0
 
     print("Building URL mapping from file log...")
@@ -393,11 +348,9 @@ def main():
     if root_files:
         print(f"Processing root folder ({len(root_files)} files)...")
         for doc_file in sorted(root_files):
-            updates = parse_document(doc_file, url_map)
-            if updates:
-                all_updates.extend(updates)
+            parse_document(doc_file, url_map, batch)
             files_processed += 1
-        print(f"  Found {len(all_updates)} updates")
+        print(f"  Found {len(batch)} updates")
 
     # Process SEP Weekly Meeting Notes
     weekly_path = BASE_PATH / "SEP - SNWG Weekly Meeting Notes"
@@ -409,20 +362,16 @@ def main():
                 print(f"Processing {fy_folder.name} ({len(docx_files)} files)...")
                 fy_count = 0
                 for doc_file in sorted(docx_files):
-                    updates = parse_document(doc_file, url_map)
-                    if updates:
-                        fy_count += len(updates)
-                        all_updates.extend(updates)
+                    fy_count += parse_document(doc_file, url_map, batch)
                     files_processed += 1
                 print(f"  Found {fy_count} updates")
 
         # Consolidated files
         for doc_file in sorted(weekly_path.glob("*_C0_*.docx")):
             print(f"Processing consolidated: {doc_file.name}")
-            updates = parse_consolidated_document(doc_file, url_map)
-            if updates:
-                print(f"  Found {len(updates)} updates")
-                all_updates.extend(updates)
+            count = parse_consolidated_document(doc_file, url_map, batch)
+            if count:
+                print(f"  Found {count} updates")
             files_processed += 1
 
     # Process SEP OPERA folder
@@ -431,17 +380,13 @@ def main():
         docx_files = list(opera_path.glob("*.docx"))
         if docx_files:
             print(f"Processing SEP OPERA ({len(docx_files)} files)...")
-            opera_count = 0
+            opera_start = len(batch)
             for doc_file in sorted(docx_files):
-                updates = parse_document(doc_file, url_map)
-                if updates:
-                    # Override solution_id for OPERA files
-                    for u in updates:
-                        u['solution_id'] = 'OPERA'
-                    opera_count += len(updates)
-                    all_updates.extend(updates)
+                parse_document(doc_file, url_map, batch)
                 files_processed += 1
-            print(f"  Found {opera_count} updates")
+            # Override solution_id for OPERA files
+            batch.set_values('solution_id', 'OPERA', start=opera_start)
+            print(f"  Found {len(batch) - opera_start} updates")
 
     # Process SEP Cycle 3 (SPoRT)
     sport_path = BASE_PATH / "SEP Cycle 3 (SPoRT)"
@@ -451,39 +396,33 @@ def main():
             print(f"Processing SEP SPoRT ({len(docx_files)} files)...")
             sport_count = 0
             for doc_file in sorted(docx_files):
-                updates = parse_document(doc_file, url_map)
-                if updates:
-                    sport_count += len(updates)
-                    all_updates.extend(updates)
+                sport_count += parse_document(doc_file, url_map, batch)
                 files_processed += 1
             print(f"  Found {sport_count} updates")
 
     print()
     print("=" * 60)
     print(f"Total files processed: {files_processed}")
-    print(f"Total updates found: {len(all_updates)}")
+    print(f"Total updates found: {len(batch)}")
+
+    df = batch.to_frame()
 
     # Count by solution
-    by_solution = {}
-    for u in all_updates:
-        sol = u['solution_id']
-        by_solution[sol] = by_solution.get(sol, 0) + 1
+    by_solution = df['solution_id'].value_counts()
 
     print(f"Unique solutions: {len(by_solution)}")
     print("\nUpdates by solution:")
-    for sol, count in sorted(by_solution.items(), key=lambda x: -x[1]):
+    for sol, count in by_solution.items():
         print(f"  {sol}: {count}")
 
     # Count with URLs
-    with_urls = sum(1 for u in all_updates if u.get('source_url'))
-    print(f"\nUpdates with source URLs: {with_urls}/{len(all_updates)}")
+    with_urls = int(df['source_url'].ne('').sum())
+    print(f"\nUpdates with source URLs: {with_urls}/{len(df)}")
 
     # Write Excel
-    if all_updates:
+    if len(df):
         OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-        df = pd.DataFrame(all_updates, columns=OUTPUT_COLUMNS)
-
         # Sort by date descending
         df['meeting_date'] = pd.to_datetime(df['meeting_date'], errors='coerce')
         df = df.sort_values(['meeting_date', 'solution_id'], ascending=[False, True])
@@ -492,15 +431,7 @@ def main():
         # Remove rows without dates
         df = df[df['meeting_date'].notna()]
 
-        with pd.ExcelWriter(OUTPUT_PATH, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='SEP Updates', index=False)
-
-            worksheet = writer.sheets['SEP Updates']
-            for idx, col in enumerate(df.columns):
-                max_length = max(df[col].astype(str).map(len).max(), len(col))
-                adjusted_width = min(max_length + 2, 60)
-                col_letter = chr(65 + idx) if idx < 26 else f"A{chr(65 + idx - 26)}"
-                worksheet.column_dimensions[col_letter].width = adjusted_width
+        write_xlsx(OUTPUT_PATH, {'SEP Updates': df}, max_width=60)
 
         print(f"\nExcel file written to: {OUTPUT_PATH}")
     else:
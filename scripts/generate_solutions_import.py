@@ -10,12 +10,15 @@ Extracts all data from Quick Look including:
 - Document status (Doc Tracking)
 """
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
 import sys
-import re
 from datetime import datetime
 
+from date_parsing import parse_dates
+from solution_name_index import SolutionNameIndex
+
 sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
 # Name mappings for matching Quick Look to DB names
@@ -94,60 +97,6 @@ NAME_MAPPINGS = {
 }
 
 
-def normalize_name(name):
-    if pd.isna(name):
-        return ''
-    return str(name).strip().lower().replace('(', '').replace(')', '').replace('-', ' ').replace('_', ' ')
-
-
-def find_db_name(ql_name, db_names):
-    """Find matching database solution name for a Quick Look name."""
-    if pd.isna(ql_name):
-        return None
-
-    norm = normalize_name(ql_name)
-    # Remove cycle prefix
-    norm = re.sub(r'^cycle \d+\s*', '', norm).strip()
-
-    # Check mappings
-    for pattern, target in NAME_MAPPINGS.items():
-        if pattern in norm:
-            if target in db_names:
-                return target
-
-    # Exact match
-    for db_name in db_names:
-        if normalize_name(db_name) == norm:
-            return db_name
-
-    # Substring match
-    for db_name in db_names:
-        db_norm = normalize_name(db_name)
-        if db_norm in norm or norm in db_norm:
-            return db_name
-
-    return None
-
-
-def parse_date(val):
-    """Parse date value to YYYY-MM-DD format."""
-    if pd.isna(val):
-        return ''
-    if isinstance(val, datetime):
-        return val.strftime('%Y-%m-%d')
-    if isinstance(val, str):
-        val = val.strip()
-        if val.lower() in ['working', 'in work', 'tbd', 'n/a', '']:
-            return ''
-        # Try to parse
-        try:
-            dt = pd.to_datetime(val)
-            return dt.strftime('%Y-%m-%d')
-        except:
-            return ''
-    return ''
-
-
 def parse_doc_status(val):
     """Parse document status value."""
     if pd.isna(val):
@@ -202,12 +151,113 @@ def fix_typos(val):
     return val
 
 
+YES_VALUES = ['YES', 'Y', 'X', 'TRUE', '1']
+
+# Quick Look output fields: (import column, source column)
+POC_TEXT_FIELDS = [
+    ('solution_lead', 'Solution Lead'),
+    ('solution_lead_affiliation', 'Solution Lead Affiliation'),
+    ('ra_representative', 'R&A Representative'),
+    ('ra_representative_affiliation', 'R&A Representative Affiliation'),
+    ('earth_action_advocate', 'Earth Action Representative'),
+    ('earth_action_affiliation', 'Earth Action Representative Affiliation'),
+]
+POC_FLAG_FIELDS = [
+    ('on_official_webpage', 'On Official Webpage'),
+    ('has_drive_folder', 'Has folder in NSITE MO drive?'),
+    ('is_commercial', 'Commerical Solution?'),
+]
+CYCLES_DOC_FIELDS = [
+    ('atp_memo_status', 'ATP DG Memo'),
+    ('f2i_memo_status', 'F2I DG Memo'),
+    ('orr_memo_status', 'ORR DG Memo'),
+    ('closeout_memo_status', 'Closeout DG Memo'),
+    ('science_sow_status', 'Science SOW'),
+    ('project_plan_status', 'Project Plan'),
+    ('ipa_status', 'IPA'),
+    ('icd_status', 'ICD'),
+    ('risk_register_status', 'Risk Register'),
+]
+
+
+def parse_funding_status(val):
+    """Funded/Unfunded from the PoCs 'Funded or Unfunded? F/U' column."""
+    f_str = str(val).strip().upper()
+    if f_str == 'F' or 'FUNDED' in f_str:
+        return 'Funded'
+    elif f_str == 'U' or 'UNFUNDED' in f_str:
+        return 'Unfunded'
+    return np.nan
+
+
+def parse_count(val):
+    """Cycle numbers/years: whole numbers as int, anything else as written."""
+    return int(float(val)) if isinstance(val, (int, float)) else val
+
+
+def find_header_row(df, needles, require_all=False, upper=False):
+    """Position of the first row containing any (or all) of the needles."""
+    text = df.astype(str)
+    if upper:
+        text = text.apply(lambda col: col.str.upper())
+    hits = [text.apply(lambda col: col.str.contains(n, regex=False)).any(axis=1).to_numpy()
+            for n in needles]
+    found = np.logical_and.reduce(hits) if require_all else np.logical_or.reduce(hits)
+    rows = np.flatnonzero(found)
+    return int(rows[0]) if len(rows) else None
+
+
+def use_header_row(df, header_row):
+    """Promote a row to column names and drop everything above it."""
+    if header_row is None:
+        return df
+    df = df.copy()
+    df.columns = df.iloc[header_row].values
+    return df.iloc[header_row + 1:].reset_index(drop=True)
+
+
+def match_sheet(sheet, ql_names, db_df, name_index, label):
+    """
+    Key a Quick Look sheet by DB solution name.
+
+    Returns (rows, unmatched): one sheet row per matched solution (the first
+    one, indexed by DB name) and the sheet names that matched no solution,
+    taken from the merge indicator.
+    """
+    sheet = sheet.loc[:, ~pd.Index(sheet.columns).duplicated()].copy()
+    sheet['_ql_name'] = ql_names.values
+    sheet['_db_name'] = name_index.resolve(ql_names)['db_name'].values
+
+    merged = sheet[['_ql_name', '_db_name']].merge(db_df[['name']].drop_duplicates(), left_on='_db_name',
+                                                   right_on='name', how='left', indicator=True)
+    unmatched = merged.loc[(merged['_merge'] == 'left_only') & merged['_ql_name'].notna(), '_ql_name']
+    unmatched = [str(n).strip() for n in unmatched if str(n).strip()]
+
+    rows = sheet.dropna(subset=['_db_name']).drop_duplicates('_db_name').set_index('_db_name')
+    print(f"  {label}: {len(rows)} solutions matched, {len(unmatched)} names unmatched")
+    return rows, unmatched
+
+
+def first_text_cell(df):
+    """First non-blank string in each row (where the Cycles sheet puts names)."""
+    is_text = df.map(lambda v: isinstance(v, str) and bool(v.strip()))
+    return df.where(is_text).bfill(axis=1).iloc[:, 0]
+
+
+def sheet_values(rows, column, default=np.nan):
+    """A sheet column aligned to the import rows (default where missing)."""
+    if column in rows.columns:
+        return rows[column]
+    return pd.Series(default, index=rows.index, dtype=object)
+
+
 def main():
     base_dir = Path(__file__).parent.parent.parent
 
     quicklook_path = base_dir / 'Solution Status Quick Look_NSITE MO_C0_01-16-2026.xlsx'
     solutions_path = base_dir / 'database-files' / 'MO-Viewer Databases' / 'MO-DB_Solutions.xlsx'
     output_path = base_dir / 'nsite-mo-viewer' / 'scripts' / 'SOLUTIONS_IMPORT.csv'
+    unmatched_path = output_path.with_name('SOLUTIONS_IMPORT_unmatched.csv')
 
     print("=" * 70)
     print("GENERATING SOLUTIONS IMPORT CSV")
@@ -216,220 +266,99 @@ def main():
     # Read current database
     print("\nReading current MO-DB_Solutions...")
     db_df = pd.read_excel(solutions_path)
-    db_names = db_df['name'].dropna().tolist()
+    name_index = SolutionNameIndex(db_df['name'].dropna().tolist(), NAME_MAPPINGS)
     print(f"  Found {len(db_df)} solutions")
 
-    # Read Quick Look sheets
+    # Read Quick Look sheets (one workbook open for all four)
     print("\nReading Quick Look sheets...")
-    xl = pd.ExcelFile(quicklook_path)
-
-    # 1. Solution PoCs (contacts)
-    pocs_df = pd.read_excel(quicklook_path, sheet_name='Solution PoCs')
-    for i, row in pocs_df.iterrows():
-        if 'Solution' in str(row.values) and 'Title' in str(row.values):
-            pocs_df.columns = pocs_df.iloc[i].values
-            pocs_df = pocs_df.iloc[i+1:].reset_index(drop=True)
-            break
+    sheets = pd.read_excel(quicklook_path, sheet_name=['Solution PoCs', 'Solution Top Sheet',
+                                                      'Doc Tracking', 'SNWG MO Cycles'], header=None)
+
+    # 1. Solution PoCs (contacts) - first row is the usual header
+    pocs_df = use_header_row(sheets['Solution PoCs'], 0)
+    pocs_df = use_header_row(pocs_df, find_header_row(pocs_df, ['Solution', 'Title'], require_all=True))
     print(f"  Solution PoCs: {len(pocs_df)} entries")
 
     # 2. Solution Top Sheet (phases, key milestones)
-    top_df = pd.read_excel(quicklook_path, sheet_name='Solution Top Sheet', header=None)
-    for i, row in top_df.iterrows():
-        if 'Solution Project' in str(row.values):
-            top_df.columns = top_df.iloc[i].values
-            top_df = top_df.iloc[i+1:].reset_index(drop=True)
-            break
-    top_df = top_df.dropna(how='all')
+    top_df = sheets['Solution Top Sheet']
+    top_df = use_header_row(top_df, find_header_row(top_df, ['Solution Project'])).dropna(how='all')
     print(f"  Solution Top Sheet: {len(top_df)} entries")
 
     # 3. Doc Tracking
-    doc_df = pd.read_excel(quicklook_path, sheet_name='Doc Tracking', header=None)
-    # Find header row
-    for i, row in doc_df.iterrows():
-        if 'SOLUTION PROJECT' in str(row.values).upper():
-            doc_df.columns = doc_df.iloc[i].values
-            doc_df = doc_df.iloc[i+1:].reset_index(drop=True)
-            break
-    doc_df = doc_df.dropna(how='all')
+    doc_df = sheets['Doc Tracking']
+    doc_df = use_header_row(doc_df, find_header_row(doc_df, ['SOLUTION PROJECT'], upper=True)).dropna(how='all')
     print(f"  Doc Tracking: {len(doc_df)} entries")
 
-    # 4. SNWG MO Cycles (detailed milestones)
-    cycles_df = pd.read_excel(quicklook_path, sheet_name='SNWG MO Cycles', header=None)
-    # This sheet has complex structure - find the header row with document names
-    header_row = None
-    for i, row in cycles_df.iterrows():
-        row_str = str(row.values)
-        if 'Science SOW' in row_str or 'ATP DG Memo' in row_str:
-            header_row = i
-            break
-
-    if header_row is not None:
-        cycles_df.columns = cycles_df.iloc[header_row].values
-        cycles_df = cycles_df.iloc[header_row+1:].reset_index(drop=True)
+    # 4. SNWG MO Cycles (detailed milestones) - header row holds document names
+    cycles_df = sheets['SNWG MO Cycles']
+    cycles_df = use_header_row(cycles_df, find_header_row(cycles_df, ['Science SOW', 'ATP DG Memo']))
     print(f"  SNWG MO Cycles: {len(cycles_df)} entries")
 
+    # Key every sheet by DB solution name once, then join
+    print("\nMatching Quick Look names to MO-DB_Solutions...")
+    poc_names = sheet_values(pocs_df, 'Solution', None)
+    if 'Title' in pocs_df.columns:
+        poc_names = poc_names.where(poc_names.notna() & (poc_names.astype(str) != ''), pocs_df['Title'])
+    pocs, unmatched_pocs = match_sheet(pocs_df, poc_names, db_df, name_index, 'Solution PoCs')
+    top, unmatched_top = match_sheet(top_df, sheet_values(top_df, 'Solution Project'), db_df, name_index, 'Solution Top Sheet')
+    doc, unmatched_doc = match_sheet(doc_df, sheet_values(doc_df, 'SOLUTION PROJECT'), db_df, name_index, 'Doc Tracking')
+    cycles, unmatched_cycles = match_sheet(cycles_df, first_text_cell(cycles_df), db_df, name_index, 'SNWG MO Cycles')
+
     # Build import data
     print("\nBuilding import data...")
 
-    import_records = []
-
-    for _, db_row in db_df.iterrows():
-        sol_name = db_row['name']
-        sol_id = db_row.get('solution_id', '')
-
-        record = {
-            'solution_id': sol_id,
-            'name': sol_name,
-        }
-
-        # Find matching PoCs entry
-        poc_match = None
-        for _, poc_row in pocs_df.iterrows():
-            ql_name = poc_row.get('Solution') or poc_row.get('Title')
-            if find_db_name(ql_name, [sol_name]) == sol_name:
-                poc_match = poc_row
-                break
-
-        # Find matching Top Sheet entry
-        top_match = None
-        for _, top_row in top_df.iterrows():
-            ql_name = top_row.get('Solution Project')
-            if find_db_name(ql_name, [sol_name]) == sol_name:
-                top_match = top_row
-                break
-
-        # Find matching Doc Tracking entry
-        doc_match = None
-        for _, doc_row in doc_df.iterrows():
-            ql_name = doc_row.get('SOLUTION PROJECT')
-            if find_db_name(ql_name, [sol_name]) == sol_name:
-                doc_match = doc_row
-                break
-
-        # Find matching Cycles entry
-        cycles_match = None
-        for _, cyc_row in cycles_df.iterrows():
-            # Solution name is in first non-null column typically
-            for col in cycles_df.columns:
-                ql_name = cyc_row.get(col)
-                if isinstance(ql_name, str) and ql_name.strip():
-                    if find_db_name(ql_name, [sol_name]) == sol_name:
-                        cycles_match = cyc_row
-                        break
-            if cycles_match is not None:
-                break
-
-        # === Contact Information (from PoCs) ===
-        if poc_match is not None:
-            record['solution_lead'] = fix_typos(poc_match.get('Solution Lead', ''))
-            record['solution_lead_affiliation'] = fix_typos(poc_match.get('Solution Lead Affiliation', ''))
-            record['ra_representative'] = fix_typos(poc_match.get('R&A Representative', ''))
-            record['ra_representative_affiliation'] = fix_typos(poc_match.get('R&A Representative Affiliation', ''))
-            record['earth_action_advocate'] = fix_typos(poc_match.get('Earth Action Representative', ''))
-            record['earth_action_affiliation'] = fix_typos(poc_match.get('Earth Action Representative Affiliation', ''))
-
-            # Cycle info
-            cycle_val = poc_match.get('Cycle')
-            if pd.notna(cycle_val):
-                record['cycle'] = int(float(cycle_val)) if isinstance(cycle_val, (int, float)) else cycle_val
-
-            cycle_year = poc_match.get('Cycle Year')
-            if pd.notna(cycle_year):
-                record['cycle_year'] = int(float(cycle_year)) if isinstance(cycle_year, (int, float)) else cycle_year
-
-            # Funding status
-            funded = poc_match.get('Funded or Unfunded? F/U')
-            if pd.notna(funded):
-                f_str = str(funded).strip().upper()
-                if f_str == 'F' or 'FUNDED' in f_str:
-                    record['funding_status'] = 'Funded'
-                elif f_str == 'U' or 'UNFUNDED' in f_str:
-                    record['funding_status'] = 'Unfunded'
-
-            # Boolean flags
-            on_web = poc_match.get('On Official Webpage')
-            if pd.notna(on_web):
-                record['on_official_webpage'] = str(on_web).strip().upper() in ['YES', 'Y', 'X', 'TRUE', '1']
-
-            has_folder = poc_match.get('Has folder in NSITE MO drive?')
-            if pd.notna(has_folder):
-                record['has_drive_folder'] = str(has_folder).strip().upper() in ['YES', 'Y', 'X', 'TRUE', '1']
-
-            is_commercial = poc_match.get('Commerical Solution?')
-            if pd.notna(is_commercial):
-                record['is_commercial'] = str(is_commercial).strip().upper() in ['YES', 'Y', 'X', 'TRUE', '1']
-
-        # === Phase (from Top Sheet) ===
-        if top_match is not None:
-            phase = top_match.get('Phase')
-            if pd.notna(phase):
-                record['phase'] = standardize_phase(phase)
-
-            # Key milestone dates from Top Sheet
-            production_start = top_match.get('Production Start')
-            if pd.notna(production_start) and str(production_start).strip().lower() not in ['working', 'tbd', '']:
-                record['production_start_date'] = parse_date(production_start)
-
-        # === Document Status (from Doc Tracking) ===
-        if doc_match is not None:
-            # Map doc tracking columns to database columns
-            # The doc tracking sheet has various document columns
-            pass  # Doc tracking has complex structure, will extract what we can
-
-        # === Milestone Dates (from Cycles sheet) ===
-        if cycles_match is not None:
-            # ATP
-            atp_memo = cycles_match.get('ATP DG Memo')
-            if pd.notna(atp_memo):
-                record['atp_memo_status'] = parse_doc_status(atp_memo)
-
-            # F2I
-            f2i_memo = cycles_match.get('F2I DG Memo')
-            if pd.notna(f2i_memo):
-                record['f2i_memo_status'] = parse_doc_status(f2i_memo)
-
-            # ORR
-            orr_memo = cycles_match.get('ORR DG Memo')
-            if pd.notna(orr_memo):
-                record['orr_memo_status'] = parse_doc_status(orr_memo)
-
-            # Closeout
-            closeout_memo = cycles_match.get('Closeout DG Memo')
-            if pd.notna(closeout_memo):
-                record['closeout_memo_status'] = parse_doc_status(closeout_memo)
-
-            # Science SOW
-            science_sow = cycles_match.get('Science SOW')
-            if pd.notna(science_sow):
-                record['science_sow_status'] = parse_doc_status(science_sow)
-
-            # Project Plan
-            project_plan = cycles_match.get('Project Plan')
-            if pd.notna(project_plan):
-                record['project_plan_status'] = parse_doc_status(project_plan)
-
-            # IPA
-            ipa = cycles_match.get('IPA')
-            if pd.notna(ipa):
-                record['ipa_status'] = parse_doc_status(ipa)
-
-            # ICD
-            icd = cycles_match.get('ICD')
-            if pd.notna(icd):
-                record['icd_status'] = parse_doc_status(icd)
-
-            # Risk Register
-            risk_reg = cycles_match.get('Risk Register')
-            if pd.notna(risk_reg):
-                record['risk_register_status'] = parse_doc_status(risk_reg)
-
-        # Add last_updated timestamp
-        record['last_updated'] = datetime.now().strftime('%Y-%m-%d')
-
-        import_records.append(record)
-
-    # Create DataFrame
-    import_df = pd.DataFrame(import_records)
+    names = db_df['name']
+    import_df = pd.DataFrame({
+        'solution_id': db_df['solution_id'] if 'solution_id' in db_df.columns else '',
+        'name': names,
+    })
+
+    # === Contact Information (from PoCs) ===
+    pocs = pocs.reindex(names)
+    has_poc = pocs['_ql_name'].notna().to_numpy()
+    for field, column in POC_TEXT_FIELDS:
+        values = sheet_values(pocs, column, '').map(fix_typos)
+        import_df[field] = values.where(has_poc).to_numpy()
+
+    # Cycle info
+    for field, column in [('cycle', 'Cycle'), ('cycle_year', 'Cycle Year')]:
+        values = sheet_values(pocs, column)
+        import_df[field] = values.map(parse_count, na_action='ignore').to_numpy()
+
+    # Funding status
+    funded = sheet_values(pocs, 'Funded or Unfunded? F/U')
+    import_df['funding_status'] = funded.map(parse_funding_status, na_action='ignore').to_numpy()
+
+    # Boolean flags
+    for field, column in POC_FLAG_FIELDS:
+        values = sheet_values(pocs, column)
+        flags = values.astype(str).str.strip().str.upper().isin(YES_VALUES)
+        import_df[field] = flags.astype(object).where(values.notna()).to_numpy()
+
+    # === Phase (from Top Sheet) ===
+    top = top.reindex(names)
+    phase = sheet_values(top, 'Phase')
+    import_df['phase'] = phase.map(standardize_phase, na_action='ignore').to_numpy()
+
+    # Key milestone dates from Top Sheet
+    production_start = sheet_values(top, 'Production Start')
+    has_start = production_start.notna() & ~production_start.astype(str).str.strip().str.lower().isin(['working', 'tbd', ''])
+    import_df['production_start_date'] = parse_dates(production_start, 'solutions').where(has_start).to_numpy()
+
+    # === Document Status (from Doc Tracking) ===
+    # Doc tracking has complex structure; matches are only reported for now
+
+    # === Milestone Dates (from Cycles sheet) ===
+    cycles = cycles.reindex(names)
+    for field, column in CYCLES_DOC_FIELDS:
+        values = sheet_values(cycles, column)
+        import_df[field] = values.map(parse_doc_status, na_action='ignore').to_numpy()
+
+    # Add last_updated timestamp
+    import_df['last_updated'] = datetime.now().strftime('%Y-%m-%d')
+
+    # Fields no solution had a value for are left out, as before
+    import_df = import_df.dropna(axis=1, how='all')
 
     # Reorder columns
     priority_cols = [
@@ -454,6 +383,18 @@ def main():
     # Write CSV
     import_df.to_csv(output_path, index=False, encoding='utf-8')
 
+    # Unmatched Quick Look names, straight from the merge indicators
+    unmatched_df = pd.DataFrame(
+        [(sheet, name) for sheet, names_list in [
+            ('Solution PoCs', unmatched_pocs),
+            ('Solution Top Sheet', unmatched_top),
+            ('Doc Tracking', unmatched_doc),
+            ('SNWG MO Cycles', unmatched_cycles),
+        ] for name in names_list],
+        columns=['sheet', 'quick_look_name'],
+    ).drop_duplicates()
+    unmatched_df.to_csv(unmatched_path, index=False, encoding='utf-8')
+
     print(f"\n{'='*70}")
     print("IMPORT CSV GENERATED")
     print("=" * 70)
@@ -465,6 +406,13 @@ def main():
         non_empty = import_df[col].notna() & (import_df[col].astype(str).str.strip() != '')
         print(f"  {col}: {non_empty.sum()}/{len(import_df)} filled")
 
+    unmatched_solutions = db_df.loc[~names.isin(pocs.dropna(subset=['_ql_name']).index)
+                                    & ~names.isin(top.dropna(subset=['_ql_name']).index), 'name']
+    print(f"\nUnmatched Quick Look names: {len(unmatched_df)} (see {unmatched_path.name})")
+    print(f"Solutions with no PoCs or Top Sheet row: {len(unmatched_solutions)}")
+    for name in unmatched_solutions:
+        print(f"  - {name}")
+
 
 if __name__ == '__main__':
     main()
@@ -24,7 +24,13 @@ SCHEMA_COLUMNS = [
     "created_by",         # Who/what created it
 ]
 
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-df = pd.DataFrame(columns=SCHEMA_COLUMNS)
-df.to_excel(OUTPUT_FILE, index=False, sheet_name="Actions")
-print(f"Created: {OUTPUT_FILE}")
+
+def main():
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    df = pd.DataFrame(columns=SCHEMA_COLUMNS)
+    df.to_excel(OUTPUT_FILE, index=False, sheet_name="Actions")
+    print(f"Created: {OUTPUT_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,14 +7,28 @@ This script extracts:
 
 And converts them to the new CommsAssets schema.
 
+The comms columns are melted into one row per (solution, column), and the
+fields that are the same for every asset are filled in once per column.
+
+With --incremental, only assets whose source text changed since the last
+migration are written. Each run records a content hash and asset_id per
+source cell in the state file; a changed asset keeps its asset_id and a
+new one gets the next free ID. Repeated source keys (two blurbs with one
+story_id, or blurbs keyed by a shared title) are numbered by occurrence.
+The CSV is written on every run, header only when nothing changed.
+
 Usage:
-    python migrate_to_comms_assets.py
+    python migrate_to_comms_assets.py [--incremental]
 
 Output:
     database-files/comms-assets-migrated.csv
+    database-files/comms-assets-migration-state.json
 """
 
 import pandas as pd
+import argparse
+import hashlib
+import json
 import os
 from datetime import datetime
 
@@ -22,6 +36,37 @@ from datetime import datetime
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATABASE_DIR = os.path.join(BASE_DIR, 'database-files', 'MO-Viewer Databases')
 OUTPUT_FILE = os.path.join(BASE_DIR, 'database-files', 'comms-assets-migrated.csv')
+STATE_FILE = os.path.join(BASE_DIR, 'database-files', 'comms-assets-migration-state.json')
+
+# MO-DB_CommsAssets column order
+ASSET_COLUMNS = [
+    'asset_id', 'asset_type', 'title', 'content',
+    'source_name', 'source_type', 'source_url', 'attribution_text', 'date_captured',
+    'solution_ids', 'agency_ids', 'contact_ids', 'tags',
+    'audience', 'channels', 'tone', 'usage_notes',
+    'status', 'approved_by', 'approved_date', 'expiration_date',
+    'created_by', 'created_at', 'updated_at', 'use_count', 'last_used_date'
+]
+
+# Solutions columns to extract: (column, asset_type, title suffix)
+COMMS_COLUMNS = [
+    ('comms_key_messages', 'talking_point', 'Key Messages'),
+    ('comms_science', 'fact', 'Scientific Advancement'),
+    ('comms_agency_impact', 'connection', 'Agency Use & Impact'),
+    ('comms_industry', 'connection', 'Industry Connections'),
+]
+
+# First asset_id number per source (blurbs start at 500 to avoid collisions)
+KEY_MESSAGE_ID_START = 1
+BLURB_ID_START = 500
+
+# Story status -> asset status (anything else is a draft)
+STATUS_MAP = {
+    'published': 'approved',
+    'review': 'approved',
+    'drafting': 'draft',
+    'idea': 'draft'
+}
 
 def load_solutions():
     """Load MO-DB_Solutions and extract comms columns."""
@@ -64,181 +109,275 @@ def load_stories():
 
     return df
 
-def extract_key_messages(solutions_df):
-    """Extract key messages from solutions into CommsAssets format."""
-    assets = []
-    asset_id_counter = 1
-
-    # Columns to extract
-    comms_columns = [
-        ('comms_key_messages', 'talking_point', 'Key Messages'),
-        ('comms_science', 'fact', 'Scientific Advancement'),
-        ('comms_agency_impact', 'connection', 'Agency Use & Impact'),
-        ('comms_industry', 'connection', 'Industry Connections'),
-    ]
-
-    for _, row in solutions_df.iterrows():
-        solution_id = row.get('core_id', '')
-        solution_name = row.get('core_official_name', solution_id)
-
-        if not solution_id:
-            continue
-
-        for col, asset_type, title_prefix in comms_columns:
-            content = row.get(col, '')
-            if pd.isna(content) or not str(content).strip():
-                continue
-
-            content = str(content).strip()
-
-            # Split by double newlines or bullet points to create separate assets
-            # For now, keep as single asset per column
-            asset = {
-                'asset_id': f'CA-{asset_id_counter:03d}',
-                'asset_type': asset_type,
-                'title': f'{solution_name} - {title_prefix}',
-                'content': content,
-                'source_name': 'MO-DB_Solutions',
-                'source_type': 'internal',
-                'source_url': '',
-                'attribution_text': 'NSITE MO',
-                'date_captured': datetime.now().strftime('%Y-%m-%d'),
-                'solution_ids': solution_id,
-                'agency_ids': '',
-                'contact_ids': '',
-                'tags': f'{solution_id},{asset_type}',
-                'audience': 'all',
-                'channels': 'all',
-                'tone': 'formal',
-                'usage_notes': f'Migrated from MO-DB_Solutions.{col}',
-                'status': 'approved',
-                'approved_by': 'Migration Script',
-                'approved_date': datetime.now().strftime('%Y-%m-%d'),
-                'expiration_date': '',
-                'created_by': 'Migration Script',
-                'created_at': datetime.now().strftime('%Y-%m-%d'),
-                'updated_at': datetime.now().strftime('%Y-%m-%d'),
-                'use_count': 0,
-                'last_used_date': ''
-            }
-            assets.append(asset)
-            asset_id_counter += 1
-
+def text_column(df, column, default=''):
+    """df[column] as stripped text ('' for missing cells or a missing column)."""
+    if column is None or column not in df.columns:
+        return pd.Series(default, index=df.index, dtype=object)
+    return df[column].astype(object).where(df[column].notna(), default).astype(str).str.strip()
+
+def content_hashes(content):
+    """Short SHA-1 of each asset's text, used to spot changed sources."""
+    return [hashlib.sha1(text.encode('utf-8')).hexdigest()[:16] for text in content]
+
+def asset_ids(numbers):
+    """CA-001 style IDs from a sequence of numbers."""
+    return 'CA-' + pd.Series(numbers, dtype='int64').astype(str).str.zfill(3)
+
+def extract_key_messages(solutions_df, today):
+    """
+    Extract key messages from solutions into CommsAssets format.
+
+    One asset per non-empty comms column per solution, in row order.
+    Returns a DataFrame without asset_id, plus source_key/content_hash.
+    """
+    columns = [c for c, _, _ in COMMS_COLUMNS if c in solutions_df.columns]
+    if not columns:
+        return pd.DataFrame(columns=ASSET_COLUMNS + ['source_key', 'content_hash'])
+
+    wide = pd.DataFrame({
+        'solution_id': text_column(solutions_df, 'core_id'),
+        'solution_name': text_column(solutions_df, 'core_official_name'),
+        '_row': range(len(solutions_df)),
+    }, index=solutions_df.index)
+    wide['solution_name'] = wide['solution_name'].mask(wide['solution_name'].eq(''), wide['solution_id'])
+    for col in columns:
+        wide[col] = text_column(solutions_df, col)
+
+    # One row per (solution, comms column), ordered as solution then column
+    long = wide[wide['solution_id'].ne('')].melt(
+        id_vars=['solution_id', 'solution_name', '_row'], value_vars=columns,
+        var_name='source_column', value_name='content'
+    )
+    long = long[long['content'].ne('')]
+    long['_col'] = long['source_column'].map({c: i for i, (c, _, _) in enumerate(COMMS_COLUMNS)})
+    long = long.sort_values(['_row', '_col'], kind='stable').reset_index(drop=True)
+
+    asset_type = long['source_column'].map({c: t for c, t, _ in COMMS_COLUMNS})
+    suffix = long['source_column'].map({c: s for c, _, s in COMMS_COLUMNS})
+
+    assets = pd.DataFrame({
+        'asset_type': asset_type,
+        'title': long['solution_name'] + ' - ' + suffix,
+        'content': long['content'],
+        'solution_ids': long['solution_id'],
+        'tags': long['solution_id'] + ',' + asset_type,
+        'usage_notes': 'Migrated from MO-DB_Solutions.' + long['source_column'],
+        'source_key': 'MO-DB_Solutions.' + long['source_column'] + ':' + long['solution_id'],
+    })
+    constants = {
+        'source_name': 'MO-DB_Solutions',
+        'source_type': 'internal',
+        'source_url': '',
+        'attribution_text': 'NSITE MO',
+        'date_captured': today,
+        'agency_ids': '',
+        'contact_ids': '',
+        'audience': 'all',
+        'channels': 'all',
+        'tone': 'formal',
+        'status': 'approved',
+        'approved_by': 'Migration Script',
+        'approved_date': today,
+        'expiration_date': '',
+        'created_by': 'Migration Script',
+        'created_at': today,
+        'updated_at': today,
+        'use_count': 0,
+        'last_used_date': '',
+    }
+    for col, value in constants.items():
+        assets[col] = value
+    assets['content_hash'] = content_hashes(assets['content'])
     return assets
 
-def extract_blurbs(stories_df):
-    """Extract highlighter blurbs from stories into CommsAssets format."""
-    assets = []
-    asset_id_counter = 500  # Start at 500 to avoid collision with key messages
-
-    for _, row in stories_df.iterrows():
-        story_id = row.get('story_id', '')
-        title = row.get('title', 'Untitled Blurb')
-        content = row.get('blurb_content', row.get('content', row.get('notes', '')))
-        solution_id = row.get('solution_id', '')
-        target_date = row.get('target_date', '')
-        status = row.get('status', 'draft')
-
-        if pd.isna(content) or not str(content).strip():
-            continue
-
-        # Map status
-        status_map = {
-            'published': 'approved',
-            'review': 'approved',
-            'drafting': 'draft',
-            'idea': 'draft'
-        }
-        new_status = status_map.get(status, 'draft')
-
-        asset = {
-            'asset_id': f'CA-{asset_id_counter:03d}',
-            'asset_type': 'blurb',
-            'title': str(title),
-            'content': str(content).strip(),
-            'source_name': 'Weekly Internal Planning',
-            'source_type': 'internal',
-            'source_url': '',
-            'attribution_text': 'NSITE MO Team',
-            'date_captured': str(target_date) if not pd.isna(target_date) else datetime.now().strftime('%Y-%m-%d'),
-            'solution_ids': str(solution_id) if not pd.isna(solution_id) else '',
-            'agency_ids': '',
-            'contact_ids': '',
-            'tags': 'blurb,hq-reporting',
-            'audience': 'external',
-            'channels': 'email,report',
-            'tone': 'formal',
-            'usage_notes': f'Migrated from MO-DB_Stories (story_id: {story_id})',
-            'status': new_status,
-            'approved_by': 'Migration Script' if new_status == 'approved' else '',
-            'approved_date': datetime.now().strftime('%Y-%m-%d') if new_status == 'approved' else '',
-            'expiration_date': '',
-            'created_by': 'Migration Script',
-            'created_at': datetime.now().strftime('%Y-%m-%d'),
-            'updated_at': datetime.now().strftime('%Y-%m-%d'),
-            'use_count': 0,
-            'last_used_date': ''
-        }
-        assets.append(asset)
-        asset_id_counter += 1
+def extract_blurbs(stories_df, today):
+    """
+    Extract highlighter blurbs from stories into CommsAssets format.
 
+    Returns a DataFrame without asset_id, plus source_key/content_hash.
+    """
+    # Blurb text comes from the first of these columns the sheet has
+    content_col = next((c for c in ('blurb_content', 'content', 'notes') if c in stories_df.columns), None)
+    content = text_column(stories_df, content_col)
+    stories = stories_df[content.ne('')]
+    content = content[content.ne('')]
+
+    status = stories['status'] if 'status' in stories.columns else pd.Series('draft', index=stories.index)
+    new_status = status.map(STATUS_MAP).fillna('draft')
+    approved = new_status.eq('approved')
+
+    if 'title' in stories.columns:
+        title = stories['title'].astype(str)
+    else:
+        title = pd.Series('Untitled Blurb', index=stories.index)
+    story_id = text_column(stories, 'story_id')
+    target_date = stories['target_date'] if 'target_date' in stories.columns else pd.Series(None, index=stories.index)
+
+    assets = pd.DataFrame({
+        'asset_type': 'blurb',
+        'title': title,
+        'content': content,
+        'date_captured': target_date.astype(str).where(target_date.notna(), today),
+        'solution_ids': text_column(stories, 'solution_id'),
+        'usage_notes': 'Migrated from MO-DB_Stories (story_id: ' + story_id + ')',
+        'status': new_status,
+        'approved_by': approved.map({True: 'Migration Script', False: ''}),
+        'approved_date': approved.map({True: today, False: ''}),
+        'source_key': 'MO-DB_Stories:' + story_id.mask(story_id.eq(''), title),
+    }, index=stories.index).reset_index(drop=True)
+    constants = {
+        'source_name': 'Weekly Internal Planning',
+        'source_type': 'internal',
+        'source_url': '',
+        'attribution_text': 'NSITE MO Team',
+        'agency_ids': '',
+        'contact_ids': '',
+        'tags': 'blurb,hq-reporting',
+        'audience': 'external',
+        'channels': 'email,report',
+        'tone': 'formal',
+        'expiration_date': '',
+        'created_by': 'Migration Script',
+        'created_at': today,
+        'updated_at': today,
+        'use_count': 0,
+        'last_used_date': '',
+    }
+    for col, value in constants.items():
+        assets[col] = value
+    assets['content_hash'] = content_hashes(assets['content'])
     return assets
 
+def load_state(path=STATE_FILE):
+    """{source name: {source_key: [content_hash, asset_id]}} from the last run."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def save_state(state, path=STATE_FILE):
+    """Write the migration state (sorted, so diffs stay readable)."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+        f.write('\n')
+
+def unique_source_keys(keys):
+    """
+    source_key made unique per row: repeats get '#2', '#3', ... in row order
+    (blurbs fall back to the title, and two blurbs can share a story_id).
+    """
+    keys = pd.Series(keys, dtype=object).reset_index(drop=True)
+    occurrence = keys.groupby(keys, sort=False).cumcount()
+    repeated = occurrence.gt(0)
+    if repeated.any():
+        print(f"   Warning: {int(repeated.sum())} repeated source keys numbered by occurrence "
+              f"(e.g. {keys[repeated].iloc[0]})")
+    return keys.where(~repeated, keys + '#' + (occurrence + 1).astype(str)).to_numpy()
+
+def assign_ids(assets, start, previous=None):
+    """
+    Set asset_id on a frame from extract_*.
+
+    Without previous state, IDs run from start in order. With it, known
+    sources keep their asset_id and new ones continue after the highest
+    ID used so far.
+    """
+    assets = assets.copy()
+    if not previous:
+        assets['asset_id'] = asset_ids(range(start, start + len(assets))).to_numpy()
+        return assets
+
+    known = assets['source_key'].map({k: v[1] for k, v in previous.items()})
+    used = [int(v[1].split('-')[1]) for v in previous.values()]
+    next_id = max(used + [start - 1]) + 1
+    new = known.isna()
+    known[new] = asset_ids(range(next_id, next_id + int(new.sum()))).to_numpy()
+    assets['asset_id'] = known
+    return assets
+
+def changed_assets(assets, previous):
+    """Rows whose source is new or whose content hash differs from the last run."""
+    last_hash = assets['source_key'].map({k: v[0] for k, v in previous.items()})
+    return assets[last_hash.ne(assets['content_hash'])]
+
+def migrate(frames, state, incremental=False):
+    """
+    Assign IDs and pick the assets to write.
+
+    frames: [(source name, assets frame, first ID)]. Returns (assets to
+    write, new state covering every current source).
+    """
+    output, new_state = [], {}
+    for source, assets, start in frames:
+        previous = state.get(source, {}) if incremental else {}
+        assets = assets.assign(source_key=unique_source_keys(assets['source_key']))
+        assets = assign_ids(assets, start, previous)
+        new_state[source] = dict(zip(assets['source_key'],
+                                     zip(assets['content_hash'], assets['asset_id'])))
+        if incremental:
+            unchanged = len(assets)
+            assets = changed_assets(assets, previous)
+            print(f"   {source}: {len(assets)} new or changed, {unchanged - len(assets)} unchanged")
+        output.append(assets)
+
+    output = [a for a in output if len(a)]
+    combined = pd.concat(output, ignore_index=True) if output else pd.DataFrame(columns=ASSET_COLUMNS)
+    return combined[ASSET_COLUMNS], {k: {key: list(v) for key, v in s.items()} for k, s in new_state.items()}
+
 def main():
+    parser = argparse.ArgumentParser(description='Migrate comms content to MO-DB_CommsAssets')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only write assets whose source text changed since the last migration')
+    args = parser.parse_args()
+
     print("=" * 60)
     print("MO-DB_CommsAssets Migration Script")
     print("=" * 60)
 
-    all_assets = []
+    today = datetime.now().strftime('%Y-%m-%d')
+    frames = []
 
     # Extract from Solutions
     print("\n1. Extracting key messages from MO-DB_Solutions...")
     solutions_df = load_solutions()
     if not solutions_df.empty:
-        key_message_assets = extract_key_messages(solutions_df)
+        key_message_assets = extract_key_messages(solutions_df, today)
         print(f"   Extracted {len(key_message_assets)} key message assets")
-        all_assets.extend(key_message_assets)
+        frames.append(('MO-DB_Solutions', key_message_assets, KEY_MESSAGE_ID_START))
 
     # Extract from Stories
     print("\n2. Extracting highlighter blurbs from MO-DB_Stories...")
     stories_df = load_stories()
     if not stories_df.empty:
-        blurb_assets = extract_blurbs(stories_df)
+        blurb_assets = extract_blurbs(stories_df, today)
         print(f"   Extracted {len(blurb_assets)} blurb assets")
-        all_assets.extend(blurb_assets)
-
-    # Create output DataFrame
-    print(f"\n3. Writing {len(all_assets)} assets to CSV...")
-    if all_assets:
-        output_df = pd.DataFrame(all_assets)
-
-        # Ensure column order matches schema
-        columns = [
-            'asset_id', 'asset_type', 'title', 'content',
-            'source_name', 'source_type', 'source_url', 'attribution_text', 'date_captured',
-            'solution_ids', 'agency_ids', 'contact_ids', 'tags',
-            'audience', 'channels', 'tone', 'usage_notes',
-            'status', 'approved_by', 'approved_date', 'expiration_date',
-            'created_by', 'created_at', 'updated_at', 'use_count', 'last_used_date'
-        ]
-        output_df = output_df[columns]
-
-        output_df.to_csv(OUTPUT_FILE, index=False)
-        print(f"   Output written to: {OUTPUT_FILE}")
-    else:
-        print("   No assets to write!")
+        frames.append(('MO-DB_Stories', blurb_assets, BLURB_ID_START))
+
+    state = load_state()
+    if args.incremental:
+        print(f"\n   Incremental: comparing against {STATE_FILE}" if state
+              else "\n   Incremental: no previous state, writing all assets")
+    output_df, new_state = migrate(frames, state, args.incremental)
+
+    # Create output CSV
+    # Always written (header only when nothing changed), so an earlier run's
+    # delta is never left behind to be imported twice
+    print(f"\n3. Writing {len(output_df)} assets to CSV...")
+    output_df.to_csv(OUTPUT_FILE, index=False)
+    print(f"   Output written to: {OUTPUT_FILE}")
+    if not len(output_df):
+        print("   No assets to write (header only)")
+    if frames:
+        save_state({**state, **new_state})
+        print(f"   State written to: {STATE_FILE}")
 
     # Summary
     print("\n" + "=" * 60)
     print("Migration Summary")
     print("=" * 60)
-    if all_assets:
-        types = {}
-        for a in all_assets:
-            t = a['asset_type']
-            types[t] = types.get(t, 0) + 1
-        print(f"Total assets: {len(all_assets)}")
-        for t, count in sorted(types.items()):
+    if len(output_df):
+        print(f"Total assets: {len(output_df)}")
+        for t, count in output_df['asset_type'].value_counts().sort_index().items():
             print(f"  - {t}: {count}")
 
     print("\nNext steps:")
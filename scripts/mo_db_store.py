@@ -0,0 +1,453 @@
+# -*- coding: utf-8 -*-
+"""
+Canonical Local Store for MO-DB Tables
+=======================================
+One SQLite database holding the MO-DB tables (Solutions, Updates,
+Milestones, Stories, Contacts + Roles, Actions, CommsAssets), so scripts
+can upsert changed rows by primary key instead of rewriting whole xlsx/CSV
+files, and joins become indexed queries. consolidate_solutions_db.py,
+sync_stories_from_tracking.py and combine_final_import.py upsert their
+output here with --store.
+
+The schema is generated, not hand-written:
+- column names/types and primary/secondary indexes are parsed from the
+  table definitions in docs/DATA_SCHEMA.md
+- MO-DB_Actions columns come from import-actions/create_actions_db.py
+  (SCHEMA_COLUMNS), which is what the Actions sheet actually uses
+- columns found in imported files but not documented are added on the fly
+
+xlsx/CSV files are exported on demand for copying into Google Sheets.
+
+Usage:
+    python mo_db_store.py schema                       # Print generated DDL
+    python mo_db_store.py import TABLE FILE [--sheet NAME]
+    python mo_db_store.py export TABLE FILE            # .xlsx or .csv
+    python mo_db_store.py stats
+"""
+
+import argparse
+import importlib.util
+import re
+import sqlite3
+from pathlib import Path
+
+import pandas as pd
+
+REPO_DIR = Path(__file__).parent.parent
+DATA_SCHEMA_PATH = REPO_DIR / "docs" / "DATA_SCHEMA.md"
+ACTIONS_SCHEMA_PATH = Path(__file__).parent / "import-actions" / "create_actions_db.py"
+
+DATABASE_DIR = Path(r"C:\Users\cjtucke3\Documents\Personal\MO-development\nsite-mo-viewer\database-files")
+DB_FILE = DATABASE_DIR / "mo_db.sqlite"
+
+# Store tables: where each schema comes from and its primary key.
+# 'section' is the DATA_SCHEMA.md heading (### N. SECTION ...), 'subsection'
+# narrows to a #### heading for multi-tab sheets. 'extra_columns' lists
+# columns the import scripts write that the doc does not (yet) describe.
+STORE_TABLES = {
+    'solutions': {
+        'sheet': 'MO-DB_Solutions',
+        'section': 'SOLUTIONS',
+        'primary_key': 'solution_id',
+    },
+    'updates': {
+        'sheet': 'MO-DB_Updates',
+        'section': 'UPDATES',
+        'primary_key': 'update_id',
+        'extra_columns': ['source_category', 'source_tab', 'created_by'],
+        'indexes': [('solution_id', 'meeting_date'), ('meeting_date',)],
+    },
+    'milestones': {
+        'sheet': 'MO-DB_Milestones',
+        'section': 'MILESTONES',
+        'primary_key': 'milestone_id',
+        'extra_columns': ['solution_name', 'cycle', 'category', 'phase', 'source'],
+        'indexes': [('solution_id', 'target_date')],
+    },
+    'stories': {
+        'sheet': 'MO-DB_Stories',
+        'section': 'STORIES',
+        'primary_key': 'story_id',
+    },
+    'contacts': {
+        'sheet': 'MO-DB_Contacts (People)',
+        'section': 'CONTACTS',
+        'subsection': 'People Tab',
+        'index_label': 'People',
+        'primary_key': 'contact_id',
+    },
+    'contact_roles': {
+        'sheet': 'MO-DB_Contacts (Roles)',
+        'section': 'CONTACTS',
+        'subsection': 'Roles Tab',
+        'index_label': 'Roles',
+        'primary_key': 'role_id',
+        'indexes': [('solution_id', 'contact_id')],
+    },
+    'actions': {
+        'sheet': 'MO-DB_Actions',
+        'primary_key': 'action_id',
+        'indexes': [('solution',), ('status',), ('source_date',)],
+    },
+    'comms_assets': {
+        'sheet': 'MO-DB_CommsAssets',
+        'section': 'COMMS ASSETS',
+        'primary_key': 'asset_id',
+        'indexes': [('asset_type',)],
+    },
+}
+
+# Columns matched case-insensitively in joins and filters; declaring the
+# collation on the column lets those lookups use its indexes
+NOCASE_COLUMNS = ('solution_id',)
+
+# DATA_SCHEMA.md types -> SQLite column affinity
+SQL_TYPES = {
+    'INTEGER': 'INTEGER',
+    'NUMBER': 'REAL',
+    'FLOAT': 'REAL',
+}
+
+SECTION_RE = re.compile(r'^###\s+\d+\.\s+(.+?)\s*(?:\(|$)')
+SUBSECTION_RE = re.compile(r'^####\s+(.+?)\s*$')
+COLUMN_ROW_RE = re.compile(r'^\|\s*`([a-z0-9_]+)`\s*\|\s*([A-Z]+)\s*\|')
+BACKTICK_RE = re.compile(r'`([a-z0-9_]+)`')
+
+
+# =============================================================================
+# SCHEMA GENERATION
+# =============================================================================
+
+def _section_lines(lines, section, subsection=None):
+    """Lines of one ### section (optionally one #### subsection of it)"""
+    in_section = in_subsection = False
+    result = []
+    for line in lines:
+        match = SECTION_RE.match(line)
+        if match:
+            in_section = match.group(1).strip().upper() == section
+            in_subsection = False
+            continue
+        if not in_section:
+            continue
+        sub = SUBSECTION_RE.match(line)
+        if sub:
+            in_subsection = sub.group(1).strip() == subsection
+        if subsection is None or in_subsection or line.startswith('**Indexes'):
+            result.append(line)
+        elif line.startswith('- ') and 'Secondary' in line:
+            result.append(line)
+    return result
+
+
+def _secondary_indexes(lines, label=None):
+    """Single-column secondary indexes from the '**Indexes:**' list"""
+    for line in lines:
+        if 'Secondary' not in line or not line.startswith('- '):
+            continue
+        if label and not line.startswith(f'- {label}:'):
+            continue
+        # Composite entries ("a + b") are not used by the store tables
+        names = [n for part in line.split('Secondary', 1)[1].split(',')
+                 if '+' not in part for n in BACKTICK_RE.findall(part)]
+        return [(n,) for n in names]
+    return []
+
+
+def load_actions_columns(path=ACTIONS_SCHEMA_PATH):
+    """SCHEMA_COLUMNS from create_actions_db.py (its folder is not a package)"""
+    spec = importlib.util.spec_from_file_location('create_actions_db', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return list(module.SCHEMA_COLUMNS)
+
+
+def load_schema(schema_path=DATA_SCHEMA_PATH, actions_path=ACTIONS_SCHEMA_PATH):
+    """
+    Build {table: {'columns': {name: sql_type}, 'primary_key', 'indexes'}}
+    from DATA_SCHEMA.md and the Actions schema.
+    """
+    lines = Path(schema_path).read_text(encoding='utf-8').splitlines()
+    schema = {}
+
+    for table, config in STORE_TABLES.items():
+        columns = {}
+        indexes = []
+
+        if 'section' in config:
+            section = _section_lines(lines, config['section'], config.get('subsection'))
+            for line in section:
+                match = COLUMN_ROW_RE.match(line)
+                if match:
+                    name, doc_type = match.groups()
+                    columns.setdefault(name, SQL_TYPES.get(doc_type, 'TEXT'))
+            indexes = _secondary_indexes(section, config.get('index_label'))
+        else:
+            for name in load_actions_columns(actions_path):
+                columns[name] = 'TEXT'
+
+        for name in config.get('extra_columns', []):
+            columns.setdefault(name, 'TEXT')
+
+        primary_key = config['primary_key']
+        if primary_key not in columns:
+            columns = {primary_key: 'TEXT', **columns}
+
+        indexes = [ix for ix in indexes + config.get('indexes', [])
+                   if all(c in columns for c in ix) and ix != (primary_key,)]
+
+        schema[table] = {
+            'columns': columns,
+            'primary_key': primary_key,
+            'indexes': list(dict.fromkeys(indexes)),
+        }
+
+    return schema
+
+
+def schema_ddl(schema):
+    """CREATE TABLE / CREATE INDEX statements for a generated schema"""
+    statements = []
+    for table, spec in schema.items():
+        cols = ',\n    '.join(
+            f'"{name}" {sql_type}'
+            + (' COLLATE NOCASE' if name in NOCASE_COLUMNS else '')
+            + (' PRIMARY KEY' if name == spec['primary_key'] else '')
+            for name, sql_type in spec['columns'].items()
+        )
+        statements.append(f'CREATE TABLE IF NOT EXISTS "{table}" (\n    {cols}\n)')
+        for ix in spec['indexes']:
+            name = f'idx_{table}_' + '_'.join(ix)
+            cols = ', '.join(f'"{c}"' for c in ix)
+            statements.append(f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" ({cols})')
+    return statements
+
+
+# =============================================================================
+# STORE API
+# =============================================================================
+
+def connect(db_path=DB_FILE, schema=None):
+    """Open (creating if needed) the store and make sure all tables exist"""
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.execute('PRAGMA journal_mode=WAL')
+    for statement in schema_ddl(schema or load_schema()):
+        conn.execute(statement)
+    conn.commit()
+    return conn
+
+
+def table_columns(conn, table):
+    return [row[1] for row in conn.execute(f'PRAGMA table_info("{table}")')]
+
+
+def _primary_key(conn, table):
+    keys = [row[1] for row in conn.execute(f'PRAGMA table_info("{table}")') if row[5]]
+    if len(keys) != 1:
+        raise ValueError(f"Table '{table}' has no single-column primary key")
+    return keys[0]
+
+
+def _sql_values(df):
+    """DataFrame -> list of tuples with None for missing and ISO dates"""
+    out = pd.DataFrame(index=df.index)
+    for col in df.columns:
+        values = df[col]
+        if pd.api.types.is_datetime64_any_dtype(values):
+            has_time = (values.dropna().dt.normalize() != values.dropna()).any()
+            values = values.dt.strftime('%Y-%m-%dT%H:%M:%S' if has_time else '%Y-%m-%d')
+        out[col] = values.astype(object).where(values.notna(), None)
+    return list(out.itertuples(index=False, name=None))
+
+
+def upsert(conn, table, df):
+    """
+    Insert or update rows by primary key; returns (inserted, updated).
+
+    Only the columns present in df are written, so a partial frame updates
+    those fields and leaves the rest of each row alone. Rows without a key
+    are skipped. Columns the store does not know yet are added.
+    """
+    key = _primary_key(conn, table)
+    if key not in df.columns:
+        raise ValueError(f"Cannot upsert into '{table}': column '{key}' missing")
+
+    df = df.loc[:, ~df.columns.duplicated()].copy()
+    df[key] = df[key].fillna('').astype(str).str.strip()
+    df = df[df[key].ne('')].drop_duplicates(key, keep='last')
+    if df.empty:
+        return 0, 0
+
+    known = table_columns(conn, table)
+    for col in df.columns:
+        if col not in known:
+            print(f"  Note: adding undocumented column '{col}' to {table}")
+            conn.execute(f'ALTER TABLE "{table}" ADD COLUMN "{col}" TEXT')
+
+    cols = list(df.columns)
+    col_sql = ', '.join(f'"{c}"' for c in cols)
+    placeholders = ', '.join('?' for _ in cols)
+    updates = ', '.join(f'"{c}" = excluded."{c}"' for c in cols if c != key)
+    conflict = f'DO UPDATE SET {updates}' if updates else 'DO NOTHING'
+
+    before = conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+    conn.executemany(
+        f'INSERT INTO "{table}" ({col_sql}) VALUES ({placeholders}) ON CONFLICT("{key}") {conflict}',
+        _sql_values(df[cols]),
+    )
+    conn.commit()
+    after = conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+
+    inserted = after - before
+    return inserted, len(df) - inserted
+
+
+def delete_rows(conn, table, keys):
+    """Delete rows by primary key; returns number deleted"""
+    key = _primary_key(conn, table)
+    keys = list(keys)
+    deleted = 0
+    for start in range(0, len(keys), 500):
+        chunk = keys[start:start + 500]
+        cursor = conn.execute(
+            f'DELETE FROM "{table}" WHERE "{key}" IN ({", ".join("?" for _ in chunk)})', chunk
+        )
+        deleted += cursor.rowcount
+    conn.commit()
+    return deleted
+
+
+def store_output(table, df, db_path=DB_FILE, deleted=(), replace=False):
+    """
+    Upsert an import script's output into the store (their --store option)
+    and print the counts. deleted: primary keys to remove; replace: df is
+    the whole table, so stored rows whose key it lacks are removed too.
+    """
+    conn = connect(db_path)
+    try:
+        inserted, updated = upsert(conn, table, df)
+        deleted = set(map(str, deleted))
+        if replace:
+            key = _primary_key(conn, table)
+            current = set(df[key].fillna('').astype(str).str.strip())
+            deleted |= {k for (k,) in conn.execute(f'SELECT "{key}" FROM "{table}"') if k not in current}
+        removed = delete_rows(conn, table, sorted(deleted)) if deleted else 0
+    finally:
+        conn.close()
+    print(f"  Store: {table}: {inserted} inserted, {updated} updated, {removed} deleted ({db_path})")
+
+
+def read_table(conn, table, where=None, params=()):
+    """Load a store table (optionally filtered) as a DataFrame"""
+    sql = f'SELECT * FROM "{table}"' + (f' WHERE {where}' if where else '')
+    return pd.read_sql_query(sql, conn, params=params)
+
+
+def query(conn, sql, params=()):
+    """Run any SELECT against the store and return a DataFrame"""
+    return pd.read_sql_query(sql, conn, params=params)
+
+
+def export_table(conn, table, path, sheet_name=None):
+    """Write a store table to .xlsx or .csv for copying into MO-DB sheets"""
+    path = Path(path)
+    df = read_table(conn, table)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix.lower() == '.csv':
+        df.to_csv(path, index=False)
+    else:
+        df.to_excel(path, index=False, sheet_name=sheet_name or table.title().replace('_', ''))
+    return len(df)
+
+
+# Common joins, served by the store's indexes
+
+def updates_with_solutions(conn, solution_id=None, start=None, end=None):
+    """Updates joined to their solution's name and lifecycle phase"""
+    sql = '''
+        SELECT u.*, s.core_official_name, s.admin_lifecycle_phase
+        FROM updates u
+        LEFT JOIN solutions s ON s.solution_id = u.solution_id COLLATE NOCASE
+        WHERE 1 = 1
+    '''
+    params = []
+    if solution_id:
+        sql += ' AND u.solution_id = ? COLLATE NOCASE'
+        params.append(solution_id)
+    if start:
+        sql += ' AND u.meeting_date >= ?'
+        params.append(start)
+    if end:
+        sql += ' AND u.meeting_date <= ?'
+        params.append(end)
+    return query(conn, sql + ' ORDER BY u.meeting_date DESC', params)
+
+
+def contacts_for_solution(conn, solution_id):
+    """People linked to a solution through the Roles table"""
+    return query(conn, '''
+        SELECT c.*, r.role, r.survey_year
+        FROM contact_roles r
+        JOIN contacts c ON c.contact_id = r.contact_id
+        WHERE r.solution_id = ? COLLATE NOCASE
+        ORDER BY c.last_name, c.first_name
+    ''', [solution_id])
+
+
+def load_file(path, sheet_name=None):
+    """Read an xlsx sheet (default: first) or CSV as strings"""
+    path = Path(path)
+    if path.suffix.lower() == '.csv':
+        return pd.read_csv(path, dtype=str)
+    return pd.read_excel(path, sheet_name=sheet_name or 0, dtype=str)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Canonical local store for MO-DB tables')
+    parser.add_argument('--db', type=Path, default=DB_FILE, help='SQLite database path')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    sub.add_parser('schema', help='Print the generated schema DDL')
+    sub.add_parser('stats', help='Row counts per table')
+
+    p_import = sub.add_parser('import', help='Upsert an xlsx/CSV file into a table')
+    p_import.add_argument('table', choices=list(STORE_TABLES))
+    p_import.add_argument('file', type=Path)
+    p_import.add_argument('--sheet', help='Sheet name (default: first sheet)')
+
+    p_export = sub.add_parser('export', help='Export a table to xlsx/CSV')
+    p_export.add_argument('table', choices=list(STORE_TABLES))
+    p_export.add_argument('file', type=Path)
+
+    args = parser.parse_args()
+
+    if args.command == 'schema':
+        for statement in schema_ddl(load_schema()):
+            print(statement + ';\n')
+        return
+
+    conn = connect(args.db)
+
+    if args.command == 'import':
+        df = load_file(args.file, args.sheet)
+        inserted, updated = upsert(conn, args.table, df)
+        print(f"{args.table}: {inserted} inserted, {updated} updated from {args.file.name}")
+    elif args.command == 'export':
+        count = export_table(conn, args.table, args.file)
+        print(f"{args.table}: {count} rows written to {args.file}")
+    else:
+        for table, config in STORE_TABLES.items():
+            count = conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+            print(f"  {table:<15} {count:>7}  ({config['sheet']})")
+
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
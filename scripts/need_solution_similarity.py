@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Rank Candidate Solutions for Stakeholder Needs (TF-IDF)
+=======================================================
+Links free-text need records (extract_needs_data.py) to solutions by the
+text of their Earthdata descriptions (purpose_mission, societal_impact from
+extract_earthdata_content.py), instead of keyword loops.
+
+1. Both corpora are tokenized column-wise and counted as (document, term)
+   pairs; idf is computed over needs and solutions together.
+2. Documents get sublinear TF-IDF weights, L2-normalized over all of their
+   terms, so the dot product of two documents is their cosine similarity.
+3. Only terms that occur in some solution can score, so needs are kept as
+   sparse (row, term, weight) triples over the solution vocabulary, and the
+   small solution matrix stays dense.
+4. Needs are scored in chunks (chunk x vocabulary densified, times the
+   solution matrix), keeping the top-k solutions of each chunk, so memory
+   stays bounded however many needs there are.
+
+The candidate table lists each need's top-k solutions with their cosine
+score, the terms that contributed most, and the rule-based score from
+alignment_matrix.py when its artifact exists, so analysts can review both
+side by side.
+
+Usage:
+    python need_solution_similarity.py
+    python need_solution_similarity.py --top-k 10 --min-score 0.05
+    python need_solution_similarity.py --needs mo_db_needs.csv --output candidates.csv
+"""
+
+import argparse
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from alignment_matrix import NEEDS_CSV, NO_DATA, OUTPUT_STEM as ALIGNMENT_STEM, SOLUTIONS_CSV, column_text
+
+OUTPUT_CSV = SOLUTIONS_CSV.parent / "need-solution-candidates.csv"
+
+NEED_TEXT_COLUMNS = ['strategic_objective', 'application_description', 'feature_to_observe', 'impact_if_unmet']
+SOLUTION_TEXT_COLUMNS = ['solution_name', 'purpose_mission', 'societal_impact', 'thematic_areas']
+
+TOKEN_RE = re.compile(r'[a-z][a-z0-9]+(?:-[a-z0-9]+)*')
+MIN_TOKEN_LENGTH = 3
+STOPWORDS = frozenset('''
+    about above after again against all also among and any are because been before being below between both
+    but can could did does doing during each few for from further had has have having here how into its
+    itself just more most not now off once only other our out over own same should some such than that the
+    their them then there these they this those through too under until very was were what when where which
+    while who whom why will with within would you your nasa data use used using need needs provide provides
+    information may well new based help able
+'''.split())
+
+DEFAULT_TOP_K = 5
+DEFAULT_CHUNK_SIZE = 2000
+DEFAULT_MIN_SCORE = 0.02
+SHARED_TERMS = 5
+
+
+# =============================================================================
+# TF-IDF
+# =============================================================================
+
+def document_text(df, columns):
+    text = pd.Series('', index=df.index)
+    for column in columns:
+        text = text + ' ' + column_text(df, column)
+    return text.reset_index(drop=True)
+
+
+def term_counts(text):
+    """(doc, term, count) rows for a Series of lowercased documents"""
+    tokens = text.str.findall(TOKEN_RE).explode().dropna()
+    tokens = tokens[(tokens.str.len() >= MIN_TOKEN_LENGTH) & ~tokens.isin(STOPWORDS)]
+    counts = tokens.groupby([tokens.index, tokens.values]).size()
+    counts.index.names = ['doc', 'term']
+    return counts.rename('count').reset_index()
+
+
+def tfidf(counts, idf):
+    """Add L2-normalized sublinear TF-IDF weights to (doc, term, count) rows"""
+    weight = (1 + np.log(counts['count'].to_numpy(dtype=float))) * counts['term'].map(idf).to_numpy()
+    norms = pd.Series(weight ** 2).groupby(counts['doc'].to_numpy()).sum() ** 0.5
+    return counts.assign(weight=weight / counts['doc'].map(norms).to_numpy())
+
+
+def build_tfidf(need_text, solution_text):
+    """(need weights, solution weights, vocabulary) with idf over both corpora"""
+    need_counts = term_counts(need_text)
+    solution_counts = term_counts(solution_text)
+
+    documents = len(need_text) + len(solution_text)
+    doc_freq = pd.concat([need_counts['term'], solution_counts['term']]).value_counts()
+    idf = np.log((1 + documents) / (1 + doc_freq)) + 1
+
+    need_weights = tfidf(need_counts, idf)
+    solution_weights = tfidf(solution_counts, idf)
+    vocabulary = pd.Index(solution_weights['term'].unique())
+    return need_weights, solution_weights, vocabulary
+
+
+# =============================================================================
+# TOP-K SEARCH
+# =============================================================================
+
+def top_k_candidates(need_weights, solution_weights, vocabulary, n_needs, n_solutions,
+                     top_k=DEFAULT_TOP_K, chunk_size=DEFAULT_CHUNK_SIZE, min_score=DEFAULT_MIN_SCORE):
+    """(need_row, solution_row, rank, score) frame of each need's best solutions"""
+    solution_matrix = np.zeros((len(vocabulary), n_solutions), dtype=np.float32)
+    solution_matrix[vocabulary.get_indexer(solution_weights['term']), solution_weights['doc']] = \
+        solution_weights['weight']
+
+    # Needs as sparse triples over the solution vocabulary, sorted by row
+    term_codes = vocabulary.get_indexer(need_weights['term'])
+    keep = term_codes >= 0
+    rows = need_weights['doc'].to_numpy()[keep]
+    terms = term_codes[keep]
+    weights = need_weights['weight'].to_numpy(dtype=np.float32)[keep]
+    order = np.argsort(rows, kind='stable')
+    rows, terms, weights = rows[order], terms[order], weights[order]
+
+    k = min(top_k, n_solutions)
+    results = []
+    for start in range(0, n_needs, chunk_size):
+        stop = min(start + chunk_size, n_needs)
+        lo, hi = np.searchsorted(rows, [start, stop])
+        chunk = np.zeros((stop - start, len(vocabulary)), dtype=np.float32)
+        chunk[rows[lo:hi] - start, terms[lo:hi]] = weights[lo:hi]
+        scores = chunk @ solution_matrix
+
+        best = np.argpartition(-scores, k - 1, axis=1)[:, :k] if k < n_solutions else \
+            np.tile(np.arange(n_solutions), (stop - start, 1))
+        best_scores = np.take_along_axis(scores, best, axis=1)
+        order = np.argsort(-best_scores, axis=1, kind='stable')
+        best = np.take_along_axis(best, order, axis=1)
+        best_scores = np.take_along_axis(best_scores, order, axis=1)
+
+        need_rows = np.repeat(np.arange(start, stop), k)
+        ranks = np.tile(np.arange(1, k + 1), stop - start)
+        frame = pd.DataFrame({'need_row': need_rows, 'solution_row': best.ravel(),
+                              'rank': ranks, 'score': best_scores.ravel()})
+        results.append(frame[frame['score'] >= min_score])
+
+    if not results:
+        # Typed empty columns, so callers can still index arrays with them
+        return pd.DataFrame({'need_row': np.empty(0, dtype=np.int64), 'solution_row': np.empty(0, dtype=np.int64),
+                             'rank': np.empty(0, dtype=np.int64), 'score': np.empty(0, dtype=np.float64)})
+    return pd.concat(results, ignore_index=True)
+
+
+def shared_terms(candidates, need_weights, solution_weights, limit=SHARED_TERMS):
+    """Top contributing terms (need weight x solution weight) per candidate pair"""
+    pairs = candidates[['need_row', 'solution_row']]
+    need_terms = need_weights.rename(columns={'doc': 'need_row', 'weight': 'need_weight'})
+    solution_terms = solution_weights.rename(columns={'doc': 'solution_row', 'weight': 'solution_weight'})
+    joined = (pairs.merge(need_terms[['need_row', 'term', 'need_weight']], on='need_row')
+                   .merge(solution_terms[['solution_row', 'term', 'solution_weight']],
+                          on=['solution_row', 'term']))
+    joined['contribution'] = joined['need_weight'] * joined['solution_weight']
+    joined = joined.sort_values(['need_row', 'solution_row', 'contribution'], ascending=[True, True, False])
+    top = joined.groupby(['need_row', 'solution_row'], sort=False).head(limit)
+    terms = top.groupby(['need_row', 'solution_row'], sort=False)['term'].agg(', '.join)
+    return pd.MultiIndex.from_frame(pairs).map(terms.to_dict()).fillna('')
+
+
+def rule_scores(path, need_ids, solution_keys, candidates):
+    """Rule-based scores from the alignment_matrix.py artifact ('' when not comparable)"""
+    artifact = np.load(path)
+    need_pos = pd.Index(artifact['need_ids']).get_indexer(need_ids[candidates['need_row']])
+    solution_pos = pd.Index(artifact['solution_keys']).get_indexer(solution_keys[candidates['solution_row']])
+    found = (need_pos >= 0) & (solution_pos >= 0)
+    scores = np.full(len(candidates), NO_DATA, dtype=np.uint8)
+    scores[found] = artifact['scores'][need_pos[found], solution_pos[found]]
+    return pd.Series(scores).astype(object).where(scores != NO_DATA, '').to_numpy()
+
+
+def column_values(df, column, default=''):
+    """Column as a string array ('' for missing), default when the column is absent"""
+    if column not in df.columns:
+        return np.array(pd.Series(default, index=df.index, dtype=object).astype(str))
+    return df[column].fillna('').astype(str).str.strip().to_numpy()
+
+
+def candidate_table(needs, solutions, top_k=DEFAULT_TOP_K, chunk_size=DEFAULT_CHUNK_SIZE,
+                    min_score=DEFAULT_MIN_SCORE, alignment_path=None):
+    """Ranked need -> solution candidates for review"""
+    needs = needs.reset_index(drop=True)
+    solutions = solutions.reset_index(drop=True)
+    need_weights, solution_weights, vocabulary = build_tfidf(
+        document_text(needs, NEED_TEXT_COLUMNS), document_text(solutions, SOLUTION_TEXT_COLUMNS))
+    print(f"Vocabulary: {len(vocabulary):,} solution terms, {need_weights['term'].nunique():,} need terms")
+
+    candidates = top_k_candidates(need_weights, solution_weights, vocabulary, len(needs), len(solutions),
+                                  top_k, chunk_size, min_score)
+
+    need_ids = column_values(needs, 'need_id', [f'row-{i}' for i in range(len(needs))])
+    solution_keys = column_values(solutions, 'solution_key', [f'row-{i}' for i in range(len(solutions))])
+    need_rows = candidates['need_row'].to_numpy()
+    solution_rows = candidates['solution_row'].to_numpy()
+    table = pd.DataFrame({
+        'need_id': need_ids[need_rows],
+        'survey_solution': column_values(needs, 'solution')[need_rows],
+        'rank': candidates['rank'].to_numpy(),
+        'solution_key': solution_keys[solution_rows],
+        'solution_name': column_values(solutions, 'solution_name')[solution_rows],
+        'score': candidates['score'].round(4).to_numpy(),
+        'shared_terms': shared_terms(candidates, need_weights, solution_weights),
+    })
+    if alignment_path is not None and Path(alignment_path).exists():
+        table['rule_score'] = rule_scores(alignment_path, need_ids, solution_keys, candidates)
+    elif alignment_path is not None:
+        print(f"Warning: {Path(alignment_path).name} not found, rule_score column skipped")
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rank candidate solutions for each stakeholder need by TF-IDF')
+    parser.add_argument('--needs', type=Path, default=NEEDS_CSV, help='MO-DB_Needs CSV (extract_needs_data.py)')
+    parser.add_argument('--solutions', type=Path, default=SOLUTIONS_CSV,
+                        help='Earthdata content CSV (extract_earthdata_content.py)')
+    parser.add_argument('--alignment', type=Path, default=ALIGNMENT_STEM.with_suffix('.npz'),
+                        help='alignment_matrix.py artifact for the rule_score column')
+    parser.add_argument('--output', type=Path, default=OUTPUT_CSV, help='Candidate table CSV')
+    parser.add_argument('--top-k', type=int, default=DEFAULT_TOP_K, help='Candidates per need')
+    parser.add_argument('--min-score', type=float, default=DEFAULT_MIN_SCORE, help='Minimum cosine similarity')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='Needs scored per chunk')
+    args = parser.parse_args()
+
+    for path in (args.needs, args.solutions):
+        if not path.exists():
+            raise SystemExit(f"ERROR: Input file not found: {path}")
+
+    needs = pd.read_csv(args.needs, dtype=str)
+    solutions = pd.read_csv(args.solutions, dtype=str)
+    print(f"Needs: {len(needs):,}  Solutions: {len(solutions)}")
+
+    table = candidate_table(needs, solutions, args.top_k, args.chunk_size, args.min_score, args.alignment)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    table.to_csv(args.output, index=False)
+    print(f"{len(table):,} candidates for {table['need_id'].nunique():,} needs")
+    print(f"Wrote: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
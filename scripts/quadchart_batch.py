@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+Offline Quad Chart Batch Generator
+==================================
+Builds a quad chart for every solution in one run from the local MO-DB
+store (mo_db_store.py), instead of generateQuadChartData() in
+deploy/quadchart-data.gs re-filtering every table for each request.
+
+Four quadrants per solution, as in the web report:
+    updates    - updates from the last --days-back days
+    milestones - milestones (store table + solution gate dates) in the next
+                 --days-ahead days
+    actions    - open actions due by the end of the window (or undated)
+    decisions  - decision gates within 60 days with no memo
+
+Updates, milestones, actions and gates are each sorted once by (solution,
+date) into a DateIndex, so every solution's window is two binary searches.
+
+Outputs a pptx (title slide + one quad chart slide per solution, drawn with
+the deck_generator helpers and the implementation deck's theme) and a JSON
+payload with every item.
+
+Usage:
+    python quadchart_batch.py
+    python quadchart_batch.py --days-back 14 --days-ahead 60 --default-only
+    python quadchart_batch.py --as-of 2026-01-15 --json-only
+"""
+
+import argparse
+import io
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import mo_db_store
+
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+SCRIPTS_DIR = Path(__file__).parent
+OUTPUT_DIR = SCRIPTS_DIR.parent
+THEME_SPEC = SCRIPTS_DIR / 'deck_specs' / 'implementation.json'
+
+DEFAULT_DAYS_BACK = 7
+DEFAULT_DAYS_AHEAD = 30
+DECISION_DAYS = 60
+
+# (milestone label, solution date column, memo column)
+GATES = [
+    ('ATP DG', 'milestone_atp_date', 'milestone_atp_memo_url'),
+    ('F2I DG', 'milestone_f2i_date', 'milestone_f2i_memo_url'),
+    ('ORR', 'milestone_orr_date', 'milestone_orr_memo_url'),
+    ('Closeout', 'milestone_closeout_date', 'milestone_closeout_memo_url'),
+]
+DECISION_GATES = ('ATP DG', 'F2I DG', 'ORR')
+
+CLOSED_ACTION_STATUSES = {'done', 'closed', 'complete', 'completed', 'cancelled'}
+
+# Items drawn per quadrant on a slide (the JSON keeps all of them)
+SLIDE_ITEMS = 6
+SLIDE_TEXT_LENGTH = 110
+
+
+# =============================================================================
+# DATE INDEX
+# =============================================================================
+
+def to_dates(values):
+    """Store date strings -> normalized datetime64 (NaT where unparseable)"""
+    return pd.to_datetime(pd.Series(values, dtype=object), errors='coerce', format='ISO8601').dt.normalize()
+
+
+class DateIndex:
+    """
+    Rows of one table sorted by (solution key, date), with each key's rows
+    in one contiguous block, so a date window is two binary searches.
+    Rows without a key or a parseable date are kept aside in `undated`.
+    """
+
+    def __init__(self, df, key_column, date_column):
+        frame = df.assign(_key=df[key_column].fillna('').astype(str).str.strip().str.lower(),
+                          _date=to_dates(df[date_column]).to_numpy())
+        has_key = frame['_key'] != ''
+        dated = has_key & frame['_date'].notna()
+
+        self.frame = frame[dated].sort_values(['_key', '_date'], kind='stable').reset_index(drop=True)
+        self.dates = self.frame['_date'].to_numpy()
+        keys = self.frame['_key'].to_numpy()
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else []
+        ends = np.r_[starts[1:], len(keys)] if len(keys) else []
+        self.blocks = {keys[s]: (s, e) for s, e in zip(starts, ends)}
+
+        undated = frame[has_key & ~dated]
+        self.undated = {key: rows for key, rows in undated.groupby('_key', sort=False)}
+
+    def window(self, key, start=None, end=None):
+        """Rows for key with start <= date <= end (either bound optional), oldest first"""
+        lo, hi = self.blocks.get(str(key).strip().lower(), (0, 0))
+        dates = self.dates[lo:hi]
+        first = lo + (np.searchsorted(dates, np.datetime64(start), 'left') if start is not None else 0)
+        last = lo + (np.searchsorted(dates, np.datetime64(end), 'right') if end is not None else len(dates))
+        return self.frame.iloc[first:last]
+
+    def without_date(self, key):
+        return self.undated.get(str(key).strip().lower(), self.frame.iloc[0:0])
+
+
+# =============================================================================
+# SNAPSHOT
+# =============================================================================
+
+def load_snapshot(db_path):
+    """Solutions, updates, milestones and actions tables from the store"""
+    db_path = Path(db_path)
+    if not db_path.exists():
+        raise SystemExit(f"Store not found: {db_path} (build it with mo_db_store.py import)")
+    conn = mo_db_store.connect(db_path)
+    try:
+        return {table: mo_db_store.read_table(conn, table)
+                for table in ('solutions', 'updates', 'milestones', 'actions')}
+    finally:
+        conn.close()
+
+
+def text(value):
+    return '' if value is None or pd.isna(value) else str(value).strip()
+
+
+def shorten(value, length):
+    value = ' '.join(text(value).split())
+    return value if len(value) <= length else value[:length - 3].rstrip() + '...'
+
+
+def format_date_short(date):
+    """Mon D, as formatDateShort_() in quadchart-data.gs"""
+    return '' if pd.isna(date) else f"{date:%b} {date.day}"
+
+
+def gate_rows(solutions):
+    """Solution gate dates as long rows: solution_id, type, target_date, memo"""
+    frames = [
+        pd.DataFrame({
+            'solution_id': solutions['solution_id'],
+            'type': label,
+            'target_date': solutions.get(date_col),
+            'memo': solutions.get(memo_col),
+        })
+        for label, date_col, memo_col in GATES
+    ]
+    return pd.concat(frames, ignore_index=True)
+
+
+def action_solution_ids(actions, solutions):
+    """Action 'solution' text (an ID or official name) -> solution_id"""
+    lookup = {}
+    for column in ('core_official_name', 'solution_id'):
+        if column in solutions.columns:
+            keys = solutions[column].fillna('').astype(str).str.strip().str.lower()
+            lookup.update(zip(keys, solutions['solution_id']))
+    lookup.pop('', None)
+    return actions['solution'].fillna('').astype(str).str.strip().str.lower().map(lookup)
+
+
+class Snapshot:
+    """Store tables with their date indexes, built once per run"""
+
+    def __init__(self, tables):
+        self.solutions = tables['solutions'].dropna(subset=['solution_id']).reset_index(drop=True)
+
+        self.updates = DateIndex(tables['updates'], 'solution_id', 'meeting_date')
+
+        gates = gate_rows(self.solutions)
+        self.gates = DateIndex(gates, 'solution_id', 'target_date')
+        # Gates recorded in both places appear once
+        milestones = pd.concat([tables['milestones'][['solution_id', 'type', 'target_date']],
+                                gates[['solution_id', 'type', 'target_date']]], ignore_index=True)
+        milestones['target_date'] = to_dates(milestones['target_date']).to_numpy()
+        self.milestones = DateIndex(milestones.drop_duplicates(), 'solution_id', 'target_date')
+
+        actions = tables['actions']
+        status = actions['status'].fillna('').astype(str).str.strip().str.lower()
+        actions = actions[~status.isin(CLOSED_ACTION_STATUSES)].assign(
+            _solution_id=action_solution_ids(actions, self.solutions))
+        self.actions = DateIndex(actions, '_solution_id', 'due_date')
+
+
+# =============================================================================
+# QUADRANTS
+# =============================================================================
+
+def quadrant(title, subtitle, items, count=None):
+    return {'title': title, 'subtitle': subtitle, 'items': items,
+            'count': len(items) if count is None else count}
+
+
+def quadrant_updates(snapshot, solution_id, today, days_back):
+    rows = snapshot.updates.window(solution_id, today - pd.Timedelta(days=days_back), today)
+    items = [{
+        'date': format_date_short(row['_date']),
+        'summary': text(row.get('update_text')),
+        'source': text(row.get('source_document')),
+    } for _, row in rows.iloc[::-1].iterrows()]
+    return quadrant('Recent Updates', f'Last {days_back} days', items)
+
+
+def quadrant_milestones(snapshot, solution_id, today, days_ahead):
+    rows = snapshot.milestones.window(solution_id, today, today + pd.Timedelta(days=days_ahead))
+    items = []
+    for _, row in rows.iterrows():
+        days_until = int((row['_date'] - today).days)
+        items.append({
+            'milestone': text(row['type']),
+            'date': format_date_short(row['_date']),
+            'daysUntil': days_until,
+            'urgency': 'urgent' if days_until <= 7 else ('soon' if days_until <= 14 else 'upcoming'),
+        })
+    return quadrant('Upcoming Milestones', f'Next {days_ahead} days', items)
+
+
+def quadrant_actions(snapshot, solution_id, today, days_ahead):
+    due = snapshot.actions.window(solution_id, end=today + pd.Timedelta(days=days_ahead))
+    undated = snapshot.actions.without_date(solution_id)
+    items = [{
+        'action': text(row.get('task')),
+        'owner': text(row.get('assigned_to')),
+        'due': format_date_short(row['_date']),
+        'overdue': bool(row['_date'] < today),
+        'priority': text(row.get('priority')) or 'medium',
+        'status': text(row.get('status')),
+    } for _, row in due.iterrows()]
+    items += [{
+        'action': text(row.get('task')),
+        'owner': text(row.get('assigned_to')),
+        'due': '',
+        'overdue': False,
+        'priority': text(row.get('priority')) or 'medium',
+        'status': text(row.get('status')),
+    } for _, row in undated.iterrows()]
+    return quadrant('Open Action Items', 'From MO-DB_Actions', items)
+
+
+def quadrant_decisions(snapshot, solution_id, today):
+    rows = snapshot.gates.window(solution_id, today + pd.Timedelta(days=1),
+                                 today + pd.Timedelta(days=DECISION_DAYS))
+    items = []
+    for _, row in rows.iterrows():
+        if row['type'] not in DECISION_GATES or text(row['memo']):
+            continue
+        days_until = int((row['_date'] - today).days)
+        items.append({
+            'type': f"{row['type']} memo needed",
+            'urgency': 'high' if days_until <= 14 else ('medium' if days_until <= 30 else 'low'),
+            'daysUntil': days_until,
+        })
+    return quadrant('Key Decisions Needed', 'Pending approvals and memos', items)
+
+
+def build_quad_charts(snapshot, today, days_back, days_ahead, default_only=False):
+    """Quad chart payload for every solution"""
+    solutions = snapshot.solutions
+    if default_only and 'admin_default_in_dashboard' in solutions.columns:
+        solutions = solutions[solutions['admin_default_in_dashboard'].fillna('').astype(str).str.strip() == 'Y']
+
+    charts = []
+    for _, solution in solutions.iterrows():
+        solution_id = solution['solution_id']
+        charts.append({
+            'solution': solution_id,
+            'name': text(solution.get('core_official_name')) or solution_id,
+            'cycle': 'C' + (text(solution.get('core_cycle')) or '?'),
+            'phase': text(solution.get('admin_lifecycle_phase')),
+            'quadrants': {
+                'updates': quadrant_updates(snapshot, solution_id, today, days_back),
+                'milestones': quadrant_milestones(snapshot, solution_id, today, days_ahead),
+                'actions': quadrant_actions(snapshot, solution_id, today, days_ahead),
+                'decisions': quadrant_decisions(snapshot, solution_id, today),
+            },
+        })
+
+    totals = {name: sum(c['quadrants'][name]['count'] for c in charts)
+              for name in ('updates', 'milestones', 'actions', 'decisions')}
+    return {
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'reportPeriod': {
+            'from': (today - pd.Timedelta(days=days_back)).strftime('%Y-%m-%d'),
+            'to': (today + pd.Timedelta(days=days_ahead)).strftime('%Y-%m-%d'),
+        },
+        'solutions': charts,
+        'summary': {
+            'totalUpdates': totals['updates'],
+            'totalMilestones': totals['milestones'],
+            'totalActions': totals['actions'],
+            'totalDecisions': totals['decisions'],
+            'solutionsTracked': len(charts),
+        },
+    }
+
+
+# =============================================================================
+# SLIDES
+# =============================================================================
+
+def quadrant_lines(name, data):
+    """Slide bullet lines for one quadrant"""
+    items = data['items']
+    if name == 'updates':
+        lines = [f"{i['date']}: {i['summary']}" for i in items]
+    elif name == 'milestones':
+        lines = [f"{i['milestone']} - {i['date']} ({i['daysUntil']}d)" for i in items]
+    elif name == 'actions':
+        lines = [i['action'] + (f" ({i['owner']})" if i['owner'] else '') +
+                 (f" - due {i['due']}" + (' OVERDUE' if i['overdue'] else '') if i['due'] else '')
+                 for i in items]
+    else:
+        lines = [i['type'] for i in items]
+
+    lines = ['• ' + shorten(line, SLIDE_TEXT_LENGTH) for line in lines[:SLIDE_ITEMS]]
+    if len(items) > SLIDE_ITEMS:
+        lines.append(f"  ...and {len(items) - SLIDE_ITEMS} more")
+    return lines or ['None']
+
+
+QUADRANT_LAYOUT = [
+    ('updates', [0.4, 1.3, 6.1, 2.9], 'green'),
+    ('milestones', [6.8, 1.3, 6.1, 2.9], 'blue'),
+    ('actions', [0.4, 4.4, 6.1, 2.9], 'orange'),
+    ('decisions', [6.8, 4.4, 6.1, 2.9], 'primary'),
+]
+
+
+def render_pptx(payload, output_path):
+    """Title slide plus one quad chart slide per solution"""
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    import deck_generator as dg
+
+    spec = dg.load_spec(THEME_SPEC)
+    theme = dg.Theme(spec.get('colors'), spec.get('styles'))
+    slide_size = spec.get('slide_size', dg.DEFAULT_SLIDE_SIZE)
+
+    prs = Presentation(io.BytesIO(dg.template_bytes()))
+    prs.slide_width, prs.slide_height = Inches(slide_size[0]), Inches(slide_size[1])
+    layout = prs.slide_layouts[dg.BLANK_LAYOUT]
+
+    slide = prs.slides.add_slide(layout)
+    dg.add_background(slide, theme, 'primary', slide_size)
+    dg.add_text(slide, theme, [0.5, 2.5, 12.333, 1.5], ['Solution Quad Charts'], 'title')
+    period = payload['reportPeriod']
+    dg.add_text(slide, theme, [0.5, 4.5, 12.333, 1], [f"{period['from']} to {period['to']}"], 'date')
+
+    for chart in payload['solutions']:
+        slide = prs.slides.add_slide(layout)
+        subtitle = ' | '.join(part for part in (chart['cycle'], chart['phase']) if part)
+        dg.add_header_bar(slide, theme, chart['name'], subtitle, slide_size=slide_size)
+        for name, box, color in QUADRANT_LAYOUT:
+            data = chart['quadrants'][name]
+            left, top, width, height = box
+            dg.add_rounded_box(slide, theme, box, f"{data['title']} ({data['count']})", color)
+            dg.add_text(slide, theme, [left + 0.2, top + 0.65, width - 0.4, height - 0.8],
+                        quadrant_lines(name, data), 'small_item', wrap=True)
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    prs.save(output_path)
+    return output_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate quad charts for every solution from the local store')
+    parser.add_argument('--db', type=Path, default=mo_db_store.DB_FILE, help='SQLite store path')
+    parser.add_argument('--days-back', type=int, default=DEFAULT_DAYS_BACK, help='Days of updates to include')
+    parser.add_argument('--days-ahead', type=int, default=DEFAULT_DAYS_AHEAD, help='Days of milestones to include')
+    parser.add_argument('--as-of', help='Report date YYYY-MM-DD (default: today)')
+    parser.add_argument('--default-only', action='store_true', help='Only solutions shown by default in the dashboard')
+    parser.add_argument('--output', type=Path, help='pptx path (default: MO-Quad-Charts-<date>.pptx in the repo root)')
+    parser.add_argument('--json', type=Path, help='JSON path (default: next to the pptx)')
+    parser.add_argument('--json-only', action='store_true', help='Skip the pptx')
+    args = parser.parse_args()
+
+    today = pd.Timestamp(args.as_of or datetime.now().date()).normalize()
+    output = args.output or OUTPUT_DIR / f"MO-Quad-Charts-{today:%Y-%m-%d}.pptx"
+    json_path = args.json or output.with_suffix('.json')
+
+    print(f"Reading store: {args.db}")
+    snapshot = Snapshot(load_snapshot(args.db))
+    print(f"  {len(snapshot.solutions)} solutions")
+
+    payload = build_quad_charts(snapshot, today, args.days_back, args.days_ahead, args.default_only)
+    summary = payload['summary']
+    print(f"Built {summary['solutionsTracked']} quad charts: {summary['totalUpdates']} updates, "
+          f"{summary['totalMilestones']} milestones, {summary['totalActions']} actions, "
+          f"{summary['totalDecisions']} decisions")
+
+    json_path.parent.mkdir(parents=True, exist_ok=True)
+    json_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding='utf-8')
+    print(f"JSON saved to: {json_path}")
+
+    if not args.json_only:
+        print(f"Presentation saved to: {render_pptx(payload, output)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+Hash-Based Row Diff Engine
+==========================
+Compares two versions of a table (Quick Look vs MO-DB_Solutions, or two
+Quick Look revisions) without walking every field of every row:
+
+1. Normalize the compared columns to stripped text ('' for missing)
+2. Align both tables on a resolved key column
+3. Hash each row's normalized field tuple (pandas hash_pandas_object);
+   rows with equal hashes are unchanged and skipped
+4. Field-level diffs are computed only for rows whose hashes differ
+
+The result is a Changeset: added keys, removed keys and changed fields
+(each classed as 'filled', 'changed' or 'cleared'), written as JSON or xlsx.
+
+Usage:
+    from row_diff import diff_tables
+    changeset = diff_tables(db_df, ql_df, key='name', columns=[...])
+    changeset.write('changes.json')    # or .xlsx
+
+    python row_diff.py OLD.xlsx NEW.xlsx --key Solution [--output changes.xlsx]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from excel_export import write_xlsx
+from generate_solutions_import import find_header_row, use_header_row
+
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+CHANGE_COLUMNS = ['key', 'field', 'kind', 'old_value', 'new_value']
+
+
+def normalize_frame(df, columns):
+    """Stripped text of the given columns ('' for missing values and missing columns)"""
+    values = df.reindex(columns=columns).astype(object)
+    values = values.where(values.notna(), '').astype(str).apply(lambda col: col.str.strip())
+    return values.where(values != 'nan', '')
+
+
+def row_hashes(normalized):
+    """uint64 hash of each row's field tuple"""
+    if normalized.empty:
+        return pd.Series(0, index=normalized.index, dtype='uint64')
+    return pd.util.hash_pandas_object(normalized, index=False)
+
+
+class Changeset:
+    """Differences between an old and a new table aligned on one key"""
+
+    def __init__(self, key, columns, added, removed, changes, unchanged, duplicates):
+        self.key = key
+        self.columns = columns
+        self.added = added          # keys only in the new table
+        self.removed = removed      # keys only in the old table
+        self.changes = changes      # DataFrame of CHANGE_COLUMNS
+        self.unchanged = unchanged  # number of keys with equal row hashes
+        self.duplicates = duplicates
+
+    def __bool__(self):
+        return bool(self.added or self.removed or len(self.changes))
+
+    def changed_keys(self):
+        return list(dict.fromkeys(self.changes['key']))
+
+    def of_kind(self, kind):
+        return self.changes[self.changes['kind'] == kind]
+
+    def summary(self):
+        return {
+            'added': len(self.added),
+            'removed': len(self.removed),
+            'changed_rows': len(self.changed_keys()),
+            'changed_fields': len(self.changes),
+            'unchanged': self.unchanged,
+            'duplicate_keys': len(self.duplicates),
+        }
+
+    def to_dict(self):
+        changed = {}
+        for change in self.changes.to_dict('records'):
+            changed.setdefault(change['key'], {})[change['field']] = {
+                'kind': change['kind'], 'old': change['old_value'], 'new': change['new_value']}
+        return {
+            'key': self.key,
+            'columns': self.columns,
+            'summary': self.summary(),
+            'added': self.added,
+            'removed': self.removed,
+            'changed': changed,
+            'duplicate_keys': self.duplicates,
+        }
+
+    def sheets(self, prefix=''):
+        """{sheet name: DataFrame} for xlsx output"""
+        return {
+            f'{prefix}Changed': self.changes,
+            f'{prefix}Added': pd.DataFrame({self.key: self.added}),
+            f'{prefix}Removed': pd.DataFrame({self.key: self.removed}),
+        }
+
+    def write(self, path):
+        """Write as .json or .xlsx (by suffix)"""
+        path = Path(path)
+        if path.suffix.lower() == '.json':
+            path.write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2), encoding='utf-8')
+        else:
+            write_xlsx(path, self.sheets())
+
+
+def diff_tables(old, new, key, columns=None, skip_blank_new=False):
+    """
+    Changeset from old to new, rows aligned on the key column.
+
+    columns:        compared columns (default: columns both tables share,
+                    minus the key); a column missing on one side reads as ''
+    skip_blank_new: ignore fields that are blank in new (new is a partial
+                    source, e.g. Quick Look filling MO-DB)
+
+    Rows with a blank key are ignored; for repeated keys the first row wins
+    and the key is listed in duplicates.
+    """
+    if columns is None:
+        columns = [c for c in old.columns if c in set(new.columns) and c != key]
+    columns = list(columns)
+
+    sides = []
+    duplicates = set()
+    for df in (old, new):
+        keys = normalize_frame(df, [key])[key]
+        frame = normalize_frame(df, columns).set_axis(keys, axis=0)
+        frame = frame[frame.index != '']
+        repeated = frame.index.duplicated()
+        duplicates.update(frame.index[repeated])
+        sides.append(frame[~repeated])
+    old_frame, new_frame = sides
+
+    added = [k for k in new_frame.index if k not in old_frame.index]
+    removed = [k for k in old_frame.index if k not in new_frame.index]
+    # Keys in both, in new-table order
+    common = new_frame.index[new_frame.index.isin(old_frame.index)]
+
+    old_common = old_frame.loc[common]
+    new_common = new_frame.loc[common]
+    if skip_blank_new:
+        # Blank new fields count as unchanged, so they must not move the hash
+        old_common = old_common.where(new_common != '', '')
+    differs = row_hashes(old_common).to_numpy() != row_hashes(new_common).to_numpy()
+
+    old_changed = old_common[differs]
+    new_changed = new_common[differs]
+    field_differs = old_changed != new_changed
+    if skip_blank_new:
+        field_differs &= new_changed != ''
+    stacked = field_differs.stack()
+    pairs = stacked[stacked].index
+    changes = pd.DataFrame({
+        'key': pairs.get_level_values(0),
+        'field': pairs.get_level_values(1),
+        'old_value': [old_changed.at[k, f] for k, f in pairs],
+        'new_value': [new_changed.at[k, f] for k, f in pairs],
+    })
+    changes['kind'] = 'changed'
+    changes.loc[changes['old_value'] == '', 'kind'] = 'filled'
+    changes.loc[changes['new_value'] == '', 'kind'] = 'cleared'
+
+    return Changeset(key, columns, added, removed, changes[CHANGE_COLUMNS].reset_index(drop=True),
+                     int((~differs).sum()), sorted(duplicates))
+
+
+def read_keyed_sheets(path, key):
+    """{sheet: DataFrame} for the sheets with a key column (header row found by key name)"""
+    tables = {}
+    for name, df in pd.read_excel(path, sheet_name=None, header=None, dtype=object).items():
+        header_row = find_header_row(df, [key])
+        if header_row is None:
+            continue
+        table = use_header_row(df, header_row)
+        table.columns = [str(c).strip() for c in table.columns]
+        if key in table.columns:
+            tables[name] = table.loc[:, ~pd.Index(table.columns).duplicated()]
+    return tables
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Diff two workbook revisions sheet by sheet on a key column')
+    parser.add_argument('old', type=Path, help='Previous revision (xlsx)')
+    parser.add_argument('new', type=Path, help='New revision (xlsx)')
+    parser.add_argument('--key', required=True, help='Key column (its header row is located per sheet)')
+    parser.add_argument('--output', type=Path, help='Write the changesets (.json or .xlsx)')
+    args = parser.parse_args()
+
+    for path in (args.old, args.new):
+        if not path.exists():
+            raise SystemExit(f"ERROR: Input file not found: {path}")
+
+    old_sheets = read_keyed_sheets(args.old, args.key)
+    new_sheets = read_keyed_sheets(args.new, args.key)
+    changesets = {}
+    for name, new_table in new_sheets.items():
+        if name not in old_sheets:
+            print(f"  {name}: new sheet")
+            continue
+        changesets[name] = diff_tables(old_sheets[name], new_table, args.key)
+        summary = changesets[name].summary()
+        print(f"  {name}: {summary['changed_rows']} changed rows ({summary['changed_fields']} fields), "
+              f"{summary['added']} added, {summary['removed']} removed, {summary['unchanged']} unchanged")
+    for name in old_sheets:
+        if name not in new_sheets:
+            print(f"  {name}: sheet removed")
+
+    if args.output:
+        if args.output.suffix.lower() == '.json':
+            payload = {name: cs.to_dict() for name, cs in changesets.items()}
+            args.output.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding='utf-8')
+        else:
+            sheets = {}
+            for i, (name, cs) in enumerate(changesets.items()):
+                # xlsx sheet names max out at 31 characters
+                sheets.update(cs.sheets(prefix=f"{i + 1}-{name[:20]} "))
+            write_xlsx(args.output, sheets)
+        print(f"\nOutput: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+"""
+Local Full-Text Search Index over MO-DB History
+===============================================
+Loads the consolidated updates (final_updates_import.xlsx, all year tabs),
+stories, actions and milestones into a local SQLite database with:
+
+- FTS5 indexes (porter stemming) on the text columns of each table
+- B-tree indexes on (solution_id, date) for per-solution timelines
+- a `timeline` view that merges all four tables into one dated stream
+
+Past updates can then be searched by keyword in milliseconds instead of
+opening the yearly spreadsheet tabs.
+
+Usage:
+    python search_index.py build [--db PATH] [--updates PATH] [--stories PATH]
+                                 [--actions PATH] [--milestones PATH]
+    python search_index.py search "flood mapping" [--solution HLS]
+                                 [--from 2024-01-01] [--to 2024-12-31]
+                                 [--table updates] [--limit 20] [--raw]
+    python search_index.py timeline HLS [--from 2024-01-01] [--to 2024-12-31]
+"""
+
+import argparse
+import re
+import sqlite3
+import time
+from pathlib import Path
+
+import pandas as pd
+
+DATABASE_DIR = Path(r"C:\Users\cjtucke3\Documents\Personal\MO-development\nsite-mo-viewer\database-files")
+
+# Default inputs (outputs of the import scripts)
+UPDATES_FILE = DATABASE_DIR / "final_updates_import.xlsx"
+STORIES_FILE = DATABASE_DIR / "MO-DB_Stories.xlsx"
+ACTIONS_FILE = DATABASE_DIR / "MO-Viewer Databases" / "MO-DB_Actions.xlsx"
+MILESTONES_FILE = DATABASE_DIR / "MO-DB_Milestones.csv"
+
+# Default index location
+DB_FILE = DATABASE_DIR / "mo_search.sqlite"
+
+DEFAULT_LIMIT = 20
+
+# Per-table layout. 'date' is built from the first non-empty source column
+# listed in 'date_sources'; 'solution_sources' does the same for solution_id.
+INDEX_TABLES = {
+    'updates': {
+        'key': 'update_id',
+        'date': 'meeting_date',
+        'date_sources': ['meeting_date'],
+        'solution_sources': ['solution_id'],
+        'columns': ['source_document', 'source_category', 'source_url', 'source_tab'],
+        'text': ['update_text'],
+        'summary': 'update_text',
+    },
+    'stories': {
+        'key': 'story_id',
+        'date': 'story_date',
+        'date_sources': ['publish_date', 'target_date', 'idea_date', 'last_updated'],
+        'solution_sources': ['solution_id', 'solution_names'],
+        'columns': ['content_type', 'status', 'channel', 'published_url', 'source_sheet'],
+        'text': ['title', 'notes'],
+        'summary': 'title',
+    },
+    'actions': {
+        'key': 'action_id',
+        'date': 'source_date',
+        'date_sources': ['source_date', 'created_at'],
+        'solution_sources': ['solution_id', 'solution'],
+        'columns': ['source_document', 'source_url', 'category', 'status', 'assigned_to', 'due_date', 'priority'],
+        'text': ['task', 'notes'],
+        'summary': 'task',
+    },
+    'milestones': {
+        'key': 'milestone_id',
+        'date': 'milestone_date',
+        'date_sources': ['actual_date', 'target_date'],
+        'solution_sources': ['solution_id'],
+        'columns': ['solution_name', 'type', 'phase', 'status', 'target_date', 'actual_date'],
+        'text': ['type', 'notes'],
+        'summary': 'type',
+    },
+}
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+# =============================================================================
+# LOADING
+# =============================================================================
+
+def read_table(path):
+    """Read every sheet of an xlsx (or a CSV) into one DataFrame"""
+    path = Path(path)
+    if not path.exists():
+        print(f"  Warning: {path.name} not found")
+        return pd.DataFrame()
+
+    if path.suffix.lower() == '.csv':
+        return pd.read_csv(path, dtype=str)
+
+    sheets = pd.read_excel(path, sheet_name=None, dtype=str)
+    frames = [df for df in sheets.values() if len(df) > 0]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def _first_present(df, columns):
+    """Coalesce the first non-empty value across columns"""
+    result = pd.Series('', index=df.index)
+    for col in reversed(columns):
+        if col in df.columns:
+            values = df[col].fillna('').astype(str).str.strip()
+            result = values.where(values != '', result)
+    return result
+
+
+def prepare_rows(df, spec):
+    """Project a source frame onto the index layout for one table"""
+    out = pd.DataFrame(index=df.index)
+    out[spec['key']] = df[spec['key']].fillna('').astype(str) if spec['key'] in df.columns else ''
+    out['solution_id'] = _first_present(df, spec['solution_sources'])
+
+    dates = pd.to_datetime(_first_present(df, spec['date_sources']), errors='coerce', format='mixed')
+    out[spec['date']] = dates.dt.strftime('%Y-%m-%d').fillna('')
+
+    for col in dict.fromkeys(spec['columns'] + spec['text']):
+        out[col] = df[col].fillna('').astype(str) if col in df.columns else ''
+
+    return out
+
+
+def create_schema(conn):
+    """Drop and recreate all index tables"""
+    for table, spec in INDEX_TABLES.items():
+        columns = [spec['key'], 'solution_id', spec['date']] + list(dict.fromkeys(spec['columns'] + spec['text']))
+        # solution_id matches case-insensitively; the column collation lets
+        # those lookups use idx_{table}_solution_date
+        column_sql = ', '.join(f'"{c}" TEXT' + (' COLLATE NOCASE' if c == 'solution_id' else '')
+                               for c in columns)
+        text_sql = ', '.join(f'"{c}"' for c in spec['text'])
+
+        conn.execute(f'DROP TABLE IF EXISTS "{table}_fts"')
+        conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+        conn.execute(f'CREATE TABLE "{table}" ({column_sql})')
+        conn.execute(f'CREATE INDEX "idx_{table}_solution_date" ON "{table}" (solution_id, "{spec["date"]}")')
+        conn.execute(f'CREATE INDEX "idx_{table}_date" ON "{table}" ("{spec["date"]}")')
+        conn.execute(
+            f'CREATE VIRTUAL TABLE "{table}_fts" USING fts5({text_sql}, '
+            f'content="{table}", content_rowid="rowid", tokenize="porter unicode61")'
+        )
+
+    conn.execute('DROP VIEW IF EXISTS timeline')
+    conn.execute('CREATE VIEW timeline AS ' + ' UNION ALL '.join(
+        f"SELECT '{table}' AS kind, \"{spec['key']}\" AS record_id, solution_id, "
+        f"\"{spec['date']}\" AS event_date, \"{spec['summary']}\" AS summary FROM \"{table}\""
+        for table, spec in INDEX_TABLES.items()
+    ))
+
+
+def build_index(db_path=DB_FILE, sources=None):
+    """Rebuild the search database from the source files; returns row counts"""
+    sources = sources or {
+        'updates': UPDATES_FILE,
+        'stories': STORIES_FILE,
+        'actions': ACTIONS_FILE,
+        'milestones': MILESTONES_FILE,
+    }
+
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    counts = {}
+
+    with sqlite3.connect(db_path) as conn:
+        create_schema(conn)
+        for table, spec in INDEX_TABLES.items():
+            df = read_table(sources[table]) if sources.get(table) else pd.DataFrame()
+            rows = prepare_rows(df, spec) if len(df) else pd.DataFrame()
+            if len(rows):
+                rows.to_sql(table, conn, if_exists='append', index=False)
+            conn.execute(f'INSERT INTO "{table}_fts"("{table}_fts") VALUES (\'rebuild\')')
+            counts[table] = len(rows)
+        conn.execute('ANALYZE')
+
+    return counts
+
+
+# =============================================================================
+# QUERY API
+# =============================================================================
+
+def connect(db_path=DB_FILE):
+    """Open the search database read-only with dict-like rows"""
+    db_path = Path(db_path)
+    if not db_path.exists():
+        raise FileNotFoundError(f"{db_path} not found. Run: python search_index.py build")
+    conn = sqlite3.connect(f'file:{db_path.as_posix()}?mode=ro', uri=True)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def to_match_query(text):
+    """Quote each word so free text is safe to pass to FTS5 MATCH"""
+    tokens = TOKEN_RE.findall(text)
+    return ' '.join(f'"{t}"' for t in tokens)
+
+
+def _date_filters(date_col, solution_id, start, end):
+    clauses, params = [], []
+    if solution_id:
+        clauses.append('t.solution_id = ?')
+        params.append(solution_id)
+    if start:
+        clauses.append(f't."{date_col}" >= ?')
+        params.append(start)
+    if end:
+        clauses.append(f't."{date_col}" <= ?')
+        params.append(end)
+    return clauses, params
+
+
+def search(conn, query, tables=None, solution_id=None, start=None, end=None,
+           limit=DEFAULT_LIMIT, raw=False):
+    """
+    Ranked keyword search (BM25) across the indexed tables.
+
+    start/end are inclusive YYYY-MM-DD bounds on each table's date column.
+    Pass raw=True to use FTS5 query syntax (OR, NEAR, prefix*) directly.
+    Returns a list of dicts sorted best match first.
+    """
+    match = query if raw else to_match_query(query)
+    if not match:
+        return []
+
+    results = []
+    for table in tables or INDEX_TABLES:
+        spec = INDEX_TABLES[table]
+        clauses, params = _date_filters(spec['date'], solution_id, start, end)
+        where = ''.join(f' AND {c}' for c in clauses)
+        sql = (
+            f'SELECT \'{table}\' AS kind, t."{spec["key"]}" AS record_id, t.solution_id, '
+            f't."{spec["date"]}" AS event_date, '
+            f'snippet("{table}_fts", -1, \'[\', \']\', \'...\', 16) AS snippet, '
+            f'bm25("{table}_fts") AS rank '
+            f'FROM "{table}_fts" JOIN "{table}" t ON t.rowid = "{table}_fts".rowid '
+            f'WHERE "{table}_fts" MATCH ?{where} ORDER BY rank LIMIT ?'
+        )
+        results.extend(dict(r) for r in conn.execute(sql, [match] + params + [limit]))
+
+    results.sort(key=lambda r: r['rank'])
+    return results[:limit]
+
+
+def timeline(conn, solution_id, start=None, end=None, kinds=None):
+    """All dated records for one solution, newest first"""
+    sql = 'SELECT * FROM timeline WHERE solution_id = ?'
+    params = [solution_id]
+    if start:
+        sql += ' AND event_date >= ?'
+        params.append(start)
+    if end:
+        sql += ' AND event_date <= ?'
+        params.append(end)
+    if kinds:
+        sql += f' AND kind IN ({", ".join("?" for _ in kinds)})'
+        params.extend(kinds)
+    sql += ' ORDER BY event_date DESC, kind'
+    return [dict(r) for r in conn.execute(sql, params)]
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def _one_line(text, width=100):
+    text = ' '.join(str(text or '').split())
+    return text if len(text) <= width else text[:width - 3] + '...'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Full-text search over MO-DB history')
+    parser.add_argument('--db', type=Path, default=DB_FILE, help='SQLite database path')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_build = sub.add_parser('build', help='Rebuild the index from the import files')
+    p_build.add_argument('--updates', type=Path, default=UPDATES_FILE)
+    p_build.add_argument('--stories', type=Path, default=STORIES_FILE)
+    p_build.add_argument('--actions', type=Path, default=ACTIONS_FILE)
+    p_build.add_argument('--milestones', type=Path, default=MILESTONES_FILE)
+
+    p_search = sub.add_parser('search', help='Ranked keyword search')
+    p_search.add_argument('query')
+    p_search.add_argument('--solution', help='Limit to one solution_id')
+    p_search.add_argument('--from', dest='start', help='Start date (YYYY-MM-DD)')
+    p_search.add_argument('--to', dest='end', help='End date (YYYY-MM-DD)')
+    p_search.add_argument('--table', action='append', choices=list(INDEX_TABLES),
+                          help='Table(s) to search (default: all)')
+    p_search.add_argument('--limit', type=int, default=DEFAULT_LIMIT)
+    p_search.add_argument('--raw', action='store_true', help='Pass query as FTS5 syntax')
+
+    p_timeline = sub.add_parser('timeline', help='Per-solution timeline')
+    p_timeline.add_argument('solution')
+    p_timeline.add_argument('--from', dest='start', help='Start date (YYYY-MM-DD)')
+    p_timeline.add_argument('--to', dest='end', help='End date (YYYY-MM-DD)')
+    p_timeline.add_argument('--table', action='append', choices=list(INDEX_TABLES),
+                            help='Record kind(s) to include (default: all)')
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        print("Building search index...")
+        started = time.perf_counter()
+        counts = build_index(args.db, {
+            'updates': args.updates,
+            'stories': args.stories,
+            'actions': args.actions,
+            'milestones': args.milestones,
+        })
+        for table, count in counts.items():
+            print(f"  {table}: {count} rows")
+        print(f"\nIndex written to: {args.db} ({time.perf_counter() - started:.1f}s)")
+        return
+
+    conn = connect(args.db)
+    started = time.perf_counter()
+
+    if args.command == 'search':
+        rows = search(conn, args.query, args.table, args.solution, args.start, args.end,
+                      args.limit, args.raw)
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"{len(rows)} result(s) in {elapsed:.1f} ms\n")
+        for r in rows:
+            print(f"[{r['kind']}] {r['event_date'] or '----------'}  {r['solution_id'] or '-'}  {r['record_id']}")
+            print(f"    {_one_line(r['snippet'])}")
+    else:
+        rows = timeline(conn, args.solution, args.start, args.end, args.table)
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"{args.solution}: {len(rows)} record(s) in {elapsed:.1f} ms\n")
+        for r in rows:
+            print(f"{r['event_date'] or '----------'}  {r['kind']:<10}  {_one_line(r['summary'])}")
+
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
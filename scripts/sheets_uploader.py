@@ -0,0 +1,584 @@
+# -*- coding: utf-8 -*-
+"""
+Batched MO-DB Sheet Uploader
+============================
+Pushes import results straight into the MO-DB spreadsheets instead of
+copying an xlsx by hand (combine_final_import.py, generate_solutions_import.py,
+sync_stories_from_tracking.py and friends all end with one):
+
+- a DataFrame becomes header + rows of plain values, written as A1 ranges
+  through values.batchUpdate, chunked so no request exceeds max_cells
+- a changeset (new/changed rows keyed on a column) only rewrites the rows
+  whose key is already on the sheet, in contiguous runs, and appends the rest
+- transient errors (HTTP 429/5xx) are retried with exponential backoff and
+  jitter
+- tabs upload in parallel; batches within a tab stay in order
+
+FakeSheetsValues is an in-process stand-in for the Sheets values API (same
+calls, A1 ranges, optional latency and injected 429s), so batching and
+throughput can be tested and benchmarked offline. GoogleSheetsValues wraps
+the real API and needs google-api-python-client and google-auth.
+
+Usage:
+    python sheets_uploader.py FILE.xlsx --spreadsheet-id ID [--credentials service-account.json]
+                              [--tab Sheet=Tab ...] [--key update_id] [--max-cells 50000]
+    python sheets_uploader.py --benchmark [--rows 20000] [--cols 12] [--latency 0.05]
+"""
+
+import argparse
+import random
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+# Cells per values.batchUpdate request (keeps payloads well under the API's
+# request size limit)
+DEFAULT_MAX_CELLS = 50000
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BACKOFF = 1.0
+MAX_BACKOFF = 64.0
+DEFAULT_WORKERS = 4
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+SHEETS_SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+
+A1_RE = re.compile(r'^([A-Z]*)(\d*)$')
+
+
+class TransientSheetsError(Exception):
+    """Retryable API error (rate limit or server error)"""
+
+    def __init__(self, message, status=429):
+        super().__init__(message)
+        self.status = status
+
+
+# =============================================================================
+# A1 NOTATION AND VALUES
+# =============================================================================
+
+def column_letter(n):
+    """1 -> 'A', 27 -> 'AA'"""
+    letters = ''
+    while n:
+        n, rem = divmod(n - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def column_number(letters):
+    """'A' -> 1, 'AA' -> 27"""
+    n = 0
+    for c in letters:
+        n = n * 26 + ord(c) - 64
+    return n
+
+
+def quote_tab(tab):
+    return "'" + tab.replace("'", "''") + "'"
+
+
+def a1_range(tab, first_row, first_col, last_row, last_col):
+    """'Tab'!A2:F9 (1-based, inclusive)"""
+    return (f"{quote_tab(tab)}!{column_letter(first_col)}{first_row}:"
+            f"{column_letter(last_col)}{last_row}")
+
+
+def parse_a1(range_name):
+    """
+    (tab, first_row, first_col, last_row, last_col) for 'Tab'!A1:C9,
+    'Tab'!A:A or 'Tab'; open ends are None.
+    """
+    tab, _, cells = range_name.rpartition('!') if '!' in range_name else (range_name, '', '')
+    if tab.startswith("'") and tab.endswith("'"):
+        tab = tab[1:-1].replace("''", "'")
+    if not cells:
+        return tab, None, None, None, None
+    start, _, end = cells.partition(':')
+    bounds = []
+    for part in (start, end or start):
+        m = A1_RE.match(part.upper())
+        if not m:
+            raise ValueError(f"Bad A1 range: {range_name}")
+        bounds.append((int(m.group(2)) if m.group(2) else None,
+                       column_number(m.group(1)) if m.group(1) else None))
+    (r0, c0), (r1, c1) = bounds
+    return tab, r0, c0, r1, c1
+
+
+def cell_value(value):
+    """Plain JSON value for one cell ('' for missing)"""
+    if value is None or (not isinstance(value, (str, bytes, list)) and pd.isna(value)):
+        return ''
+    if isinstance(value, datetime):
+        value = pd.Timestamp(value)
+        return value.strftime('%Y-%m-%d') if value == value.normalize() else value.isoformat(sep=' ')
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def frame_values(df):
+    """Rows of plain cell values (no header)"""
+    return [[cell_value(v) for v in row] for row in df.itertuples(index=False, name=None)]
+
+
+def chunk_rows(row_count, width, max_cells):
+    """(offset, count) row blocks of at most max_cells cells each"""
+    per_block = max(1, max_cells // max(width, 1))
+    return [(start, min(per_block, row_count - start)) for start in range(0, row_count, per_block)]
+
+
+def plan_batches(tab, rows, first_row, max_cells=DEFAULT_MAX_CELLS, first_col=1):
+    """
+    Value ranges for rows written from first_row down, packed into requests.
+
+    Returns a list of batches; each batch is a list of {'range', 'values'}
+    holding at most max_cells cells.
+    """
+    if not rows:
+        return []
+    width = max(len(r) for r in rows)
+    batches, batch, cells = [], [], 0
+    for offset, count in chunk_rows(len(rows), width, max_cells):
+        block = [list(r) + [''] * (width - len(r)) for r in rows[offset:offset + count]]
+        size = count * width
+        if batch and cells + size > max_cells:
+            batches.append(batch)
+            batch, cells = [], 0
+        start = first_row + offset
+        batch.append({'range': a1_range(tab, start, first_col, start + count - 1, first_col + width - 1),
+                      'values': block})
+        cells += size
+    batches.append(batch)
+    return batches
+
+
+def pack_ranges(ranges, max_cells=DEFAULT_MAX_CELLS):
+    """Group {'range', 'values'} entries into requests of at most max_cells cells"""
+    batches, batch, cells = [], [], 0
+    for entry in ranges:
+        size = sum(len(r) for r in entry['values'])
+        if batch and cells + size > max_cells:
+            batches.append(batch)
+            batch, cells = [], 0
+        batch.append(entry)
+        cells += size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def contiguous_runs(row_numbers):
+    """Sorted row (or column) numbers -> [(first, count)] of consecutive runs"""
+    runs = []
+    for n in sorted(row_numbers):
+        if runs and n == runs[-1][0] + runs[-1][1]:
+            runs[-1][1] += 1
+        else:
+            runs.append([n, 1])
+    return [tuple(r) for r in runs]
+
+
+# =============================================================================
+# VALUES API BACKENDS
+# =============================================================================
+
+class FakeSheetsValues:
+    """
+    In-process stand-in for spreadsheets.values (batchUpdate, get, clear).
+
+    latency:         seconds slept per request (simulates round trips)
+    fail_every:      raise TransientSheetsError on every Nth request (0 = never)
+    max_cells:       reject requests writing more cells than this (0 = no limit)
+    """
+
+    def __init__(self, latency=0.0, fail_every=0, max_cells=0):
+        self.latency = latency
+        self.fail_every = fail_every
+        self.max_cells = max_cells
+        self.tabs = {}
+        self.requests = 0
+        self.failures = 0
+        self.cells_written = 0
+        self.lock = threading.Lock()
+
+    def _request(self):
+        if self.latency:
+            time.sleep(self.latency)
+        with self.lock:
+            self.requests += 1
+            if self.fail_every and self.requests % self.fail_every == 0:
+                self.failures += 1
+                raise TransientSheetsError('Quota exceeded (fake)', 429)
+
+    def batch_update(self, spreadsheet_id, data):
+        cells = sum(len(r) for entry in data for r in entry['values'])
+        if self.max_cells and cells > self.max_cells:
+            raise ValueError(f"Request writes {cells} cells (limit {self.max_cells})")
+        self._request()
+        with self.lock:
+            for entry in data:
+                tab, r0, c0, _, _ = parse_a1(entry['range'])
+                grid = self.tabs.setdefault((spreadsheet_id, tab), [])
+                for i, row in enumerate(entry['values']):
+                    r = (r0 or 1) - 1 + i
+                    while len(grid) <= r:
+                        grid.append([])
+                    target = grid[r]
+                    c = (c0 or 1) - 1
+                    if len(target) < c + len(row):
+                        target.extend([''] * (c + len(row) - len(target)))
+                    target[c:c + len(row)] = row
+            self.cells_written += cells
+        return {'totalUpdatedCells': cells}
+
+    def get(self, spreadsheet_id, range_name):
+        self._request()
+        return self._values(spreadsheet_id, range_name)
+
+    def _values(self, spreadsheet_id, range_name):
+        tab, r0, c0, r1, c1 = parse_a1(range_name)
+        with self.lock:
+            grid = self.tabs.get((spreadsheet_id, tab), [])
+            rows = grid[(r0 or 1) - 1:r1]
+            values = [row[(c0 or 1) - 1:c1] for row in rows]
+        # Like the API: trailing empty cells and rows are dropped
+        values = [list(v) for v in values]
+        for row in values:
+            while row and row[-1] == '':
+                row.pop()
+        while values and not values[-1]:
+            values.pop()
+        return values
+
+    def clear(self, spreadsheet_id, range_name):
+        self._request()
+        tab, r0, c0, r1, c1 = parse_a1(range_name)
+        with self.lock:
+            grid = self.tabs.get((spreadsheet_id, tab), [])
+            for row in grid[(r0 or 1) - 1:r1]:
+                end = len(row) if c1 is None else min(c1, len(row))
+                row[(c0 or 1) - 1:end] = [''] * max(0, end - (c0 or 1) + 1)
+
+    def ensure_size(self, spreadsheet_id, tab, rows, cols):
+        """The fake grid grows on write"""
+
+    def table(self, spreadsheet_id, tab):
+        """Tab contents as a DataFrame (first row is the header); not counted as a request"""
+        values = self._values(spreadsheet_id, quote_tab(tab))
+        if not values:
+            return pd.DataFrame()
+        width = max(len(r) for r in values)
+        header = values[0] + [''] * (width - len(values[0]))
+        return pd.DataFrame([r + [''] * (width - len(r)) for r in values[1:]], columns=header)
+
+
+class GoogleSheetsValues:
+    """spreadsheets.values through google-api-python-client (service account)"""
+
+    def __init__(self, credentials_file):
+        try:
+            from google.oauth2 import service_account
+            from googleapiclient.discovery import build
+        except ImportError:
+            raise SystemExit("google-api-python-client and google-auth are needed to upload "
+                             "(pip install google-api-python-client google-auth)")
+        credentials = service_account.Credentials.from_service_account_file(
+            str(credentials_file), scopes=SHEETS_SCOPES)
+        self.credentials = credentials
+        self.build = build
+        self.local = threading.local()
+
+    @property
+    def service(self):
+        # httplib2 is not thread-safe: one client per worker thread
+        if not hasattr(self.local, 'service'):
+            self.local.service = self.build('sheets', 'v4', credentials=self.credentials,
+                                            cache_discovery=False)
+        return self.local.service
+
+    def batch_update(self, spreadsheet_id, data):
+        body = {'valueInputOption': 'RAW', 'data': data}
+        return self.service.spreadsheets().values().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=body).execute()
+
+    def get(self, spreadsheet_id, range_name):
+        result = self.service.spreadsheets().values().get(
+            spreadsheetId=spreadsheet_id, range=range_name).execute()
+        return result.get('values', [])
+
+    def clear(self, spreadsheet_id, range_name):
+        self.service.spreadsheets().values().clear(
+            spreadsheetId=spreadsheet_id, range=range_name, body={}).execute()
+
+    def ensure_size(self, spreadsheet_id, tab, rows, cols):
+        """Grow the tab's grid so rows x cols fits (values writes do not add rows)"""
+        sheets = self.service.spreadsheets()
+        meta = sheets.get(spreadsheetId=spreadsheet_id,
+                          fields='sheets(properties(sheetId,title,gridProperties))').execute()
+        for sheet in meta.get('sheets', []):
+            props = sheet['properties']
+            if props['title'] != tab:
+                continue
+            grid = props.get('gridProperties', {})
+            need = {'rowCount': max(rows, grid.get('rowCount', 0)),
+                    'columnCount': max(cols, grid.get('columnCount', 0))}
+            if need != {k: grid.get(k, 0) for k in need}:
+                sheets.batchUpdate(spreadsheetId=spreadsheet_id, body={'requests': [{
+                    'updateSheetProperties': {
+                        'properties': {'sheetId': props['sheetId'], 'gridProperties': need},
+                        'fields': 'gridProperties(rowCount,columnCount)',
+                    }}]}).execute()
+            return
+        raise ValueError(f"Tab not found: {tab}")
+
+
+def error_status(error):
+    """HTTP status of an API error, None if it has none"""
+    for attr in ('status', 'status_code'):
+        value = getattr(error, attr, None)
+        if isinstance(value, int):
+            return value
+    resp = getattr(error, 'resp', None)
+    return int(resp.status) if resp is not None and hasattr(resp, 'status') else None
+
+
+# =============================================================================
+# UPLOADER
+# =============================================================================
+
+class SheetsUploader:
+    """
+    Batched writes of DataFrames into one spreadsheet.
+
+    api:          FakeSheetsValues, GoogleSheetsValues or anything with the
+                  same batch_update/get/clear/ensure_size calls
+    max_cells:    cells per batchUpdate request
+    max_retries:  retries per request on transient errors
+    backoff:      first retry delay in seconds (doubles each retry, plus jitter)
+    max_workers:  tabs uploaded at once
+    """
+
+    def __init__(self, api, spreadsheet_id, max_cells=DEFAULT_MAX_CELLS, max_retries=DEFAULT_MAX_RETRIES,
+                 backoff=DEFAULT_BACKOFF, max_workers=DEFAULT_WORKERS, sleep=time.sleep):
+        self.api = api
+        self.spreadsheet_id = spreadsheet_id
+        self.max_cells = max_cells
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_workers = max_workers
+        self.sleep = sleep
+        self.retries = 0
+        self.lock = threading.Lock()
+
+    def call(self, method, *args):
+        """Run one API call, retrying transient errors with backoff"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return method(self.spreadsheet_id, *args)
+            except Exception as e:
+                if attempt == self.max_retries or error_status(e) not in RETRY_STATUSES:
+                    raise
+                with self.lock:
+                    self.retries += 1
+                delay = min(MAX_BACKOFF, self.backoff * 2 ** attempt)
+                self.sleep(delay * (1 + random.random()))
+
+    def write_batches(self, batches):
+        cells = 0
+        for batch in batches:
+            self.call(self.api.batch_update, batch)
+            cells += sum(len(r) for entry in batch for r in entry['values'])
+        return {'requests': len(batches), 'cells': cells}
+
+    def upload_frame(self, tab, df):
+        """
+        Replace the tab's contents with df (header row + values).
+
+        The new rows are written over the old ones first; only then are the
+        rows and columns past the new extent cleared. A failed upload leaves
+        the old rows in place past whatever was written, never a cleared or
+        truncated tab.
+        """
+        rows = [list(map(str, df.columns))] + frame_values(df)
+        width = max(len(df.columns), 1)
+        old = self.call(self.api.get, quote_tab(tab))
+        old_width = max((len(r) for r in old), default=0)
+        self.call(self.api.ensure_size, tab, len(rows), width)
+        stats = self.write_batches(plan_batches(tab, rows, 1, self.max_cells))
+
+        if len(old) > len(rows):
+            self.call(self.api.clear, a1_range(tab, len(rows) + 1, 1, len(old), max(old_width, width)))
+        if old_width > width:
+            self.call(self.api.clear, a1_range(tab, 1, width + 1, min(len(old), len(rows)), old_width))
+        return {'tab': tab, 'rows': len(df), 'updated': 0, 'appended': len(df), **stats}
+
+    def upload_changes(self, tab, df, key_column):
+        """
+        Upsert df's rows by key_column: rows whose key is on the sheet are
+        rewritten in place (contiguous rows share one range), the rest are
+        appended. The sheet's header decides the column order; columns the
+        sheet lacks are ignored. Rows missing from df are left alone, and
+        updated rows are written only in df's own columns, so sheet columns
+        the changeset does not carry keep their values.
+        """
+        values = self.call(self.api.get, quote_tab(tab))
+        if not values:
+            return self.upload_frame(tab, df)
+        header = values[0]
+        if key_column not in header:
+            raise ValueError(f"{tab}: key column '{key_column}' not in sheet header")
+        key_index = header.index(key_column)
+        positions = {}
+        for row_number, row in enumerate(values[1:], start=2):
+            key = str(row[key_index]).strip() if key_index < len(row) else ''
+            if key:
+                positions.setdefault(key, row_number)
+
+        aligned = df.reindex(columns=header)
+        rows = frame_values(aligned)
+        keys = df[key_column].map(cell_value).astype(str).str.strip().tolist()
+        existing = {}
+        appended = []
+        for key, row in zip(keys, rows):
+            if key in positions:
+                existing[positions[key]] = row
+            else:
+                appended.append(row)
+
+        # Column spans (1-based) of the sheet columns df carries; each run of
+        # rows is chunked like a full upload so no range exceeds max_cells
+        carried = [i + 1 for i, column in enumerate(header) if column in df.columns]
+        ranges = []
+        for first, count in contiguous_runs(existing):
+            block = [existing[first + i] for i in range(count)]
+            for first_col, width in contiguous_runs(carried):
+                span = [row[first_col - 1:first_col - 1 + width] for row in block]
+                for batch in plan_batches(tab, span, first, self.max_cells, first_col):
+                    ranges.extend(batch)
+        next_row = len(values) + 1
+        if appended:
+            self.call(self.api.ensure_size, tab, next_row + len(appended) - 1, len(header))
+            for batch in plan_batches(tab, appended, next_row, self.max_cells):
+                ranges.extend(batch)
+
+        stats = self.write_batches(pack_ranges(ranges, self.max_cells))
+        return {'tab': tab, 'rows': len(df), 'updated': len(existing), 'appended': len(appended), **stats}
+
+    def upload_tabs(self, frames, key_column=None):
+        """
+        Upload {tab: DataFrame} with tabs in parallel; returns per-tab stats
+        (an 'error' entry for tabs that failed).
+        """
+        def run(item):
+            tab, df = item
+            try:
+                if key_column and key_column in df.columns:
+                    return self.upload_changes(tab, df, key_column)
+                return self.upload_frame(tab, df)
+            except Exception as e:
+                return {'tab': tab, 'error': str(e)}
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(frames)) or 1) as pool:
+            return list(pool.map(run, frames.items()))
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def benchmark(rows, cols, tabs, latency, max_cells, max_workers, fail_every):
+    """Upload synthetic frames to FakeSheetsValues and report throughput"""
+    rng = np.random.default_rng(0)
+    frames = {
+        f"Tab{t + 1}": pd.DataFrame(rng.integers(0, 10 ** 6, size=(rows, cols)),
+                                    columns=[f"col_{c}" for c in range(cols)]).astype(str)
+        for t in range(tabs)
+    }
+    api = FakeSheetsValues(latency=latency, fail_every=fail_every)
+    uploader = SheetsUploader(api, 'benchmark', max_cells=max_cells, max_workers=max_workers,
+                              backoff=0.01)
+    start = time.perf_counter()
+    results = uploader.upload_tabs(frames)
+    elapsed = time.perf_counter() - start
+
+    for result in results:
+        print(f"  {result}")
+    for tab, df in frames.items():
+        uploaded = api.table('benchmark', tab)
+        if uploaded.shape != df.shape or not (uploaded.to_numpy() == df.to_numpy()).all():
+            print(f"  Warning: {tab} round trip differs")
+    print(f"Requests: {api.requests} ({api.failures} injected failures, {uploader.retries} retries)")
+    print(f"Cells: {api.cells_written:,} in {elapsed:.2f}s ({api.cells_written / elapsed:,.0f} cells/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Upload import workbooks to MO-DB sheets in batches')
+    parser.add_argument('input', type=Path, nargs='?', help='xlsx to upload (each sheet to the tab of the same name)')
+    parser.add_argument('--spreadsheet-id', help='Target spreadsheet ID')
+    parser.add_argument('--credentials', type=Path, help='Service account JSON key')
+    parser.add_argument('--tab', action='append', default=[], metavar='SHEET=TAB',
+                        help='Upload SHEET to TAB (repeatable; default: every sheet to the same name)')
+    parser.add_argument('--key', help='Upsert rows by this column instead of replacing the tab')
+    parser.add_argument('--max-cells', type=int, default=DEFAULT_MAX_CELLS,
+                        help=f'Cells per request (default: {DEFAULT_MAX_CELLS})')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Tabs uploaded at once (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--benchmark', action='store_true', help='Benchmark against the local fake API')
+    parser.add_argument('--rows', type=int, default=20000, help='Benchmark rows per tab')
+    parser.add_argument('--cols', type=int, default=12, help='Benchmark columns')
+    parser.add_argument('--tabs', type=int, default=4, help='Benchmark tabs')
+    parser.add_argument('--latency', type=float, default=0.05, help='Benchmark seconds per request')
+    parser.add_argument('--fail-every', type=int, default=0, help='Benchmark: inject a 429 every N requests')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.rows, args.cols, args.tabs, args.latency, args.max_cells, args.workers, args.fail_every)
+        return
+
+    if not args.input or not args.spreadsheet_id or not args.credentials:
+        parser.error('input, --spreadsheet-id and --credentials are required (or use --benchmark)')
+    if not args.input.exists():
+        raise SystemExit(f"ERROR: Input file not found: {args.input}")
+
+    sheets = pd.read_excel(args.input, sheet_name=None, dtype=object)
+    mapping = dict(item.split('=', 1) for item in args.tab) if args.tab else {name: name for name in sheets}
+    missing = [name for name in mapping if name not in sheets]
+    for name in missing:
+        print(f"Warning: sheet {name} not found in {args.input.name}")
+    frames = {mapping[name]: sheets[name] for name in mapping if name in sheets}
+
+    uploader = SheetsUploader(GoogleSheetsValues(args.credentials), args.spreadsheet_id,
+                              max_cells=args.max_cells, max_workers=args.workers)
+    start = time.perf_counter()
+    results = uploader.upload_tabs(frames, key_column=args.key)
+    elapsed = time.perf_counter() - start
+
+    failed = 0
+    for result in results:
+        if 'error' in result:
+            failed += 1
+            print(f"  {result['tab']}: ERROR - {result['error']}")
+        else:
+            print(f"  {result['tab']}: {result['updated']} updated, {result['appended']} appended "
+                  f"({result['requests']} requests, {result['cells']:,} cells)")
+    print(f"Done in {elapsed:.1f}s ({uploader.retries} retries)")
+    if failed:
+        raise SystemExit(f"ERROR: {failed} tab(s) failed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+"""
+Content-Addressed Snapshot Store for MO-DB Exports
+==================================================
+Keeps every export of an MO-DB table (MO-DB_Solutions.xlsx, MO-DB_Updates,
+...) as a version without keeping full copies:
+
+- each row is serialized canonically (JSON, sorted columns, missing -> null)
+  and addressed by its BLAKE2b-128 hash; only rows not seen before are
+  stored (zlib-compressed), so storage grows with churn
+- a version is a manifest: the columns, the row keys and the row hashes in
+  file order (16 bytes per row)
+- an export identical to the table's latest version is not stored again
+- a version is rebuilt by fetching its row blobs in one pass
+- two versions diff by comparing manifests (added / removed / changed keys)
+  without reading any rows; --fields loads only the changed rows and runs
+  them through row_diff.py for field-level changes
+
+Rows are keyed on the table's primary key (mo_db_store.STORE_TABLES) or
+--key; tables without a usable key are keyed by row position.
+
+Versions are named by id, TABLE (latest) or TABLE@YYYY-MM-DD (latest as of
+that date), e.g. "what changed since last month":
+    python snapshot_store.py diff solutions@2025-12-01 solutions
+
+Usage:
+    python snapshot_store.py ingest TABLE FILE [--sheet NAME] [--key COL] [--as-of DATE]
+    python snapshot_store.py list [TABLE]
+    python snapshot_store.py export VERSION FILE      # .xlsx or .csv
+    python snapshot_store.py diff OLD NEW [--fields] [--output changes.json]
+    python snapshot_store.py stats
+"""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import sys
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from excel_export import write_xlsx
+from mo_db_store import DATABASE_DIR, STORE_TABLES, load_file
+from row_diff import diff_tables
+
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+SNAPSHOT_DB = DATABASE_DIR / "mo_db_snapshots.sqlite"
+
+DIGEST_SIZE = 16
+POSITION_KEY = '_row'
+FETCH_CHUNK = 500
+
+SCHEMA = [
+    '''CREATE TABLE IF NOT EXISTS blobs (
+        hash BLOB PRIMARY KEY,
+        data BLOB NOT NULL
+    ) WITHOUT ROWID''',
+    '''CREATE TABLE IF NOT EXISTS versions (
+        version_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        table_name TEXT NOT NULL,
+        as_of TEXT NOT NULL,
+        ingested_at TEXT NOT NULL,
+        source_file TEXT,
+        key_column TEXT NOT NULL,
+        columns TEXT NOT NULL,
+        row_count INTEGER NOT NULL,
+        new_rows INTEGER NOT NULL,
+        manifest_hash TEXT NOT NULL,
+        row_keys BLOB NOT NULL,
+        row_hashes BLOB NOT NULL
+    )''',
+    'CREATE INDEX IF NOT EXISTS idx_versions_table ON versions (table_name, as_of)',
+]
+
+
+# =============================================================================
+# ROWS AND MANIFESTS
+# =============================================================================
+
+def connect(db_path=SNAPSHOT_DB):
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    for statement in SCHEMA:
+        conn.execute(statement)
+    conn.commit()
+    return conn
+
+
+def canonical_rows(df):
+    """One canonical JSON encoding (bytes) per row: sorted columns, missing -> null"""
+    values = df.astype(object).where(df.notna(), None)
+    columns = sorted(range(len(df.columns)), key=lambda i: str(df.columns[i]))
+    names = [json.dumps(str(df.columns[i]), ensure_ascii=False) for i in columns]
+    rows = []
+    for row in values.itertuples(index=False, name=None):
+        fields = (f'{name}:{json.dumps(row[i], ensure_ascii=False, default=str)}'
+                  for name, i in zip(names, columns))
+        rows.append(('{' + ','.join(fields) + '}').encode('utf-8'))
+    return rows
+
+
+def row_digest(data):
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).digest()
+
+
+def split_digests(packed):
+    return [packed[i:i + DIGEST_SIZE] for i in range(0, len(packed), DIGEST_SIZE)]
+
+
+def resolve_key(df, table, key=None):
+    """Key column for a table: --key, the store's primary key, else row position"""
+    key = key or STORE_TABLES.get(table, {}).get('primary_key')
+    if key and key in df.columns:
+        keys = df[key].fillna('').astype(str).str.strip()
+        if keys.ne('').all() and not keys.duplicated().any():
+            return key, keys.tolist()
+        print(f"  Warning: {key} has blank or repeated values; keying {table} by row position")
+    elif key:
+        print(f"  Warning: {key} not found; keying {table} by row position")
+    return POSITION_KEY, [str(i) for i in range(len(df))]
+
+
+def ingest(conn, table, df, source_file=None, as_of=None, key=None):
+    """
+    Store df as a new version of table; returns (version_id, new_rows, stored).
+    If df matches the latest version exactly nothing is stored and the
+    latest version_id is returned with stored=False.
+    """
+    df = df.loc[:, ~pd.Index(df.columns).duplicated()]
+    key_column, keys = resolve_key(df, table, key)
+    rows = canonical_rows(df)
+    digests = [row_digest(r) for r in rows]
+    columns = json.dumps([str(c) for c in df.columns], ensure_ascii=False)
+    packed = b''.join(digests)
+    manifest_hash = hashlib.blake2b(columns.encode('utf-8') + b'\x00' + packed,
+                                    digest_size=DIGEST_SIZE).hexdigest()
+
+    latest = conn.execute(
+        'SELECT version_id, manifest_hash FROM versions WHERE table_name = ? '
+        'ORDER BY as_of DESC, version_id DESC LIMIT 1', [table]).fetchone()
+    if latest and latest[1] == manifest_hash:
+        return latest[0], 0, False
+
+    # Only blobs the store does not have yet
+    unique = dict(zip(digests, rows))
+    known = set()
+    candidates = list(unique)
+    for start in range(0, len(candidates), FETCH_CHUNK):
+        chunk = candidates[start:start + FETCH_CHUNK]
+        known.update(h for (h,) in conn.execute(
+            f'SELECT hash FROM blobs WHERE hash IN ({",".join("?" for _ in chunk)})', chunk))
+    new = [(h, zlib.compress(unique[h])) for h in candidates if h not in known]
+    conn.executemany('INSERT INTO blobs (hash, data) VALUES (?, ?)', new)
+
+    now = datetime.now().isoformat(timespec='seconds')
+    cursor = conn.execute(
+        'INSERT INTO versions (table_name, as_of, ingested_at, source_file, key_column, columns, '
+        'row_count, new_rows, manifest_hash, row_keys, row_hashes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+        [table, as_of or now, now, str(source_file or ''), key_column, columns, len(df), len(new),
+         manifest_hash, zlib.compress(json.dumps(keys, ensure_ascii=False).encode('utf-8')), packed])
+    conn.commit()
+    return cursor.lastrowid, len(new), True
+
+
+def resolve_version(conn, spec):
+    """version_id for '12', 'solutions' (latest) or 'solutions@2025-12-01' (latest as of)"""
+    if str(spec).isdigit():
+        row = conn.execute('SELECT version_id FROM versions WHERE version_id = ?', [int(spec)]).fetchone()
+    else:
+        table, _, as_of = str(spec).partition('@')
+        sql = 'SELECT version_id FROM versions WHERE table_name = ?'
+        params = [table]
+        if as_of:
+            # Dates without a time mean the end of that day
+            sql += ' AND as_of <= ?'
+            params.append(as_of if 'T' in as_of else as_of + 'T99')
+        row = conn.execute(sql + ' ORDER BY as_of DESC, version_id DESC LIMIT 1', params).fetchone()
+    if not row:
+        raise SystemExit(f"ERROR: No snapshot version matches '{spec}'")
+    return row[0]
+
+
+def load_manifest(conn, version_id):
+    """{'table', 'key', 'columns', 'keys', 'hashes'} for a version (no rows read)"""
+    table, key, columns, keys, hashes = conn.execute(
+        'SELECT table_name, key_column, columns, row_keys, row_hashes FROM versions WHERE version_id = ?',
+        [version_id]).fetchone()
+    return {
+        'table': table,
+        'key': key,
+        'columns': json.loads(columns),
+        'keys': json.loads(zlib.decompress(keys)),
+        'hashes': split_digests(hashes),
+    }
+
+
+def fetch_rows(conn, hashes):
+    """{hash: row dict} for the given row hashes"""
+    wanted = list(dict.fromkeys(hashes))
+    rows = {}
+    for start in range(0, len(wanted), FETCH_CHUNK):
+        chunk = wanted[start:start + FETCH_CHUNK]
+        for h, data in conn.execute(
+                f'SELECT hash, data FROM blobs WHERE hash IN ({",".join("?" for _ in chunk)})', chunk):
+            rows[h] = json.loads(zlib.decompress(data))
+    return rows
+
+
+def reconstruct(conn, version_id, keys=None):
+    """
+    A version as a DataFrame, optionally only the rows with the given keys
+    (in version order). Rows are picked by their (key, hash) manifest
+    entries, so rows with the same content elsewhere are not pulled in.
+    """
+    manifest = load_manifest(conn, version_id)
+    entries = list(zip(manifest['keys'], manifest['hashes']))
+    if keys is not None:
+        wanted = set(keys)
+        entries = [(k, h) for k, h in entries if k in wanted]
+    rows = fetch_rows(conn, [h for _, h in entries])
+    frame = pd.DataFrame([rows[h] for _, h in entries], columns=manifest['columns'])
+    if keys is not None and manifest['key'] == POSITION_KEY:
+        frame.insert(0, POSITION_KEY, [k for k, _ in entries])
+    return frame
+
+
+def diff_versions(conn, old_id, new_id):
+    """
+    Manifest-only diff: {'added', 'removed', 'changed'} keys, plus the
+    unchanged count. Rows are matched on the versions' key column.
+    """
+    old, new = load_manifest(conn, old_id), load_manifest(conn, new_id)
+    old_rows = dict(zip(old['keys'], old['hashes']))
+    new_rows = dict(zip(new['keys'], new['hashes']))
+    changed = [k for k, h in new_rows.items() if k in old_rows and old_rows[k] != h]
+    return {
+        'key': new['key'],
+        'added': [k for k in new_rows if k not in old_rows],
+        'removed': [k for k in old_rows if k not in new_rows],
+        'changed': changed,
+        'unchanged': sum(1 for k, h in new_rows.items() if old_rows.get(k) == h),
+        'columns_added': [c for c in new['columns'] if c not in old['columns']],
+        'columns_removed': [c for c in old['columns'] if c not in new['columns']],
+    }
+
+
+def field_changes(conn, old_id, new_id, changed_keys):
+    """row_diff Changeset over just the changed rows of two versions"""
+    frames = [reconstruct(conn, version_id, changed_keys) for version_id in (old_id, new_id)]
+    key = load_manifest(conn, new_id)['key']
+    return diff_tables(frames[0], frames[1], key)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Content-addressed snapshots of MO-DB exports')
+    parser.add_argument('--db', type=Path, default=SNAPSHOT_DB, help='Snapshot database path')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_ingest = sub.add_parser('ingest', help='Store an xlsx/CSV export as a new version')
+    p_ingest.add_argument('table', help='Table name (e.g. solutions, updates)')
+    p_ingest.add_argument('file', type=Path)
+    p_ingest.add_argument('--sheet', help='Sheet name (default: first sheet)')
+    p_ingest.add_argument('--key', help='Key column (default: the store primary key)')
+    p_ingest.add_argument('--as-of', help='Export date (default: now)')
+
+    p_list = sub.add_parser('list', help='List versions')
+    p_list.add_argument('table', nargs='?')
+
+    p_export = sub.add_parser('export', help='Rebuild a version as xlsx/CSV')
+    p_export.add_argument('version')
+    p_export.add_argument('file', type=Path)
+
+    p_diff = sub.add_parser('diff', help='Compare two versions')
+    p_diff.add_argument('old')
+    p_diff.add_argument('new')
+    p_diff.add_argument('--fields', action='store_true', help='Field-level changes for changed rows')
+    p_diff.add_argument('--output', type=Path, help='Write the diff (.json, or .xlsx with --fields)')
+
+    sub.add_parser('stats', help='Versions, rows and blob storage per table')
+
+    args = parser.parse_args()
+    conn = connect(args.db)
+
+    if args.command == 'ingest':
+        if not args.file.exists():
+            raise SystemExit(f"ERROR: Input file not found: {args.file}")
+        df = load_file(args.file, args.sheet)
+        version_id, new_rows, stored = ingest(conn, args.table, df, args.file.name, args.as_of, args.key)
+        if stored:
+            print(f"{args.table}: version {version_id}, {len(df)} rows ({new_rows} new row blobs)")
+        else:
+            print(f"{args.table}: unchanged since version {version_id}")
+    elif args.command == 'list':
+        sql = ('SELECT version_id, table_name, as_of, row_count, new_rows, source_file FROM versions'
+               + (' WHERE table_name = ?' if args.table else '') + ' ORDER BY table_name, as_of')
+        for row in conn.execute(sql, [args.table] if args.table else []):
+            print(f"  {row[0]:>5}  {row[1]:<15} {row[2]:<20} {row[3]:>7} rows  {row[4]:>6} new  {row[5]}")
+    elif args.command == 'export':
+        version_id = resolve_version(conn, args.version)
+        df = reconstruct(conn, version_id)
+        args.file.parent.mkdir(parents=True, exist_ok=True)
+        if args.file.suffix.lower() == '.csv':
+            df.to_csv(args.file, index=False)
+        else:
+            write_xlsx(args.file, {'Snapshot': df})
+        print(f"Version {version_id}: {len(df)} rows written to {args.file}")
+    elif args.command == 'diff':
+        old_id, new_id = resolve_version(conn, args.old), resolve_version(conn, args.new)
+        result = diff_versions(conn, old_id, new_id)
+        print(f"Version {old_id} -> {new_id} (key: {result['key']})")
+        print(f"  Added:     {len(result['added'])}")
+        print(f"  Removed:   {len(result['removed'])}")
+        print(f"  Changed:   {len(result['changed'])}")
+        print(f"  Unchanged: {result['unchanged']}")
+        for label in ('columns_added', 'columns_removed'):
+            if result[label]:
+                print(f"  {label.replace('_', ' ').capitalize()}: {', '.join(result[label])}")
+        changeset = field_changes(conn, old_id, new_id, result['changed']) if args.fields else None
+        if changeset is not None:
+            for field, count in changeset.changes['field'].value_counts().items():
+                print(f"    {field:35} {count}")
+        if args.output:
+            if changeset is not None and args.output.suffix.lower() != '.json':
+                changeset.write(args.output)
+            else:
+                payload = {**result, 'old_version': old_id, 'new_version': new_id}
+                if changeset is not None:
+                    payload['changed_fields'] = changeset.to_dict()['changed']
+                args.output.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding='utf-8')
+            print(f"Output: {args.output}")
+    else:
+        for table, versions, rows in conn.execute(
+                'SELECT table_name, COUNT(*), SUM(row_count) FROM versions GROUP BY table_name'):
+            print(f"  {table:<15} {versions:>4} versions  {rows:>9,} rows across versions")
+        blobs, size = conn.execute('SELECT COUNT(*), COALESCE(SUM(LENGTH(data)), 0) FROM blobs').fetchone()
+        print(f"  Row blobs: {blobs:,} ({size / 1024:,.0f} KB compressed)")
+
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
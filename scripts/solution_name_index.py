@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""
+Shared Solution Name Index
+==========================
+Matches Quick Look solution names to MO-DB_Solutions names. The import,
+diff, audit and crosswalk scripts each had their own find_db_name() /
+find_solution_match() that re-normalized every DB name for every Quick Look
+row; SolutionNameIndex does that work once per DB name list.
+
+Rules are tried in order and the first hit wins, as before:
+1. mapping   - first NAME_MAPPINGS pattern found in the name whose target
+               is a DB name (one ordered alternation)
+2. exact     - normalized names equal (hash lookup)
+3. substring - first DB name (in list order) contained in the name or
+               containing it (ordered alternation one way, one find() over
+               the joined DB names the other way)
+4. overlap   - optional: first DB name sharing more than half of the words
+               (candidates from a word index)
+5. fuzzy     - optional (off by default): closest DB name within a small
+               edit distance (BK-tree), for typos and near misses. Distinct
+               names can be that close ('OPERA Release 3 - DISP-S1' vs
+               'OPERA Release 6 - DIST-S1'), so every fuzzy match is
+               printed for review
+
+Each script keeps its own NAME_MAPPINGS and normalization quirks through the
+constructor options, so switching over does not change which names match.
+
+Usage:
+    from solution_name_index import SolutionNameIndex
+    index = SolutionNameIndex(db_names, NAME_MAPPINGS)
+    db_name = index.find(ql_name)
+    resolved = index.resolve(df['Solution'])   # columns: db_name, rule
+"""
+
+import bisect
+import re
+
+import pandas as pd
+
+from text_normalization import compile_ordered_substrings
+
+CYCLE_PREFIX = re.compile(r'^cycle \d+\s*')
+
+# Fuzzy matching is opt-in (max_distance=FUZZY_MAX_DISTANCE). Matches must be
+# within that many edits and within a quarter of the name's length, so short
+# acronyms never fuzzy-match each other
+DEFAULT_MAX_DISTANCE = 0
+FUZZY_MAX_DISTANCE = 2
+
+# Joins normalized DB names for the "name in DB name" search; never occurs in a name
+SEPARATOR = '\x00'
+
+
+def normalize_name(name, underscores=True, collapse_spaces=False):
+    """Lowercase, drop parentheses, turn '-' (and '_') into spaces"""
+    if pd.isna(name):
+        return ''
+    result = str(name).strip().lower().replace('(', '').replace(')', '').replace('-', ' ')
+    if underscores:
+        result = result.replace('_', ' ')
+    if collapse_spaces:
+        result = ' '.join(result.split())
+    return result
+
+
+def edit_distance(a, b, limit=None):
+    """Levenshtein distance; stops early once every path exceeds limit"""
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class BKTree:
+    """Burkhard-Keller tree over strings for edit-distance range queries"""
+
+    def __init__(self, words=()):
+        self.root = None
+        for word in words:
+            self.add(word)
+
+    def add(self, word):
+        if self.root is None:
+            self.root = (word, {})
+            return
+        node = self.root
+        while True:
+            distance = edit_distance(word, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (word, {})
+                return
+            node = child
+
+    def search(self, word, max_distance):
+        """All (distance, word) pairs within max_distance of word"""
+        found = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node_word, children = stack.pop()
+            distance = edit_distance(word, node_word)
+            if distance <= max_distance:
+                found.append((distance, node_word))
+            for d, child in children.items():
+                if distance - max_distance <= d <= distance + max_distance:
+                    stack.append(child)
+        return found
+
+
+class SolutionNameIndex:
+    """
+    Normalized lookup structures for one list of DB solution names.
+
+    db_names:        DB names in priority order (earlier names win ties)
+    mappings:        {lowercase pattern: DB name}, checked in order
+    underscores:     treat '_' as a space when normalizing
+    collapse_spaces: collapse runs of whitespace when normalizing
+    min_substring:   DB names must normalize to more than this many
+                     characters to take part in substring matching
+    word_overlap:    enable the word-overlap rule
+    max_distance:    edit distance for the fuzzy rule (0, the default,
+                     disables it); each fuzzy match is printed once
+    """
+
+    def __init__(self, db_names, mappings=None, underscores=True, collapse_spaces=False,
+                 min_substring=0, word_overlap=False, max_distance=DEFAULT_MAX_DISTANCE):
+        self.db_names = [n for n in db_names if pd.notna(n)]
+        self.underscores = underscores
+        self.collapse_spaces = collapse_spaces
+        self.word_overlap = word_overlap
+        self.max_distance = max_distance
+        self.norms = [self.normalize(n) for n in self.db_names]
+
+        db_set = set(self.db_names)
+        self.mappings = [(p, t) for p, t in (mappings or {}).items() if t in db_set]
+        self.mapping_regex = compile_ordered_substrings([p for p, _ in self.mappings]) if self.mappings else None
+
+        self.exact = {}
+        for position, norm in enumerate(self.norms):
+            self.exact.setdefault(norm, position)
+
+        # Substring candidates, kept in DB order
+        self.substring_positions = [i for i, n in enumerate(self.norms) if len(n) > min_substring]
+        substring_norms = [self.norms[i] for i in self.substring_positions]
+        self.substring_regex = compile_ordered_substrings(substring_norms) if substring_norms else None
+        self.joined = SEPARATOR.join(substring_norms)
+        self.offsets = []
+        offset = 0
+        for norm in substring_norms:
+            self.offsets.append(offset)
+            offset += len(norm) + len(SEPARATOR)
+
+        self.words = [set(n.split()) for n in self.norms]
+        self.word_index = {}
+        for position, words in enumerate(self.words):
+            for word in words:
+                self.word_index.setdefault(word, []).append(position)
+
+        self.tree = BKTree(self.exact) if max_distance else None
+        self.fuzzy_matches = {}  # {normalized query: DB name}, for review
+
+    def normalize(self, name):
+        return normalize_name(name, self.underscores, self.collapse_spaces)
+
+    def normalize_query(self, name):
+        """Normalize a Quick Look name, dropping any "Cycle N" prefix"""
+        return CYCLE_PREFIX.sub('', self.normalize(name)).strip()
+
+    def _substring_position(self, norm):
+        """DB position of the first name contained in norm or containing it"""
+        candidates = []
+        if self.substring_regex is not None:
+            m = self.substring_regex.match(norm)
+            if m:
+                candidates.append(self.substring_positions[m.lastindex - 1])
+        at = self.joined.find(norm) if self.substring_positions else -1
+        if at >= 0:
+            candidates.append(self.substring_positions[bisect.bisect_right(self.offsets, at) - 1])
+        return min(candidates) if candidates else None
+
+    def _overlap_position(self, norm):
+        words = set(norm.split())
+        candidates = sorted({p for w in words for p in self.word_index.get(w, ())})
+        for position in candidates:
+            total = max(len(words), len(self.words[position]))
+            if len(words & self.words[position]) / total > 0.5:
+                return position
+        return None
+
+    def _fuzzy_position(self, norm):
+        limit = min(self.max_distance, len(norm) // 4)
+        if not limit or self.tree is None:
+            return None
+        found = self.tree.search(norm, limit)
+        if not found:
+            return None
+        return min((distance, self.exact[word]) for distance, word in found)[1]
+
+    def match_normalized(self, norm):
+        """(db_name, rule) for an already normalized query, (None, None) if no match"""
+        if self.mapping_regex is not None:
+            m = self.mapping_regex.match(norm)
+            if m:
+                return self.mappings[m.lastindex - 1][1], 'mapping'
+
+        position = self.exact.get(norm)
+        if position is not None:
+            return self.db_names[position], 'exact'
+
+        position = self._substring_position(norm)
+        if position is not None:
+            return self.db_names[position], 'substring'
+
+        if self.word_overlap:
+            position = self._overlap_position(norm)
+            if position is not None:
+                return self.db_names[position], 'overlap'
+
+        if self.max_distance:
+            position = self._fuzzy_position(norm)
+            if position is not None:
+                db_name = self.db_names[position]
+                if norm not in self.fuzzy_matches:
+                    self.fuzzy_matches[norm] = db_name
+                    print(f"  Note: fuzzy match '{norm}' -> '{db_name}' (check before import)")
+                return db_name, 'fuzzy'
+
+        return None, None
+
+    def match(self, name):
+        """(db_name, rule) for a Quick Look name, (None, None) if no match"""
+        if pd.isna(name):
+            return None, None
+        return self.match_normalized(self.normalize_query(name))
+
+    def find(self, name):
+        """Matching DB name for a Quick Look name, or None"""
+        return self.match(name)[0]
+
+    def resolve(self, names):
+        """
+        Match a column of Quick Look names in one pass.
+
+        Returns a DataFrame on the same index with columns db_name and rule
+        (None where nothing matched). Each distinct normalized name is
+        matched once.
+        """
+        names = pd.Series(names, dtype=object)
+        present = names.notna()
+        norms = names[present].map(self.normalize_query)
+        results = {norm: self.match_normalized(norm) for norm in norms.unique()}
+
+        resolved = pd.DataFrame({'db_name': None, 'rule': None}, index=names.index, dtype=object)
+        resolved.loc[present, 'db_name'] = norms.map(lambda n: results[n][0])
+        resolved.loc[present, 'rule'] = norms.map(lambda n: results[n][1])
+        return resolved.astype(object).where(resolved.notna(), None)
+
+    def matches(self, name):
+        """
+        Every DB name the name matches by mapping, exact or substring rule,
+        i.e. the names for which a one-name index would return a match.
+        """
+        if pd.isna(name):
+            return set()
+        norm = self.normalize_query(name)
+        found = {target for pattern, target in self.mappings if pattern in norm}
+        substring = set(self.substring_positions)
+        for position, db_norm in enumerate(self.norms):
+            if db_norm == norm or (position in substring and (db_norm in norm or norm in db_norm)):
+                found.add(self.db_names[position])
+        return found
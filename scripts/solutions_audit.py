@@ -13,9 +13,10 @@ Outputs a detailed diff report for review.
 import pandas as pd
 from pathlib import Path
 import sys
-import re
 from datetime import datetime
 
+from solution_name_index import SolutionNameIndex
+
 sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
 # Name mappings
@@ -86,33 +87,13 @@ NAME_MAPPINGS = {
 }
 
 
-def normalize_name(name):
-    if pd.isna(name):
-        return ''
-    return str(name).strip().lower().replace('(', '').replace(')', '').replace('-', ' ')
-
-
-def find_solution_match(name, solutions_names):
-    if pd.isna(name):
-        return None
-    norm = normalize_name(name)
-    norm = re.sub(r'^cycle \d+\s*', '', norm).strip()
-
-    for pattern, target in NAME_MAPPINGS.items():
-        if pattern in norm:
-            if target in solutions_names:
-                return target
-
-    for sol in solutions_names:
-        if normalize_name(sol) == norm:
-            return sol
-
-    for sol in solutions_names:
-        sol_norm = normalize_name(sol)
-        if sol_norm in norm or norm in sol_norm:
-            return sol
-
-    return None
+def first_matching_rows(df, get_name, name_index):
+    """First row of df matching each DB solution name (by mapping, exact or substring rule)"""
+    rows = {}
+    for _, row in df.iterrows():
+        for sol_name in name_index.matches(get_name(row)):
+            rows.setdefault(sol_name, row)
+    return rows
 
 
 def safe_str(val, max_len=60):
@@ -210,6 +191,11 @@ def main():
     changes_status = []
     unmatched_ql = []
 
+    # First Quick Look row matching each solution
+    name_index = SolutionNameIndex(solutions_names, NAME_MAPPINGS, underscores=False)
+    poc_rows = first_matching_rows(pocs_df, lambda row: row.get('Solution') or row.get('Title'), name_index)
+    top_rows = first_matching_rows(top_df, lambda row: row.get('Solution Project'), name_index)
+
     # Process each solution in database
     lines.append("## Solutions Audit\n")
 
@@ -219,20 +205,8 @@ def main():
         lines.append("")
 
         # Find matching Quick Look entries
-        poc_match = None
-        top_match = None
-
-        for _, poc_row in pocs_df.iterrows():
-            ql_name = poc_row.get('Solution') or poc_row.get('Title')
-            if find_solution_match(ql_name, [sol_name]):
-                poc_match = poc_row
-                break
-
-        for _, top_row in top_df.iterrows():
-            ql_name = top_row.get('Solution Project')
-            if find_solution_match(ql_name, [sol_name]):
-                top_match = top_row
-                break
+        poc_match = poc_rows.get(sol_name)
+        top_match = top_rows.get(sol_name)
 
         # Contact Information
         lines.append("**Contact Information:**")
@@ -0,0 +1,437 @@
+# -*- coding: utf-8 -*-
+"""
+Source Archive Scanner
+======================
+Walks source-archives once (os.scandir), classifies every file and
+dispatches only new or changed files to the matching extractor, instead of
+each extractor globbing its own folders:
+
+    monthly_deck     Monthly Project Status Updates decks (.pptx)
+    monthly_docx     Monthly status notes (.docx, FY folders)
+    weekly_internal  Weekly Internal Planning notes (dated or _C0_ consolidated)
+    sep_weekly       SEP / SNWG weekly notes (dated or _C0_ consolidated)
+    needs_survey     DB-Copy of <solution>.xlsx stakeholder survey workbooks
+
+Files are classified by folder, then by filename, then by sniffing the
+Office package (presentation / document / workbook parts, document text,
+survey-year sheet names), so files dropped in unexpected folders are still
+picked up. Office files that match no extractor are reported, not skipped
+silently.
+
+The manifest (size and mtime per file, plus kind and when it was processed)
+is kept between runs; a file is dispatched again only when its size or
+mtime changes. A file whose extraction fails is reported and left
+unprocessed, so the next run retries it; the other files of its kind still
+go through. Updates from the dispatched files are written to a review
+workbook per run (source_scan_import_<YYYYMMDD_HHMMSS>.xlsx, a sheet per
+kind), so rows from earlier runs are never overwritten.
+
+Usage:
+    python source_scanner.py                 # dispatch new/changed files
+    python source_scanner.py --scan-only     # classify and report only
+    python source_scanner.py --all           # reprocess every file
+    python source_scanner.py --root DIR --manifest FILE --output FILE   # FILE gets the run stamp
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+import extract_historical_updates
+import extract_monthly_docx
+import extract_monthly_updates
+import extract_needs_data
+import extract_sep_updates
+from date_parsing import date_from_filename
+from excel_export import write_xlsx
+
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+ARCHIVE_ROOT = Path(r"C:\Users\cjtucke3\Documents\Personal\MO-development\source-archives")
+DATABASE_FILES = extract_monthly_updates.OUTPUT_PATH.parent
+MANIFEST_PATH = DATABASE_FILES / "source_archive_manifest.json"
+OUTPUT_PATH = DATABASE_FILES / "source_scan_import.xlsx"
+
+# Top-level archive folders each extractor reads
+MONTHLY_FOLDER = 'Monthly Project Status Updates'
+WEEKLY_FOLDER = 'Weekly Internal Planning'
+SEP_FOLDER = 'SEP'
+NEEDS_FOLDER = 'DB-solution-stakeholder-lists'
+
+OPERA_FOLDER = 'SEP OPERA'
+CONSOLIDATED_MARKER = '_C0_'
+
+# Office package part that identifies each file type
+OFFICE_PARTS = {
+    'ppt/presentation.xml': 'pptx',
+    'word/document.xml': 'docx',
+    'xl/workbook.xml': 'xlsx',
+}
+OFFICE_SUFFIXES = {'.pptx', '.docx', '.xlsx', '.xlsm', ''}
+
+# Bytes of word/document.xml read when sniffing a document's text
+SNIFF_BYTES = 200_000
+
+# Filename / document text patterns, checked in order (kind, type, pattern)
+NAME_RULES = [
+    ('weekly_internal', 'docx', re.compile(r'internal planning', re.IGNORECASE)),
+    ('sep_weekly', 'docx', re.compile(r'\bSEP\b|SNWG')),
+    ('needs_survey', 'xlsx', re.compile(r'^DB-Copy of ', re.IGNORECASE)),
+    ('monthly_deck', 'pptx', re.compile(r'monthly|status update', re.IGNORECASE)),
+    ('monthly_docx', 'docx', re.compile(r'monthly|status update', re.IGNORECASE)),
+]
+
+# Not extractable (different format), never reported as unclassified
+SKIP_RE = re.compile(r'biweekly', re.IGNORECASE)
+
+KIND_SHEETS = {
+    'monthly_deck': 'Monthly Decks',
+    'monthly_docx': 'Monthly Docx',
+    'weekly_internal': 'Weekly Internal',
+    'sep_weekly': 'SEP Weekly',
+    'needs_survey': 'Needs',
+}
+
+
+# =============================================================================
+# SCANNING
+# =============================================================================
+
+def walk_archive(root):
+    """(path, stat) for every file under root; hidden and Office lock files skipped"""
+    stack = [str(root)]
+    while stack:
+        folder = stack.pop()
+        try:
+            entries = os.scandir(folder)
+        except OSError as e:
+            print(f"  Warning: cannot read {folder}: {e}")
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name.startswith(('.', '~$')):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path, entry.stat()
+
+
+def office_type(path):
+    """'pptx', 'docx' or 'xlsx' from the package contents (None if not an Office file)"""
+    try:
+        with zipfile.ZipFile(path) as package:
+            names = set(package.namelist())
+    except (zipfile.BadZipFile, OSError):
+        return None
+    for part, file_type in OFFICE_PARTS.items():
+        if part in names:
+            return file_type
+    return None
+
+
+def sniff_kind(path, file_type):
+    """Kind from document text (docx) or survey-year sheet names (xlsx)"""
+    try:
+        with zipfile.ZipFile(path) as package:
+            if file_type == 'docx':
+                with package.open('word/document.xml') as part:
+                    text = re.sub(r'<[^>]+>', ' ', part.read(SNIFF_BYTES).decode('utf-8', errors='ignore'))
+                for kind, rule_type, pattern in NAME_RULES:
+                    if rule_type == 'docx' and pattern.search(text):
+                        return kind
+            elif file_type == 'xlsx':
+                workbook = package.read('xl/workbook.xml').decode('utf-8', errors='ignore')
+                sheets = set(re.findall(r'<sheet [^>]*name="([^"]+)"', workbook))
+                if sheets & set(extract_needs_data.SURVEY_YEARS):
+                    return 'needs_survey'
+    except (zipfile.BadZipFile, KeyError, OSError):
+        pass
+    return None
+
+
+def classify(relative, path):
+    """
+    (kind, file_type) for a file; kind is None for unmatched Office files and
+    'skip' for files no extractor reads. Folder rules first, then filename
+    rules, then content sniffing.
+    """
+    parts = relative.split('/')
+    name = parts[-1]
+    if Path(name).suffix.lower() not in OFFICE_SUFFIXES:
+        return 'skip', None
+    file_type = office_type(path)
+    if file_type is None:
+        return 'skip', None
+    if SKIP_RE.search(relative):
+        return 'skip', file_type
+
+    folder = parts[0] if len(parts) > 1 else ''
+    in_fy = any(p.startswith('FY') for p in parts[1:-1])
+    if folder == MONTHLY_FOLDER and file_type == 'pptx':
+        return 'monthly_deck', file_type
+    if folder == MONTHLY_FOLDER and file_type == 'docx' and in_fy:
+        return 'monthly_docx', file_type
+    if folder == WEEKLY_FOLDER and file_type == 'docx':
+        return 'weekly_internal', file_type
+    if folder == SEP_FOLDER and file_type == 'docx':
+        return 'sep_weekly', file_type
+    if NEEDS_FOLDER in parts[:-1] and file_type == 'xlsx' and name.startswith('DB-Copy of '):
+        return 'needs_survey', file_type
+
+    for kind, rule_type, pattern in NAME_RULES:
+        if rule_type == file_type and pattern.search(name):
+            return kind, file_type
+    return sniff_kind(path, file_type), file_type
+
+
+def scan(root, manifest, rescan=False):
+    """
+    Walk root once; returns (files, pending, removed). files is the new
+    manifest file table, pending the relative paths to dispatch (new,
+    changed, or never processed), removed the paths no longer present.
+    """
+    previous = manifest.get('files', {})
+    files = {}
+    pending = []
+    root = Path(root)
+    for path, stat in walk_archive(root):
+        relative = Path(path).relative_to(root).as_posix()
+        entry = previous.get(relative)
+        unchanged = (entry is not None and entry['size'] == stat.st_size
+                     and entry['mtime_ns'] == stat.st_mtime_ns)
+        if unchanged and not rescan:
+            files[relative] = entry
+        else:
+            kind, file_type = classify(relative, path)
+            files[relative] = {
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'mtime': datetime.fromtimestamp(stat.st_mtime).isoformat(timespec='seconds'),
+                'kind': kind,
+                'type': file_type,
+                'processed': None,
+                'records': None,
+            }
+        if files[relative]['kind'] in KIND_SHEETS and not files[relative]['processed']:
+            pending.append(relative)
+    removed = sorted(set(previous) - set(files))
+    return files, sorted(pending), removed
+
+
+def load_manifest(path):
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def save_manifest(path, root, files):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {'root': str(root), 'scanned': datetime.now().isoformat(timespec='seconds'), 'files': files}
+    temp = path.with_suffix(path.suffix + '.tmp')
+    temp.write_text(json.dumps(payload, ensure_ascii=False, indent=1, sort_keys=True), encoding='utf-8')
+    os.replace(temp, path)
+
+
+# =============================================================================
+# DISPATCH
+# =============================================================================
+# Each dispatcher takes absolute paths and returns ({sheet: DataFrame},
+# {path: records extracted}), using the extractor's own per-file functions.
+# Files that failed are left out of the counts.
+
+def extract_each(paths, extract, batch=None):
+    """
+    {path: extract(path)} over paths. A file that raises is reported and
+    left out, and any rows it added to batch are dropped.
+    """
+    counts = {}
+    for path in paths:
+        start = len(batch) if batch is not None else 0
+        try:
+            counts[path] = extract(path)
+        except Exception as e:
+            print(f"  Warning: {path.name} extraction failed: {e}")
+            if batch is not None:
+                batch.truncate(start)
+    return counts
+
+
+def dispatch_monthly_decks(paths):
+    batch = extract_monthly_updates.new_batch()
+    mapping = extract_monthly_updates.build_solution_mapping()
+    counts = extract_each(paths, lambda p: extract_monthly_updates.process_presentation(p, mapping, batch), batch)
+    return {KIND_SHEETS['monthly_deck']: batch.to_frame()}, counts
+
+
+def dispatch_monthly_docx(paths):
+    batch = extract_monthly_docx.new_batch()
+    mapping = extract_monthly_docx.build_solution_mapping()
+    counts = extract_each(paths, lambda p: extract_monthly_docx.parse_document(p, mapping, batch), batch)
+    return {KIND_SHEETS['monthly_docx']: batch.to_frame()}, counts
+
+
+def dispatch_weekly_internal(paths):
+    batch = extract_historical_updates.new_batch()
+    mapping = extract_historical_updates.build_solution_mapping()
+
+    def extract(path):
+        if CONSOLIDATED_MARKER in path.name:
+            return extract_historical_updates.parse_consolidated_document(path, mapping, batch)
+        meeting_date = date_from_filename(path.name)
+        if not meeting_date:
+            print(f"  Warning: no meeting date in {path.name}")
+            return 0
+        return extract_historical_updates.parse_document(path, meeting_date, mapping, batch)
+
+    counts = extract_each(paths, extract, batch)
+    frame = batch.to_frame(extract_historical_updates.CSV_HEADERS)
+    return {KIND_SHEETS['weekly_internal']: frame}, counts
+
+
+def dispatch_sep_weekly(paths):
+    batch = extract_sep_updates.new_batch()
+    url_map = extract_sep_updates.build_url_mapping()
+
+    def extract(path):
+        start = len(batch)
+        if CONSOLIDATED_MARKER in path.name:
+            extract_sep_updates.parse_consolidated_document(path, url_map, batch)
+        else:
+            extract_sep_updates.parse_document(path, url_map, batch)
+        if OPERA_FOLDER in path.parts:
+            batch.set_values('solution_id', 'OPERA', start=start)
+        return len(batch) - start
+
+    counts = extract_each(paths, extract, batch)
+    return {KIND_SHEETS['sep_weekly']: batch.to_frame()}, counts
+
+
+def dispatch_needs_surveys(paths):
+    all_records, all_mappings = [], []
+
+    def extract(path):
+        records, mappings = extract_needs_data.process_file(path)
+        all_records.extend(records)
+        all_mappings.extend(mappings)
+        return len(records)
+
+    counts = extract_each(paths, extract)
+    return {
+        KIND_SHEETS['needs_survey']: pd.DataFrame(all_records, columns=extract_needs_data.OUTPUT_COLUMNS),
+        'Needs Contacts': pd.DataFrame(all_mappings, columns=extract_needs_data.MAPPING_COLUMNS),
+    }, counts
+
+
+DISPATCHERS = {
+    'monthly_deck': dispatch_monthly_decks,
+    'monthly_docx': dispatch_monthly_docx,
+    'weekly_internal': dispatch_weekly_internal,
+    'sep_weekly': dispatch_sep_weekly,
+    'needs_survey': dispatch_needs_surveys,
+}
+
+
+def dispatch(root, files, pending):
+    """
+    Run each kind's extractor over its pending files; marks the files that
+    went through as processed in files (failed ones are retried next run)
+    """
+    root = Path(root)
+    sheets = {}
+    for kind, dispatcher in DISPATCHERS.items():
+        relatives = [r for r in pending if files[r]['kind'] == kind]
+        if not relatives:
+            continue
+        print(f"\n{KIND_SHEETS[kind]}: {len(relatives)} files")
+        paths = [root / r for r in relatives]
+        try:
+            kind_sheets, counts = dispatcher(paths)
+        except Exception as e:
+            # Setup failed (e.g. the solution mapping); retried next run
+            print(f"  Warning: {kind} extraction failed: {e}")
+            continue
+        now = datetime.now().isoformat(timespec='seconds')
+        for relative, path in zip(relatives, paths):
+            if path in counts:
+                files[relative]['processed'] = now
+                files[relative]['records'] = counts[path]
+        failed = len(relatives) - len(counts)
+        if failed:
+            print(f"  {failed} of {len(relatives)} files failed; retried next run")
+        for sheet, frame in kind_sheets.items():
+            print(f"  {sheet}: {len(frame)} rows")
+            if len(frame):
+                sheets[sheet] = frame
+    return sheets
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Scan source-archives once and extract new or changed files')
+    parser.add_argument('--root', type=Path, default=ARCHIVE_ROOT, help='source-archives folder')
+    parser.add_argument('--manifest', type=Path, default=MANIFEST_PATH, help='Scan manifest (JSON)')
+    parser.add_argument('--output', type=Path, default=OUTPUT_PATH,
+                        help='Review workbook for extracted rows (a run timestamp is added to the name)')
+    parser.add_argument('--scan-only', action='store_true', help='Classify and report without extracting')
+    parser.add_argument('--all', action='store_true', help='Reclassify and reprocess every file')
+    args = parser.parse_args()
+
+    if not args.root.exists():
+        raise SystemExit(f"ERROR: Input folder not found: {args.root}")
+
+    print(f"Scanning {args.root}...")
+    manifest = {} if args.all else load_manifest(args.manifest)
+    files, pending, removed = scan(args.root, manifest, rescan=args.all)
+
+    kinds = pd.Series([f['kind'] or 'unclassified' for f in files.values()], dtype=object)
+    print(f"  {len(files)} files")
+    for kind, count in kinds.value_counts().items():
+        print(f"    {kind:20} {count}")
+    print(f"  New or changed: {len(pending)}")
+    if removed:
+        print(f"  Removed since last scan: {len(removed)}")
+
+    unclassified = sorted(r for r, f in files.items() if f['kind'] is None)
+    if unclassified:
+        print(f"\nWarning: {len(unclassified)} Office files match no extractor:")
+        for relative in unclassified[:20]:
+            print(f"  {relative}")
+        if len(unclassified) > 20:
+            print(f"  ... and {len(unclassified) - 20} more")
+
+    if args.scan_only:
+        for relative in pending:
+            print(f"  {files[relative]['kind']:16} {relative}")
+        return
+
+    sheets = dispatch(args.root, files, pending) if pending else {}
+    if sheets:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        output = args.output.with_name(f"{args.output.stem}_{timestamp}{args.output.suffix}")
+        output.parent.mkdir(parents=True, exist_ok=True)
+        write_xlsx(output, sheets, max_width=60)
+        print(f"\nExtracted rows written to: {output}")
+    elif pending:
+        print("\nNo rows extracted.")
+    else:
+        print("\nNothing new to extract.")
+
+    save_manifest(args.manifest, args.root, files)
+    print(f"Manifest: {args.manifest}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+"""
+Stakeholder Entity Resolution Across Survey Years
+==================================================
+extract_needs_data.py writes one need row per respondent per survey year per
+solution workbook, so the same person appears many times with small
+differences in name, email or agency. This stage resolves those rows to one
+stakeholder each without comparing every pair of rows:
+
+1. Normalize each row: name tokens ("Last, First" reordered, titles dropped),
+   email, email domain, agency (department when agency is blank)
+2. Block rows by exact email, and by name phonetic key (Soundex of the last
+   name + first initial) together with email domain, agency or solution
+3. Score candidate pairs within each block only (name similarity plus
+   agreeing domain / agency / solution, minus conflicts)
+4. Union-find the matched pairs; each cluster gets a stable stakeholder_key
+   hashed from its smallest email (or name + agency when it has no email)
+
+Work grows with the number of rows, not the number of pairs.
+
+Outputs (next to mo_db_needs.csv by default):
+    stakeholders.csv          - one row per stakeholder
+    stakeholder_crosswalk.csv - need_id -> stakeholder_key
+
+Usage:
+    python stakeholder_resolution.py
+    python stakeholder_resolution.py --needs mo_db_needs.csv --output-dir out/ [--threshold 0.75]
+"""
+
+import argparse
+import hashlib
+import re
+import sys
+import unicodedata
+from collections import Counter, defaultdict
+from pathlib import Path
+
+import pandas as pd
+
+from dedupe_updates import UnionFind
+from extract_needs_data import OUTPUT_DIR
+from solution_name_index import edit_distance
+
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+NEEDS_CSV = OUTPUT_DIR / "mo_db_needs.csv"
+STAKEHOLDERS_FILE = "stakeholders.csv"
+CROSSWALK_FILE = "stakeholder_crosswalk.csv"
+
+STAKEHOLDER_COLUMNS = [
+    'stakeholder_key', 'name', 'email', 'department', 'agency', 'organization',
+    'name_variants', 'emails', 'solutions', 'survey_years', 'need_count',
+]
+
+# Pair scoring
+NAME_WEIGHT = 0.6
+DOMAIN_WEIGHT = 0.2
+AGENCY_WEIGHT = 0.2
+SOLUTION_WEIGHT = 0.2
+DOMAIN_CONFLICT_PENALTY = 0.2
+EMAIL_CONFLICT_PENALTY = 0.1
+DEFAULT_THRESHOLD = 0.75
+
+# Block members compared per row (blocks are name-sorted, so this only
+# bounds very common surnames within one agency)
+MAX_BLOCK_LOOKBACK = 25
+
+# Last names this long may differ by one edit (typos, transliteration)
+MIN_FUZZY_LAST_NAME = 5
+
+NAME_TITLES = {'dr', 'mr', 'mrs', 'ms', 'miss', 'prof', 'phd', 'md', 'jr', 'sr', 'ii', 'iii', 'iv'}
+ORG_STOPWORDS = {'the', 'of', 'and', 'for', 'u', 's', 'us', 'department', 'dept'}
+
+EMAIL_RE = re.compile(r'[a-z0-9._%+\-]+@[a-z0-9\-]+(?:\.[a-z0-9\-]+)+')
+WORD_RE = re.compile(r'[a-z]+')
+ACRONYM_RE = re.compile(r'\(([A-Za-z&]{2,10})\)')
+
+SOUNDEX_CODES = {c: str(d) for d, letters in enumerate(
+    ['aeiouyhw', 'bfpv', 'cgjkqsxz', 'dt', 'l', 'mn', 'r']) for c in letters}
+
+
+# =============================================================================
+# NORMALIZATION
+# =============================================================================
+
+def _ascii_lower(value):
+    if pd.isna(value):
+        return ''
+    text = unicodedata.normalize('NFKD', str(value)).encode('ascii', 'ignore').decode('ascii')
+    return text.strip().lower()
+
+
+def name_tokens(name):
+    """Lowercase name words, "Last, First" reordered, titles dropped"""
+    text = _ascii_lower(name).replace("'", '')
+    if ',' in text:
+        head, tail = text.split(',', 1)
+        tail_words = WORD_RE.findall(tail)
+        if tail_words and not set(tail_words) <= NAME_TITLES and len(WORD_RE.findall(head)) == 1:
+            text = f"{tail} {head}"
+    return [w for w in WORD_RE.findall(text) if w not in NAME_TITLES]
+
+
+def soundex(word):
+    """American Soundex code ('' for an empty word)"""
+    if not word:
+        return ''
+    code = word[0].upper()
+    previous = SOUNDEX_CODES.get(word[0], '')
+    for c in word[1:]:
+        digit = SOUNDEX_CODES.get(c, '')
+        if digit not in ('', '0') and digit != previous:
+            code += digit
+        if c not in 'hw':
+            previous = digit
+    return (code + '000')[:4]
+
+
+def normalize_email(value):
+    """First email address in the value, lowercased ('' if none)"""
+    m = EMAIL_RE.search(_ascii_lower(value))
+    return m.group(0).strip('.') if m else ''
+
+
+def email_domain(email):
+    """Registered domain: 'usgs.gov' for 'jdoe@er.usgs.gov', 'fs.fed.us' for '...@fs.fed.us'"""
+    if not email:
+        return ''
+    labels = email.rsplit('@', 1)[-1].split('.')
+    keep = 3 if len(labels) > 2 and len(labels[-1]) == 2 and len(labels[-2]) <= 3 else 2
+    return '.'.join(labels[-keep:])
+
+
+def normalize_org(value):
+    """Parenthesized acronym if present, else the significant words"""
+    if pd.isna(value):
+        return ''
+    m = ACRONYM_RE.search(str(value))
+    if m:
+        return m.group(1).lower()
+    words = [w for w in WORD_RE.findall(_ascii_lower(value).replace('.', '')) if w not in ORG_STOPWORDS]
+    return ' '.join(words)
+
+
+def column_values(df, column):
+    """Stripped strings of a column ('' for missing values and missing columns)"""
+    if column not in df.columns:
+        return pd.Series('', index=df.index)
+    values = df[column].astype(object).where(df[column].notna(), '').astype(str).str.strip()
+    return values.where(values.str.lower() != 'nan', '')
+
+
+def prepare_rows(needs):
+    """Normalized matching fields, one row per need row"""
+    tokens = column_values(needs, 'submitter_name').map(name_tokens)
+    rows = pd.DataFrame({
+        'name': tokens.map(' '.join),
+        'first': tokens.map(lambda t: t[0] if t else ''),
+        'last': tokens.map(lambda t: t[-1] if t else ''),
+        'email': column_values(needs, 'submitter_email').map(normalize_email),
+    }, index=needs.index)
+    rows['domain'] = rows['email'].map(email_domain)
+    agency = column_values(needs, 'agency').map(normalize_org)
+    department = column_values(needs, 'department').map(normalize_org)
+    rows['agency'] = agency.where(agency != '', department)
+    rows['solution'] = column_values(needs, 'solution').str.lower()
+    rows['phonetic'] = [soundex(last) + first[:1] if last else ''
+                        for first, last in zip(rows['first'], rows['last'])]
+    return rows
+
+
+# =============================================================================
+# BLOCKING AND SCORING
+# =============================================================================
+
+def block_keys(row):
+    """Blocks a normalized row belongs to"""
+    keys = []
+    if row.email:
+        keys.append(('email', row.email))
+    if row.phonetic:
+        if row.domain:
+            keys.append(('domain', row.domain, row.phonetic))
+        if row.agency:
+            keys.append(('agency', row.agency, row.phonetic))
+        if row.solution:
+            keys.append(('solution', row.solution, row.phonetic))
+    return keys
+
+
+def name_similarity(a_first, a_last, b_first, b_last):
+    """1.0 same name; less for an initial / short form or a one-letter last name typo; 0 otherwise"""
+    if not a_last or not b_last:
+        return 0.0
+    if a_last == b_last:
+        last = 1.0
+    elif min(len(a_last), len(b_last)) >= MIN_FUZZY_LAST_NAME and edit_distance(a_last, b_last, 1) <= 1:
+        last = 0.8
+    else:
+        return 0.0
+    if a_first == b_first:
+        return last
+    if a_first and b_first and (a_first.startswith(b_first) or b_first.startswith(a_first)):
+        return last * 0.9
+    return 0.0
+
+
+def score_pair(a, b):
+    """Match score for two normalized rows (1.0 for the same email)"""
+    if a.email and a.email == b.email:
+        return 1.0
+    similarity = name_similarity(a.first, a.last, b.first, b.last)
+    if not similarity:
+        return 0.0
+    score = NAME_WEIGHT * similarity
+    if a.domain and b.domain:
+        score += DOMAIN_WEIGHT if a.domain == b.domain else -DOMAIN_CONFLICT_PENALTY
+    if a.email and b.email:
+        score -= EMAIL_CONFLICT_PENALTY
+    if a.agency and a.agency == b.agency:
+        score += AGENCY_WEIGHT
+    if a.solution and a.solution == b.solution:
+        score += SOLUTION_WEIGHT
+    return score
+
+
+def resolve_clusters(rows, threshold=DEFAULT_THRESHOLD):
+    """
+    Cluster label per row (position of the cluster's first row); rows with
+    neither a name nor an email get -1.
+    """
+    records = list(rows.itertuples(index=False))
+    blocks = defaultdict(list)
+    for i in sorted(range(len(records)), key=lambda i: records[i].name):
+        for key in block_keys(records[i]):
+            blocks[key].append(i)
+
+    uf = UnionFind(len(records))
+    checked = set()
+    for key, members in blocks.items():
+        if key[0] == 'email':
+            for i in members[1:]:
+                uf.union(members[0], i)
+            continue
+        for pos, i in enumerate(members):
+            for j in members[max(0, pos - MAX_BLOCK_LOOKBACK):pos]:
+                pair = (min(i, j), max(i, j))
+                if pair in checked:
+                    continue
+                checked.add(pair)
+                if score_pair(records[i], records[j]) >= threshold:
+                    uf.union(i, j)
+
+    labels = uf.labels()
+    resolvable = (rows['name'] != '') | (rows['email'] != '')
+    labels[~resolvable.to_numpy()] = -1
+    return labels
+
+
+def stakeholder_keys(rows, labels):
+    """Stable key per row: hash of the cluster's smallest email, else smallest name|agency"""
+    identity = rows['email'].where(rows['email'] != '', '~' + rows['name'] + '|' + rows['agency'])
+    canonical = identity.groupby(labels).transform('min')
+    keys = canonical.map(lambda v: 'STK_' + hashlib.sha1(v.encode('utf-8')).hexdigest()[:10].upper())
+    return keys.where(labels >= 0, '')
+
+
+# =============================================================================
+# OUTPUT TABLES
+# =============================================================================
+
+def join_unique(values):
+    seen = []
+    for value in values:
+        value = str(value).strip()
+        if value and value != 'nan' and value not in seen:
+            seen.append(value)
+    return '; '.join(seen)
+
+
+def most_common(values):
+    """Most frequent non-empty value (longest on ties)"""
+    counts = Counter(v for v in values if v)
+    if not counts:
+        return ''
+    return max(counts, key=lambda v: (counts[v], len(v)))
+
+
+def resolve_stakeholders(needs, threshold=DEFAULT_THRESHOLD):
+    """
+    Resolve need rows to stakeholders.
+
+    Returns (stakeholders_df, crosswalk_df). The crosswalk has one row per
+    need row with its stakeholder_key ('' when the row names nobody).
+    """
+    needs = needs.reset_index(drop=True)
+    rows = prepare_rows(needs)
+    labels = resolve_clusters(rows, threshold)
+    keys = stakeholder_keys(rows, labels)
+
+    crosswalk = pd.DataFrame({
+        'need_id': column_values(needs, 'need_id'),
+        'solution': column_values(needs, 'solution'),
+        'survey_year': column_values(needs, 'survey_year'),
+        'submitter_name': column_values(needs, 'submitter_name'),
+        'submitter_email': column_values(needs, 'submitter_email'),
+        'stakeholder_key': keys,
+    })
+
+    members = crosswalk[keys != ''].assign(
+        department=column_values(needs, 'department'),
+        agency=column_values(needs, 'agency'),
+        organization=column_values(needs, 'organization'),
+        email=rows['email'],
+    )
+    if members.empty:
+        return pd.DataFrame(columns=STAKEHOLDER_COLUMNS), crosswalk
+
+    grouped = members.groupby('stakeholder_key', sort=True)
+    stakeholders = pd.DataFrame({
+        'name': grouped['submitter_name'].agg(most_common),
+        'email': grouped['email'].agg(most_common),
+        'department': grouped['department'].agg(most_common),
+        'agency': grouped['agency'].agg(most_common),
+        'organization': grouped['organization'].agg(most_common),
+        'name_variants': grouped['submitter_name'].agg(join_unique),
+        'emails': grouped['email'].agg(join_unique),
+        'solutions': grouped['solution'].agg(join_unique),
+        'survey_years': grouped['survey_year'].agg(lambda v: join_unique(sorted(set(v)))),
+        'need_count': grouped.size(),
+    }).reset_index()
+    return stakeholders[STAKEHOLDER_COLUMNS], crosswalk
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Resolve needs-survey respondents to stakeholders')
+    parser.add_argument('--needs', type=Path, default=NEEDS_CSV, help='MO-DB_Needs CSV (extract_needs_data.py)')
+    parser.add_argument('--output-dir', type=Path, help='Output directory (default: next to the needs CSV)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Min pair score to merge (default: {DEFAULT_THRESHOLD})')
+    args = parser.parse_args()
+
+    if not args.needs.exists():
+        raise SystemExit(f"ERROR: Input file not found: {args.needs}")
+    output_dir = args.output_dir or args.needs.parent
+
+    needs = pd.read_csv(args.needs, dtype=str)
+    print(f"Loaded {len(needs)} need rows")
+    if 'submitter_email' not in needs.columns:
+        print("Warning: submitter_email column not found (re-run extract_needs_data.py); matching on names only")
+
+    stakeholders, crosswalk = resolve_stakeholders(needs, args.threshold)
+    linked = crosswalk['stakeholder_key'] != ''
+    print(f"Resolved {linked.sum()} rows to {len(stakeholders)} stakeholders "
+          f"({(~linked).sum()} rows without a name or email)")
+    repeat = stakeholders[stakeholders['need_count'] > 1]
+    print(f"Stakeholders on more than one row: {len(repeat)}")
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stakeholders_path = output_dir / STAKEHOLDERS_FILE
+    crosswalk_path = output_dir / CROSSWALK_FILE
+    stakeholders.to_csv(stakeholders_path, index=False)
+    crosswalk.to_csv(crosswalk_path, index=False)
+    print(f"Saved: {stakeholders_path}")
+    print(f"Saved: {crosswalk_path}")
+
+
+if __name__ == '__main__':
+    main()
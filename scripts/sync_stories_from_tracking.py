@@ -16,341 +16,383 @@ Sheets processed:
 - Key Dates -> content_type: 'key_date'
 - Science Advancement Stories -> content_type: 'science_advancement'
 
+Story IDs are fingerprints of the source sheet and title (e.g.
+WEB-3FA9C2D1), so inserting a row no longer renumbers later stories;
+stories already in MO-DB_Stories keep the ID they have. With --delta, only
+new and changed stories are written, plus a Deleted tab listing stories
+whose source row is gone.
+
 Usage:
-    python sync_stories_from_tracking.py [--input PATH] [--output PATH]
+    python sync_stories_from_tracking.py [--input PATH] [--output PATH] [--delta] [--store [DB]]
 """
 
 import pandas as pd
 import argparse
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-import re
-
-
-def generate_story_id(counter, content_type):
-    """Generate unique story ID based on content type."""
-    prefix_map = {
-        'story': 'STORY',
-        'web_content': 'WEB',
-        'social_media': 'SOCIAL',
-        'nugget': 'NUG',
-        'key_date': 'DATE',
-        'science_advancement': 'SCI'
-    }
-    prefix = prefix_map.get(content_type, 'STORY')
-    return f"{prefix}-{counter:03d}"
-
-
-def normalize_status(status_value):
-    """Normalize status values to standard enum."""
-    if pd.isna(status_value) or not status_value:
-        return 'idea'
-
-    status_str = str(status_value).lower().strip()
-
-    # Map various status terms to standard values
-    status_map = {
-        'under review': 'review',
-        'in review': 'review',
-        'review': 'review',
-        'proposed': 'idea',
-        'idea': 'idea',
-        'researching': 'researching',
-        'research': 'researching',
-        'drafting': 'drafting',
-        'draft': 'drafting',
-        'writing': 'drafting',
-        'published': 'published',
-        'posted': 'published',
-        'live': 'published',
-        'archived': 'archived',
-        'cancelled': 'archived',
-        'on hold': 'idea'
-    }
-
-    return status_map.get(status_str, 'idea')
-
-
-def parse_date(date_value):
-    """Parse various date formats to YYYY-MM-DD string."""
-    if pd.isna(date_value) or not date_value:
-        return ''
-
-    if isinstance(date_value, datetime):
-        return date_value.strftime('%Y-%m-%d')
-
-    # Try common date formats
-    date_str = str(date_value).strip()
-    formats = ['%Y-%m-%d', '%m/%d/%Y', '%m-%d-%Y', '%B %d, %Y', '%b %d, %Y']
-
-    for fmt in formats:
-        try:
-            return datetime.strptime(date_str, fmt).strftime('%Y-%m-%d')
-        except ValueError:
-            continue
-
-    return date_str  # Return as-is if can't parse
-
-
-def extract_url_from_hyperlink(cell_value):
-    """Extract URL from cell that might be a hyperlink or plain text."""
-    if pd.isna(cell_value):
-        return ''
 
-    cell_str = str(cell_value)
+from date_parsing import parse_column
+from mo_db_store import DB_FILE, store_output
+
+# MO-DB_Stories column order
+STORY_COLUMNS = [
+    'story_id', 'title', 'content_type', 'status', 'solution_id',
+    'solution_names', 'channel', 'platform', 'author', 'comms_poc',
+    'pitch_doc_url', 'published_url', 'target_date', 'publish_date',
+    'idea_date', 'last_updated', 'timeliness_notes', 'notes',
+    'admin_priorities', 'source_sheet', 'source_row', 'created_date'
+]
+
+STORY_ID_PREFIXES = {
+    'story': 'STORY',
+    'web_content': 'WEB',
+    'social_media': 'SOCIAL',
+    'nugget': 'NUG',
+    'key_date': 'DATE',
+    'science_advancement': 'SCI'
+}
+
+# Map various status terms to standard values (anything else is an idea)
+STATUS_MAP = {
+    'under review': 'review',
+    'in review': 'review',
+    'review': 'review',
+    'proposed': 'idea',
+    'idea': 'idea',
+    'researching': 'researching',
+    'research': 'researching',
+    'drafting': 'drafting',
+    'draft': 'drafting',
+    'writing': 'drafting',
+    'published': 'published',
+    'posted': 'published',
+    'live': 'published',
+    'archived': 'archived',
+    'cancelled': 'archived',
+    'on hold': 'idea'
+}
+
+MARKDOWN_URL_RE = r'\[.*?\]\((https?://[^\)]+)\)'
+PLAIN_URL_RE = r'(https?://\S+)'
+
+
+def fingerprint_keys(stories):
+    """
+    Match key per story: source sheet + normalized title.
+
+    A title repeated within a sheet gets its occurrence number appended,
+    so duplicates stay distinct.
+    """
+    title = stories['title'].fillna('').astype(str).str.strip().str.lower()
+    base = stories['source_sheet'].fillna('').astype(str) + '|' + title
+    occurrence = base.groupby(base).cumcount()
+    return base.where(occurrence.eq(0), base + '|' + occurrence.astype(str))
+
+
+def fingerprint_ids(content_types, keys):
+    """Story IDs like WEB-3FA9C2D1 from the content type and match key."""
+    prefixes = content_types.map(STORY_ID_PREFIXES).fillna('STORY')
+    digests = [hashlib.sha1(key.encode('utf-8')).hexdigest()[:8].upper() for key in keys]
+    return prefixes + '-' + pd.Series(digests, index=keys.index)
+
+
+def row_hashes(stories, columns):
+    """Hash of each story's source-derived fields, to spot changed rows."""
+    values = stories.reindex(columns=columns).fillna('').astype(str)
+    joined = values.agg('\x1f'.join, axis=1) if len(values) else pd.Series(dtype=object)
+    return pd.Series([hashlib.sha1(v.encode('utf-8')).hexdigest() for v in joined],
+                     index=stories.index, dtype=object)
+
+
+def cell_text(df, column):
+    """Cells as str() would print them ('' if the sheet lacks the column)."""
+    if column not in df.columns:
+        return pd.Series('', index=df.index, dtype=object)
+    return df[column].map(str).astype(object)
+
+
+def stripped(df, column, default=''):
+    """Stripped cell text; missing cells (or column) become default."""
+    if column not in df.columns:
+        return pd.Series(default, index=df.index, dtype=object)
+    values = df[column]
+    return cell_text(df, column).str.strip().where(values.notna(), default)
+
+
+def normalize_status(values):
+    """Normalize a status column to the standard enum."""
+    text = values.map(str).str.lower().str.strip()
+    return text.map(STATUS_MAP).where(values.notna()).fillna('idea')
+
+
+def extract_urls(values):
+    """URL from each cell: markdown link first, then a plain URL, else ''."""
+    text = values.map(str).astype(object).where(values.notna(), '')
+    urls = text.str.extract(MARKDOWN_URL_RE, expand=False)
+    missing = urls.isna()
+    urls[missing] = text[missing].str.extract(PLAIN_URL_RE, expand=False)
+    return urls.fillna('').astype(object)
+
+
+def column_urls(df, column):
+    """extract_urls() of df[column] ('' if the sheet lacks the column)."""
+    if column not in df.columns:
+        return pd.Series('', index=df.index, dtype=object)
+    return extract_urls(df[column])
+
+
+def build_stories(df, keep, content_type, source_sheet, fields, today):
+    """
+    MO-DB_Stories rows for the rows of df selected by keep.
+
+    fields: {column: Series aligned with df, or one value for every row};
+    columns not given are ''. story_id is assigned later (assign_story_ids).
+    The Series fields are the ones compared in delta mode
+    (attrs['hash_columns']); constants and run dates are not.
+    """
+    rows = df.index[keep]
+    stories = pd.DataFrame(index=rows, columns=STORY_COLUMNS, dtype=object)
+    stories[:] = ''
+    for col, value in fields.items():
+        stories[col] = value[keep] if isinstance(value, pd.Series) else value
+    stories['content_type'] = content_type
+    stories['source_sheet'] = source_sheet
+    stories['source_row'] = rows + 2  # +2 for 1-based index + header row
+    stories['created_date'] = today
+    stories = stories.reset_index(drop=True)
+    stories.attrs['hash_columns'] = [col for col, value in fields.items() if isinstance(value, pd.Series)]
+    return stories
+
+
+def has_text(df, column):
+    """Rows whose column is present and not blank."""
+    return stripped(df, column).ne('')
 
-    # Check for markdown-style link
-    match = re.search(r'\[.*?\]\((https?://[^\)]+)\)', cell_str)
-    if match:
-        return match.group(1)
 
-    # Check for plain URL
-    match = re.search(r'(https?://\S+)', cell_str)
-    if match:
-        return match.group(1)
-
-    return ''
-
-
-def process_impact_story_pipeline(df, counter_start):
+def process_impact_story_pipeline(df, today):
     """Process Impact Story Pipeline sheet."""
-    stories = []
-    counter = counter_start
-
     # Expected columns: Title, Date of Idea, Date of Last Update, Status, Link to Slide, Source, Notes
-    for idx, row in df.iterrows():
-        title = row.get('Title', '')
-        if pd.isna(title) or not str(title).strip():
-            continue
-
-        counter += 1
-        stories.append({
-            'story_id': generate_story_id(counter, 'story'),
-            'title': str(title).strip(),
-            'content_type': 'story',
-            'status': normalize_status(row.get('Status', '')),
-            'solution_id': '',
-            'solution_names': '',
-            'channel': 'Internal',
-            'platform': 'Presentation',
-            'author': '',
-            'comms_poc': '',
-            'pitch_doc_url': extract_url_from_hyperlink(row.get('Link to Slide', '')),
-            'published_url': '',
-            'target_date': '',
-            'publish_date': '',
-            'idea_date': parse_date(row.get('Date of Idea', '')),
-            'last_updated': parse_date(row.get('Date of Last Update', '')),
-            'timeliness_notes': '',
-            'notes': f"Source: {row.get('Source', '')}. {row.get('Notes', '')}".strip('. '),
-            'source_sheet': 'Impact Story Pipeline',
-            'source_row': idx + 2,  # +2 for 1-based index + header row
-            'created_date': datetime.now().strftime('%Y-%m-%d')
-        })
-
-    return stories, counter
-
-
-def process_web_content(df, counter_start):
+    notes = ('Source: ' + cell_text(df, 'Source') + '. ' + cell_text(df, 'Notes')).str.strip('. ')
+    return build_stories(df, has_text(df, 'Title'), 'story', 'Impact Story Pipeline', {
+        'title': stripped(df, 'Title'),
+        'status': normalize_status(df['Status']) if 'Status' in df.columns else 'idea',
+        'channel': 'Internal',
+        'platform': 'Presentation',
+        'pitch_doc_url': column_urls(df, 'Link to Slide'),
+        'idea_date': parse_column(df, 'Date of Idea', 'stories'),
+        'last_updated': parse_column(df, 'Date of Last Update', 'stories'),
+        'notes': notes,
+    }, today)
+
+
+def process_web_content(df, today):
     """Process Web Content sheet."""
-    stories = []
-    counter = counter_start
-
     # Columns: Solution(s), Hyperlinked Title, Status, Pitch document, Primary outlet,
     #          Author(s), Comms POC, Published link, Publish date, Cross-posting,
     #          Social media, Timeliness consideration, Notes
-    for idx, row in df.iterrows():
-        title = row.get('Hyperlinked Title', '')
-        if pd.isna(title) or not str(title).strip():
-            continue
-
-        counter += 1
-        stories.append({
-            'story_id': generate_story_id(counter, 'web_content'),
-            'title': str(title).strip(),
-            'content_type': 'web_content',
-            'status': normalize_status(row.get('Status', '')),
-            'solution_id': '',
-            'solution_names': str(row.get('Solution(s)', '')).strip() if not pd.isna(row.get('Solution(s)', '')) else '',
-            'channel': str(row.get('Primary outlet', 'Earthdata')).strip() if not pd.isna(row.get('Primary outlet', '')) else 'Earthdata',
-            'platform': 'Website',
-            'author': str(row.get('Author(s)', '')).strip() if not pd.isna(row.get('Author(s)', '')) else '',
-            'comms_poc': str(row.get('Comms POC', '')).strip() if not pd.isna(row.get('Comms POC', '')) else '',
-            'pitch_doc_url': extract_url_from_hyperlink(row.get('Pitch document', '')),
-            'published_url': extract_url_from_hyperlink(row.get('Published link ', '')),
-            'target_date': '',
-            'publish_date': parse_date(row.get('Publish date', '')),
-            'idea_date': '',
-            'last_updated': datetime.now().strftime('%Y-%m-%d'),
-            'timeliness_notes': str(row.get('Timeliness consideration', '')).strip() if not pd.isna(row.get('Timeliness consideration', '')) else '',
-            'notes': f"Cross-posting: {row.get('Cross-posting', '')}. Social: {row.get('Social media', '')}. {row.get('Notes', '')}".strip('. '),
-            'source_sheet': 'Web Content',
-            'source_row': idx + 2,
-            'created_date': datetime.now().strftime('%Y-%m-%d')
-        })
-
-    return stories, counter
-
-
-def process_social_media(df, counter_start):
+    notes = ('Cross-posting: ' + cell_text(df, 'Cross-posting') + '. Social: ' + cell_text(df, 'Social media')
+             + '. ' + cell_text(df, 'Notes')).str.strip('. ')
+    return build_stories(df, has_text(df, 'Hyperlinked Title'), 'web_content', 'Web Content', {
+        'title': stripped(df, 'Hyperlinked Title'),
+        'status': normalize_status(df['Status']) if 'Status' in df.columns else 'idea',
+        'solution_names': stripped(df, 'Solution(s)'),
+        'channel': stripped(df, 'Primary outlet', 'Earthdata'),
+        'platform': 'Website',
+        'author': stripped(df, 'Author(s)'),
+        'comms_poc': stripped(df, 'Comms POC'),
+        'pitch_doc_url': column_urls(df, 'Pitch document'),
+        'published_url': column_urls(df, 'Published link '),
+        'publish_date': parse_column(df, 'Publish date', 'stories'),
+        'last_updated': today,
+        'timeliness_notes': stripped(df, 'Timeliness consideration'),
+        'notes': notes,
+    }, today)
+
+
+def process_social_media(df, today):
     """Process Social Media sheet."""
-    stories = []
-    counter = counter_start
-
     # Columns: Publish date, Published Link/Content Summary, Featured Solution(s),
     #          Platform, Comms POC, Status, Cross-posting, Notes
-    for idx, row in df.iterrows():
-        content = row.get('Published Link/Content Summary', '')
-        if pd.isna(content) or not str(content).strip():
-            continue
-
-        counter += 1
-        # Use content as title (truncated)
-        title = str(content).strip()[:100] + ('...' if len(str(content)) > 100 else '')
-
-        stories.append({
-            'story_id': generate_story_id(counter, 'social_media'),
-            'title': title,
-            'content_type': 'social_media',
-            'status': normalize_status(row.get('Status', '')),
-            'solution_id': '',
-            'solution_names': str(row.get('Featured Solution(s)', '')).strip() if not pd.isna(row.get('Featured Solution(s)', '')) else '',
-            'channel': 'Social Media',
-            'platform': str(row.get('Platform', '')).strip() if not pd.isna(row.get('Platform', '')) else '',
-            'author': '',
-            'comms_poc': str(row.get('Comms POC', '')).strip() if not pd.isna(row.get('Comms POC', '')) else '',
-            'pitch_doc_url': '',
-            'published_url': extract_url_from_hyperlink(content),
-            'target_date': '',
-            'publish_date': parse_date(row.get('Publish date', '')),
-            'idea_date': '',
-            'last_updated': datetime.now().strftime('%Y-%m-%d'),
-            'timeliness_notes': '',
-            'notes': f"Cross-posting: {row.get('Cross-posting', '')}. {row.get('Notes', '')}".strip('. '),
-            'source_sheet': 'Social Media',
-            'source_row': idx + 2,
-            'created_date': datetime.now().strftime('%Y-%m-%d')
-        })
-
-    return stories, counter
-
-
-def process_nugget_slides(df, counter_start):
+    content = cell_text(df, 'Published Link/Content Summary')
+    # Use content as title (truncated)
+    title = content.str.strip().str[:100] + content.str.len().gt(100).map({True: '...', False: ''})
+    notes = ('Cross-posting: ' + cell_text(df, 'Cross-posting') + '. ' + cell_text(df, 'Notes')).str.strip('. ')
+    return build_stories(df, has_text(df, 'Published Link/Content Summary'), 'social_media', 'Social Media', {
+        'title': title,
+        'status': normalize_status(df['Status']) if 'Status' in df.columns else 'idea',
+        'solution_names': stripped(df, 'Featured Solution(s)'),
+        'channel': 'Social Media',
+        'platform': stripped(df, 'Platform'),
+        'comms_poc': stripped(df, 'Comms POC'),
+        'published_url': column_urls(df, 'Published Link/Content Summary'),
+        'publish_date': parse_column(df, 'Publish date', 'stories'),
+        'last_updated': today,
+        'notes': notes,
+    }, today)
+
+
+def process_nugget_slides(df, today):
     """Process NuggetFeatured Slide sheet."""
-    stories = []
-    counter = counter_start
-
     # Columns: Date (hyperlink to slide), Title/Summary, Featured Solution(s),
     #          Forum/context, Leadership feedback, Notes
-    for idx, row in df.iterrows():
-        title = row.get('Title/Summary', '')
-        if pd.isna(title) or not str(title).strip():
-            continue
-
-        counter += 1
-        stories.append({
-            'story_id': generate_story_id(counter, 'nugget'),
-            'title': str(title).strip(),
-            'content_type': 'nugget',
-            'status': 'published',  # Nuggets are typically already presented
-            'solution_id': '',
-            'solution_names': str(row.get('Featured Solution(s)', '')).strip() if not pd.isna(row.get('Featured Solution(s)', '')) else '',
-            'channel': 'Internal',
-            'platform': 'Presentation',
-            'author': '',
-            'comms_poc': '',
-            'pitch_doc_url': extract_url_from_hyperlink(row.get('Date (hyperlink to slide)', '')),
-            'published_url': '',
-            'target_date': '',
-            'publish_date': parse_date(row.get('Date (hyperlink to slide)', '')),
-            'idea_date': '',
-            'last_updated': datetime.now().strftime('%Y-%m-%d'),
-            'timeliness_notes': '',
-            'notes': f"Forum: {row.get('Forum/context for slide (nugget, part of a broader strategy presentation, etc.)', '')}. Feedback: {row.get('Leadership feedback, if any', '')}. {row.get('Notes/reflections for next time', '')}".strip('. '),
-            'source_sheet': 'NuggetFeatured Slide',
-            'source_row': idx + 2,
-            'created_date': datetime.now().strftime('%Y-%m-%d')
-        })
-
-    return stories, counter
-
-
-def process_key_dates(df, counter_start):
+    notes = ('Forum: ' + cell_text(df, 'Forum/context for slide (nugget, part of a broader strategy presentation, etc.)')
+             + '. Feedback: ' + cell_text(df, 'Leadership feedback, if any')
+             + '. ' + cell_text(df, 'Notes/reflections for next time')).str.strip('. ')
+    return build_stories(df, has_text(df, 'Title/Summary'), 'nugget', 'NuggetFeatured Slide', {
+        'title': stripped(df, 'Title/Summary'),
+        'status': 'published',  # Nuggets are typically already presented
+        'solution_names': stripped(df, 'Featured Solution(s)'),
+        'channel': 'Internal',
+        'platform': 'Presentation',
+        'pitch_doc_url': column_urls(df, 'Date (hyperlink to slide)'),
+        'publish_date': parse_column(df, 'Date (hyperlink to slide)', 'stories'),
+        'last_updated': today,
+        'notes': notes,
+    }, today)
+
+
+def process_key_dates(df, today):
     """Process Key Dates sheet."""
-    stories = []
-    counter = counter_start
-
     # Columns: Date, Milestone (hyperlink if relevant), Related Solution(s), Additional Notes
-    for idx, row in df.iterrows():
-        milestone = row.get('Milestone (hyperlink if relevant)', '')
-        if pd.isna(milestone) or not str(milestone).strip():
-            continue
-
-        counter += 1
-        stories.append({
-            'story_id': generate_story_id(counter, 'key_date'),
-            'title': str(milestone).strip(),
-            'content_type': 'key_date',
-            'status': 'idea',  # Key dates are opportunities
-            'solution_id': '',
-            'solution_names': str(row.get('Related Solution(s)', '')).strip() if not pd.isna(row.get('Related Solution(s)', '')) else '',
-            'channel': '',
-            'platform': '',
-            'author': '',
-            'comms_poc': '',
-            'pitch_doc_url': extract_url_from_hyperlink(milestone),
-            'published_url': '',
-            'target_date': parse_date(row.get('Date', '')),
-            'publish_date': '',
-            'idea_date': datetime.now().strftime('%Y-%m-%d'),
-            'last_updated': datetime.now().strftime('%Y-%m-%d'),
-            'timeliness_notes': str(row.get('Additional Notes', '')).strip() if not pd.isna(row.get('Additional Notes', '')) else '',
-            'notes': '',
-            'source_sheet': 'Key Dates',
-            'source_row': idx + 2,
-            'created_date': datetime.now().strftime('%Y-%m-%d')
-        })
-
-    return stories, counter
-
-
-def process_science_advancement(df, counter_start):
+    return build_stories(df, has_text(df, 'Milestone (hyperlink if relevant)'), 'key_date', 'Key Dates', {
+        'title': stripped(df, 'Milestone (hyperlink if relevant)'),
+        'status': 'idea',  # Key dates are opportunities
+        'solution_names': stripped(df, 'Related Solution(s)'),
+        'pitch_doc_url': column_urls(df, 'Milestone (hyperlink if relevant)'),
+        'target_date': parse_column(df, 'Date', 'stories'),
+        'idea_date': today,
+        'last_updated': today,
+        'timeliness_notes': stripped(df, 'Additional Notes'),
+    }, today)
+
+
+def process_science_advancement(df, today):
     """Process Science Advancement Stories sheet."""
-    stories = []
-    counter = counter_start
-
     # Columns: Project, Related Files, Notes
-    for idx, row in df.iterrows():
-        project = row.get('Project', '')
-        if pd.isna(project) or not str(project).strip():
-            continue
-
-        counter += 1
-        stories.append({
-            'story_id': generate_story_id(counter, 'science_advancement'),
-            'title': str(project).strip(),
-            'content_type': 'science_advancement',
-            'status': 'idea',
-            'solution_id': '',
-            'solution_names': '',
-            'channel': '',
-            'platform': '',
-            'author': '',
-            'comms_poc': '',
-            'pitch_doc_url': extract_url_from_hyperlink(row.get('Related Files', '')),
-            'published_url': '',
-            'target_date': '',
-            'publish_date': '',
-            'idea_date': datetime.now().strftime('%Y-%m-%d'),
-            'last_updated': datetime.now().strftime('%Y-%m-%d'),
-            'timeliness_notes': '',
-            'notes': str(row.get('Notes', '')).strip() if not pd.isna(row.get('Notes', '')) else '',
-            'source_sheet': 'Science Advancement Stories',
-            'source_row': idx + 2,
-            'created_date': datetime.now().strftime('%Y-%m-%d')
-        })
-
-    return stories, counter
+    return build_stories(df, has_text(df, 'Project'), 'science_advancement', 'Science Advancement Stories', {
+        'title': stripped(df, 'Project'),
+        'status': 'idea',
+        'pitch_doc_url': column_urls(df, 'Related Files'),
+        'idea_date': today,
+        'last_updated': today,
+        'notes': stripped(df, 'Notes'),
+    }, today)
+
+
+# Sheets in story_id order
+SHEET_PROCESSORS = [
+    ('Impact Story Pipeline', process_impact_story_pipeline),
+    ('Web Content', process_web_content),
+    ('Social Media', process_social_media),
+    ('NuggetFeatured Slide', process_nugget_slides),
+    ('Key Dates', process_key_dates),
+    ('Science Advancement Stories', process_science_advancement),
+]
+
+
+def read_sheets(input_path, sheet_names):
+    """
+    Parse the workbook once; returns {sheet name: DataFrame}.
+
+    Sheets the workbook lacks are reported and left out.
+    """
+    with pd.ExcelFile(input_path) as workbook:
+        present = [name for name in sheet_names if name in workbook.sheet_names]
+        for name in sheet_names:
+            if name not in present:
+                print(f"  {name}: Error - Worksheet named '{name}' not found")
+        return pd.read_excel(workbook, sheet_name=present) if present else {}
+
+
+def transform_sheets(sheets, today, processors=SHEET_PROCESSORS):
+    """
+    Run each sheet's processor concurrently; returns [(sheet name, stories)]
+    in processor order.
+    """
+    jobs = [(name, processor) for name, processor in processors if name in sheets]
+
+    def run(job):
+        name, processor = job
+        try:
+            return name, processor(sheets[name], today)
+        except Exception as e:
+            print(f"  {name}: Error - {e}")
+            return name, None
+
+    with ThreadPoolExecutor(max_workers=len(jobs) or 1) as pool:
+        return [(name, stories) for name, stories in pool.map(run, jobs) if stories is not None]
+
+
+def load_existing(path):
+    """Current MO-DB_Stories as text (empty if the file is not there yet)."""
+    if not Path(path).exists():
+        return pd.DataFrame(columns=STORY_COLUMNS)
+    existing = pd.read_excel(path, sheet_name='Stories', dtype=str)
+    return existing.reindex(columns=STORY_COLUMNS).fillna('')
+
+
+def assign_story_ids(stories, existing):
+    """
+    Set story_id: the existing ID for stories already in MO-DB_Stories
+    (matched on sheet + title), a fingerprint ID for new ones.
+    """
+    keys = fingerprint_keys(stories)
+    known = dict(zip(fingerprint_keys(existing), existing['story_id']))
+    ids = keys.map(known)
+    stories['story_id'] = ids.where(ids.notna() & ids.ne(''), fingerprint_ids(stories['content_type'], keys))
+    return stories
+
+
+def diff_stories(results, existing):
+    """
+    Compare synced stories with MO-DB_Stories, per source sheet.
+
+    Returns (new and changed stories, tombstones). Tombstones are existing
+    stories from a synced sheet whose row is gone; sheets that failed to
+    load this run are left alone.
+    """
+    changed, deleted = [], []
+    existing = existing.reset_index(drop=True)
+    existing_keys = fingerprint_keys(existing)
+    for sheet_name, stories in results:
+        columns = stories.attrs.get('hash_columns', [])
+        old = existing[existing['source_sheet'].eq(sheet_name)]
+        old_hash = dict(zip(existing_keys[old.index], row_hashes(old, columns)))
+
+        keys = fingerprint_keys(stories)
+        hashes = row_hashes(stories, columns)
+        changed.append(stories[keys.map(old_hash).ne(hashes)])
+        deleted.append(old[~existing_keys[old.index].isin(set(keys))])
+
+    changed = pd.concat(changed, ignore_index=True) if changed else pd.DataFrame(columns=STORY_COLUMNS)
+    tombstones = pd.concat(deleted, ignore_index=True) if deleted else pd.DataFrame(columns=STORY_COLUMNS)
+    return changed[STORY_COLUMNS], tombstones[['story_id', 'title', 'source_sheet', 'source_row']]
+
+
+def write_delta(results, existing, output_path):
+    """
+    Write new/changed stories and tombstones next to MO-DB_Stories.
+    Returns (changed, tombstones).
+    """
+    changed, tombstones = diff_stories(results, existing)
+    delta_path = output_path.with_name(f"{output_path.stem}_delta.xlsx")
+
+    print(f"\n=== DELTA SYNC ===")
+    print(f"Existing stories: {len(existing)}")
+    print(f"New or changed: {len(changed)}")
+    print(f"Deleted: {len(tombstones)}")
+
+    if changed.empty and tombstones.empty:
+        print("\nMO-DB_Stories is up to date.")
+        return changed, tombstones
+
+    with pd.ExcelWriter(delta_path) as writer:
+        changed.to_excel(writer, index=False, sheet_name='Stories')
+        tombstones.to_excel(writer, index=False, sheet_name='Deleted')
+    print(f"Output: {delta_path}")
+    return changed, tombstones
 
 
 def main():
@@ -361,6 +403,10 @@ def main():
     parser.add_argument('--output', '-o',
                         default='database-files/MO-Viewer Databases/MO-DB_Stories.xlsx',
                         help='Path to output MO-DB_Stories file')
+    parser.add_argument('--delta', action='store_true',
+                        help='Write only new/changed stories and deletions to <output>_delta.xlsx')
+    parser.add_argument('--store', nargs='?', const=DB_FILE, type=Path, metavar='DB',
+                        help=f'Also upsert the stories into the local store (default: {DB_FILE})')
     args = parser.parse_args()
 
     # Resolve paths
@@ -371,62 +417,48 @@ def main():
     print(f"Reading from: {input_path}")
     print(f"Writing to: {output_path}")
 
-    all_stories = []
-    counter = 0
-
-    # Process each sheet
-    sheet_processors = [
-        ('Impact Story Pipeline', process_impact_story_pipeline),
-        ('Web Content', process_web_content),
-        ('Social Media', process_social_media),
-        ('NuggetFeatured Slide', process_nugget_slides),
-        ('Key Dates', process_key_dates),
-        ('Science Advancement Stories', process_science_advancement),
-    ]
-
-    for sheet_name, processor in sheet_processors:
-        try:
-            df = pd.read_excel(input_path, sheet_name=sheet_name)
-            stories, counter = processor(df, counter)
-            print(f"  {sheet_name}: {len(stories)} stories extracted")
-            all_stories.extend(stories)
-        except Exception as e:
-            print(f"  {sheet_name}: Error - {e}")
+    today = datetime.now().strftime('%Y-%m-%d')
+
+    # Parse the workbook once, then transform the sheets side by side
+    try:
+        sheets = read_sheets(input_path, [name for name, _ in SHEET_PROCESSORS])
+    except Exception as e:
+        print(f"  Error reading workbook - {e}")
+        sheets = {}
+    results = transform_sheets(sheets, today)
+    existing = load_existing(output_path)
+    for sheet_name, stories in results:
+        assign_story_ids(stories, existing)
+        print(f"  {sheet_name}: {len(stories)} stories extracted")
+
+    if args.delta:
+        changed, tombstones = write_delta(results, existing, output_path)
+        if args.store:
+            store_output('stories', changed, args.store, deleted=tombstones['story_id'])
+        return
 
     # Create DataFrame and save
-    if all_stories:
-        result_df = pd.DataFrame(all_stories)
-
-        # Ensure column order
-        columns = [
-            'story_id', 'title', 'content_type', 'status', 'solution_id',
-            'solution_names', 'channel', 'platform', 'author', 'comms_poc',
-            'pitch_doc_url', 'published_url', 'target_date', 'publish_date',
-            'idea_date', 'last_updated', 'timeliness_notes', 'notes',
-            'admin_priorities', 'source_sheet', 'source_row', 'created_date'
-        ]
-        # Add admin_priorities column if missing (for stories without priority tags)
-        if 'admin_priorities' not in result_df.columns:
-            result_df['admin_priorities'] = ''
-        result_df = result_df[columns]
+    frames = [stories for _, stories in results if len(stories)]
+    if frames:
+        result_df = pd.concat(frames, ignore_index=True)[STORY_COLUMNS]
 
         # Save to Excel
         result_df.to_excel(output_path, index=False, sheet_name='Stories')
+        if args.store:
+            store_output('stories', result_df, args.store, replace=True)
 
         print(f"\n=== SYNC COMPLETE ===")
-        print(f"Total stories: {len(all_stories)}")
+        print(f"Total stories: {len(result_df)}")
         print(f"Output: {output_path}")
 
         # Summary by content type
         print("\nBy content type:")
-        for ct in result_df['content_type'].unique():
-            count = len(result_df[result_df['content_type'] == ct])
+        for ct, count in result_df['content_type'].value_counts(sort=False).items():
             print(f"  {ct}: {count}")
 
         # Summary by status
         print("\nBy status:")
-        for status in result_df['status'].unique():
-            count = len(result_df[result_df['status'] == status])
+        for status, count in result_df['status'].value_counts(sort=False).items():
             print(f"  {status}: {count}")
     else:
         print("\nNo stories found to sync.")
@@ -0,0 +1,511 @@
+# -*- coding: utf-8 -*-
+"""
+Shared Text Normalization Rules for Update Extraction
+======================================================
+One home for the boilerplate-removal and skip rules used by the update
+extractors (weekly, monthly pptx/docx, SEP). Each rule family is compiled
+once into a single alternation, so a cleaner makes one regex pass per text
+instead of one pass per pattern.
+
+Every rule has a scalar API (one string) and a batch API (pandas Series)
+that give identical results, so a whole update history can be cleaned in
+one vectorized pass.
+
+Profiles select the rule set of the source being cleaned:
+    weekly  - Weekly Internal Planning notes (consolidate_weekly_updates.py)
+    monthly - Monthly status decks and docs (combine_monthly_updates.py)
+    sep     - SEP meeting notes (extract_sep_updates.py)
+
+Usage:
+    python text_normalization.py --check        # Verify against golden corpus
+    python text_normalization.py --regenerate   # Rewrite golden expectations
+"""
+
+import argparse
+import json
+import re
+import warnings
+from pathlib import Path
+
+import pandas as pd
+
+GOLDEN_CORPUS_PATH = Path(__file__).parent / "text_normalization_golden.json"
+
+# Boilerplate removal passes are repeated until nothing matches, so a removal
+# that exposes another rule (e.g. nested bullets) is also cleaned. Real text
+# settles in one or two passes; this is only a safety bound.
+# Unlike the old one-pass-per-pattern loops, a repeated marker is removed
+# whole: '• • text' now cleans to 'text' (the old loop left '• text').
+MAX_REMOVAL_PASSES = 5
+
+# Minimum length for an update to count as real content
+MIN_MEANINGFUL_LENGTH = 30
+MIN_TEMPLATE_LENGTH = 20
+MIN_LINE_LENGTH = 5
+
+
+# =============================================================================
+# RULE FAMILIES
+# =============================================================================
+
+# Boilerplate removed from update text, per source profile
+BOILERPLATE_PATTERNS = {
+    'weekly': [
+        r'^\s*•\s*',  # Leading bullet
+        r'^\s*○\s*',  # Leading circle
+        r'^\s*■\s*',  # Leading square
+        r'Action:\s*.*$',  # Action items (multiline)
+        r'ACTION:\s*.*$',
+        r'\[Action\].*$',
+    ],
+    'monthly': [
+        r'Project Status\s*\n?',
+        r'Project Phase:\s*(Operations|Implementation|Planning|Development|Production \+ Development)\s*\n?',
+        r'Project Description\s*\n?',
+        r'Solution Products?\s*\(acronyms and definitions\):\s*',
+        r'Solution Products?:\s*\n?',
+        # Clean up the long question headers (various formats)
+        r'What have I done to ensure that my solution is the right fit for end users and/or is achieving its intended impact\?[^\n]*\n?',
+        r'What have I done to ensure that my solution is the right fit[^\n]*\n?',
+        r'What programmatic/project timeline milestones have occurred this month\?\s*\n?',
+        r'What software/hardware/location/product development milestones have occurred this month\?\s*\n?',
+        r'The SNWG MO can help me with this roadblock or challenge:\s*\n?',
+        # Simplified versions with markdown
+        r'\*\*What have I done.*?\*\*\s*\n?',
+        r'\*\*What programmatic.*?\*\*\s*\n?',
+        r'\*\*What software.*?\*\*\s*\n?',
+        r'\*\*The SNWG MO can help.*?\*\*\s*\n?',
+        # Without markdown
+        r'What have I done to ensure[^\n]*\?\s*\n?',
+        r'What programmatic[^\n]*\?\s*\n?',
+        r'What software[^\n]*\?\s*\n?',
+        r'Production status\?\s*\n?',
+        # Other boilerplate
+        r'\(e\.?g\.?,?\s*user engagement[^\)]*\)\s*\n?',
+        r'products?\s*\(acronyms and definitions\):\s*If needed\s*\n?',
+        r'/Implementation\s*\n?',
+        r'/Operations\s*\n?',
+        r'Provided by the SNWG MO\s*\n?',
+        r'^Today\s*\n?',
+    ],
+    'sep': [
+        r'^\s*•\s*',
+        r'^\s*○\s*',
+        r'Action:\s*.*$',
+        r'ACTION:\s*.*$',
+    ],
+}
+
+# Monthly notes are free text blocks; the other sources are line oriented
+BOILERPLATE_FLAGS = {
+    'weekly': re.IGNORECASE | re.MULTILINE,
+    'monthly': re.IGNORECASE,
+    'sep': re.IGNORECASE | re.MULTILINE,
+}
+
+# Updates that are only a placeholder (matched against lowercased text)
+NOT_MEANINGFUL_PATTERNS = {
+    'weekly': [
+        r'^n/a\s*$',
+        r'^none\s*$',
+        r'^no\s+update\s*$',
+        r'^tbd\s*$',
+        r'^no\s+new\s+updates?\s*$',
+        r'^\s*$',
+        r'^air quality\s*\(gsfc\)',  # Header only
+        r'^gmao\s*$',
+        r'^pm2\.5\s*$',
+        r'^pandora\s+sensors?\s*$',
+        r'^poc:\s*',  # Point of contact lines
+        r'^next\s+steps?:\s*wait',  # Waiting placeholders
+        r'^next\s+deliverable.*:$',  # Empty deliverable lines
+        r'^updates?\s+pending\s+',  # Pending updates
+        r'^delay\s+this\s+',  # Delay notes
+        r'^note:\s*\w+\s+on\s+leave',  # Leave notices
+        r'^verify\s+data\s+input',  # Admin tasks
+        r'^pi\s+objectives\s+review',  # Just headers
+        r'deep\s+dive.*\d{1,2}[;:]\s*\d',  # Event scheduling
+    ],
+    'monthly': [
+        r'^n/a\s*$',
+        r'^none\s*$',
+        r'^no\s+update\s*$',
+        r'^tbd\s*$',
+        r'^operations\s*$',
+        r'^provided\s+by\s+the\s+snwg',
+        r'^today\s*$',
+    ],
+    'sep': [
+        r'^n/a\s*$',
+        r'^none\s*$',
+        r'^no\s+update\s*$',
+        r'^tbd\s*$',
+    ],
+}
+
+# Slide/section text that is only template boilerplate (lowercased, searched)
+TEMPLATE_TEXT_PATTERNS = [
+    r'^project\s+status\s*$',
+    r'^project\s+status\s*\n\s*project\s+phase',
+    r'^project\s+phase\s*:\s*(operations|implementation|planning|development)',
+    r'^solution\s+products?\s*\(acronyms',
+    r'^solution\s+products?\s*:',
+    r'^what\s+have\s+i\s+done.*?\?\s*$',
+    r'^what\s+programmatic.*?\?\s*$',
+    r'^what\s+software.*?\?\s*$',
+    r'^the\s+snwg\s+mo\s+can\s+help.*?\s*$',
+    r'^n/a\s*$',
+    r'^none\s*$',
+    r'^no\s+update\s*$',
+    r'^tbd\s*$',
+    r'sneaky\s*slide',
+    r'^project\s+description\s*$',
+]
+
+# Long question headers in monthly slides, replaced with short labels
+SECTION_HEADER_REPLACEMENTS = [
+    (r'\*\*What have I done to ensure that my solution is the right fit for end users and/or is achieving its intended impact\?.*?\*\*\s*', 'User Engagement: '),
+    (r'\*\*What programmatic/project timeline milestones have occurred this month\?\*\*\s*', 'Milestones: '),
+    (r'\*\*What software/hardware/location/product development milestones have occurred this month\?\*\*\s*', 'Development: '),
+    (r'\*\*The SNWG MO can help me with this roadblock or challenge:\*\*\s*', 'Needs Help: '),
+    (r'Project Status\s*\n\s*Project Phase:\s*\w+\s*\n?', ''),
+    (r'Solution Products?\s*\(acronyms and definitions\):\s*', 'Products: '),
+    (r'Project Description\s*\n?', ''),
+]
+
+# Slides to skip (not solution-specific updates), matched on lowercased title
+SKIP_TITLE_PATTERNS = [
+    r'^agenda',
+    r'^snwg\s+(headquarters|hq)',
+    r'^solution\s+team\s+folders',
+    r'^insert\s+impact',
+    r'^cycle\s+\d+\s+\(\d{4}\)',  # "Cycle 1 (2016)" divider slides
+    r'^assessment',
+    r'^appendix',
+    r'^thank\s*you',
+    r'^questions',
+    r'^backup',
+    r'^management\s+office',
+    r'^nsite\s+mo\s+slide',
+    r'^satellite\s+needs\s+working\s+group\s+management',  # Title slide
+    r'^\[project\s+name\]',  # Template placeholder
+    r'^project\s+name',  # Template placeholder
+    r'^cycle\s+\d+[:\s]',  # "Cycle 2: Land Surface" divider slides
+    r'^\[project\]',  # Template placeholder
+    r'^\d{4}\s+snwg\s+assessment',  # Assessment slides
+    r'^status\s+and\s+near',  # Non-solution slides
+    r'^snwg\s+sep',  # SEP overview slides
+    r'^sep\s+',  # SEP slides
+]
+
+# Lines to skip in monthly meeting docs (headers, agenda items, etc.)
+SKIP_LINE_PATTERNS = [
+    r'^SNWG Monthly Meeting',
+    r'^AGENDA:?$',
+    r'^Moderator',
+    r'^Recording',
+    r'^Previous Meeting Notes',
+    r'^I\.\s+Introduction',
+    r'^II\.\s+Verbal Status',
+    r'^III\.',
+    r'^IV\.',
+    r'^Cycle\s+\d+',
+    r'^\d+\.\s+(Introduction|Meeting Series)',
+    r'^Announcements:?$',
+    r'^Notes on Open Source',
+    r'^Quick Verbal Status',
+    r'^Action:',
+    r'^ACTION:',
+]
+
+# Date-only and time-only lines (the date rule is case-sensitive)
+SKIP_LINE_DATE_PATTERN = r'^[A-Z][a-z]+\s+\d{1,2},?\s+\d{4}'
+SKIP_LINE_TIME_PATTERN = r'^\d{1,2}:\d{2}\s*(AM|PM|CT|ET|PT)'
+
+
+def compile_alternation(patterns, flags=0):
+    """Compile a list of patterns into one regex that matches any of them"""
+    return re.compile('|'.join(f'(?:{p})' for p in patterns), flags)
+
+
+def compile_replacements(replacements, flags=0):
+    """Compile (pattern, replacement) pairs into one regex plus a lookup"""
+    combined = '|'.join(f'(?P<r{i}>{p})' for i, (p, _) in enumerate(replacements))
+    lookup = {f'r{i}': repl for i, (_, repl) in enumerate(replacements)}
+    return re.compile(combined, flags), lookup
+
+
+BOILERPLATE_RE = {
+    profile: compile_alternation(patterns, BOILERPLATE_FLAGS[profile])
+    for profile, patterns in BOILERPLATE_PATTERNS.items()
+}
+NOT_MEANINGFUL_RE = {
+    profile: compile_alternation(patterns)
+    for profile, patterns in NOT_MEANINGFUL_PATTERNS.items()
+}
+TEMPLATE_TEXT_RE = compile_alternation(TEMPLATE_TEXT_PATTERNS)
+SECTION_HEADER_RE, SECTION_HEADER_LOOKUP = compile_replacements(
+    SECTION_HEADER_REPLACEMENTS, re.IGNORECASE
+)
+SKIP_TITLE_RE = compile_alternation(SKIP_TITLE_PATTERNS)
+SKIP_LINE_RE = compile_alternation(
+    [f'(?i:{p})' for p in SKIP_LINE_PATTERNS]
+    + [SKIP_LINE_DATE_PATTERN, f'(?i:{SKIP_LINE_TIME_PATTERN})']
+)
+EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+
+PROFILES = tuple(BOILERPLATE_PATTERNS)
+
+
+def _check_profile(profile):
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown profile '{profile}' (expected one of {', '.join(PROFILES)})")
+
+
+def _section_header_repl(match):
+    return SECTION_HEADER_LOOKUP[match.lastgroup]
+
+
+# =============================================================================
+# SCALAR API
+# =============================================================================
+
+def _as_text(text):
+    """Coerce a cell value to str, mapping empty/NaN to ''"""
+    if text is None or (not isinstance(text, str) and pd.isna(text)):
+        return ''
+    return str(text)
+
+
+def _remove_to_fixpoint(regex, text):
+    for _ in range(MAX_REMOVAL_PASSES):
+        text, count = regex.subn('', text)
+        if not count:
+            break
+    return text
+
+
+def clean_update_text(text, profile='weekly'):
+    """Clean boilerplate and standardize formatting"""
+    _check_profile(profile)
+    text = _as_text(text)
+    if not text:
+        return ''
+
+    text = _remove_to_fixpoint(BOILERPLATE_RE[profile], text)
+    text = EXCESS_NEWLINES_RE.sub('\n\n', text)
+    return text.strip()
+
+
+def is_meaningful_update(text, profile='weekly'):
+    """Check if update has real content"""
+    _check_profile(profile)
+    if not text or len(text) < MIN_MEANINGFUL_LENGTH:
+        return False
+    return not NOT_MEANINGFUL_RE[profile].match(text.lower().strip())
+
+
+def is_template_text(text):
+    """Check if text is just template/boilerplate"""
+    text_lower = text.lower().strip()
+    if TEMPLATE_TEXT_RE.search(text_lower):
+        return True
+    # Very short text with no real content
+    return len(text_lower) < MIN_TEMPLATE_LENGTH
+
+
+def clean_section_headers(text):
+    """Remove or simplify section header boilerplate"""
+    result = SECTION_HEADER_RE.sub(_section_header_repl, text)
+    result = EXCESS_NEWLINES_RE.sub('\n\n', result)
+    return result.strip()
+
+
+def should_skip_slide(title):
+    """Check if this slide should be skipped (not a solution update)"""
+    if not title:
+        return True
+    return bool(SKIP_TITLE_RE.search(title.lower().strip()))
+
+
+def should_skip_line(text):
+    """Check if line should be skipped"""
+    if not text or len(text.strip()) < MIN_LINE_LENGTH:
+        return True
+    return bool(SKIP_LINE_RE.match(text.strip()))
+
+
+# =============================================================================
+# BATCH API (pandas Series)
+# =============================================================================
+
+def _as_text_series(series):
+    return series.fillna('').astype(str)
+
+
+def _contains(series, regex):
+    # Rule patterns keep their own groups; pandas warns about them on contains()
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', UserWarning)
+        return series.str.contains(regex)
+
+
+def _remove_to_fixpoint_series(regex, series):
+    for _ in range(MAX_REMOVAL_PASSES):
+        pending = _contains(series, regex)
+        if not pending.any():
+            break
+        series = series.where(~pending, series[pending].str.replace(regex, '', regex=True))
+    return series
+
+
+def clean_update_text_series(series, profile='weekly'):
+    """Vectorized clean_update_text over a Series of update texts"""
+    _check_profile(profile)
+    result = _remove_to_fixpoint_series(BOILERPLATE_RE[profile], _as_text_series(series))
+    result = result.str.replace(EXCESS_NEWLINES_RE, '\n\n', regex=True)
+    return result.str.strip()
+
+
+def is_meaningful_update_series(series, profile='weekly'):
+    """Vectorized is_meaningful_update; returns a boolean Series"""
+    _check_profile(profile)
+    text = _as_text_series(series)
+    long_enough = text.str.len() >= MIN_MEANINGFUL_LENGTH
+    placeholder = text.str.lower().str.strip().str.match(NOT_MEANINGFUL_RE[profile])
+    return long_enough & ~placeholder
+
+
+def is_template_text_series(series):
+    """Vectorized is_template_text; returns a boolean Series"""
+    text_lower = _as_text_series(series).str.lower().str.strip()
+    return _contains(text_lower, TEMPLATE_TEXT_RE) | (text_lower.str.len() < MIN_TEMPLATE_LENGTH)
+
+
+def clean_section_headers_series(series):
+    """Vectorized clean_section_headers over a Series of slide texts"""
+    result = _as_text_series(series).str.replace(SECTION_HEADER_RE, _section_header_repl, regex=True)
+    result = result.str.replace(EXCESS_NEWLINES_RE, '\n\n', regex=True)
+    return result.str.strip()
+
+
+def should_skip_slide_series(series):
+    """Vectorized should_skip_slide; returns a boolean Series"""
+    title = _as_text_series(series)
+    return (title == '') | _contains(title.str.lower().str.strip(), SKIP_TITLE_RE)
+
+
+def should_skip_line_series(series):
+    """Vectorized should_skip_line; returns a boolean Series"""
+    stripped = _as_text_series(series).str.strip()
+    return (stripped.str.len() < MIN_LINE_LENGTH) | stripped.str.match(SKIP_LINE_RE)
+
+
+def compile_ordered_substrings(keys):
+    """
+    One regex whose group i matches when keys[i] occurs in the text and no
+    earlier key does, so priority follows the key order rather than the
+    leftmost position in the text.
+    """
+    return re.compile('^(?:' + '|'.join(f'.*?({re.escape(k)})' for k in keys) + ')', re.DOTALL)
+
+
+def first_substring_match_series(series, mapping):
+    """
+    Column-wise `next(v for k, v in mapping.items() if k in text.lower())`.
+
+    mapping: {lowercase substring: value}, checked in order. Returns an
+    object Series of values, None where no key occurs.
+    """
+    keys = list(mapping)
+    groups = _as_text_series(series).str.lower().str.extract(compile_ordered_substrings(keys))
+    matched = groups.bfill(axis=1).iloc[:, 0] if len(keys) else pd.Series(index=series.index)
+    values = matched.map(mapping)
+    return values.astype(object).where(values.notna(), None)
+
+
+# =============================================================================
+# GOLDEN CORPUS
+# =============================================================================
+
+SCALAR_FUNCTIONS = {
+    'clean_update_text': clean_update_text,
+    'is_meaningful_update': is_meaningful_update,
+    'is_template_text': is_template_text,
+    'clean_section_headers': clean_section_headers,
+    'should_skip_slide': should_skip_slide,
+    'should_skip_line': should_skip_line,
+}
+
+BATCH_FUNCTIONS = {
+    'clean_update_text': clean_update_text_series,
+    'is_meaningful_update': is_meaningful_update_series,
+    'is_template_text': is_template_text_series,
+    'clean_section_headers': clean_section_headers_series,
+    'should_skip_slide': should_skip_slide_series,
+    'should_skip_line': should_skip_line_series,
+}
+
+
+def _call(functions, case, value):
+    args = [case['profile']] if case.get('profile') else []
+    return functions[case['function']](value, *args)
+
+
+def check_golden_corpus(path=GOLDEN_CORPUS_PATH):
+    """Run every golden case through the scalar and batch APIs; return failures"""
+    cases = json.loads(path.read_text(encoding='utf-8'))
+    failures = []
+
+    for case in cases:
+        scalar = _call(SCALAR_FUNCTIONS, case, case['input'])
+        if scalar != case['expected']:
+            failures.append((case, 'scalar', scalar))
+
+    # Batch: one Series per function/profile, as the extractors use it
+    groups = {}
+    for case in cases:
+        groups.setdefault((case['function'], case.get('profile')), []).append(case)
+    for group in groups.values():
+        series = pd.Series([c['input'] for c in group])
+        batch = _call(BATCH_FUNCTIONS, group[0], series).tolist()
+        for case, value in zip(group, batch):
+            value = bool(value) if isinstance(case['expected'], bool) else value
+            if value != case['expected']:
+                failures.append((case, 'batch', value))
+
+    return cases, failures
+
+
+def regenerate_golden_corpus(path=GOLDEN_CORPUS_PATH):
+    """Recompute expected outputs after an intentional rule change"""
+    cases = json.loads(path.read_text(encoding='utf-8'))
+    for case in cases:
+        case['expected'] = _call(SCALAR_FUNCTIONS, case, case['input'])
+    path.write_text(json.dumps(cases, indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+    return cases
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Shared update text normalization rules')
+    parser.add_argument('--check', action='store_true', help='Verify rules against the golden corpus')
+    parser.add_argument('--regenerate', action='store_true', help='Rewrite golden corpus expectations')
+    args = parser.parse_args()
+
+    if args.regenerate:
+        cases = regenerate_golden_corpus()
+        print(f"Regenerated {len(cases)} golden cases: {GOLDEN_CORPUS_PATH}")
+        return
+
+    cases, failures = check_golden_corpus()
+    for case, api, actual in failures:
+        print(f"FAIL [{api}] {case['function']}({case.get('profile') or ''}): {case['input']!r}")
+        print(f"  expected: {case['expected']!r}")
+        print(f"  actual:   {actual!r}")
+    print(f"{len(cases) - len({id(c) for c, _, _ in failures})}/{len(cases)} golden cases passed")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
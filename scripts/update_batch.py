@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Columnar Update Builder
+=======================
+Shared record builder for the update extractors, in place of a 10-12 key
+dict per update collected in an all_updates list.
+
+- values go straight into one list per column
+- created_at is stamped once per run, not datetime.now() per record
+- source/category/date style columns are interned, so repeated strings
+  ('Monthly Status Meeting', 'MO', a file name) are stored once
+- to_frame() builds the DataFrame from the column lists directly, with
+  category dtype for those repeated-value columns
+
+Usage:
+    from update_batch import UpdateBatch
+    batch = UpdateBatch(defaults={'source_document': 'SEP Meeting'}, id_factory=generate_update_id)
+    batch.append(solution_id='HLS', update_text=text, meeting_date='2024-03-11')
+    df = batch.to_frame()
+"""
+
+from datetime import datetime
+
+import pandas as pd
+
+# MO-DB_Updates columns
+UPDATE_COLUMNS = [
+    'update_id', 'solution_id', 'update_text', 'source_document',
+    'source_category', 'source_url', 'source_tab', 'meeting_date',
+    'created_at', 'created_by'
+]
+
+# Few distinct values per run; interned while building, category in the frame
+CATEGORY_COLUMNS = (
+    'solution_id', 'source_document', 'source_category', 'source_url',
+    'source_tab', 'meeting_date', 'created_at', 'created_by', 'presenter'
+)
+
+
+class UpdateBatch:
+    """Extracted updates held as one list per column"""
+
+    def __init__(self, columns=UPDATE_COLUMNS, defaults=None, id_factory=None, created_at=None):
+        """
+        columns: output columns (extra tracking columns are fine).
+        defaults: {column: value} for columns an append leaves out; anything
+        else missing is ''. id_factory: called for update_id when an append
+        has none. created_at: run timestamp (default: now).
+        """
+        self.columns = list(columns)
+        self.created_at = created_at or datetime.now().isoformat()
+        self.defaults = dict.fromkeys(self.columns, '')
+        if 'created_at' in self.defaults:
+            self.defaults['created_at'] = self.created_at
+        self.defaults.update(defaults or {})
+        self.id_factory = id_factory
+        self._data = {col: [] for col in self.columns}
+        self._interned = {}
+
+    def __len__(self):
+        return len(self._data[self.columns[0]]) if self.columns else 0
+
+    def _intern(self, value):
+        """One shared copy per distinct string"""
+        if isinstance(value, str):
+            return self._interned.setdefault(value, value)
+        return value
+
+    def append(self, **values):
+        """Add one update; returns its row number"""
+        unknown = values.keys() - self._data.keys()
+        if unknown:
+            raise KeyError(f"Unknown update columns: {', '.join(sorted(unknown))}")
+        if self.id_factory and 'update_id' in self._data and not values.get('update_id'):
+            values['update_id'] = self.id_factory()
+
+        for col, items in self._data.items():
+            value = values.get(col, self.defaults[col])
+            items.append(self._intern(value) if col in CATEGORY_COLUMNS else value)
+        return len(self) - 1
+
+    def extend(self, other):
+        """Append every row of another batch (shared columns; others get defaults)"""
+        count = len(other)
+        for col, items in self._data.items():
+            if col in other._data:
+                items.extend(self._intern(v) if col in CATEGORY_COLUMNS else v for v in other._data[col])
+            else:
+                items.extend([self.defaults[col]] * count)
+
+    def column(self, name):
+        """The list of values for one column (not a copy)"""
+        return self._data[name]
+
+    def set_values(self, column, value, start=0):
+        """Overwrite a column from row `start` on (e.g. a folder-wide solution_id)"""
+        items = self._data[column]
+        items[start:] = [self._intern(value)] * (len(items) - start)
+
+    def truncate(self, length):
+        """Drop every row from `length` on (e.g. a file that failed part-way)"""
+        for items in self._data.values():
+            del items[length:]
+
+    def to_frame(self, columns=None):
+        """DataFrame of the batch (default all columns), repeated-value columns as category"""
+        columns = list(columns) if columns is not None else self.columns
+        data = {}
+        for col in columns:
+            values = self._data[col]
+            data[col] = pd.Categorical(values) if col in CATEGORY_COLUMNS else values
+        return pd.DataFrame(data, columns=columns)
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+Year-Sharded Update Writer
+==========================
+Shared partition-and-write step for the update import files
+(all_updates_import.xlsx, final_updates_import.xlsx,
+meeting_references_import.xlsx), which all use the MO-DB_Updates layout of
+one tab per recent year plus an Archive tab.
+
+- meeting_date is parsed once for the whole frame
+- text columns are sanitized column-wise (no per-cell .apply)
+- rows are sorted once and split with a single groupby
+- tabs come from the data: every year from the archive cutoff up to the
+  latest year present, newest first; older and undated rows go to Archive
+- each tab is streamed to xlsx through excel_export (constant-memory
+  mode), so memory does not grow with the size of the update history
+
+Usage:
+    from update_shards import write_year_shards
+    shards = write_year_shards(df, OUTPUT_FILE, KEEP_COLUMNS)
+"""
+
+import re
+
+import pandas as pd
+
+from excel_export import write_xlsx, sanitize_columns as _sanitize_columns
+
+# Years before this go to the Archive tab
+DEFAULT_ARCHIVE_BEFORE = 2024
+ARCHIVE_TAB = 'Archive'
+
+DATE_COLUMN = 'meeting_date'
+TEXT_COLUMNS = ['update_text', 'source_document', 'source_tab']
+
+# Column widths for the MO-DB_Updates layout (others get DEFAULT_WIDTH)
+COLUMN_WIDTHS = {
+    'update_id': 20, 'solution_id': 15, 'update_text': 80,
+    'source_document': 25, 'source_category': 15, 'source_url': 50,
+    'source_tab': 30, 'meeting_date': 12, 'created_at': 25, 'created_by': 25
+}
+DEFAULT_WIDTH = 15
+
+LEADING_YEAR_RE = re.compile(r'^\s*(\d{4})')
+
+
+def sanitize_columns(df, columns=TEXT_COLUMNS):
+    """Strip Excel-illegal characters from text columns (missing -> '')"""
+    return _sanitize_columns(df, columns)
+
+
+def parse_meeting_dates(values):
+    """
+    Parse a date column once; returns (timestamps, years).
+
+    Years also come from a leading YYYY in text that is not a full date
+    ("2024-Q3"), so such rows still land in their year's tab.
+    """
+    dates = pd.to_datetime(values, errors='coerce', format='ISO8601')
+    years = dates.dt.year.astype('Int64')
+
+    missing = years.isna() & values.notna()
+    if missing.any():
+        leading = values[missing].astype(str).str.extract(LEADING_YEAR_RE, expand=False)
+        years[missing] = pd.to_numeric(leading, errors='coerce').astype('Int64')
+
+    return dates, years
+
+
+def year_tab_names(years, archive_before=DEFAULT_ARCHIVE_BEFORE):
+    """Tab per year from archive_before to the latest year seen, newest first, then Archive"""
+    years = years.dropna()
+    recent = years[years >= archive_before]
+    latest = int(recent.max()) if len(recent) else None
+    tabs = [str(y) for y in range(latest, archive_before - 1, -1)] if latest else []
+    return tabs + [ARCHIVE_TAB]
+
+
+def partition_by_year(df, columns, date_column=DATE_COLUMN, archive_before=DEFAULT_ARCHIVE_BEFORE,
+                      parsed_dates=None):
+    """
+    Split updates into year tabs.
+
+    Returns [(tab_name, frame)] in tab order; each frame has only `columns`,
+    is sorted by date (newest first) then solution_id, and has the date
+    formatted YYYY-MM-DD. Empty tabs are included so the layout is stable.
+    parsed_dates: (dates, years) from parse_meeting_dates, if already done.
+    """
+    work = df.copy()
+    for col in columns:
+        if col not in work.columns:
+            work[col] = ''
+
+    dates, years = parsed_dates or parse_meeting_dates(work[date_column])
+    work['_date'] = dates
+    recent = (years.fillna(0) >= archive_before).to_numpy()
+    work['_tab'] = ARCHIVE_TAB
+    work.loc[recent, '_tab'] = years[recent].astype(int).astype(str).to_numpy()
+    work[date_column] = dates.dt.strftime('%Y-%m-%d')
+
+    sort_cols = ['_date'] + (['solution_id'] if 'solution_id' in work.columns else [])
+    work = work.sort_values(sort_cols, ascending=[False] + [True] * (len(sort_cols) - 1), kind='stable')
+
+    groups = dict(tuple(work.groupby('_tab', sort=False)))
+    return [
+        (tab, groups[tab][columns].reset_index(drop=True) if tab in groups else pd.DataFrame(columns=columns))
+        for tab in year_tab_names(years, archive_before)
+    ]
+
+
+def write_sheets(path, sheets, column_widths=COLUMN_WIDTHS):
+    """Stream (tab name, DataFrame) pairs into one xlsx (see excel_export)"""
+    write_xlsx(path, sheets, widths=column_widths, default_width=DEFAULT_WIDTH)
+
+
+def write_year_shards(df, path, columns, date_column=DATE_COLUMN,
+                      archive_before=DEFAULT_ARCHIVE_BEFORE, extra_sheets=(), parsed_dates=None):
+    """
+    Partition updates by year and stream every tab to one xlsx.
+
+    extra_sheets: additional (tab name, DataFrame) pairs written after the
+    year tabs (e.g. the Duplicates report). Returns the year shards.
+    """
+    shards = partition_by_year(df, columns, date_column, archive_before, parsed_dates)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_sheets(path, shards + [(name, frame) for name, frame in extra_sheets])
+    return shards
+
+
+def print_shard_counts(shards, label=''):
+    """Per-tab row counts in the style of the combine scripts"""
+    for tab, frame in shards:
+        print(f"  {tab}: {len(frame)}{label}")
+    print(f"  TOTAL: {sum(len(frame) for _, frame in shards)}{label}")